@@ -1,4 +1,5 @@
 import asyncio
+import re
 from logging.config import fileConfig
 
 from sqlalchemy import pool
@@ -20,10 +21,32 @@ from app.core.config import get_settings
 from app.models.base import Base
 from app.models.question import Question  # noqa: F401
 from app.models.answer import Answer  # noqa: F401
+from app.models.archive import ArchivedAnswer, ArchivedQuestion  # noqa: F401
+from app.models.hand import QuestionHand  # noqa: F401
+from app.models.job import Job  # noqa: F401
+from app.models.question_view import QuestionViewCount  # noqa: F401
+from app.models.stats import (  # noqa: F401
+    AuthorAnswerStat,
+    DailyActivityStat,
+    FirstAnswerLatencyBucket,
+    QuestionFirstAnswer,
+)
+from app.models.trending import QuestionTrendingScore  # noqa: F401
+from app.models.watermark import AggregateDelta, AggregateWatermark  # noqa: F401
 
 # target_metadata는 'autogenerate' 지원을 위해 설정
 target_metadata = Base.metadata
 
+# 애플리케이션이 런타임에 만드는 파티션 테이블은 autogenerate 비교에서 제외
+PARTITION_TABLE_PATTERN = re.compile(r"^answers_(p\d{6}|default)$")
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    if type_ == "table" and reflected and PARTITION_TABLE_PATTERN.match(name):
+        return False
+    return True
+
+
 # 환경변수에서 데이터베이스 URL 가져오기
 settings = get_settings()
 config.set_main_option("sqlalchemy.url", settings.database_url)
@@ -48,6 +71,7 @@ def run_migrations_offline() -> None:
         dialect_opts={"paramstyle": "named"},
         compare_type=True,
         compare_server_default=True,
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -61,6 +85,7 @@ def do_run_migrations(connection: Connection) -> None:
         target_metadata=target_metadata,
         compare_type=True,
         compare_server_default=True,
+        include_object=include_object,
     )
 
     with context.begin_transaction():
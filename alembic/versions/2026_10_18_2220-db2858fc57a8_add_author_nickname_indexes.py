@@ -0,0 +1,58 @@
+"""add author nickname indexes
+
+Revision ID: db2858fc57a8
+Revises: 07aa79ce3854
+Create Date: 2026-10-18 22:20:04.361240
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'db2858fc57a8'
+down_revision: Union[str, Sequence[str], None] = '07aa79ce3854'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY는 트랜잭션 안에서 실행할 수 없으므로 autocommit 블록에서 생성
+    # 중간에 실패하면 INVALID 인덱스가 남으므로 DROP 후 다시 실행해야 함
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_questions_author_nickname_created_at',
+            'questions',
+            ['author_nickname', sa.text('created_at DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_answers_author_nickname_created_at',
+            'answers',
+            ['author_nickname', sa.text('created_at DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_answers_author_nickname_created_at',
+            table_name='answers',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_questions_author_nickname_created_at',
+            table_name='questions',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
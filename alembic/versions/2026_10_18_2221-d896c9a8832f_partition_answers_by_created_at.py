@@ -0,0 +1,114 @@
+"""partition answers by created_at
+
+Revision ID: d896c9a8832f
+Revises: db2858fc57a8
+Create Date: 2026-10-18 22:21:55.744131
+
+"""
+from datetime import UTC, date, datetime
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd896c9a8832f'
+down_revision: Union[str, Sequence[str], None] = 'db2858fc57a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 마이그레이션 시점 기준으로 미리 만들어 둘 월 파티션 수.
+# 이후의 파티션은 애플리케이션(app.db.partitions)이 주기적으로 만든다.
+MONTHS_AHEAD = 3
+
+COLUMNS = "id, question_id, content, author_nickname, created_at, updated_at"
+
+
+def _month_start(day: date, offset: int = 0) -> date:
+    index = day.year * 12 + (day.month - 1) + offset
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_answers_table(partitioned: bool) -> None:
+    kwargs = {"postgresql_partition_by": "RANGE (created_at)"} if partitioned else {}
+    primary_key = ("id", "created_at") if partitioned else ("id",)
+
+    op.create_table('answers',
+    sa.Column('question_id', sa.Integer(), nullable=False, comment='질문 ID'),
+    sa.Column('content', sa.Text(), nullable=False, comment='답변 내용'),
+    sa.Column('author_nickname', sa.String(length=50), nullable=False, comment='작성자 닉네임'),
+    sa.Column('id', sa.Integer(), sa.Identity(always=False, start=1, increment=1), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(
+        ['question_id'], ['questions.id'], name='answers_question_id_fkey', ondelete='CASCADE'
+    ),
+    sa.PrimaryKeyConstraint(*primary_key),
+    **kwargs,
+    )
+    op.create_index(op.f('ix_answers_id'), 'answers', ['id'], unique=False)
+    op.create_index(op.f('ix_answers_question_id'), 'answers', ['question_id'], unique=False)
+    op.create_index(
+        'ix_answers_author_nickname_created_at',
+        'answers',
+        ['author_nickname', sa.text('created_at DESC')],
+        unique=False,
+    )
+
+
+def _rename_old_answers_table(new_name: str) -> None:
+    # 새 테이블과 이름이 겹치지 않도록 기존 테이블의 인덱스를 지우고 기본 키/시퀀스 이름을 바꿈
+    op.drop_index('ix_answers_author_nickname_created_at', table_name='answers')
+    op.drop_index(op.f('ix_answers_question_id'), table_name='answers')
+    op.drop_index(op.f('ix_answers_id'), table_name='answers')
+    op.rename_table('answers', new_name)
+    op.execute(f'ALTER TABLE {new_name} RENAME CONSTRAINT answers_pkey TO {new_name}_pkey')
+    op.execute(f'ALTER SEQUENCE answers_id_seq RENAME TO {new_name}_id_seq')
+
+
+def _copy_answers(source: str) -> None:
+    op.execute(f'INSERT INTO answers ({COLUMNS}) SELECT {COLUMNS} FROM {source}')
+    op.execute(
+        "SELECT setval(pg_get_serial_sequence('answers', 'id'), "
+        "(SELECT COALESCE(MAX(id), 0) + 1 FROM answers), false)"
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 테이블 전체를 복사하는 동안 answers에 대한 쓰기는 막힌다.
+    # 운영 데이터가 크면 점검 시간에 적용할 것.
+    _rename_old_answers_table('answers_heap')
+    _create_answers_table(partitioned=True)
+
+    this_month = _month_start(datetime.now(UTC).date())
+    first_month = this_month
+    if not context.is_offline_mode():
+        oldest = op.get_bind().execute(sa.text('SELECT MIN(created_at) FROM answers_heap')).scalar()
+        if oldest is not None:
+            first_month = min(first_month, _month_start(oldest.astimezone(UTC).date()))
+
+    month = first_month
+    while month <= _month_start(this_month, MONTHS_AHEAD):
+        next_month = _month_start(month, 1)
+        op.execute(
+            f'CREATE TABLE answers_p{month:%Y%m} PARTITION OF answers '
+            f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') "
+            f"TO ('{next_month.isoformat()} 00:00:00+00')"
+        )
+        month = next_month
+    op.execute('CREATE TABLE answers_default PARTITION OF answers DEFAULT')
+
+    _copy_answers('answers_heap')
+    op.drop_table('answers_heap')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _rename_old_answers_table('answers_partitioned')
+    _create_answers_table(partitioned=False)
+    _copy_answers('answers_partitioned')
+    # 파티션도 함께 삭제됨
+    op.drop_table('answers_partitioned')
@@ -0,0 +1,52 @@
+"""seed stats deltas
+
+Revision ID: 9d4c2a7e6f10
+Revises: 5b8e1f3c9a27
+Create Date: 2026-10-18 23:16:05.730914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4c2a7e6f10'
+down_revision: Union[str, Sequence[str], None] = '5b8e1f3c9a27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 통계도 delta로 옮김. 워터마크보다 뒤의 행만 아직 반영되지 않은 것
+    op.execute(
+        """
+        INSERT INTO aggregate_deltas (consumer, row_id, created_at, updated_at)
+        SELECT 'stats:questions', id, now(), now()
+        FROM questions
+        WHERE id > coalesce(
+            (SELECT last_id FROM aggregate_watermarks WHERE name = 'stats:questions'), 0
+        )
+        ORDER BY id
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO aggregate_deltas (consumer, row_id, created_at, updated_at)
+        SELECT 'stats:answers', id, now(), now()
+        FROM answers
+        WHERE id > coalesce(
+            (SELECT last_id FROM aggregate_watermarks WHERE name = 'stats:answers'), 0
+        )
+        ORDER BY id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(
+        "DELETE FROM aggregate_deltas WHERE consumer IN ('stats:questions', 'stats:answers')"
+    )
@@ -0,0 +1,196 @@
+from datetime import UTC, datetime
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import FileResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.crud.job import read_job_queue_stats
+from app.db.database import get_session
+from app.db.limits import query_limits
+from app.db.slow_queries import slow_query_log
+from app.dependencies.admin import require_admin
+from app.middleware.profiling import profile_store
+from app.schemas.job import JobMetricsResponse, JobQueueStat, JobWorkerStat
+from app.schemas.loop_lag import LagBucket, LoopLagResponse, LoopStallResponse
+from app.schemas.profile import ProfileResponse
+from app.schemas.slow_query import SlowQueryReport, SlowQueryRoute, SlowQueryStatResponse
+from app.schemas.stats import StatsRefreshResponse
+from app.services.jobs import job_worker
+from app.services.loop_lag import LAG_BUCKETS_MS, loop_lag_monitor
+from app.services.stats import refresh_stats
+
+
+settings = get_settings()
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin)])
+
+
+@router.post(
+    "/stats/refresh",
+    response_model=StatsRefreshResponse,
+    status_code=status.HTTP_200_OK,
+    summary="통계 즉시 갱신",
+    description="다음 주기를 기다리지 않고 통계 집계를 바로 갱신합니다. "
+    "X-Admin-Token 헤더가 필요합니다.",
+)
+# 밀린 행을 배치로 여러 번 읽으므로 기본 한도보다 넉넉하게
+@query_limits(statement_timeout=60.0, statement_budget=1000)
+async def refresh_stats_handler(
+    db: AsyncSession = Depends(get_session),
+) -> StatsRefreshResponse:
+    processed = await refresh_stats(db)
+    return StatsRefreshResponse(processed=processed)
+
+
+@router.get(
+    "/jobs/metrics",
+    response_model=JobMetricsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="작업 큐 지표",
+    description="작업 종류와 상태별 대기열 길이, 대기 시간과 이 프로세스 워커의 처리량을 "
+    "조회합니다. X-Admin-Token 헤더가 필요합니다.",
+)
+async def job_metrics_handler(
+    db: AsyncSession = Depends(get_session),
+) -> JobMetricsResponse:
+    now = datetime.now(UTC)
+    queues = [
+        JobQueueStat(
+            kind=kind,
+            status=job_status,
+            count=count,
+            lag_seconds=None if oldest is None else max((now - oldest).total_seconds(), 0.0),
+        )
+        for kind, job_status, count, oldest in await read_job_queue_stats(db)
+    ]
+
+    metrics = job_worker.metrics
+    return JobMetricsResponse(
+        queues=queues,
+        worker=JobWorkerStat(
+            concurrency=job_worker.concurrency,
+            running=job_worker.running_count,
+            completed=dict(metrics.completed),
+            retried=dict(metrics.retried),
+            failed=dict(metrics.failed),
+            completed_last_minute=metrics.completed_last_minute(),
+            average_duration_seconds=metrics.average_duration,
+            average_start_lag_seconds=metrics.average_start_lag,
+        ),
+    )
+
+
+@router.get(
+    "/slow-queries",
+    response_model=SlowQueryReport,
+    status_code=status.HTTP_200_OK,
+    summary="느린 쿼리 상위 목록",
+    description="이 프로세스가 시작된 뒤 기준 시간을 넘은 쿼리를 쿼리 모양과 호출 함수별로 "
+    "모아 정렬해 보여 줍니다. 개별 기록은 SLOW_QUERY_LOG_PATH의 NDJSON 파일에 있습니다. "
+    "X-Admin-Token 헤더가 필요합니다.",
+)
+async def slow_queries_handler(
+    limit: int = Query(20, ge=1, le=100, description="보여 줄 쿼리 수"),
+    order_by: Literal["total", "max", "mean", "count"] = Query(
+        "total", description="정렬 기준 (누적 시간, 최대 시간, 평균 시간, 횟수)"
+    ),
+) -> SlowQueryReport:
+    return SlowQueryReport(
+        threshold_ms=slow_query_log.threshold_ms,
+        sample_rate=slow_query_log.sample_rate,
+        tracked=len(slow_query_log.stats),
+        queries=[
+            SlowQueryStatResponse(
+                sql=stat.sql,
+                call_site=stat.call_site,
+                count=stat.count,
+                total_ms=stat.total_ms,
+                mean_ms=stat.mean_ms,
+                max_ms=stat.max_ms,
+                rows=stat.rows,
+                routes=[
+                    SlowQueryRoute(route=route, count=count)
+                    for route, count in stat.routes.most_common(5)
+                ],
+            )
+            for stat in slow_query_log.top(limit, order_by)
+        ],
+    )
+
+
+@router.delete(
+    "/slow-queries",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="느린 쿼리 집계 초기화",
+    description="배포나 인덱스 추가 뒤 다시 모으도록 집계를 비웁니다. 파일 기록은 그대로 "
+    "둡니다. X-Admin-Token 헤더가 필요합니다.",
+)
+async def reset_slow_queries_handler() -> None:
+    slow_query_log.reset()
+
+
+@router.get(
+    "/profiles",
+    response_model=list[ProfileResponse],
+    status_code=status.HTTP_200_OK,
+    summary="요청 프로파일 목록",
+    description="X-Profile 헤더나 PROFILE_SAMPLE_RATE로 기록한 요청 프로파일을 최신순으로 "
+    "조회합니다. X-Admin-Token 헤더가 필요합니다.",
+)
+async def list_profiles_handler() -> list[ProfileResponse]:
+    return [
+        ProfileResponse(name=p.name, size_bytes=p.size_bytes, created_at=p.created_at)
+        for p in profile_store.list()
+    ]
+
+
+@router.get(
+    "/profiles/{name}",
+    response_class=FileResponse,
+    status_code=status.HTTP_200_OK,
+    summary="요청 프로파일 내려받기",
+    description="pstats 형식 파일을 내려받습니다. python -m pstats나 snakeviz로 열 수 "
+    "있습니다. X-Admin-Token 헤더가 필요합니다.",
+)
+async def download_profile_handler(name: str) -> FileResponse:
+    path = profile_store.path(name)
+    if path is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="프로파일을 찾을 수 없습니다.",
+        )
+    return FileResponse(path, media_type="application/octet-stream", filename=name)
+
+
+@router.get(
+    "/loop-lag",
+    response_model=LoopLagResponse,
+    status_code=status.HTTP_200_OK,
+    summary="이벤트 루프 지연",
+    description="이 프로세스 이벤트 루프의 지연 히스토그램과, LOOP_WATCHDOG가 켜져 있으면 "
+    "루프를 오래 붙잡은 코드의 스택을 조회합니다. X-Admin-Token 헤더가 필요합니다.",
+)
+async def loop_lag_handler() -> LoopLagResponse:
+    histogram = loop_lag_monitor.histogram
+    return LoopLagResponse(
+        interval_seconds=settings.loop_lag_interval,
+        samples=histogram.count,
+        mean_ms=histogram.mean_ms,
+        max_ms=histogram.max_ms,
+        p50_ms=histogram.quantile(0.5),
+        p99_ms=histogram.quantile(0.99),
+        buckets=[
+            LagBucket(le_ms=le_ms, count=count)
+            for le_ms, count in zip((*LAG_BUCKETS_MS, None), histogram.counts, strict=True)
+        ],
+        watchdog=loop_lag_monitor.watchdog_running,
+        block_threshold_ms=settings.loop_block_threshold * 1000,
+        stalls=[
+            LoopStallResponse(
+                started_at=stall.started_at, duration_ms=stall.duration_ms, stack=stall.stack
+            )
+            for stall in reversed(loop_lag_monitor.stalls)
+        ],
+    )
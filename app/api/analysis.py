@@ -0,0 +1,163 @@
+from fastapi import APIRouter, HTTPException, Query, status
+
+from app.core.config import get_settings
+from app.schemas.analysis import (
+    DiscardEstimateItem,
+    DiscardOption,
+    DiscardRequest,
+    DiscardResponse,
+    ScoreRequest,
+    ScoreResponse,
+    ShantenResponse,
+    UkeireTile,
+    YakuItem,
+)
+from app.services.discard import evaluate_discards
+from app.services.scoring import WinContext, parse_meld, score_hand
+from app.services.shanten import analyze_hand
+from app.services.tiles import format_hand, parse_hand, parse_tiles, tile_counts, tile_name
+
+
+settings = get_settings()
+
+router = APIRouter(prefix="/analysis", tags=["analysis"])
+
+WIND_TILES = {"east": 27, "south": 28, "west": 29, "north": 30}
+
+
+def _ukeire_tiles(ukeire: dict[int, int]) -> list[UkeireTile]:
+    return [UkeireTile(tile=tile_name(tile), remaining=count) for tile, count in ukeire.items()]
+
+
+# CPU만 쓰는 계산이므로 동기 함수로 두어 스레드 풀에서 실행되게 함
+@router.get(
+    "/shanten",
+    response_model=ShantenResponse,
+    response_model_exclude_none=True,
+    status_code=status.HTTP_200_OK,
+    summary="샹텐/유효패 계산",
+    description="MPSZ 표기 손패의 샹텐 수(일반형, 칠대자, 국사무쌍)를 계산합니다. "
+    "3n+1장이면 유효패를, 3n+2장이면 버릴 패마다 버린 뒤의 샹텐과 유효패를 돌려줍니다.",
+)
+def shanten_handler(
+    hand: str = Query(..., description="MPSZ 표기 손패", examples=["123m456p789s1123z"]),
+) -> ShantenResponse:
+    try:
+        tiles = parse_hand(hand)
+        result, detail = analyze_hand(tiles)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    response = ShantenResponse(
+        hand=format_hand(tiles),
+        tile_count=len(tiles),
+        shanten=result.shanten,
+        regular=result.regular,
+        chiitoitsu=result.chiitoitsu,
+        kokushi=result.kokushi,
+    )
+    if isinstance(detail, dict):
+        response.ukeire = _ukeire_tiles(detail)
+        response.ukeire_total = sum(detail.values())
+    else:
+        response.discards = [
+            DiscardOption(
+                discard=tile_name(option.tile),
+                shanten=option.shanten,
+                ukeire=_ukeire_tiles(option.ukeire),
+                ukeire_total=sum(option.ukeire.values()),
+            )
+            for option in detail
+        ]
+    return response
+
+
+@router.post(
+    "/score",
+    response_model=ScoreResponse,
+    response_model_exclude_none=True,
+    status_code=status.HTTP_200_OK,
+    summary="점수 계산",
+    description="화료한 손패의 역, 판, 부, 점수를 계산합니다. "
+    "여러 가지로 해석되는 손패는 점수가 가장 높은 해석을 고릅니다.",
+)
+def score_handler(score_in: ScoreRequest) -> ScoreResponse:
+    try:
+        win_tile = parse_hand(score_in.win_tile)
+        if len(win_tile) != 1:
+            raise ValueError(f"화료패는 한 장이어야 합니다: {score_in.win_tile}")
+        melds = [parse_meld(meld.type, parse_hand(meld.tiles)) for meld in score_in.melds]
+        context = WinContext(
+            win_tile=win_tile[0],
+            round_wind=WIND_TILES[score_in.round_wind],
+            seat_wind=WIND_TILES[score_in.seat_wind],
+            tsumo=score_in.tsumo,
+            riichi=score_in.riichi,
+            ippatsu=score_in.ippatsu,
+            dora=score_in.dora,
+        )
+        score = score_hand(parse_hand(score_in.hand), melds, context)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    return ScoreResponse(
+        yaku=[YakuItem(name=name, han=han) for name, han in score.yaku],
+        han=score.han,
+        fu=score.fu,
+        limit=score.limit,
+        total=score.total,
+        ron=score.ron,
+        tsumo_dealer=score.tsumo_dealer,
+        tsumo_non_dealer=score.tsumo_non_dealer,
+    )
+
+
+@router.post(
+    "/discard",
+    response_model=DiscardResponse,
+    status_code=status.HTTP_200_OK,
+    summary="버릴 패 평가",
+    description="버릴 수 있는 패마다 남은 산에서 draws번 쯔모하는 시뮬레이션을 돌려 "
+    "텐파이/화료 확률을 추정합니다. 계산은 별도 프로세스에서 실행되며, "
+    "마감 시간을 넘긴 후보는 결과에서 빠지고 complete가 false가 됩니다.",
+)
+async def discard_handler(discard_in: DiscardRequest) -> DiscardResponse:
+    samples = min(
+        discard_in.samples or settings.discard_simulation_samples,
+        settings.discard_simulation_max_samples,
+    )
+    try:
+        tiles = parse_hand(discard_in.hand)
+        visible = parse_tiles(discard_in.visible) if discard_in.visible else ()
+        estimates, complete = await evaluate_discards(
+            tile_counts(tiles),
+            tile_counts(visible),
+            discard_in.draws,
+            samples,
+            discard_in.seed,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    if not estimates:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="시뮬레이션이 마감 시간 안에 끝나지 않았습니다",
+        )
+
+    return DiscardResponse(
+        hand=format_hand(tiles),
+        draws=discard_in.draws,
+        samples=samples,
+        complete=complete,
+        candidates=[
+            DiscardEstimateItem(
+                discard=tile_name(estimate.tile),
+                shanten=estimate.shanten,
+                ukeire=estimate.ukeire,
+                tenpai_probability=estimate.tenpai_probability,
+                win_probability=estimate.win_probability,
+            )
+            for estimate in estimates
+        ],
+    )
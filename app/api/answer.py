@@ -1,25 +1,58 @@
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import datetime
+
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from app.crud.answer import (
-    create_answer,
-    delete_answer,
-    read_answer_by_id,
-    read_answers_by_question_id,
-    update_answer,
-)
-from app.crud.question import read_question_by_id
-from app.db.database import get_session
+from fastapi.responses import StreamingResponse
+
+from app.core.config import get_settings
+from app.dependencies.fields import project, select_fields
+from app.dependencies.ids import parse_ids
+from app.dependencies.repository import get_repository
+from app.repositories.base import Repository
 from app.schemas.answer import (
+    ANSWER_LIST_FIELDS,
+    AnswerBatchResponse,
     AnswerCreate,
     AnswerListItem,
     AnswerResponse,
     AnswerUpdate,
 )
+from app.services.answer_events import answer_events
+from app.services.list_cache import question_list_cache
+
 
+settings = get_settings()
 
 router = APIRouter(prefix="/questions/{question_id}/answers", tags=["answers"])
 
+# 질문과 상관없이 답변 ID로 조회 (알림, 북마크 화면용)
+batch_router = APIRouter(prefix="/answers", tags=["answers"])
+
+
+@batch_router.get(
+    "",
+    response_model=AnswerBatchResponse,
+    status_code=status.HTTP_200_OK,
+    summary="답변 여러 개 조회",
+    description="ID로 여러 답변을 요청한 순서대로 한 번에 조회하고 찾지 못한 ID를 알려줍니다.",
+)
+async def batch_answers_handler(
+    ids: list[int] | None = Depends(parse_ids),
+    repo: Repository = Depends(get_repository),
+) -> AnswerBatchResponse:
+    if ids is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="ids를 지정해야 합니다.",
+        )
+
+    answers = await repo.read_answers_by_ids(ids)
+    return AnswerBatchResponse(
+        items=[AnswerResponse.model_validate(answers[i]) for i in ids if i in answers],
+        missing_ids=[answer_id for answer_id in ids if answer_id not in answers],
+    )
+
 
 @router.post(
     "",
@@ -31,23 +64,27 @@ router = APIRouter(prefix="/questions/{question_id}/answers", tags=["answers"])
 async def create_answer_handler(
     question_id: int,
     answer_in: AnswerCreate,
-    db: AsyncSession = Depends(get_session),
+    repo: Repository = Depends(get_repository),
 ) -> AnswerResponse:
-    question = await read_question_by_id(db, question_id)
+    question = await repo.read_question(question_id)
     if question is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"질문을 찾을 수 없습니다. (ID: {question_id})",
         )
 
-    answer = await create_answer(db, question_id, answer_in)
-    await db.commit()  # ✅ API 레이어에서 commit
+    answer, restored = await repo.create_answer(question_id, answer_in)
+    await repo.commit()  # ✅ API 레이어에서 commit
+    if restored:
+        # 보관에서 돌아온 질문이 목록에 다시 나타남
+        question_list_cache.invalidate()
     return AnswerResponse.model_validate(answer)
 
 
 @router.get(
     "",
     response_model=list[AnswerListItem],
+    response_model_exclude_unset=True,
     status_code=status.HTTP_200_OK,
     summary="답변 목록 조회",
     description="특정 질문의 모든 답변을 조회합니다. 최신순으로 정렬됩니다.",
@@ -56,17 +93,66 @@ async def list_answers_handler(
     question_id: int,
     skip: int = Query(default=0, ge=0, description="건너뛸 개수"),
     limit: int = Query(default=100, ge=1, le=100, description="가져올 최대 개수"),
-    db: AsyncSession = Depends(get_session),
+    fields: tuple[str, ...] = Depends(select_fields(AnswerListItem, ANSWER_LIST_FIELDS)),
+    repo: Repository = Depends(get_repository),
 ) -> list[AnswerListItem]:
-    question = await read_question_by_id(db, question_id)
+    question = await repo.read_question(question_id)
+    if question is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"질문을 찾을 수 없습니다. (ID: {question_id})",
+        )
+
+    answers, _ = await repo.read_answers_by_question_id(question_id, skip, limit, columns=fields)
+    return [AnswerListItem(**project(a, fields)) for a in answers]
+
+
+async def _question_created_at(repo: Repository, question_id: int) -> datetime | None:
+    # 답변은 질문보다 늦게 달리므로 질문 작성 시각을 답변 ID 조회의 하한으로 넘겨 그 이전
+    # 월 파티션을 건너뜀. 질문이 없으면 하한 없이 찾아 기존처럼 답변 기준으로 응답함
+    question = await repo.read_question(question_id)
+    return None if question is None else question.created_at
+
+
+async def _answer_event_stream(question_id: int) -> AsyncIterator[str]:
+    with answer_events.subscribe(question_id) as queue:
+        # 연결 직후 바로 한 번 내보내서 프록시가 응답 헤더를 붙잡고 있지 않게 함
+        yield "retry: 3000\n\n"
+        while True:
+            try:
+                event, data = await asyncio.wait_for(queue.get(), settings.answer_stream_heartbeat)
+            except TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            yield f"event: {event}\ndata: {data}\n\n"
+
+
+@router.get(
+    "/stream",
+    status_code=status.HTTP_200_OK,
+    summary="답변 실시간 스트림",
+    description="질문의 답변이 생성(created), 수정(updated), 삭제(deleted)될 때마다 "
+    "Server-Sent Events로 알려줍니다. 연결이 끊겼다 이어지면 resync 이벤트가 옵니다.",
+    response_class=StreamingResponse,
+)
+async def stream_answers_handler(
+    question_id: int,
+    repo: Repository = Depends(get_repository),
+) -> StreamingResponse:
+    question = await repo.read_question(question_id)
     if question is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"질문을 찾을 수 없습니다. (ID: {question_id})",
         )
+    # 스트림이 열려 있는 동안 세션을 붙잡지 않도록 먼저 닫음
+    await repo.close()
 
-    answers, _ = await read_answers_by_question_id(db, question_id, skip, limit)
-    return [AnswerListItem.model_validate(a) for a in answers]
+    return StreamingResponse(
+        _answer_event_stream(question_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get(
@@ -79,9 +165,10 @@ async def list_answers_handler(
 async def get_answer_handler(
     question_id: int,
     answer_id: int,
-    db: AsyncSession = Depends(get_session),
+    repo: Repository = Depends(get_repository),
 ) -> AnswerResponse:
-    answer = await read_answer_by_id(db, answer_id)
+    created_after = await _question_created_at(repo, question_id)
+    answer = await repo.read_answer(answer_id, created_after)
 
     if answer is None:
         raise HTTPException(
@@ -110,9 +197,10 @@ async def update_answer_handler(
     question_id: int,
     answer_id: int,
     answer_in: AnswerUpdate,
-    db: AsyncSession = Depends(get_session),
+    repo: Repository = Depends(get_repository),
 ) -> AnswerResponse:
-    existing_answer = await read_answer_by_id(db, answer_id)
+    created_after = await _question_created_at(repo, question_id)
+    existing_answer = await repo.read_answer(answer_id, created_after)
 
     if existing_answer is None:
         raise HTTPException(
@@ -127,8 +215,8 @@ async def update_answer_handler(
             f"(질문 ID: {question_id}, 답변 ID: {answer_id})",
         )
 
-    answer = await update_answer(db, answer_id, answer_in)
-    await db.commit()  # ✅ API 레이어에서 commit
+    answer = await repo.update_answer(answer_id, answer_in, created_after)
+    await repo.commit()  # ✅ API 레이어에서 commit
     return AnswerResponse.model_validate(answer)
 
 
@@ -141,9 +229,10 @@ async def update_answer_handler(
 async def delete_answer_handler(
     question_id: int,
     answer_id: int,
-    db: AsyncSession = Depends(get_session),
+    repo: Repository = Depends(get_repository),
 ) -> None:
-    existing_answer = await read_answer_by_id(db, answer_id)
+    created_after = await _question_created_at(repo, question_id)
+    existing_answer = await repo.read_answer(answer_id, created_after)
 
     if existing_answer is None:
         raise HTTPException(
@@ -158,5 +247,5 @@ async def delete_answer_handler(
             f"(질문 ID: {question_id}, 답변 ID: {answer_id})",
         )
 
-    await delete_answer(db, answer_id)
-    await db.commit()  # ✅ API 레이어에서 commit
+    await repo.delete_answer(answer_id, created_after)
+    await repo.commit()  # ✅ API 레이어에서 commit
@@ -0,0 +1,99 @@
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.dependencies.fields import project, select_fields
+from app.dependencies.repository import get_repository
+from app.repositories.base import Repository
+from app.schemas.author import (
+    AUTHOR_ANSWER_FIELDS,
+    AUTHOR_QUESTION_FIELDS,
+    AuthorAnswerItem,
+    AuthorAnswerPage,
+    AuthorQuestionItem,
+    AuthorQuestionPage,
+)
+from app.util.cursor import decode_cursor, encode_cursor
+
+
+router = APIRouter(prefix="/authors", tags=["authors"])
+
+
+def _parse_cursor(cursor: str | None) -> tuple[datetime, int] | None:
+    if cursor is None:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+
+
+def _with_cursor_columns(fields: tuple[str, ...]) -> tuple[str, ...]:
+    # 다음 페이지 커서를 만들려면 응답에 없어도 created_at이 필요함
+    return tuple(dict.fromkeys([*fields, "created_at"]))
+
+
+@router.get(
+    "/{nickname}/questions",
+    response_model=AuthorQuestionPage,
+    response_model_exclude_unset=True,
+    status_code=status.HTTP_200_OK,
+    summary="작성자 질문 목록 조회",
+    description="특정 작성자의 질문을 최신순으로 조회합니다. "
+    "next_cursor로 다음 페이지를 조회합니다.",
+)
+async def list_author_questions_handler(
+    nickname: str,
+    cursor: str | None = Query(default=None, description="이전 응답의 next_cursor"),
+    limit: int = Query(default=20, ge=1, le=100, description="가져올 최대 개수"),
+    fields: tuple[str, ...] = Depends(select_fields(AuthorQuestionItem, AUTHOR_QUESTION_FIELDS)),
+    repo: Repository = Depends(get_repository),
+) -> AuthorQuestionPage:
+    # 한 건 더 가져와서 다음 페이지가 있는지 판단
+    questions = await repo.read_questions_by_author(
+        nickname, limit + 1, _parse_cursor(cursor), columns=_with_cursor_columns(fields)
+    )
+
+    next_cursor = None
+    if len(questions) > limit:
+        questions = questions[:limit]
+        next_cursor = encode_cursor(questions[-1].created_at, questions[-1].id)
+
+    return AuthorQuestionPage(
+        items=[AuthorQuestionItem(**project(q, fields)) for q in questions],
+        next_cursor=next_cursor,
+    )
+
+
+@router.get(
+    "/{nickname}/answers",
+    response_model=AuthorAnswerPage,
+    response_model_exclude_unset=True,
+    status_code=status.HTTP_200_OK,
+    summary="작성자 답변 목록 조회",
+    description="특정 작성자의 답변을 최신순으로 조회합니다. "
+    "next_cursor로 다음 페이지를 조회합니다.",
+)
+async def list_author_answers_handler(
+    nickname: str,
+    cursor: str | None = Query(default=None, description="이전 응답의 next_cursor"),
+    limit: int = Query(default=20, ge=1, le=100, description="가져올 최대 개수"),
+    fields: tuple[str, ...] = Depends(select_fields(AuthorAnswerItem, AUTHOR_ANSWER_FIELDS)),
+    repo: Repository = Depends(get_repository),
+) -> AuthorAnswerPage:
+    answers = await repo.read_answers_by_author(
+        nickname, limit + 1, _parse_cursor(cursor), columns=_with_cursor_columns(fields)
+    )
+
+    next_cursor = None
+    if len(answers) > limit:
+        answers = answers[:limit]
+        next_cursor = encode_cursor(answers[-1].created_at, answers[-1].id)
+
+    return AuthorAnswerPage(
+        items=[AuthorAnswerItem(**project(a, fields)) for a in answers],
+        next_cursor=next_cursor,
+    )
@@ -1,43 +1,109 @@
 from math import ceil
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from app.crud.question import (
-    create_question,
-    delete_question,
-    read_question_by_id,
-    read_questions,
-    update_question,
-)
-from app.db.database import get_session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+
+from app.db.limits import query_limits
+from app.dependencies.fields import project, select_fields
+from app.dependencies.ids import parse_ids
+from app.dependencies.repository import get_repository
+from app.repositories.base import QuestionRow, Repository
 from app.schemas.question import (
+    QUESTION_LIST_FIELDS,
+    AutocompleteItem,
+    DuplicateQuestionItem,
     PaginationMeta,
+    QuestionBatchResponse,
     QuestionCreate,
+    QuestionCreateResponse,
     QuestionListItem,
     QuestionListResponse,
     QuestionResponse,
     QuestionUpdate,
+    RelatedQuestionItem,
+    SimilarHandItem,
 )
+from app.services.autocomplete import title_index
+from app.services.duplicates import duplicate_index, find_duplicates, question_text
+from app.services.list_cache import question_list_cache
+from app.services.related import related_index
+from app.services.tiles import extract_hands, parse_hand
+from app.services.view_counter import view_counter
 
 
 router = APIRouter(prefix="/questions", tags=["questions"])
 
 
+def _index_question(question: QuestionRow) -> None:
+    # 커밋한 뒤에 메모리 색인을 갱신해서 롤백된 질문이 색인에 남지 않도록 함
+    text = question_text(question.title, question.content)
+    duplicate_index.add(question.id, text)
+    related_index.add(question.id, text)
+    title_index.add(question.id, question.title)
+
+
+async def _duplicate_items(
+    repo: Repository,
+    matches: list[tuple[int, float]],
+) -> list[DuplicateQuestionItem]:
+    # 색인은 메모리에 있으므로 그 사이 삭제된 질문은 건너뜀
+    questions = await repo.read_questions_by_ids([question_id for question_id, _ in matches])
+    return [
+        DuplicateQuestionItem(
+            id=question_id,
+            title=questions[question_id].title,
+            author_nickname=questions[question_id].author_nickname,
+            similarity=similarity,
+        )
+        for question_id, similarity in matches
+        if question_id in questions
+    ]
+
+
 @router.post(
     "",
-    response_model=QuestionResponse,
+    response_model=QuestionCreateResponse,
     status_code=status.HTTP_201_CREATED,
     summary="질문 생성",
-    description="새로운 마작 질문을 생성합니다.",
+    description="새로운 마작 질문을 생성합니다. check_duplicates=true면 이미 있는 "
+    "비슷한 질문을 함께 돌려줍니다.",
 )
 async def create_question_handler(
     question_in: QuestionCreate,
-    db: AsyncSession = Depends(get_session),
-) -> QuestionResponse:
-    question = await create_question(db, question_in)
-    await db.commit()
-    return question
+    check_duplicates: bool = Query(default=False, description="비슷한 질문도 함께 조회"),
+    repo: Repository = Depends(get_repository),
+) -> QuestionCreateResponse:
+    matches = []
+    if check_duplicates:
+        matches = find_duplicates(question_in.title, question_in.content)
+
+    question = await repo.create_question(question_in)
+    await repo.commit()
+    _index_question(question)
+    question_list_cache.invalidate()
+
+    response = QuestionCreateResponse.model_validate(question)
+    if matches:
+        response.duplicates = await _duplicate_items(repo, matches)
+    return response
+
+
+@router.get(
+    "/autocomplete",
+    response_model=list[AutocompleteItem],
+    status_code=status.HTTP_200_OK,
+    summary="질문 제목 자동완성",
+    description="입력 중인 글자로 시작하는 제목이나 어절이 있는 질문을 조회합니다. "
+    "초성이나 받침만 입력된 상태(예: 리ㅊ)도 찾습니다.",
+)
+async def autocomplete_questions_handler(
+    q: str = Query(..., min_length=1, max_length=100, description="입력 중인 제목"),
+    limit: int = Query(default=10, ge=1, le=20, description="가져올 최대 개수"),
+) -> list[AutocompleteItem]:
+    # 색인은 이벤트 루프에서만 바뀌므로 스레드풀로 넘기지 않고 루프에서 바로 조회
+    return [
+        AutocompleteItem(id=question_id, title=title)
+        for question_id, title in title_index.search(q, limit)
+    ]
 
 
 @router.get(
@@ -49,37 +115,184 @@ async def create_question_handler(
 )
 async def get_question_handler(
     question_id: int,
-    db: AsyncSession = Depends(get_session),
+    repo: Repository = Depends(get_repository),
 ) -> QuestionResponse:
-    question = await read_question_by_id(db, question_id)
+    question = await repo.read_question(question_id)
     if question is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"질문을 찾을 수 없습니다. (ID: {question_id})",
         )
-    return question
+
+    repo.record_view(question_id)
+
+    response = QuestionResponse.model_validate(question)
+    response.view_count += view_counter.pending(question_id)
+    return response
+
+
+@router.get(
+    "/{question_id}/similar-hands",
+    response_model=list[SimilarHandItem],
+    status_code=status.HTTP_200_OK,
+    summary="비슷한 손패 질문 조회",
+    description="질문 본문의 손패와 색 순서만 다르거나 한 장 차이인 손패를 다룬 "
+    "다른 질문을 조회합니다. 같은 모양이 먼저 나옵니다.",
+)
+async def list_similar_hand_questions_handler(
+    question_id: int,
+    limit: int = Query(default=20, ge=1, le=100, description="가져올 최대 개수"),
+    repo: Repository = Depends(get_repository),
+) -> list[SimilarHandItem]:
+    question = await repo.read_question(question_id)
+    if question is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"질문을 찾을 수 없습니다. (ID: {question_id})",
+        )
+
+    rows = await repo.read_similar_hand_questions(
+        question_id, extract_hands(question.content), limit
+    )
+    return [
+        SimilarHandItem(
+            id=similar.id,
+            title=similar.title,
+            author_nickname=similar.author_nickname,
+            notation=notation,
+            distance=distance,
+        )
+        for similar, notation, distance in rows
+    ]
+
+
+@router.get(
+    "/{question_id}/duplicates",
+    response_model=list[DuplicateQuestionItem],
+    status_code=status.HTTP_200_OK,
+    summary="중복 질문 조회",
+    description="제목과 본문이 거의 같은 다른 질문을 유사도 순으로 조회합니다.",
+)
+async def list_duplicate_questions_handler(
+    question_id: int,
+    limit: int = Query(default=5, ge=1, le=50, description="가져올 최대 개수"),
+    repo: Repository = Depends(get_repository),
+) -> list[DuplicateQuestionItem]:
+    question = await repo.read_question(question_id)
+    if question is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"질문을 찾을 수 없습니다. (ID: {question_id})",
+        )
+
+    matches = find_duplicates(question.title, question.content, limit, exclude=question_id)
+    return await _duplicate_items(repo, matches)
+
+
+@router.get(
+    "/{question_id}/related",
+    response_model=list[RelatedQuestionItem],
+    status_code=status.HTTP_200_OK,
+    summary="관련 질문 조회",
+    description="제목과 본문의 TF-IDF 코사인 유사도가 높은 질문을 조회합니다.",
+)
+async def list_related_questions_handler(
+    question_id: int,
+    limit: int = Query(default=10, ge=1, le=50, description="가져올 최대 개수"),
+    repo: Repository = Depends(get_repository),
+) -> list[RelatedQuestionItem]:
+    question = await repo.read_question(question_id)
+    if question is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"질문을 찾을 수 없습니다. (ID: {question_id})",
+        )
+
+    if question_id not in related_index:
+        _index_question(question)
+    matches = related_index.related(question_id, limit)
+
+    questions = await repo.read_questions_by_ids([related_id for related_id, _ in matches])
+    return [
+        RelatedQuestionItem(
+            id=related_id,
+            title=questions[related_id].title,
+            author_nickname=questions[related_id].author_nickname,
+            score=score,
+        )
+        for related_id, score in matches
+        if related_id in questions
+    ]
+
+
+async def _batch_questions(repo: Repository, ids: list[int]) -> QuestionBatchResponse:
+    questions = await repo.read_questions_by_ids(ids)
+    items = []
+    for question_id in ids:
+        if question_id not in questions:
+            continue
+        item = QuestionResponse.model_validate(questions[question_id])
+        item.view_count += view_counter.pending(question_id)
+        items.append(item)
+    return QuestionBatchResponse(
+        items=items,
+        missing_ids=[question_id for question_id in ids if question_id not in questions],
+    )
 
 
 @router.get(
     "",
-    response_model=QuestionListResponse,
+    response_model=QuestionListResponse | QuestionBatchResponse,
+    response_model_exclude_unset=True,
     status_code=status.HTTP_200_OK,
     summary="질문 목록 조회",
-    description="질문 목록을 페이지네이션과 함께 조회합니다. 최신순으로 정렬됩니다.",
+    description="질문 목록을 페이지네이션과 함께 조회합니다. 최신순으로 정렬됩니다. "
+    "ids를 주면 그 질문들만 요청한 순서대로 한 번에 조회하고 찾지 못한 ID를 알려줍니다.",
 )
+# 깊은 페이지의 OFFSET과 손패 필터의 COUNT가 연결을 오래 붙잡지 않도록 짧게
+@query_limits(statement_timeout=2.0)
 async def list_questions_handler(
+    ids: list[int] | None = Depends(parse_ids),
+    fields: tuple[str, ...] = Depends(select_fields(QuestionListItem, QUESTION_LIST_FIELDS)),
     page: int = Query(default=1, ge=1, description="페이지 번호 (1부터 시작)"),
     size: int = Query(default=10, ge=1, le=100, description="페이지당 항목 수"),
-    db: AsyncSession = Depends(get_session),
-) -> QuestionListResponse:
+    tiles: str | None = Query(
+        default=None,
+        description="MPSZ 표기. 이 패들을 모두 포함한 손패가 있는 질문만 조회",
+        examples=["55m789p"],
+    ),
+    repo: Repository = Depends(get_repository),
+) -> QuestionListResponse | QuestionBatchResponse | Response:
+    if ids is not None:
+        return await _batch_questions(repo, ids)
+
+    # 첫 화면이 매번 부르는 기본 목록은 직렬화한 본문을 그대로 돌려줌
+    cacheable = (
+        tiles is None and fields == QUESTION_LIST_FIELDS and question_list_cache.accepts(page)
+    )
+    if cacheable:
+        body = question_list_cache.get(page, size)
+        if body is not None:
+            return Response(content=body, media_type="application/json")
+        generation = question_list_cache.generation
+
     skip = (page - 1) * size
 
-    questions, total = await read_questions(db, skip=skip, limit=size)
+    tile_filter = None
+    if tiles is not None:
+        try:
+            tile_filter = parse_hand(tiles)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    questions, total = await repo.read_questions(
+        skip=skip, limit=size, tiles=tile_filter, columns=fields
+    )
 
     total_pages = ceil(total / size) if total > 0 else 0
 
-    return QuestionListResponse(
-        items=[QuestionListItem.model_validate(q) for q in questions],
+    response = QuestionListResponse(
+        items=[QuestionListItem(**project(q, fields)) for q in questions],
         pagination=PaginationMeta(
             total=total,
             page=page,
@@ -87,6 +300,12 @@ async def list_questions_handler(
             total_pages=total_pages,
         ),
     )
+    if not cacheable:
+        return response
+
+    body = response.model_dump_json(exclude_unset=True).encode()
+    question_list_cache.put(page, size, generation, body)
+    return Response(content=body, media_type="application/json")
 
 
 @router.patch(
@@ -99,15 +318,17 @@ async def list_questions_handler(
 async def update_question_handler(
     question_id: int,
     question_in: QuestionUpdate,
-    db: AsyncSession = Depends(get_session),
+    repo: Repository = Depends(get_repository),
 ) -> QuestionResponse:
-    question = await update_question(db, question_id, question_in)
+    question = await repo.update_question(question_id, question_in)
     if question is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"질문을 찾을 수 없습니다. (ID: {question_id})",
         )
-    await db.commit()
+    await repo.commit()
+    _index_question(question)
+    question_list_cache.invalidate()
     return question
 
 
@@ -119,12 +340,16 @@ async def update_question_handler(
 )
 async def delete_question_handler(
     question_id: int,
-    db: AsyncSession = Depends(get_session),
+    repo: Repository = Depends(get_repository),
 ) -> None:
-    result = await delete_question(db, question_id)
+    result = await repo.delete_question(question_id)
     if not result:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"질문을 찾을 수 없습니다. (ID: {question_id})",
         )
-    await db.commit()
+    await repo.commit()
+    duplicate_index.remove(question_id)
+    related_index.remove(question_id)
+    title_index.remove(question_id)
+    question_list_cache.invalidate()
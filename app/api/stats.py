@@ -0,0 +1,48 @@
+from datetime import datetime, timedelta
+
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.stats import (
+    read_daily_activity,
+    read_first_answer_latency,
+    read_stats_refreshed_at,
+    read_top_answerers,
+)
+from app.db.database import get_session
+from app.schemas.stats import DailyActivity, StatsResponse, TopAnswerer
+from app.services.stats import STATS_STALENESS_BOUND, STATS_TIMEZONE
+
+
+router = APIRouter(prefix="/stats", tags=["stats"])
+
+
+@router.get(
+    "",
+    response_model=StatsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="커뮤니티 통계 조회",
+    description="일별 질문/답변 수, 답변 상위 사용자, 첫 답변까지 걸린 시간의 중앙값을 조회합니다. "
+    "백그라운드에서 증분 집계된 값이며 staleness_bound_seconds 만큼 늦을 수 있습니다. "
+    "삭제된 글도 작성 시점 기준으로 집계에 남습니다.",
+)
+async def get_stats_handler(
+    days: int = Query(default=30, ge=1, le=365, description="조회할 일수"),
+    top: int = Query(default=10, ge=1, le=100, description="상위 답변자 수"),
+    db: AsyncSession = Depends(get_session),
+) -> StatsResponse:
+    since = datetime.now(STATS_TIMEZONE).date() - timedelta(days=days - 1)
+
+    daily = await read_daily_activity(db, since)
+    top_answerers = await read_top_answerers(db, top)
+    median, answered = await read_first_answer_latency(db)
+    refreshed_at = await read_stats_refreshed_at(db)
+
+    return StatsResponse(
+        daily=[DailyActivity.model_validate(d) for d in daily],
+        top_answerers=[TopAnswerer.model_validate(a) for a in top_answerers],
+        median_first_answer_seconds=median,
+        answered_question_count=answered,
+        refreshed_at=refreshed_at,
+        staleness_bound_seconds=STATS_STALENESS_BOUND.total_seconds(),
+    )
@@ -0,0 +1,37 @@
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.trending import read_trending_questions
+from app.db.database import get_session
+from app.schemas.trending import TrendingQuestionItem
+from app.services.trending import TRENDING_HALF_LIFE
+
+
+# /questions/{question_id} 보다 먼저 등록되어야 함
+router = APIRouter(prefix="/questions/trending", tags=["questions"])
+
+
+@router.get(
+    "",
+    response_model=list[TrendingQuestionItem],
+    status_code=status.HTTP_200_OK,
+    summary="인기 질문 조회",
+    description="최근 답변 활동을 시간 감쇠로 가중한 점수 순으로 질문을 조회합니다. "
+    "점수는 백그라운드에서 주기적으로 갱신됩니다.",
+)
+async def list_trending_questions_handler(
+    limit: int = Query(default=20, ge=1, le=100, description="가져올 최대 개수"),
+    db: AsyncSession = Depends(get_session),
+) -> list[TrendingQuestionItem]:
+    rows = await read_trending_questions(db, TRENDING_HALF_LIFE, limit)
+    return [
+        TrendingQuestionItem(
+            id=row.id,
+            title=row.title,
+            author_nickname=row.author_nickname,
+            score=score,
+            answer_count=row.answer_count,
+            last_answer_at=row.last_answer_at,
+        )
+        for row, score in rows
+    ]
@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -12,12 +13,95 @@ class Settings(BaseSettings):
     postgres_host: str = Field(default="localhost", alias="POSTGRES_HOST")
     postgres_port: int = Field(default=5432, alias="POSTGRES_PORT")
 
+    # postgres 또는 memory. memory는 DB 없이 질문/답변 API만 프로세스 메모리로 동작
+    storage_backend: Literal["postgres", "memory"] = Field(
+        default="postgres", alias="STORAGE_BACKEND"
+    )
+
+    # 라우트별로 app.db.limits.query_limits로 바꿀 수 있음
+    db_statement_timeout: float = Field(default=5.0, alias="DB_STATEMENT_TIMEOUT")
+    db_statement_budget: int = Field(default=30, alias="DB_STATEMENT_BUDGET")
+
+    # 기준보다 오래 걸린 쿼리는 모두, 나머지는 표본 비율만큼 NDJSON 파일에 기록
+    slow_query_threshold_ms: float = Field(default=200.0, alias="SLOW_QUERY_THRESHOLD_MS")
+    slow_query_sample_rate: float = Field(default=0.01, alias="SLOW_QUERY_SAMPLE_RATE")
+    slow_query_log_path: str = Field(
+        default="logs/slow_queries.ndjson", alias="SLOW_QUERY_LOG_PATH"
+    )
+    slow_query_log_max_bytes: int = Field(
+        default=10 * 1024 * 1024, alias="SLOW_QUERY_LOG_MAX_BYTES"
+    )
+    slow_query_log_backups: int = Field(default=5, alias="SLOW_QUERY_LOG_BACKUPS")
+
+    # X-Profile 헤더(관리자 토큰 필요)가 붙은 요청과 표본 비율만큼의 요청을 cProfile로 기록
+    profile_sample_rate: float = Field(default=0.0, alias="PROFILE_SAMPLE_RATE")
+    profile_dir: str = Field(default="profiles", alias="PROFILE_DIR")
+    profile_max_files: int = Field(default=50, alias="PROFILE_MAX_FILES")
+
+    loop_lag_interval: float = Field(default=0.5, alias="LOOP_LAG_INTERVAL")
+    # 켜면 감시 스레드가 이 시간 넘게 루프를 붙잡은 코드의 스택을 로그로 남김
+    loop_watchdog: bool = Field(default=False, alias="LOOP_WATCHDOG")
+    loop_block_threshold: float = Field(default=0.1, alias="LOOP_BLOCK_THRESHOLD")
+
     secret_key: str = Field(..., alias="SECRET_KEY")
     algorithm: str = Field(default="HS256", alias="ALGORITHM")
     access_token_expire_minutes: int = Field(default=30, alias="ACCESS_TOKEN_EXPIRE_MINUTES")
 
     debug: bool = Field(default=False, alias="DEBUG")
     environment: str = Field(default="development", alias="ENVIRONMENT")
+    admin_token: str | None = Field(default=None, alias="ADMIN_TOKEN")
+
+    view_count_flush_interval: float = Field(default=10.0, alias="VIEW_COUNT_FLUSH_INTERVAL")
+    view_count_max_pending: int = Field(default=1000, alias="VIEW_COUNT_MAX_PENDING")
+
+    trending_refresh_interval: float = Field(default=60.0, alias="TRENDING_REFRESH_INTERVAL")
+    trending_half_life_hours: float = Field(default=24.0, alias="TRENDING_HALF_LIFE_HOURS")
+    trending_batch_size: int = Field(default=5000, alias="TRENDING_BATCH_SIZE")
+
+    stats_refresh_interval: float = Field(default=300.0, alias="STATS_REFRESH_INTERVAL")
+    stats_batch_size: int = Field(default=5000, alias="STATS_BATCH_SIZE")
+    stats_timezone: str = Field(default="Asia/Seoul", alias="STATS_TIMEZONE")
+
+    answer_partition_months_ahead: int = Field(default=3, alias="ANSWER_PARTITION_MONTHS_AHEAD")
+    answer_partition_check_interval: float = Field(
+        default=6 * 3600.0, alias="ANSWER_PARTITION_CHECK_INTERVAL"
+    )
+
+    archive_after_days: int = Field(default=365, alias="ARCHIVE_AFTER_DAYS")
+    archive_batch_size: int = Field(default=200, alias="ARCHIVE_BATCH_SIZE")
+    archive_batch_pause: float = Field(default=1.0, alias="ARCHIVE_BATCH_PAUSE")
+    archive_max_batches_per_run: int = Field(default=50, alias="ARCHIVE_MAX_BATCHES_PER_RUN")
+    archive_interval: float = Field(default=3600.0, alias="ARCHIVE_INTERVAL")
+
+    analysis_workers: int = Field(default=2, alias="ANALYSIS_WORKERS")
+    discard_simulation_samples: int = Field(default=2000, alias="DISCARD_SIMULATION_SAMPLES")
+    discard_simulation_max_samples: int = Field(
+        default=20000, alias="DISCARD_SIMULATION_MAX_SAMPLES"
+    )
+    discard_simulation_deadline: float = Field(default=5.0, alias="DISCARD_SIMULATION_DEADLINE")
+
+    duplicate_threshold: float = Field(default=0.5, alias="DUPLICATE_THRESHOLD")
+    related_cache_ttl: float = Field(default=300.0, alias="RELATED_CACHE_TTL")
+    related_rebuild_interval: float = Field(default=30.0, alias="RELATED_REBUILD_INTERVAL")
+
+    # 기본 필드로 조회한 질문 목록 앞쪽 페이지의 응답 캐시. 항목 수가 0이면 끔
+    question_list_cache_entries: int = Field(default=64, alias="QUESTION_LIST_CACHE_ENTRIES")
+    question_list_cache_max_page: int = Field(default=3, alias="QUESTION_LIST_CACHE_MAX_PAGE")
+    question_list_cache_max_bytes: int = Field(
+        default=4 * 1024 * 1024, alias="QUESTION_LIST_CACHE_MAX_BYTES"
+    )
+    question_list_cache_ttl: float = Field(default=30.0, alias="QUESTION_LIST_CACHE_TTL")
+
+    answer_stream_heartbeat: float = Field(default=15.0, alias="ANSWER_STREAM_HEARTBEAT")
+    answer_stream_queue_size: int = Field(default=100, alias="ANSWER_STREAM_QUEUE_SIZE")
+
+    job_worker_concurrency: int = Field(default=4, alias="JOB_WORKER_CONCURRENCY")
+    job_batch_size: int = Field(default=10, alias="JOB_BATCH_SIZE")
+    job_poll_interval: float = Field(default=1.0, alias="JOB_POLL_INTERVAL")
+    job_retry_base_delay: float = Field(default=5.0, alias="JOB_RETRY_BASE_DELAY")
+    job_retry_max_delay: float = Field(default=600.0, alias="JOB_RETRY_MAX_DELAY")
+    job_stale_after: float = Field(default=600.0, alias="JOB_STALE_AFTER")
+    job_retention_days: int = Field(default=7, alias="JOB_RETENTION_DAYS")
 
     model_config = SettingsConfigDict(
         env_file=".env",
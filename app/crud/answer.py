@@ -1,8 +1,32 @@
-from sqlalchemy import func, select
+import json
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import Integer, any_, bindparam, func, select, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.crud.archive import read_archived_answer_by_id
+from app.crud.watermark import ANSWER_DELTA_CONSUMERS, add_deltas
 from app.models.answer import Answer
+from app.models.archive import ArchivedAnswer
 from app.schemas.answer import AnswerCreate, AnswerUpdate
+from app.util.columns import only_columns
+
+
+# 답변이 바뀌면 이 채널로 NOTIFY. 트랜잭션이 커밋될 때만 전달됨
+ANSWER_EVENTS_CHANNEL = "answer_events"
+
+
+async def notify_answer_event(
+    db: AsyncSession,
+    event: str,
+    question_id: int,
+    answer_id: int,
+) -> None:
+    # 답변 본문은 NOTIFY 페이로드 한도(8000바이트)를 넘을 수 있어 ID만 보냄
+    payload = json.dumps({"event": event, "question_id": question_id, "answer_id": answer_id})
+    await db.execute(select(func.pg_notify(ANSWER_EVENTS_CHANNEL, payload)))
 
 
 async def create_answer(
@@ -16,13 +40,51 @@ async def create_answer(
     answer = Answer(**answer_dict)
     db.add(answer)
     await db.flush()
+    await add_deltas(db, ANSWER_DELTA_CONSUMERS, answer.id)
+    await notify_answer_event(db, "created", question_id, answer.id)
     await db.refresh(answer)
     return answer
 
 
-async def read_answer_by_id(db: AsyncSession, answer_id: int) -> Answer | None:
-    result = await db.execute(select(Answer).where(Answer.id == answer_id))
-    return result.scalar_one_or_none()
+async def read_answer_by_id(
+    db: AsyncSession,
+    answer_id: int,
+    created_after: datetime | None = None,
+) -> Answer | ArchivedAnswer | None:
+    # 답변 ID만으로는 어느 월 파티션인지 알 수 없어 모든 파티션의 ID 인덱스를 뒤짐.
+    # 답변은 질문보다 늦게 달리므로 질문 작성 시각을 하한으로 주면 그 이전 파티션은 건너뜀
+    query = select(Answer).where(Answer.id == answer_id)
+    if created_after is not None:
+        query = query.where(Answer.created_at >= created_after)
+    result = await db.execute(query)
+    answer = result.scalar_one_or_none()
+    if answer is None:
+        return await read_archived_answer_by_id(db, answer_id)
+    return answer
+
+
+async def read_answers_by_ids(
+    db: AsyncSession,
+    answer_ids: Sequence[int],
+) -> dict[int, Answer | ArchivedAnswer]:
+    if not answer_ids:
+        return {}
+    result = await db.execute(
+        select(Answer).where(
+            Answer.id == any_(bindparam("ids", list(answer_ids), type_=ARRAY(Integer)))
+        )
+    )
+    answers = {answer.id: answer for answer in result.scalars()}
+
+    missing = [answer_id for answer_id in answer_ids if answer_id not in answers]
+    if missing:
+        result = await db.execute(
+            select(ArchivedAnswer).where(
+                ArchivedAnswer.id == any_(bindparam("ids", missing, type_=ARRAY(Integer)))
+            )
+        )
+        answers.update({answer.id: answer for answer in result.scalars()})
+    return answers
 
 
 async def read_answers_by_question_id(
@@ -30,29 +92,50 @@ async def read_answers_by_question_id(
     question_id: int,
     skip: int = 0,
     limit: int = 100,
+    columns: Sequence[str] | None = None,
+    question_created_at: datetime | None = None,
 ) -> tuple[list[Answer], int]:
-    count_query = select(func.count()).select_from(Answer).where(Answer.question_id == question_id)
+    # 질문 작성 시각을 바인드 파라미터로 받아 하한으로 두면 그 이전 월 파티션은 계획
+    # 단계에서 빠짐. 서브쿼리로 읽으면 실행 시점 가지치기만 되고 조회가 한 번 더 붙음
+    condition = Answer.question_id == question_id
+    if question_created_at is not None:
+        condition = condition & (Answer.created_at >= question_created_at)
+
+    count_query = select(func.count()).select_from(Answer).where(condition)
     total = await db.scalar(count_query)
 
     query = (
-        select(Answer)
-        .where(Answer.question_id == question_id)
-        .order_by(Answer.created_at.desc())
-        .offset(skip)
-        .limit(limit)
+        select(Answer).where(condition).order_by(Answer.created_at.desc()).offset(skip).limit(limit)
     )
-    result = await db.execute(query)
+    result = await db.execute(only_columns(query, Answer, columns))
     answers = result.scalars().all()
 
     return list(answers), total or 0
 
 
+async def read_answers_by_author(
+    db: AsyncSession,
+    author_nickname: str,
+    limit: int = 20,
+    after: tuple[datetime, int] | None = None,
+    columns: Sequence[str] | None = None,
+) -> list[Answer]:
+    query = select(Answer).where(Answer.author_nickname == author_nickname)
+    if after is not None:
+        query = query.where(tuple_(Answer.created_at, Answer.id) < after)
+
+    query = query.order_by(Answer.created_at.desc(), Answer.id.desc()).limit(limit)
+    result = await db.execute(only_columns(query, Answer, columns))
+    return list(result.scalars().all())
+
+
 async def update_answer(
     db: AsyncSession,
     answer_id: int,
     answer_in: AnswerUpdate,
-) -> Answer | None:
-    answer = await read_answer_by_id(db, answer_id)
+    created_after: datetime | None = None,
+) -> Answer | ArchivedAnswer | None:
+    answer = await read_answer_by_id(db, answer_id, created_after)
     if answer is None:
         return None
 
@@ -62,15 +145,21 @@ async def update_answer(
         setattr(answer, field, value)
 
     await db.flush()
+    await notify_answer_event(db, "updated", answer.question_id, answer.id)
     await db.refresh(answer)
     return answer
 
 
-async def delete_answer(db: AsyncSession, answer_id: int) -> bool:
-    answer = await read_answer_by_id(db, answer_id)
+async def delete_answer(
+    db: AsyncSession,
+    answer_id: int,
+    created_after: datetime | None = None,
+) -> bool:
+    answer = await read_answer_by_id(db, answer_id, created_after)
     if answer is None:
         return False
 
     await db.delete(answer)
     await db.flush()
+    await notify_answer_event(db, "deleted", answer.question_id, answer_id)
     return True
@@ -0,0 +1,153 @@
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import delete, exists, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.hand import sync_question_hands
+from app.models.answer import Answer
+from app.models.archive import ArchivedAnswer, ArchivedQuestion
+from app.models.question import Question
+from app.models.question_view import QuestionViewCount
+from app.util.columns import only_columns
+
+
+QUESTION_COLUMNS = ["id", "title", "content", "author_nickname", "created_at", "updated_at"]
+ANSWER_COLUMNS = ["id", "question_id", "content", "author_nickname", "created_at", "updated_at"]
+
+
+async def archive_questions(
+    db: AsyncSession,
+    cutoff: datetime,
+    batch_size: int = 200,
+) -> list[int]:
+    # cutoff 이후로 답변도, 조회도 없었던 질문만 보관 대상
+    recently_answered = exists().where(
+        Answer.question_id == Question.id,
+        Answer.created_at >= cutoff,
+    )
+    recently_viewed = exists().where(
+        QuestionViewCount.question_id == Question.id,
+        QuestionViewCount.updated_at >= cutoff,
+    )
+    candidates = (
+        select(Question.id)
+        .where(Question.created_at < cutoff, ~recently_answered, ~recently_viewed)
+        .order_by(Question.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    question_ids = list((await db.execute(candidates)).scalars().all())
+    if not question_ids:
+        return []
+
+    await db.execute(
+        insert(ArchivedQuestion).from_select(
+            [*QUESTION_COLUMNS, "view_count", "archived_at"],
+            select(
+                *(getattr(Question, column) for column in QUESTION_COLUMNS),
+                func.coalesce(QuestionViewCount.view_count, 0),
+                func.now(),
+            )
+            .outerjoin(QuestionViewCount, QuestionViewCount.question_id == Question.id)
+            .where(Question.id.in_(question_ids)),
+        )
+    )
+    await db.execute(
+        insert(ArchivedAnswer).from_select(
+            ANSWER_COLUMNS,
+            select(*(getattr(Answer, column) for column in ANSWER_COLUMNS)).where(
+                Answer.question_id.in_(question_ids)
+            ),
+        )
+    )
+
+    # 답변과 조회수 등 질문에 딸린 행은 FK CASCADE로 함께 삭제됨
+    await db.execute(delete(Question).where(Question.id.in_(question_ids)))
+    return question_ids
+
+
+async def restore_question(db: AsyncSession, question_id: int) -> Question | None:
+    # 같은 질문을 동시에 되살리면 먼저 잠근 쪽만 옮기고, 기다린 쪽은 잠금이 풀린 뒤
+    # 보관 행이 사라진 것을 보고 이미 옮겨진 질문을 읽음
+    result = await db.execute(
+        select(ArchivedQuestion)
+        .where(ArchivedQuestion.id == question_id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+    archived = result.scalar_one_or_none()
+    if archived is None:
+        result = await db.execute(select(Question).where(Question.id == question_id))
+        return result.scalar_one_or_none()
+
+    await db.execute(
+        insert(Question).from_select(
+            QUESTION_COLUMNS,
+            select(*(getattr(ArchivedQuestion, column) for column in QUESTION_COLUMNS)).where(
+                ArchivedQuestion.id == question_id
+            ),
+        )
+    )
+    if archived.view_count:
+        await db.execute(
+            insert(QuestionViewCount).values(
+                question_id=question_id, view_count=archived.view_count
+            )
+        )
+    # 보관 전에 이미 집계에 반영된 답변이므로 delta는 남기지 않음
+    await db.execute(
+        insert(Answer).from_select(
+            ANSWER_COLUMNS,
+            select(*(getattr(ArchivedAnswer, column) for column in ANSWER_COLUMNS)).where(
+                ArchivedAnswer.question_id == question_id
+            ),
+        )
+    )
+    # 보관할 때 CASCADE로 지워진 손패 색인을 다시 만듦
+    await sync_question_hands(db, question_id, archived.content)
+    await db.delete(archived)
+    await db.flush()
+
+    result = await db.execute(select(Question).where(Question.id == question_id))
+    return result.scalar_one()
+
+
+async def read_archived_question_by_id(
+    db: AsyncSession,
+    question_id: int,
+) -> ArchivedQuestion | None:
+    result = await db.execute(select(ArchivedQuestion).where(ArchivedQuestion.id == question_id))
+    return result.scalar_one_or_none()
+
+
+async def read_archived_answer_by_id(db: AsyncSession, answer_id: int) -> ArchivedAnswer | None:
+    result = await db.execute(select(ArchivedAnswer).where(ArchivedAnswer.id == answer_id))
+    return result.scalar_one_or_none()
+
+
+async def read_archived_answers_by_question_id(
+    db: AsyncSession,
+    question_id: int,
+    skip: int = 0,
+    limit: int = 100,
+    columns: Sequence[str] | None = None,
+) -> tuple[list[ArchivedAnswer], int]:
+    count_query = (
+        select(func.count())
+        .select_from(ArchivedAnswer)
+        .where(ArchivedAnswer.question_id == question_id)
+    )
+    total = await db.scalar(count_query)
+
+    query = (
+        select(ArchivedAnswer)
+        .where(ArchivedAnswer.question_id == question_id)
+        .order_by(ArchivedAnswer.created_at.desc())
+        .offset(skip)
+        .limit(limit)
+    )
+    result = await db.execute(only_columns(query, ArchivedAnswer, columns))
+    answers = result.scalars().all()
+
+    return list(answers), total or 0
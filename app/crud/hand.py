@@ -0,0 +1,82 @@
+from collections.abc import Sequence
+
+from sqlalchemy import Integer, String, any_, bindparam, delete, func, insert, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.hand import QuestionHand
+from app.models.question import Question
+from app.services.tiles import (
+    canonical_key,
+    encode_tiles,
+    extract_hands,
+    format_hand,
+    similar_hand_keys,
+    tile_counts,
+)
+
+
+async def sync_question_hands(db: AsyncSession, question_id: int, content: str) -> None:
+    await db.execute(delete(QuestionHand).where(QuestionHand.question_id == question_id))
+
+    hands = extract_hands(content)
+    if not hands:
+        return
+
+    await db.execute(
+        insert(QuestionHand),
+        [
+            {
+                "question_id": question_id,
+                "notation": format_hand(hand),
+                "tiles": encode_tiles(hand),
+                "counts": tile_counts(hand),
+                "canonical_key": canonical_key(tile_counts(hand)),
+            }
+            for hand in hands
+        ],
+    )
+
+
+def contains_tiles(tiles: Sequence[int]):
+    # 질문의 손패 중 하나라도 주어진 패를 모두 포함하면 매치
+    return QuestionHand.tiles.contains(encode_tiles(list(tiles)))
+
+
+async def read_similar_hand_questions(
+    db: AsyncSession,
+    question_id: int,
+    hands: list[tuple[int, ...]],
+    limit: int = 20,
+) -> list[tuple[Question, str, int]]:
+    """같은 모양(거리 0)이거나 한 장 차이(거리 1)인 손패가 있는 다른 질문"""
+    exact, nearby = similar_hand_keys(hands)
+    if not exact:
+        return []
+
+    distance = QuestionHand.canonical_key.not_in(exact).cast(Integer)
+    ranked = (
+        select(
+            QuestionHand.question_id,
+            QuestionHand.notation,
+            distance.label("distance"),
+            func.row_number()
+            .over(partition_by=QuestionHand.question_id, order_by=(distance, QuestionHand.id))
+            .label("rank"),
+        )
+        .where(
+            QuestionHand.canonical_key
+            == any_(bindparam("nearby_keys", sorted(nearby), type_=ARRAY(String))),
+            QuestionHand.question_id != question_id,
+        )
+        .subquery()
+    )
+    query = (
+        select(Question, ranked.c.notation, ranked.c.distance)
+        .join(ranked, ranked.c.question_id == Question.id)
+        .where(ranked.c.rank == 1)
+        .order_by(ranked.c.distance, Question.created_at.desc())
+        .limit(limit)
+    )
+    result = await db.execute(query)
+    return [(question, notation, distance) for question, notation, distance in result.all()]
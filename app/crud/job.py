@@ -0,0 +1,113 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.job import Job
+
+
+async def enqueue_job(
+    db: AsyncSession,
+    kind: str,
+    payload: dict | None = None,
+    run_at: datetime | None = None,
+    max_attempts: int = 5,
+) -> Job:
+    """호출한 쪽의 트랜잭션 안에서 작업을 추가. 커밋되어야 워커에게 보임"""
+    job = Job(kind=kind, payload=payload or {}, max_attempts=max_attempts)
+    if run_at is not None:
+        job.run_at = run_at
+    db.add(job)
+    await db.flush()
+    return job
+
+
+async def claim_jobs(db: AsyncSession, limit: int) -> list[Job]:
+    # 다른 워커가 잡고 있는 행은 건너뛰어서 워커끼리 서로 기다리지 않음
+    claimable = (
+        select(Job.id)
+        .where(Job.status == "pending", Job.run_at <= func.now())
+        .order_by(Job.run_at, Job.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    result = await db.execute(
+        update(Job)
+        .where(Job.id.in_(claimable.scalar_subquery()))
+        .values(status="running", locked_at=func.now(), attempts=Job.attempts + 1)
+        .returning(Job)
+        .execution_options(populate_existing=True)
+    )
+    return sorted(result.scalars().all(), key=lambda job: (job.run_at, job.id))
+
+
+def _claimed(job_id: int, attempts: int):
+    # 멈춘 것으로 보고 다시 대기열에 넣었거나 다른 워커가 다시 가져간 작업이면 맞지 않음
+    return (Job.id == job_id, Job.status == "running", Job.attempts == attempts)
+
+
+async def touch_job(db: AsyncSession, job_id: int, attempts: int) -> bool:
+    """실행 중인 작업의 locked_at을 갱신. 이미 잡고 있지 않은 작업이면 False"""
+    result = await db.execute(
+        update(Job).where(*_claimed(job_id, attempts)).values(locked_at=func.now())
+    )
+    return result.rowcount > 0
+
+
+async def complete_job(db: AsyncSession, job_id: int, attempts: int) -> bool:
+    result = await db.execute(
+        update(Job)
+        .where(*_claimed(job_id, attempts))
+        .values(status="done", locked_at=None, finished_at=func.now(), last_error=None)
+    )
+    return result.rowcount > 0
+
+
+async def fail_job(
+    db: AsyncSession,
+    job_id: int,
+    attempts: int,
+    error: str,
+    retry_after: timedelta | None,
+) -> bool:
+    """retry_after가 있으면 그만큼 뒤에 다시 실행하고, 없으면 failed로 끝냄"""
+    if retry_after is None:
+        values = {"status": "failed", "finished_at": func.now()}
+    else:
+        values = {"status": "pending", "run_at": func.now() + retry_after}
+    result = await db.execute(
+        update(Job)
+        .where(*_claimed(job_id, attempts))
+        .values(locked_at=None, last_error=error, **values)
+    )
+    return result.rowcount > 0
+
+
+async def requeue_stale_jobs(db: AsyncSession, locked_before: datetime) -> int:
+    # 실행 중인 워커는 locked_at을 계속 갱신하므로, 오래 갱신되지 않은 작업은 워커
+    # 프로세스가 죽은 것으로 보고 다시 pending으로 돌림
+    result = await db.execute(
+        update(Job)
+        .where(Job.status == "running", Job.locked_at < locked_before)
+        .values(status="pending", locked_at=None, run_at=func.now())
+    )
+    return result.rowcount
+
+
+async def delete_finished_jobs(db: AsyncSession, finished_before: datetime) -> int:
+    result = await db.execute(
+        delete(Job).where(Job.status == "done", Job.finished_at < finished_before)
+    )
+    return result.rowcount
+
+
+async def read_job_queue_stats(db: AsyncSession) -> list[tuple[str, str, int, datetime | None]]:
+    """(종류, 상태, 개수, 실행 가능한 가장 오래된 pending의 run_at)"""
+    oldest_ready = func.min(Job.run_at).filter(Job.status == "pending", Job.run_at <= func.now())
+    result = await db.execute(
+        select(Job.kind, Job.status, func.count(), oldest_ready)
+        .where(Job.status.in_(("pending", "running", "failed")))
+        .group_by(Job.kind, Job.status)
+        .order_by(Job.kind, Job.status)
+    )
+    return [tuple(row) for row in result.all()]
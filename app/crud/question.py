@@ -1,8 +1,18 @@
-from sqlalchemy import func, select
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+
+from sqlalchemy import Integer, any_, bindparam, exists, func, select, tuple_, union_all
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.crud.archive import read_archived_question_by_id, restore_question
+from app.crud.hand import contains_tiles, sync_question_hands
+from app.crud.watermark import QUESTION_DELTA_CONSUMERS, add_deltas
+from app.models.archive import ArchivedQuestion
+from app.models.hand import QuestionHand
 from app.models.question import Question
 from app.schemas.question import QuestionCreate, QuestionUpdate
+from app.util.columns import only_columns
 
 
 async def create_question(db: AsyncSession, question_in: QuestionCreate) -> Question:
@@ -10,30 +20,94 @@ async def create_question(db: AsyncSession, question_in: QuestionCreate) -> Ques
     question = Question(**question_dict)
     db.add(question)
     await db.flush()
+    await add_deltas(db, QUESTION_DELTA_CONSUMERS, question.id)
+    await sync_question_hands(db, question.id, question.content)
     await db.refresh(question)
     return question
 
 
-async def read_question_by_id(db: AsyncSession, question_id: int) -> Question | None:
+async def read_question_by_id(
+    db: AsyncSession,
+    question_id: int,
+) -> Question | ArchivedQuestion | None:
     result = await db.execute(select(Question).where(Question.id == question_id))
-    return result.scalar_one_or_none()
+    question = result.scalar_one_or_none()
+    if question is None:
+        # 보관된 질문도 ID로는 그대로 조회됨
+        return await read_archived_question_by_id(db, question_id)
+    return question
+
+
+async def read_questions_by_ids(
+    db: AsyncSession,
+    question_ids: Sequence[int],
+) -> dict[int, Question | ArchivedQuestion]:
+    if not question_ids:
+        return {}
+    # IN 목록 대신 배열 파라미터 하나로 보내서 ID 개수와 상관없이 같은 SQL이 되도록 함
+    result = await db.execute(
+        select(Question).where(
+            Question.id == any_(bindparam("ids", list(question_ids), type_=ARRAY(Integer)))
+        )
+    )
+    questions = {question.id: question for question in result.scalars()}
+
+    missing = [question_id for question_id in question_ids if question_id not in questions]
+    if missing:
+        result = await db.execute(
+            select(ArchivedQuestion).where(
+                ArchivedQuestion.id == any_(bindparam("ids", missing, type_=ARRAY(Integer)))
+            )
+        )
+        questions.update({question.id: question for question in result.scalars()})
+    return questions
 
 
 async def read_questions(
     db: AsyncSession,
     skip: int = 0,
     limit: int = 10,
+    tiles: Sequence[int] | None = None,
+    columns: Sequence[str] | None = None,
 ) -> tuple[list[Question], int]:
-    count_query = select(func.count()).select_from(Question)
+    conditions = []
+    if tiles:
+        conditions.append(
+            exists().where(QuestionHand.question_id == Question.id, contains_tiles(tiles))
+        )
+
+    count_query = select(func.count()).select_from(Question).where(*conditions)
     total = await db.scalar(count_query)
 
-    query = select(Question).order_by(Question.created_at.desc()).offset(skip).limit(limit)
-    result = await db.execute(query)
+    query = (
+        select(Question)
+        .where(*conditions)
+        .order_by(Question.created_at.desc())
+        .offset(skip)
+        .limit(limit)
+    )
+    result = await db.execute(only_columns(query, Question, columns))
     questions = result.scalars().all()
 
     return list(questions), total or 0
 
 
+async def read_questions_by_author(
+    db: AsyncSession,
+    author_nickname: str,
+    limit: int = 20,
+    after: tuple[datetime, int] | None = None,
+    columns: Sequence[str] | None = None,
+) -> list[Question]:
+    query = select(Question).where(Question.author_nickname == author_nickname)
+    if after is not None:
+        query = query.where(tuple_(Question.created_at, Question.id) < after)
+
+    query = query.order_by(Question.created_at.desc(), Question.id.desc()).limit(limit)
+    result = await db.execute(only_columns(query, Question, columns))
+    return list(result.scalars().all())
+
+
 async def update_question(
     db: AsyncSession,
     question_id: int,
@@ -43,12 +117,18 @@ async def update_question(
     if question is None:
         return None
 
+    # 보관된 질문이 수정되면 다시 활성 테이블로 옮김
+    if isinstance(question, ArchivedQuestion):
+        question = await restore_question(db, question_id)
+
     update_data = question_in.model_dump(exclude_unset=True)
 
     for field, value in update_data.items():
         setattr(question, field, value)
 
     await db.flush()
+    if "content" in update_data:
+        await sync_question_hands(db, question.id, question.content)
     await db.refresh(question)
     return question
 
@@ -61,3 +141,17 @@ async def delete_question(db: AsyncSession, question_id: int) -> bool:
     await db.delete(question)
     await db.flush()
     return True
+
+
+async def stream_question_texts(
+    db: AsyncSession,
+    batch_size: int = 1000,
+) -> AsyncIterator[tuple[int, str, str]]:
+    """메모리 색인을 만들 때 쓰는 (ID, 제목, 본문). 보관된 질문도 ID로 조회되므로 포함"""
+    query = union_all(
+        select(Question.id, Question.title, Question.content),
+        select(ArchivedQuestion.id, ArchivedQuestion.title, ArchivedQuestion.content),
+    )
+    result = await db.stream(query.execution_options(yield_per=batch_size))
+    async for question_id, title, content in result:
+        yield question_id, title, content
@@ -0,0 +1,233 @@
+import math
+from collections import Counter
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import Integer, any_, bindparam, func, select
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.watermark import (
+    ANSWER_STATS_WATERMARK,
+    QUESTION_STATS_WATERMARK,
+    lock_watermark,
+    set_watermark,
+    take_deltas,
+)
+from app.models.answer import Answer
+from app.models.question import Question
+from app.models.stats import (
+    AuthorAnswerStat,
+    DailyActivityStat,
+    FirstAnswerLatencyBucket,
+    QuestionFirstAnswer,
+)
+from app.models.watermark import AggregateWatermark
+
+
+# 첫 답변까지 걸린 시간은 2배 구간을 4등분한 로그 구간으로 집계 (구간 폭 약 19%)
+LATENCY_BUCKETS_PER_OCTAVE = 4
+
+
+def latency_bucket(seconds: float) -> int:
+    return int(math.log2(max(seconds, 0.0) + 1) * LATENCY_BUCKETS_PER_OCTAVE)
+
+
+def bucket_midpoint(bucket: int) -> float:
+    return 2 ** ((bucket + 0.5) / LATENCY_BUCKETS_PER_OCTAVE) - 1
+
+
+async def _add_daily_counts(db: AsyncSession, field: str, counts: Counter[date]) -> None:
+    if not counts:
+        return
+
+    stmt = insert(DailyActivityStat).values(
+        [{"day": day, field: count} for day, count in sorted(counts.items())]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[DailyActivityStat.day],
+        set_={
+            field: getattr(DailyActivityStat, field) + getattr(stmt.excluded, field),
+            "updated_at": func.now(),
+        },
+    )
+    await db.execute(stmt)
+
+
+async def _add_author_counts(db: AsyncSession, counts: Counter[str]) -> None:
+    if not counts:
+        return
+
+    stmt = insert(AuthorAnswerStat).values(
+        [
+            {"author_nickname": author, "answer_count": count}
+            for author, count in sorted(counts.items())
+        ]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[AuthorAnswerStat.author_nickname],
+        set_={
+            "answer_count": AuthorAnswerStat.answer_count + stmt.excluded.answer_count,
+            "updated_at": func.now(),
+        },
+    )
+    await db.execute(stmt)
+
+
+async def _add_first_answers(
+    db: AsyncSession,
+    first_answers: dict[int, tuple[datetime, float]],
+) -> None:
+    if not first_answers:
+        return
+
+    # 이미 첫 답변이 기록된 질문은 건너뛰고, 새로 기록된 질문만 분포에 더함
+    stmt = (
+        insert(QuestionFirstAnswer)
+        .values(
+            [
+                {
+                    "question_id": question_id,
+                    "first_answered_at": answered_at,
+                    "latency_seconds": latency,
+                }
+                for question_id, (answered_at, latency) in sorted(first_answers.items())
+            ]
+        )
+        .on_conflict_do_nothing(index_elements=[QuestionFirstAnswer.question_id])
+        .returning(QuestionFirstAnswer.latency_seconds)
+    )
+    latencies = (await db.execute(stmt)).scalars().all()
+
+    buckets = Counter(latency_bucket(latency) for latency in latencies)
+    if not buckets:
+        return
+
+    bucket_stmt = insert(FirstAnswerLatencyBucket).values(
+        [{"bucket": bucket, "count": count} for bucket, count in sorted(buckets.items())]
+    )
+    bucket_stmt = bucket_stmt.on_conflict_do_update(
+        index_elements=[FirstAnswerLatencyBucket.bucket],
+        set_={
+            "count": FirstAnswerLatencyBucket.count + bucket_stmt.excluded.count,
+            "updated_at": func.now(),
+        },
+    )
+    await db.execute(bucket_stmt)
+
+
+async def refresh_question_stats(
+    db: AsyncSession,
+    tz: ZoneInfo,
+    batch_size: int = 5000,
+) -> int:
+    last_id = await lock_watermark(db, QUESTION_STATS_WATERMARK)
+
+    # ID 워터마크로 훑으면 늦게 커밋된 질문을 건너뛰므로 질문과 함께 커밋된 delta만 가져감
+    question_ids = await take_deltas(db, QUESTION_STATS_WATERMARK, batch_size)
+    if not question_ids:
+        # 새 데이터가 없어도 갱신 시각은 남겨서 staleness를 판단할 수 있게 함
+        await set_watermark(db, QUESTION_STATS_WATERMARK, last_id)
+        return 0
+
+    query = select(Question.id, Question.created_at).where(
+        Question.id == any_(bindparam("ids", question_ids, type_=ARRAY(Integer)))
+    )
+    rows = (await db.execute(query)).all()
+
+    await _add_daily_counts(
+        db, "question_count", Counter(row.created_at.astimezone(tz).date() for row in rows)
+    )
+    await set_watermark(db, QUESTION_STATS_WATERMARK, max(last_id, *question_ids))
+    return len(question_ids)
+
+
+async def refresh_answer_stats(
+    db: AsyncSession,
+    tz: ZoneInfo,
+    batch_size: int = 5000,
+) -> int:
+    last_id = await lock_watermark(db, ANSWER_STATS_WATERMARK)
+
+    answer_ids = await take_deltas(db, ANSWER_STATS_WATERMARK, batch_size)
+    if not answer_ids:
+        await set_watermark(db, ANSWER_STATS_WATERMARK, last_id)
+        return 0
+
+    # 그 사이 지워진 답변은 빠짐
+    query = (
+        select(
+            Answer.id,
+            Answer.question_id,
+            Answer.author_nickname,
+            Answer.created_at,
+            Question.created_at.label("question_created_at"),
+        )
+        .join(Question, Question.id == Answer.question_id)
+        .where(Answer.id == any_(bindparam("ids", answer_ids, type_=ARRAY(Integer))))
+    )
+    rows = (await db.execute(query)).all()
+
+    first_answers: dict[int, tuple[datetime, float]] = {}
+    for row in rows:
+        current = first_answers.get(row.question_id)
+        if current is None or row.created_at < current[0]:
+            latency = (row.created_at - row.question_created_at).total_seconds()
+            first_answers[row.question_id] = (row.created_at, latency)
+
+    await _add_daily_counts(
+        db, "answer_count", Counter(row.created_at.astimezone(tz).date() for row in rows)
+    )
+    await _add_author_counts(db, Counter(row.author_nickname for row in rows))
+    await _add_first_answers(db, first_answers)
+    await set_watermark(db, ANSWER_STATS_WATERMARK, max(last_id, *answer_ids))
+    return len(answer_ids)
+
+
+async def read_daily_activity(db: AsyncSession, since: date) -> list[DailyActivityStat]:
+    result = await db.execute(
+        select(DailyActivityStat)
+        .where(DailyActivityStat.day >= since)
+        .order_by(DailyActivityStat.day)
+    )
+    return list(result.scalars().all())
+
+
+async def read_top_answerers(db: AsyncSession, limit: int = 10) -> list[AuthorAnswerStat]:
+    result = await db.execute(
+        select(AuthorAnswerStat)
+        .order_by(AuthorAnswerStat.answer_count.desc(), AuthorAnswerStat.author_nickname)
+        .limit(limit)
+    )
+    return list(result.scalars().all())
+
+
+async def read_first_answer_latency(db: AsyncSession) -> tuple[float | None, int]:
+    result = await db.execute(
+        select(FirstAnswerLatencyBucket.bucket, FirstAnswerLatencyBucket.count).order_by(
+            FirstAnswerLatencyBucket.bucket
+        )
+    )
+    buckets: list[Row] = list(result.all())
+
+    total = sum(row.count for row in buckets)
+    if total == 0:
+        return None, 0
+
+    # 중앙값이 속한 구간의 대표값을 반환하므로 오차는 구간 폭 이내
+    seen = 0
+    for row in buckets:
+        seen += row.count
+        if seen * 2 >= total:
+            return bucket_midpoint(row.bucket), total
+
+    return bucket_midpoint(buckets[-1].bucket), total
+
+
+async def read_stats_refreshed_at(db: AsyncSession) -> datetime | None:
+    return await db.scalar(
+        select(func.min(AggregateWatermark.updated_at)).where(
+            AggregateWatermark.name.in_([QUESTION_STATS_WATERMARK, ANSWER_STATS_WATERMARK])
+        )
+    )
@@ -0,0 +1,143 @@
+import math
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import (
+    DateTime,
+    Float,
+    Integer,
+    any_,
+    bindparam,
+    column,
+    delete,
+    func,
+    select,
+    values,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.watermark import TRENDING_WATERMARK, lock_watermark, set_watermark, take_deltas
+from app.models.answer import Answer
+from app.models.question import Question
+from app.models.trending import QuestionTrendingScore
+
+
+# 로그 점수의 기준 시각. 바꾸면 기존 점수를 모두 다시 계산해야 한다.
+SCORE_EPOCH = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def decay_rate(half_life: timedelta) -> float:
+    return math.log(2) / half_life.total_seconds()
+
+
+def log_weight(at: datetime, rate: float) -> float:
+    return rate * (at - SCORE_EPOCH).total_seconds()
+
+
+def log_sum_exp(weights: list[float]) -> float:
+    peak = max(weights)
+    return peak + math.log(sum(math.exp(w - peak) for w in weights))
+
+
+async def refresh_trending_scores(
+    db: AsyncSession,
+    half_life: timedelta,
+    batch_size: int = 5000,
+) -> int:
+    last_id = await lock_watermark(db, TRENDING_WATERMARK)
+    rate = decay_rate(half_life)
+
+    # ID 순서로 훑으면 늦게 커밋된 답변을 건너뛰므로 답변과 함께 커밋된 delta만 가져감
+    answer_ids = await take_deltas(db, TRENDING_WATERMARK, batch_size)
+    if not answer_ids:
+        return 0
+
+    # 그 사이 지워진 답변은 빠짐
+    query = select(Answer.id, Answer.question_id, Answer.created_at).where(
+        Answer.id == any_(bindparam("ids", answer_ids, type_=ARRAY(Integer)))
+    )
+    rows = (await db.execute(query)).all()
+
+    weights: dict[int, list[float]] = {}
+    latest: dict[int, datetime] = {}
+    for _, question_id, created_at in rows:
+        weights.setdefault(question_id, []).append(log_weight(created_at, rate))
+        latest[question_id] = max(latest.get(question_id, created_at), created_at)
+
+    source = values(
+        column("question_id", Integer),
+        column("log_score", Float),
+        column("answer_count", Integer),
+        column("last_answer_at", DateTime(timezone=True)),
+        name="deltas",
+    ).data(
+        [
+            (question_id, log_sum_exp(ws), len(ws), latest[question_id])
+            for question_id, ws in sorted(weights.items())
+        ]
+    )
+    select_query = select(
+        source.c.question_id,
+        source.c.log_score,
+        source.c.answer_count,
+        source.c.last_answer_at,
+    ).join(Question, Question.id == source.c.question_id)
+
+    stmt = insert(QuestionTrendingScore).from_select(
+        ["question_id", "log_score", "answer_count", "last_answer_at"], select_query
+    )
+    current, new = QuestionTrendingScore.log_score, stmt.excluded.log_score
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[QuestionTrendingScore.question_id],
+        set_={
+            # log(exp(a) + exp(b))를 오버플로 없이 계산
+            "log_score": func.greatest(current, new)
+            + func.ln(1 + func.exp(-func.abs(current - new))),
+            "answer_count": QuestionTrendingScore.answer_count + stmt.excluded.answer_count,
+            "last_answer_at": func.greatest(
+                QuestionTrendingScore.last_answer_at, stmt.excluded.last_answer_at
+            ),
+            "updated_at": func.now(),
+        },
+    )
+    if rows:
+        await db.execute(stmt)
+    await set_watermark(db, TRENDING_WATERMARK, max(last_id, *answer_ids))
+    return len(answer_ids)
+
+
+async def prune_trending_scores(
+    db: AsyncSession,
+    half_life: timedelta,
+    min_score: float = 0.01,
+) -> None:
+    rate = decay_rate(half_life)
+    threshold = log_weight(datetime.now(UTC), rate) + math.log(min_score)
+    await db.execute(
+        delete(QuestionTrendingScore).where(QuestionTrendingScore.log_score < threshold)
+    )
+
+
+async def read_trending_questions(
+    db: AsyncSession,
+    half_life: timedelta,
+    limit: int = 20,
+) -> list[tuple[Row, float]]:
+    query = (
+        select(
+            Question.id,
+            Question.title,
+            Question.author_nickname,
+            QuestionTrendingScore.log_score,
+            QuestionTrendingScore.answer_count,
+            QuestionTrendingScore.last_answer_at,
+        )
+        .join(Question, Question.id == QuestionTrendingScore.question_id)
+        .order_by(QuestionTrendingScore.log_score.desc())
+        .limit(limit)
+    )
+    rows = (await db.execute(query)).all()
+
+    now_weight = log_weight(datetime.now(UTC), decay_rate(half_life))
+    return [(row, math.exp(row.log_score - now_weight)) for row in rows]
@@ -0,0 +1,42 @@
+from sqlalchemy import BigInteger, Integer, column, func, select, update, values
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.archive import ArchivedQuestion
+from app.models.question import Question
+from app.models.question_view import QuestionViewCount
+
+
+async def add_view_counts(db: AsyncSession, deltas: dict[int, int]) -> None:
+    if not deltas:
+        return
+
+    # 여러 프로세스가 같은 행을 다른 순서로 잠그지 않도록 question_id 순으로 정렬
+    rows = sorted(deltas.items())
+    source = values(
+        column("question_id", Integer),
+        column("delta", BigInteger),
+        name="deltas",
+    ).data(rows)
+
+    # 그 사이 삭제되거나 보관된 질문은 JOIN으로 걸러서 FK 위반으로 배치 전체가 실패하지 않게 함
+    select_query = select(source.c.question_id, source.c.delta).join(
+        Question, Question.id == source.c.question_id
+    )
+
+    stmt = insert(QuestionViewCount).from_select(["question_id", "view_count"], select_query)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[QuestionViewCount.question_id],
+        set_={
+            "view_count": QuestionViewCount.view_count + stmt.excluded.view_count,
+            "updated_at": func.now(),
+        },
+    )
+    await db.execute(stmt)
+
+    # 보관된 질문도 ID로 조회되고 조회수가 쌓이므로 보관 테이블의 조회수에 바로 더함
+    await db.execute(
+        update(ArchivedQuestion)
+        .where(ArchivedQuestion.id == source.c.question_id)
+        .values(view_count=ArchivedQuestion.view_count + source.c.delta)
+    )
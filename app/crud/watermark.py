@@ -0,0 +1,65 @@
+from collections.abc import Sequence
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.watermark import AggregateDelta, AggregateWatermark
+
+
+TRENDING_WATERMARK = "trending"
+QUESTION_STATS_WATERMARK = "stats:questions"
+ANSWER_STATS_WATERMARK = "stats:answers"
+
+# 새 질문과 답변마다 delta를 남길 집계
+QUESTION_DELTA_CONSUMERS = (QUESTION_STATS_WATERMARK,)
+ANSWER_DELTA_CONSUMERS = (TRENDING_WATERMARK, ANSWER_STATS_WATERMARK)
+
+
+async def lock_watermark(db: AsyncSession, name: str) -> int:
+    # 여러 프로세스가 같은 집계를 동시에 갱신하지 않도록 트랜잭션 끝까지 행을 잠금
+    await db.execute(
+        insert(AggregateWatermark)
+        .values(name=name, last_id=0)
+        .on_conflict_do_nothing(index_elements=[AggregateWatermark.name])
+    )
+    result = await db.execute(
+        select(AggregateWatermark.last_id).where(AggregateWatermark.name == name).with_for_update()
+    )
+    return result.scalar_one()
+
+
+async def set_watermark(db: AsyncSession, name: str, last_id: int) -> None:
+    await db.execute(
+        update(AggregateWatermark).where(AggregateWatermark.name == name).values(last_id=last_id)
+    )
+
+
+async def add_deltas(db: AsyncSession, consumers: Sequence[str], row_id: int) -> None:
+    # 원본 행과 같은 트랜잭션에서 넣어야 함께 커밋되거나 함께 사라짐
+    await db.execute(
+        insert(AggregateDelta).values(
+            [{"consumer": consumer, "row_id": row_id} for consumer in consumers]
+        )
+    )
+
+
+async def take_deltas(db: AsyncSession, consumer: str, limit: int) -> list[int]:
+    """커밋된 delta를 limit개까지 지우고 원본 행 ID를 돌려줌
+
+    지운 행은 호출한 트랜잭션이 커밋되어야 사라지므로, 반영 도중 실패해 롤백되면 다음
+    갱신에서 다시 가져간다.
+    """
+    pending = (
+        select(AggregateDelta.id)
+        .where(AggregateDelta.consumer == consumer)
+        .order_by(AggregateDelta.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    result = await db.execute(
+        delete(AggregateDelta)
+        .where(AggregateDelta.id.in_(pending))
+        .returning(AggregateDelta.row_id)
+    )
+    return list(result.scalars())
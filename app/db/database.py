@@ -1,11 +1,14 @@
 import logging
 from collections.abc import AsyncGenerator
 
+from fastapi import Request
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import NullPool
 
 from app.core.config import get_settings
+from app.db.limits import apply_statement_timeout, limits_for, start_statement_budget
+from app.db.slow_queries import set_query_route
 
 
 settings = get_settings()
@@ -23,14 +26,23 @@ engine = create_async_engine(
 AsyncSessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
-async def get_session() -> AsyncGenerator[AsyncSession]:
+async def get_session(request: Request) -> AsyncGenerator[AsyncSession]:
+    limits = limits_for(request)
+    endpoint = getattr(request.scope.get("endpoint"), "__name__", request.url.path)
+    budget = start_statement_budget(endpoint, limits.statement_budget)
+    # 느린 쿼리 기록에 남길 라우트. 실제 경로 대신 경로 템플릿으로 묶음
+    route = getattr(request.scope.get("route"), "path", request.url.path)
+    set_query_route(f"{request.method} {route}")
     async with AsyncSessionLocal() as session:
+        apply_statement_timeout(session, limits.statement_timeout)
         try:
             yield session
         except Exception as e:
             logger.error(f"데이터베이스 세션 오류: {e}")
             await session.rollback()
             raise
+        finally:
+            budget.active = False
 
 
 async def test_connection() -> bool:
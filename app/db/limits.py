@@ -0,0 +1,140 @@
+import asyncio
+import functools
+import logging
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from fastapi import HTTPException, Request, status
+from fastapi.responses import JSONResponse
+from psycopg.errors import QueryCanceled
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+from app.core.config import get_settings
+
+
+settings = get_settings()
+
+logger = logging.getLogger(__name__)
+
+# 서버의 statement_timeout이 먼저 걸리도록 클라이언트 쪽 마감은 이만큼 늦게 잡음
+CLIENT_DEADLINE_GRACE = 1.0
+
+LIMITS_ATTRIBUTE = "__query_limits__"
+
+
+class StatementBudgetError(RuntimeError):
+    pass
+
+
+@dataclass(frozen=True)
+class QueryLimits:
+    statement_timeout: float
+    statement_budget: int
+
+
+@dataclass
+class StatementBudget:
+    endpoint: str
+    limit: int
+    used: int = 0
+    active: bool = True
+
+
+_current_budget: ContextVar[StatementBudget | None] = ContextVar("statement_budget", default=None)
+
+
+def default_limits() -> QueryLimits:
+    return QueryLimits(settings.db_statement_timeout, settings.db_statement_budget)
+
+
+def query_limits(
+    statement_timeout: float | None = None,
+    statement_budget: int | None = None,
+) -> Callable[[Callable[..., Awaitable]], Callable[..., Awaitable]]:
+    """라우트마다 기본값과 다른 쿼리 마감과 쿼리 수 한도를 지정
+
+    @router.get(...) 아래에 붙인다. statement_timeout은 get_session이 트랜잭션마다
+    SET LOCAL로 걸고, 핸들러 전체도 조금 더 긴 마감 안에서 실행해서 DB가 응답하지 않아도
+    태스크가 취소되고 504로 끝나게 한다.
+    """
+
+    def decorate(func: Callable[..., Awaitable]) -> Callable[..., Awaitable]:
+        limits = QueryLimits(
+            statement_timeout or settings.db_statement_timeout,
+            statement_budget or settings.db_statement_budget,
+        )
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                async with asyncio.timeout(limits.statement_timeout + CLIENT_DEADLINE_GRACE):
+                    return await func(*args, **kwargs)
+            except TimeoutError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                    detail="데이터베이스 응답 시간이 초과되었습니다.",
+                ) from e
+
+        setattr(wrapper, LIMITS_ATTRIBUTE, limits)
+        return wrapper
+
+    return decorate
+
+
+def limits_for(request: Request) -> QueryLimits:
+    endpoint = request.scope.get("endpoint")
+    return getattr(endpoint, LIMITS_ATTRIBUTE, None) or default_limits()
+
+
+def apply_statement_timeout(session: AsyncSession, seconds: float) -> None:
+    # SET LOCAL은 트랜잭션이 끝나면 풀리므로 커밋 뒤 새 트랜잭션에도 다시 걸어야 함
+    milliseconds = int(seconds * 1000)
+
+    @event.listens_for(session.sync_session, "after_begin")
+    def set_timeout(_session: Session, _transaction: SessionTransaction, connection: Connection):
+        connection.exec_driver_sql(f"SET LOCAL statement_timeout = {milliseconds}")
+
+
+def start_statement_budget(endpoint: str, limit: int) -> StatementBudget:
+    budget = StatementBudget(endpoint, limit)
+    _current_budget.set(budget)
+    return budget
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _count_statement(_conn, _cursor, statement: str, _parameters, _context, _executemany) -> None:
+    budget = _current_budget.get()
+    # 요청 중에 만든 태스크도 컨텍스트를 물려받으므로 요청이 끝난 뒤의 쿼리는 세지 않음
+    if budget is None or not budget.active or statement.startswith("SET LOCAL "):
+        return
+
+    budget.used += 1
+    if budget.used <= budget.limit:
+        return
+    message = f"{budget.endpoint}에서 쿼리를 {budget.limit}개보다 많이 실행했습니다"
+    if settings.environment == "development":
+        # 개발 중에는 N+1 쿼리를 바로 알아차리도록 요청을 실패시킴
+        raise StatementBudgetError(message)
+    if budget.used == budget.limit + 1:
+        logger.warning(message)
+
+
+async def database_error_handler(_request: Request, exc: OperationalError) -> JSONResponse:
+    """statement_timeout으로 취소된 쿼리는 504, 연결을 못 얻거나 끊긴 경우는 503"""
+    if isinstance(exc.orig, QueryCanceled):
+        return JSONResponse(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            content={"detail": "데이터베이스 응답 시간이 초과되었습니다."},
+        )
+
+    logger.error(f"데이터베이스를 사용할 수 없습니다: {exc}")
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "데이터베이스를 일시적으로 사용할 수 없습니다."},
+        headers={"Retry-After": "5"},
+    )
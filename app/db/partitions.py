@@ -0,0 +1,78 @@
+import logging
+from datetime import UTC, date, datetime
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+logger = logging.getLogger(__name__)
+
+ANSWERS_TABLE = "answers"
+
+
+def month_start(day: date, offset: int = 0) -> date:
+    index = day.year * 12 + (day.month - 1) + offset
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def answer_partition_name(month: date) -> str:
+    return f"{ANSWERS_TABLE}_p{month:%Y%m}"
+
+
+async def read_answer_partitions(db: AsyncSession) -> list[str]:
+    result = await db.execute(
+        text(
+            """
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = :table AND parent.relkind = 'p'
+            ORDER BY child.relname
+            """
+        ),
+        {"table": ANSWERS_TABLE},
+    )
+    return list(result.scalars().all())
+
+
+async def is_answers_partitioned(db: AsyncSession) -> bool:
+    relkind = await db.scalar(
+        text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:table)"),
+        {"table": ANSWERS_TABLE},
+    )
+    return relkind == "p"
+
+
+async def ensure_answer_partitions(
+    db: AsyncSession,
+    months_ahead: int = 3,
+    today: date | None = None,
+) -> list[str]:
+    # 파티션 마이그레이션 이전의 데이터베이스에서는 아무것도 하지 않음
+    if not await is_answers_partitioned(db):
+        return []
+
+    today = today or datetime.now(UTC).date()
+    existing = set(await read_answer_partitions(db))
+
+    created = []
+    for offset in range(months_ahead + 1):
+        start = month_start(today, offset)
+        name = answer_partition_name(start)
+        if name in existing:
+            continue
+
+        # 기본 파티션에 이 범위의 행이 이미 있으면 생성이 실패하므로 항상 미리 만들어 둠
+        await db.execute(
+            text(
+                f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF {ANSWERS_TABLE} '
+                f"FOR VALUES FROM ('{start.isoformat()} 00:00:00+00') "
+                f"TO ('{month_start(start, 1).isoformat()} 00:00:00+00')"
+            )
+        )
+        created.append(name)
+
+    if created:
+        logger.info(f"답변 파티션 생성: {', '.join(created)}")
+    return created
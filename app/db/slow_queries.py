@@ -0,0 +1,216 @@
+import json
+import logging
+import queue
+import random
+import re
+import sys
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+from types import FrameType
+
+import greenlet
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import get_settings
+
+
+settings = get_settings()
+
+logger = logging.getLogger(__name__)
+
+# 집계하는 쿼리 모양 수 상한. 넘치면 누적 시간이 가장 적은 것부터 버림
+MAX_TRACKED_QUERIES = 500
+
+_STARTED_ATTRIBUTE = "_slow_query_started"
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+# IN (%(id_1_1)s, %(id_1_2)s, ...)는 값 개수마다 문장이 달라지므로 하나로 묶음
+_EXPANDED_IN = re.compile(r"\(\s*%\(\w+\)s(?:\s*,\s*%\(\w+\)s)+\s*\)")
+
+_current_route: ContextVar[str | None] = ContextVar("query_route", default=None)
+
+
+def redact(statement: str) -> str:
+    """쿼리에서 값을 지우고 공백을 정리해 같은 모양의 쿼리가 같은 문자열이 되게 함
+
+    바인드 파라미터 값은 애초에 기록하지 않고, text()나 SET LOCAL처럼 문장에 직접 들어간
+    문자열, 숫자 리터럴만 ?로 바꾼다.
+    """
+    statement = _STRING_LITERAL.sub("?", statement)
+    statement = _NUMBER_LITERAL.sub("?", statement)
+    statement = _EXPANDED_IN.sub("(...)", statement)
+    return " ".join(statement.split())
+
+
+def set_query_route(route: str | None) -> None:
+    _current_route.set(route)
+
+
+def _app_frame(frame: FrameType | None) -> str | None:
+    # 가장 안쪽의 app 코드 (보통 app.crud 함수). DB 계층과 이 모듈은 건너뜀
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith("app.") and not module.startswith("app.db."):
+            return f"{module}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return None
+
+
+def call_site() -> str | None:
+    """쿼리를 보낸 app 함수 이름
+
+    AsyncSession은 greenlet 안에서 동기 코드를 돌리므로 이벤트 훅의 스택에는 SQLAlchemy
+    내부 프레임만 있다. 호출한 코루틴 프레임은 멈춰 있는 부모 greenlet 쪽에서 찾는다.
+    """
+    site = _app_frame(sys._getframe(1))
+    if site is not None:
+        return site
+    parent = greenlet.getcurrent().parent
+    return None if parent is None else _app_frame(parent.gr_frame)
+
+
+@dataclass
+class SlowQueryStat:
+    sql: str
+    call_site: str | None
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    rows: int = 0
+    routes: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count
+
+
+class SlowQueryLog:
+    """기준 시간보다 오래 걸린 쿼리와 나머지 중 표본을 NDJSON 파일에 기록
+
+    기준을 넘은 쿼리는 (쿼리 모양, 호출 함수)별로 프로세스 메모리에도 모아 두고
+    /admin/slow-queries에서 누적 시간 순으로 보여 준다. 파일 쓰기는 QueueListener
+    스레드가 맡으므로 이벤트 루프에서는 큐에 넣기만 한다. start 전에는 집계만 한다.
+    """
+
+    def __init__(self) -> None:
+        self.stats: dict[tuple[str, str | None], SlowQueryStat] = {}
+        self._file_logger = logging.getLogger(f"{__name__}.file")
+        self._file_logger.propagate = False
+        self._file_logger.setLevel(logging.INFO)
+        self._listener: QueueListener | None = None
+
+    @property
+    def threshold_ms(self) -> float:
+        return settings.slow_query_threshold_ms
+
+    @property
+    def sample_rate(self) -> float:
+        return settings.slow_query_sample_rate
+
+    def start(self) -> None:
+        if self._listener is not None:
+            return
+        path = Path(settings.slow_query_log_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        file_handler = RotatingFileHandler(
+            path,
+            maxBytes=settings.slow_query_log_max_bytes,
+            backupCount=settings.slow_query_log_backups,
+            encoding="utf-8",
+        )
+        records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        self._file_logger.addHandler(QueueHandler(records))
+        self._listener = QueueListener(records, file_handler)
+        self._listener.start()
+
+    def stop(self) -> None:
+        if self._listener is None:
+            return
+        # 큐에 남은 줄까지 쓰고 끝냄
+        self._listener.stop()
+        for handler in self._listener.handlers:
+            handler.close()
+        for handler in list(self._file_logger.handlers):
+            self._file_logger.removeHandler(handler)
+        self._listener = None
+
+    def record(self, statement: str, duration_ms: float, rows: int) -> None:
+        slow = duration_ms >= self.threshold_ms
+        if not slow and random.random() >= self.sample_rate:
+            return
+
+        sql = redact(statement)
+        site = call_site()
+        route = _current_route.get()
+        if slow:
+            self._aggregate(sql, site, route, duration_ms, rows)
+        if self._listener is not None:
+            entry = {
+                "ts": datetime.now(UTC).isoformat(),
+                "slow": slow,
+                "duration_ms": round(duration_ms, 3),
+                "rows": rows,
+                "route": route,
+                "call_site": site,
+                "sql": sql,
+            }
+            self._file_logger.info(json.dumps(entry, ensure_ascii=False))
+
+    def _aggregate(
+        self, sql: str, site: str | None, route: str | None, duration_ms: float, rows: int
+    ) -> None:
+        key = (sql, site)
+        stat = self.stats.get(key)
+        if stat is None:
+            if len(self.stats) >= MAX_TRACKED_QUERIES:
+                smallest = min(self.stats, key=lambda k: self.stats[k].total_ms)
+                del self.stats[smallest]
+            stat = self.stats[key] = SlowQueryStat(sql, site)
+
+        stat.count += 1
+        stat.total_ms += duration_ms
+        stat.max_ms = max(stat.max_ms, duration_ms)
+        stat.rows += max(rows, 0)
+        if route is not None:
+            stat.routes[route] += 1
+
+    def top(self, limit: int = 20, order_by: str = "total") -> list[SlowQueryStat]:
+        keys = {
+            "total": lambda s: s.total_ms,
+            "max": lambda s: s.max_ms,
+            "mean": lambda s: s.mean_ms,
+            "count": lambda s: s.count,
+        }
+        return sorted(self.stats.values(), key=keys[order_by], reverse=True)[:limit]
+
+    def reset(self) -> None:
+        self.stats.clear()
+
+
+slow_query_log = SlowQueryLog()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_timer(_conn, _cursor, _statement, _parameters, context, _executemany) -> None:
+    if context is not None:
+        setattr(context, _STARTED_ATTRIBUTE, time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record_statement(_conn, cursor, statement: str, _parameters, context, _executemany) -> None:
+    started = getattr(context, _STARTED_ATTRIBUTE, None)
+    if started is None:
+        return
+    duration_ms = (time.perf_counter() - started) * 1000
+    try:
+        slow_query_log.record(statement, duration_ms, cursor.rowcount)
+    except Exception as e:
+        # 기록 실패로 쿼리를 실패시키지 않음
+        logger.warning(f"느린 쿼리 기록 실패: {e}")
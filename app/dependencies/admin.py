@@ -0,0 +1,27 @@
+import secrets
+
+from fastapi import Header, HTTPException, status
+
+from app.core.config import get_settings
+
+
+settings = get_settings()
+
+
+def is_admin_token(token: str | None) -> bool:
+    # ADMIN_TOKEN이 설정되지 않은 환경에서는 관리자 API를 열지 않음
+    return (
+        settings.admin_token is not None
+        and token is not None
+        and secrets.compare_digest(token, settings.admin_token)
+    )
+
+
+async def require_admin(
+    x_admin_token: str | None = Header(default=None, description="관리자 토큰"),
+) -> None:
+    if not is_admin_token(x_admin_token):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자 권한이 필요합니다.",
+        )
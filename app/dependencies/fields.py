@@ -0,0 +1,41 @@
+from collections.abc import Awaitable, Callable, Sequence
+
+from fastapi import HTTPException, Query, status
+from pydantic import BaseModel
+
+
+def select_fields(
+    model: type[BaseModel],
+    default: Sequence[str],
+) -> Callable[..., Awaitable[tuple[str, ...]]]:
+    """목록 API의 fields 파라미터를 응답 항목 스키마의 필드 이름 튜플로 바꾸는 의존성
+
+    id는 항상 포함한다. fields가 없으면 default.
+    """
+    allowed = tuple(model.model_fields)
+
+    async def dependency(
+        fields: str | None = Query(
+            default=None,
+            description=f"쉼표로 구분한 응답 필드. 가능한 값: {', '.join(allowed)} "
+            f"(기본값: {', '.join(default)})",
+        ),
+    ) -> tuple[str, ...]:
+        if fields is None:
+            return tuple(default)
+
+        requested = [field.strip() for field in fields.split(",") if field.strip()]
+        unknown = [field for field in requested if field not in allowed]
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"알 수 없는 필드입니다: {', '.join(unknown)}",
+            )
+        return tuple(dict.fromkeys(["id", *requested]))
+
+    return dependency
+
+
+def project(obj: object, fields: Sequence[str]) -> dict:
+    # 불러오지 않은 컬럼에 접근하면 지연 로딩이 일어나므로 요청한 필드만 읽음
+    return {field: getattr(obj, field) for field in fields}
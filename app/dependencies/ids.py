@@ -0,0 +1,38 @@
+from fastapi import HTTPException, Query, status
+
+
+# 한 번에 가져올 수 있는 최대 ID 수
+MAX_BATCH_IDS = 100
+
+
+async def parse_ids(
+    ids: str | None = Query(
+        default=None,
+        description=f"쉼표로 구분한 ID 목록 (최대 {MAX_BATCH_IDS}개)",
+        examples=["1,2,3"],
+    ),
+) -> list[int] | None:
+    """중복을 지우고 요청 순서를 유지한 ID 목록. ids가 없으면 None"""
+    if ids is None:
+        return None
+
+    try:
+        parsed = [int(part) for part in ids.split(",") if part.strip()]
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"ID는 쉼표로 구분한 정수여야 합니다: {ids}",
+        ) from e
+
+    unique = list(dict.fromkeys(parsed))
+    if not unique:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="ID를 하나 이상 지정해야 합니다.",
+        )
+    if len(unique) > MAX_BATCH_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"ID는 최대 {MAX_BATCH_IDS}개까지 지정할 수 있습니다.",
+        )
+    return unique
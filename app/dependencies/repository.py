@@ -0,0 +1,18 @@
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.db.database import get_session
+from app.repositories.base import Repository
+from app.repositories.memory import memory_repository
+from app.repositories.sql import SQLAlchemyRepository
+
+
+settings = get_settings()
+
+
+async def get_repository(db: AsyncSession = Depends(get_session)) -> Repository:
+    # 세션은 처음 쿼리할 때 연결하므로 memory 모드에서는 DB에 연결하지 않음
+    if settings.storage_backend == "memory":
+        return memory_repository
+    return SQLAlchemyRepository(db)
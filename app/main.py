@@ -6,11 +6,37 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
+from sqlalchemy.exc import OperationalError
 
+from app.api.admin import router as admin_router
+from app.api.analysis import router as analysis_router
+from app.api.answer import batch_router as answer_batch_router
 from app.api.answer import router as answer_router
+from app.api.author import router as author_router
 from app.api.question import router as question_router
+from app.api.stats import router as stats_router
+from app.api.trending import router as trending_router
+from app.core.config import get_settings
 from app.db.database import test_connection
-
+from app.db.limits import database_error_handler
+from app.db.slow_queries import slow_query_log
+from app.middleware.profiling import ProfilingMiddleware
+from app.services.answer_events import answer_events
+from app.services.archive import archive_mover
+from app.services.autocomplete import load_title_index
+from app.services.discard import shutdown_pool
+from app.services.duplicates import load_duplicate_index
+from app.services.jobs import job_worker
+from app.services.loop_lag import loop_lag_monitor
+from app.services.partitions import answer_partition_maintainer, maintain_answer_partitions
+from app.services.related import load_related_index, related_rebuilder
+from app.services.shanten import load_tables
+from app.services.stats import stats_refresher
+from app.services.trending import trending_refresher
+from app.services.view_counter import view_count_flusher, view_counter
+
+
+settings = get_settings()
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -20,19 +46,63 @@ logger = logging.getLogger(__name__)
 async def lifespan(_app: FastAPI):
     logger.info("애플리케이션 시작...")
 
+    # 샹텐 계산용 조회 테이블은 첫 요청이 아니라 시작할 때 만들어 둠
+    load_tables()
+    loop_lag_monitor.start()
+    # 관련 질문 색인은 메모리 저장소에서도 쓰므로 저장소와 관계없이 띄움
+    related_rebuilder.start()
+
+    if settings.storage_backend == "memory":
+        # 질문/답변은 메모리 저장소에만 있으므로 DB를 쓰는 백그라운드 작업은 띄우지 않음
+        logger.info("메모리 저장소로 실행합니다. 데이터베이스를 사용하지 않습니다.")
+        yield
+        await related_rebuilder.stop()
+        await loop_lag_monitor.stop()
+        shutdown_pool()
+        return
+
     # 모든 모델을 import해서 메타데이터에 등록되도록 함
     from app.models.answer import Answer  # noqa: F401
     from app.models.question import Question  # noqa: F401
 
     if await test_connection():
         logger.info("데이터베이스 연결 성공!")
+        await maintain_answer_partitions()
+        indexed = await load_duplicate_index()
+        logger.info(f"중복 질문 색인 생성: {indexed}개")
+        indexed = await load_related_index()
+        logger.info(f"관련 질문 색인 생성: {indexed}개")
+        indexed = await load_title_index()
+        logger.info(f"제목 자동완성 색인 생성: {indexed}개")
     else:
         logger.error("데이터베이스 연결 실패!")
 
+    slow_query_log.start()
+    view_count_flusher.start()
+    trending_refresher.start()
+    stats_refresher.start()
+    answer_partition_maintainer.start()
+    archive_mover.start()
+    answer_events.start()
+    job_worker.start()
+
     yield
 
     logger.info("애플리케이션 종료...")
 
+    await job_worker.stop()
+    await answer_events.stop()
+    await archive_mover.stop()
+    await answer_partition_maintainer.stop()
+    await stats_refresher.stop()
+    await trending_refresher.stop()
+    await view_count_flusher.stop()
+    await view_counter.close()
+    slow_query_log.stop()
+    await related_rebuilder.stop()
+    await loop_lag_monitor.stop()
+    shutdown_pool()
+
 
 app = FastAPI(
     title="MahjongQnA API",
@@ -51,10 +121,27 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 나중에 추가한 미들웨어가 바깥에 오므로 CORS 처리까지 프로파일에 들어감
+app.add_middleware(ProfilingMiddleware)
+
+app.add_exception_handler(OperationalError, database_error_handler)
+
+app.include_router(trending_router)
+
 app.include_router(question_router)
 
 app.include_router(answer_router)
 
+app.include_router(answer_batch_router)
+
+app.include_router(author_router)
+
+app.include_router(stats_router)
+
+app.include_router(analysis_router)
+
+app.include_router(admin_router)
+
 static_dir = PathLib(__file__).parent.parent / "static"
 static_dir.mkdir(exist_ok=True)
 
@@ -0,0 +1,150 @@
+import asyncio
+import cProfile
+import logging
+import random
+import re
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import get_settings
+from app.dependencies.admin import is_admin_token
+
+
+settings = get_settings()
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = b"x-profile"
+ADMIN_HEADER = b"x-admin-token"
+PROFILE_ID_HEADER = b"x-profile-id"
+
+PROFILE_SUFFIX = ".prof"
+_PROFILE_NAME = re.compile(r"^[\w.-]+\.prof$")
+_UNSAFE = re.compile(r"[^\w]+")
+
+
+@dataclass(frozen=True)
+class ProfileInfo:
+    name: str
+    size_bytes: int
+    created_at: datetime
+
+
+class ProfileStore:
+    """프로파일 결과(pstats 형식)를 PROFILE_DIR에 두고 PROFILE_MAX_FILES개만 남김"""
+
+    @property
+    def directory(self) -> Path:
+        return Path(settings.profile_dir)
+
+    def new_name(self, method: str, path: str) -> str:
+        stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%S%f")
+        slug = _UNSAFE.sub("_", path).strip("_")[:60] or "root"
+        return f"{stamp}_{method}_{slug}{PROFILE_SUFFIX}"
+
+    def path(self, name: str) -> Path | None:
+        # 이름은 목록에서 받은 그대로만 허용 (경로 이동 방지)
+        if not _PROFILE_NAME.match(name):
+            return None
+        path = self.directory / name
+        return path if path.is_file() else None
+
+    def list(self) -> list[ProfileInfo]:
+        if not self.directory.is_dir():
+            return []
+        profiles = []
+        for path in self.directory.glob(f"*{PROFILE_SUFFIX}"):
+            stat = path.stat()
+            profiles.append(
+                ProfileInfo(
+                    name=path.name,
+                    size_bytes=stat.st_size,
+                    created_at=datetime.fromtimestamp(stat.st_mtime, UTC),
+                )
+            )
+        # 이름이 시각으로 시작하므로 이름 순이 곧 시간 순
+        return sorted(profiles, key=lambda p: p.name, reverse=True)
+
+    def save(self, profiler: cProfile.Profile, name: str) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(self.directory / name)
+        for old in self.list()[settings.profile_max_files :]:
+            (self.directory / old.name).unlink(missing_ok=True)
+
+
+profile_store = ProfileStore()
+
+
+class ProfilingMiddleware:
+    """관리자가 요청한 요청이나 표본으로 뽑힌 요청을 cProfile로 기록
+
+    X-Profile 헤더와 올바른 X-Admin-Token이 함께 오거나 PROFILE_SAMPLE_RATE에 뽑힌 요청만
+    프로파일링하고 응답에 X-Profile-Id 헤더로 파일 이름을 돌려준다. 꺼져 있을 때는 헤더
+    목록을 한 번 훑는 것 말고는 하는 일이 없다.
+
+    cProfile은 태스크가 아니라 스레드 단위로 동작하므로 같은 시간에 이벤트 루프에서 돈
+    다른 요청의 호출도 함께 잡힌다. 그래서 한 번에 한 요청만 프로파일링한다.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self._active = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profiler = cProfile.Profile()
+        name = None
+
+        async def send_with_profile_id(message: Message) -> None:
+            nonlocal name
+            if message["type"] == "http.response.start":
+                # 라우팅이 끝난 뒤라 경로 템플릿을 쓸 수 있음
+                route = getattr(scope.get("route"), "path", scope["path"])
+                name = profile_store.new_name(scope["method"], route)
+                headers = list(message.get("headers", []))
+                headers.append((PROFILE_ID_HEADER, name.encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            profiler.enable()
+        except ValueError:
+            # 다른 프로파일러(coverage 등)가 이미 켜져 있음
+            await self.app(scope, receive, send)
+            return
+
+        self._active = True
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            profiler.disable()
+            self._active = False
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            if name is not None:
+                logger.info(f"요청 프로파일 저장: {name} ({elapsed_ms:.1f} ms)")
+                await asyncio.to_thread(profile_store.save, profiler, name)
+
+    def _should_profile(self, scope: Scope) -> bool:
+        if self._active:
+            return False
+
+        requested = False
+        token = None
+        for key, value in scope["headers"]:
+            if key == PROFILE_HEADER:
+                requested = True
+            elif key == ADMIN_HEADER:
+                token = value.decode("latin-1")
+        if requested:
+            return is_admin_token(token)
+
+        rate = settings.profile_sample_rate
+        return rate > 0 and random.random() < rate
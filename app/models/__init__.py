@@ -1,5 +1,32 @@
 from .answer import Answer
+from .archive import ArchivedAnswer, ArchivedQuestion
+from .hand import QuestionHand
+from .job import Job
 from .question import Question
+from .question_view import QuestionViewCount
+from .stats import (
+    AuthorAnswerStat,
+    DailyActivityStat,
+    FirstAnswerLatencyBucket,
+    QuestionFirstAnswer,
+)
+from .trending import QuestionTrendingScore
+from .watermark import AggregateDelta, AggregateWatermark
 
 
-__all__ = ["Question", "Answer"]
+__all__ = [
+    "Question",
+    "Answer",
+    "QuestionViewCount",
+    "QuestionTrendingScore",
+    "AggregateWatermark",
+    "AggregateDelta",
+    "DailyActivityStat",
+    "AuthorAnswerStat",
+    "QuestionFirstAnswer",
+    "FirstAnswerLatencyBucket",
+    "ArchivedQuestion",
+    "ArchivedAnswer",
+    "QuestionHand",
+    "Job",
+]
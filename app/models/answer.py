@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, Integer, String, Text
+from sqlalchemy import DDL, Column, DateTime, ForeignKey, Index, Integer, String, Text, event, func
 from sqlalchemy.orm import relationship
 
 from app.models.base import Base
@@ -7,6 +7,16 @@ from app.models.base import Base
 class Answer(Base):
     __tablename__ = "answers"
 
+    # created_at 기준 월 단위 RANGE 파티션. 파티션 키가 기본 키에 포함되어야 한다.
+    __table_args__ = {"postgresql_partition_by": "RANGE (created_at)"}
+
+    created_at = Column(
+        DateTime(timezone=True),
+        default=func.now(),
+        nullable=False,
+        primary_key=True,
+    )
+
     question_id = Column(
         Integer,
         ForeignKey("questions.id", ondelete="CASCADE"),
@@ -28,3 +38,18 @@ class Answer(Base):
             f"question_id={self.question_id}, "
             f"author='{self.author_nickname}')>"
         )
+
+
+# 작성자별 목록을 키셋 페이지네이션으로 조회하기 위한 인덱스
+Index(
+    "ix_answers_author_nickname_created_at",
+    Answer.author_nickname,
+    Answer.created_at.desc(),
+)
+
+# 월별 파티션은 app.db.partitions에서 미리 만들어 두고, 범위를 벗어난 행은 기본 파티션이 받음
+event.listen(
+    Answer.__table__,
+    "after_create",
+    DDL("CREATE TABLE IF NOT EXISTS answers_default PARTITION OF answers DEFAULT"),
+)
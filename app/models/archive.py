@@ -0,0 +1,48 @@
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Integer, String, Text, func
+
+from app.models.base import Base
+
+
+class ArchivedQuestion(Base):
+    __tablename__ = "questions_archive"
+
+    # 원본 질문 ID를 그대로 유지
+    id = Column(Integer, primary_key=True, autoincrement=False)
+
+    title = Column(String(200), nullable=False, comment="질문 제목")
+    content = Column(Text, nullable=False, comment="질문 내용")
+    author_nickname = Column(String(50), nullable=False, comment="작성자 닉네임")
+    view_count = Column(BigInteger, nullable=False, default=0, comment="보관 시점의 조회수")
+    archived_at = Column(DateTime(timezone=True), nullable=False, default=func.now())
+
+    def __repr__(self):
+        return (
+            f"<ArchivedQuestion("
+            f"id={self.id}, "
+            f"title='{self.title[:30]}...', "
+            f"author='{self.author_nickname}')>"
+        )
+
+
+class ArchivedAnswer(Base):
+    __tablename__ = "answers_archive"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+
+    question_id = Column(
+        Integer,
+        ForeignKey("questions_archive.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+        comment="질문 ID",
+    )
+    content = Column(Text, nullable=False, comment="답변 내용")
+    author_nickname = Column(String(50), nullable=False, comment="작성자 닉네임")
+
+    def __repr__(self):
+        return (
+            f"<ArchivedAnswer("
+            f"id={self.id}, "
+            f"question_id={self.question_id}, "
+            f"author='{self.author_nickname}')>"
+        )
@@ -0,0 +1,32 @@
+from sqlalchemy import Column, ForeignKey, Index, Integer, SmallInteger, String
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from app.models.base import Base
+
+
+class QuestionHand(Base):
+    __tablename__ = "question_hands"
+
+    question_id = Column(
+        Integer,
+        ForeignKey("questions.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+        comment="질문 ID",
+    )
+
+    notation = Column(String(64), nullable=False, comment="정규화된 MPSZ 표기")
+
+    # app.services.tiles.encode_tiles 형식. GIN 인덱스로 @> 포함 검색을 함
+    tiles = Column(ARRAY(Integer), nullable=False, comment="인코딩된 타일 목록")
+
+    counts = Column(ARRAY(SmallInteger), nullable=False, comment="34종 타일별 장수")
+
+    # app.services.tiles.canonical_key. 색 순서와 자패 종류를 지운 모양 키로 비슷한 손패를 찾음
+    canonical_key = Column(String(40), nullable=False, index=True, comment="손패 모양 키")
+
+    def __repr__(self):
+        return f"<QuestionHand(question_id={self.question_id}, notation='{self.notation}')>"
+
+
+Index("ix_question_hands_tiles", QuestionHand.tiles, postgresql_using="gin")
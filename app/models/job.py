@@ -0,0 +1,39 @@
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text, func, text
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.models.base import Base
+
+
+class Job(Base):
+    __tablename__ = "jobs"
+
+    kind = Column(String(50), nullable=False, comment="작업 종류 (app.services.jobs 핸들러 이름)")
+    payload = Column(JSONB, nullable=False, default=dict, comment="핸들러에 넘길 인자")
+
+    # pending -> running -> done, 재시도를 다 쓰면 failed
+    status = Column(String(20), nullable=False, default="pending", comment="작업 상태")
+    attempts = Column(Integer, nullable=False, default=0, comment="지금까지 실행한 횟수")
+    max_attempts = Column(Integer, nullable=False, default=5, comment="최대 실행 횟수")
+
+    run_at = Column(
+        DateTime(timezone=True), nullable=False, default=func.now(), comment="실행 가능 시각"
+    )
+    locked_at = Column(DateTime(timezone=True), nullable=True, comment="워커가 가져간 시각")
+    finished_at = Column(DateTime(timezone=True), nullable=True, comment="완료 또는 실패 시각")
+    last_error = Column(Text, nullable=True, comment="마지막 실패 메시지")
+
+    def __repr__(self):
+        return f"<Job(id={self.id}, kind='{self.kind}', status='{self.status}')>"
+
+
+# 워커는 실행할 차례가 된 pending 작업만 run_at 순으로 가져감
+Index(
+    "ix_jobs_pending_run_at",
+    Job.run_at,
+    postgresql_where=text("status = 'pending'"),
+)
+Index(
+    "ix_jobs_running_locked_at",
+    Job.locked_at,
+    postgresql_where=text("status = 'running'"),
+)
@@ -1,7 +1,8 @@
-from sqlalchemy import Column, String, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Index, String, Text, func, select
+from sqlalchemy.orm import column_property, relationship
 
 from app.models.base import Base
+from app.models.question_view import QuestionViewCount
 
 
 class Question(Base):
@@ -20,3 +21,21 @@ class Question(Base):
             f"title='{self.title[:30]}...', "
             f"author='{self.author_nickname}')>"
         )
+
+
+# 조회수는 별도 테이블에 배치로 누적되므로 질문 행 자체는 조회 시 갱신되지 않는다
+Question.view_count = column_property(
+    func.coalesce(
+        select(QuestionViewCount.view_count)
+        .where(QuestionViewCount.question_id == Question.id)
+        .scalar_subquery(),
+        0,
+    )
+)
+
+# 작성자별 목록을 키셋 페이지네이션으로 조회하기 위한 인덱스
+Index(
+    "ix_questions_author_nickname_created_at",
+    Question.author_nickname,
+    Question.created_at.desc(),
+)
@@ -0,0 +1,20 @@
+from sqlalchemy import BigInteger, Column, ForeignKey, Integer
+
+from app.models.base import Base
+
+
+class QuestionViewCount(Base):
+    __tablename__ = "question_view_counts"
+
+    question_id = Column(
+        Integer,
+        ForeignKey("questions.id", ondelete="CASCADE"),
+        nullable=False,
+        unique=True,
+        comment="질문 ID",
+    )
+
+    view_count = Column(BigInteger, nullable=False, default=0, comment="누적 조회수")
+
+    def __repr__(self):
+        return f"<QuestionViewCount(question_id={self.question_id}, view_count={self.view_count})>"
@@ -0,0 +1,60 @@
+from sqlalchemy import Column, Date, DateTime, Float, ForeignKey, Integer, String
+
+from app.models.base import Base
+
+
+class DailyActivityStat(Base):
+    __tablename__ = "daily_activity_stats"
+
+    day = Column(Date, nullable=False, unique=True, comment="집계 일자")
+    question_count = Column(Integer, nullable=False, default=0, comment="작성된 질문 수")
+    answer_count = Column(Integer, nullable=False, default=0, comment="작성된 답변 수")
+
+    def __repr__(self):
+        return (
+            f"<DailyActivityStat("
+            f"day={self.day}, "
+            f"questions={self.question_count}, "
+            f"answers={self.answer_count})>"
+        )
+
+
+class AuthorAnswerStat(Base):
+    __tablename__ = "author_answer_stats"
+
+    author_nickname = Column(String(50), nullable=False, unique=True, comment="작성자 닉네임")
+    answer_count = Column(Integer, nullable=False, default=0, index=True, comment="작성한 답변 수")
+
+    def __repr__(self):
+        return f"<AuthorAnswerStat(author='{self.author_nickname}', answers={self.answer_count})>"
+
+
+class QuestionFirstAnswer(Base):
+    __tablename__ = "question_first_answers"
+
+    question_id = Column(
+        Integer,
+        ForeignKey("questions.id", ondelete="CASCADE"),
+        nullable=False,
+        unique=True,
+        comment="질문 ID",
+    )
+    first_answered_at = Column(DateTime(timezone=True), nullable=False, comment="첫 답변 시각")
+    latency_seconds = Column(Float, nullable=False, comment="질문 작성부터 첫 답변까지 걸린 시간")
+
+    def __repr__(self):
+        return (
+            f"<QuestionFirstAnswer("
+            f"question_id={self.question_id}, "
+            f"latency_seconds={self.latency_seconds})>"
+        )
+
+
+class FirstAnswerLatencyBucket(Base):
+    __tablename__ = "first_answer_latency_buckets"
+
+    bucket = Column(Integer, nullable=False, unique=True, comment="로그 스케일 구간 번호")
+    count = Column(Integer, nullable=False, default=0, comment="구간에 속한 질문 수")
+
+    def __repr__(self):
+        return f"<FirstAnswerLatencyBucket(bucket={self.bucket}, count={self.count})>"
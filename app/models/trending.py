@@ -0,0 +1,27 @@
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer
+
+from app.models.base import Base
+
+
+class QuestionTrendingScore(Base):
+    __tablename__ = "question_trending_scores"
+
+    question_id = Column(
+        Integer,
+        ForeignKey("questions.id", ondelete="CASCADE"),
+        nullable=False,
+        unique=True,
+        comment="질문 ID",
+    )
+
+    # 고정된 기준 시각 대비 로그 스케일 점수. 모든 행이 같은 비율로 감쇠하므로
+    # 시간이 지나도 다시 계산할 필요 없이 이 값의 순서가 곧 인기 순서가 된다.
+    log_score = Column(Float, nullable=False, index=True, comment="로그 스케일 인기 점수")
+
+    answer_count = Column(Integer, nullable=False, default=0, comment="반영된 답변 수")
+    last_answer_at = Column(DateTime(timezone=True), nullable=False, comment="마지막 답변 시각")
+
+    def __repr__(self):
+        return (
+            f"<QuestionTrendingScore(question_id={self.question_id}, log_score={self.log_score})>"
+        )
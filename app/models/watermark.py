@@ -0,0 +1,33 @@
+from sqlalchemy import Column, Index, Integer, String
+
+from app.models.base import Base
+
+
+class AggregateWatermark(Base):
+    __tablename__ = "aggregate_watermarks"
+
+    name = Column(String(100), nullable=False, unique=True, comment="집계 이름")
+    last_id = Column(Integer, nullable=False, default=0, comment="마지막으로 반영한 원본 행 ID")
+
+    def __repr__(self):
+        return f"<AggregateWatermark(name='{self.name}', last_id={self.last_id})>"
+
+
+class AggregateDelta(Base):
+    """집계에 아직 반영하지 않은 원본 행
+
+    원본 행과 같은 트랜잭션에서 넣으므로 커밋된 행만 보인다. 집계는 가져간 행을 지우면서
+    반영하기 때문에 ID 순서와 커밋 순서가 어긋나도 늦게 커밋된 행을 건너뛰지 않는다.
+    """
+
+    __tablename__ = "aggregate_deltas"
+
+    consumer = Column(String(100), nullable=False, comment="집계 이름")
+    row_id = Column(Integer, nullable=False, comment="반영할 원본 행 ID")
+
+    def __repr__(self):
+        return f"<AggregateDelta(consumer='{self.consumer}', row_id={self.row_id})>"
+
+
+# 집계마다 들어온 순서대로 가져감
+Index("ix_aggregate_deltas_consumer_id", AggregateDelta.consumer, AggregateDelta.id)
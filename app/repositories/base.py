@@ -0,0 +1,114 @@
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Protocol
+
+from app.schemas.answer import AnswerCreate, AnswerUpdate
+from app.schemas.question import QuestionCreate, QuestionUpdate
+
+
+class QuestionRow(Protocol):
+    id: int
+    title: str
+    content: str
+    author_nickname: str
+    view_count: int
+    created_at: datetime
+
+
+class AnswerRow(Protocol):
+    id: int
+    question_id: int
+    content: str
+    author_nickname: str
+    created_at: datetime
+
+
+class Repository(Protocol):
+    """질문/답변 API가 쓰는 저장소. STORAGE_BACKEND로 구현을 고름
+
+    postgres는 app.crud 함수를 그대로 쓰고(보관 테이블 포함), memory는 프로세스 메모리의
+    dict와 정렬된 인덱스만 쓴다. 쓰기는 commit을 불러야 확정된다.
+    """
+
+    async def commit(self) -> None: ...
+
+    async def close(self) -> None: ...
+
+    async def create_question(self, question_in: QuestionCreate) -> QuestionRow: ...
+
+    async def read_question(self, question_id: int) -> QuestionRow | None: ...
+
+    async def read_questions_by_ids(
+        self, question_ids: Sequence[int]
+    ) -> dict[int, QuestionRow]: ...
+
+    async def read_questions(
+        self,
+        skip: int = 0,
+        limit: int = 10,
+        tiles: Sequence[int] | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> tuple[list[QuestionRow], int]: ...
+
+    async def read_questions_by_author(
+        self,
+        author_nickname: str,
+        limit: int = 20,
+        after: tuple[datetime, int] | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> list[QuestionRow]: ...
+
+    async def update_question(
+        self, question_id: int, question_in: QuestionUpdate
+    ) -> QuestionRow | None: ...
+
+    async def delete_question(self, question_id: int) -> bool: ...
+
+    async def read_similar_hand_questions(
+        self, question_id: int, hands: list[tuple[int, ...]], limit: int = 20
+    ) -> list[tuple[QuestionRow, str, int]]:
+        """(질문, 그 질문의 손패 표기, 거리). 거리 0이 먼저, 같은 거리는 최신순"""
+        ...
+
+    def record_view(self, question_id: int) -> None: ...
+
+    async def create_answer(
+        self, question_id: int, answer_in: AnswerCreate
+    ) -> tuple[AnswerRow, bool]:
+        """(답변, 보관된 질문을 되살렸는지)"""
+        ...
+
+    async def read_answer(
+        self, answer_id: int, created_after: datetime | None = None
+    ) -> AnswerRow | None:
+        """created_after: 답변이 이 시각 이후에 달렸다는 힌트 (보통 질문 작성 시각)"""
+        ...
+
+    async def read_answers_by_ids(self, answer_ids: Sequence[int]) -> dict[int, AnswerRow]: ...
+
+    async def read_answers_by_question_id(
+        self,
+        question_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        columns: Sequence[str] | None = None,
+    ) -> tuple[list[AnswerRow], int]: ...
+
+    async def read_answers_by_author(
+        self,
+        author_nickname: str,
+        limit: int = 20,
+        after: tuple[datetime, int] | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> list[AnswerRow]: ...
+
+    async def update_answer(
+        self,
+        answer_id: int,
+        answer_in: AnswerUpdate,
+        created_after: datetime | None = None,
+    ) -> AnswerRow | None: ...
+
+    async def delete_answer(
+        self, answer_id: int, created_after: datetime | None = None
+    ) -> bool: ...
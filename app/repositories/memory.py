@@ -0,0 +1,318 @@
+from bisect import bisect_left, insort
+from collections import defaultdict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from itertools import count
+
+from app.schemas.answer import AnswerCreate, AnswerUpdate
+from app.schemas.question import QuestionCreate, QuestionUpdate
+from app.services.tiles import (
+    canonical_key,
+    encode_tiles,
+    extract_hands,
+    format_hand,
+    similar_hand_keys,
+    tile_counts,
+)
+
+
+# (작성 시각, ID). 키셋 커서와 같은 순서
+OrderKey = tuple[datetime, int]
+
+
+@dataclass(slots=True)
+class QuestionRecord:
+    id: int
+    title: str
+    content: str
+    author_nickname: str
+    created_at: datetime
+    updated_at: datetime
+    view_count: int = 0
+    # 손패 필터용. 손패마다 encode_tiles 결과를 집합으로
+    hands: list[frozenset[int]] = field(default_factory=list, repr=False)
+    # 비슷한 손패 검색용. 손패마다 canonical_key
+    hand_keys: list[str] = field(default_factory=list, repr=False)
+
+
+@dataclass(slots=True)
+class AnswerRecord:
+    id: int
+    question_id: int
+    content: str
+    author_nickname: str
+    created_at: datetime
+    updated_at: datetime
+
+
+def _newest(index: list[OrderKey], skip: int, limit: int) -> list[int]:
+    # 오름차순 인덱스를 뒤에서부터 읽어 최신순 skip..skip+limit 구간만 꺼냄
+    end = max(len(index) - skip, 0)
+    start = max(end - limit, 0)
+    return [item_id for _, item_id in reversed(index[start:end])]
+
+
+def _newest_before(index: list[OrderKey], limit: int, after: OrderKey | None) -> list[int]:
+    end = len(index) if after is None else bisect_left(index, after)
+    return [item_id for _, item_id in reversed(index[max(end - limit, 0) : end])]
+
+
+def _unindex(index: list[OrderKey], key: OrderKey) -> None:
+    position = bisect_left(index, key)
+    if position < len(index) and index[position] == key:
+        del index[position]
+
+
+class InMemoryRepository:
+    """dict와 (작성 시각, ID) 정렬 인덱스로만 동작하는 저장소
+
+    DB 없이 HTTP, 직렬화 계층만 프로파일링하거나 로컬에서 띄워 볼 때 쓴다. 모든 변경은
+    await 없이 끝나므로 이벤트 루프 안에서 원자적이고, commit은 하는 일이 없으며 롤백은
+    지원하지 않는다. 보관 테이블, 답변 실시간 스트림은 PostgreSQL 전용이다.
+    """
+
+    def __init__(self) -> None:
+        self._questions: dict[int, QuestionRecord] = {}
+        self._answers: dict[int, AnswerRecord] = {}
+        self._question_ids = count(1)
+        self._answer_ids = count(1)
+
+        self._questions_by_time: list[OrderKey] = []
+        self._questions_by_author: defaultdict[str, list[OrderKey]] = defaultdict(list)
+        self._answers_by_question: defaultdict[int, list[OrderKey]] = defaultdict(list)
+        self._answers_by_author: defaultdict[str, list[OrderKey]] = defaultdict(list)
+        # canonical_key -> {질문 ID: (본문에서 손패 순서, 표기)}. 질문마다 먼저 나온 손패만
+        self._questions_by_hand_key: defaultdict[str, dict[int, tuple[int, str]]] = defaultdict(
+            dict
+        )
+
+    def _index_hands(self, question: QuestionRecord) -> None:
+        hands = extract_hands(question.content)
+        question.hands = [frozenset(encode_tiles(hand)) for hand in hands]
+        question.hand_keys = [canonical_key(tile_counts(hand)) for hand in hands]
+        for position, (key, hand) in enumerate(zip(question.hand_keys, hands, strict=True)):
+            self._questions_by_hand_key[key].setdefault(question.id, (position, format_hand(hand)))
+
+    def _unindex_hands(self, question: QuestionRecord) -> None:
+        for key in question.hand_keys:
+            questions = self._questions_by_hand_key[key]
+            questions.pop(question.id, None)
+            if not questions:
+                del self._questions_by_hand_key[key]
+
+    async def commit(self) -> None:
+        return None
+
+    async def close(self) -> None:
+        return None
+
+    async def create_question(self, question_in: QuestionCreate) -> QuestionRecord:
+        now = datetime.now(UTC)
+        question = QuestionRecord(
+            id=next(self._question_ids),
+            created_at=now,
+            updated_at=now,
+            **question_in.model_dump(),
+        )
+        self._index_hands(question)
+        self._questions[question.id] = question
+
+        key = (question.created_at, question.id)
+        insort(self._questions_by_time, key)
+        insort(self._questions_by_author[question.author_nickname], key)
+        return question
+
+    async def read_question(self, question_id: int) -> QuestionRecord | None:
+        return self._questions.get(question_id)
+
+    async def read_questions_by_ids(
+        self,
+        question_ids: Sequence[int],
+    ) -> dict[int, QuestionRecord]:
+        return {
+            question_id: self._questions[question_id]
+            for question_id in question_ids
+            if question_id in self._questions
+        }
+
+    async def read_questions(
+        self,
+        skip: int = 0,
+        limit: int = 10,
+        tiles: Sequence[int] | None = None,
+        columns: Sequence[str] | None = None,  # noqa: ARG002 - 레코드를 통째로 들고 있음
+    ) -> tuple[list[QuestionRecord], int]:
+        if not tiles:
+            question_ids = _newest(self._questions_by_time, skip, limit)
+            return [self._questions[i] for i in question_ids], len(self._questions_by_time)
+
+        # 손패 필터는 전체를 훑어야 개수를 알 수 있음
+        wanted = frozenset(encode_tiles(list(tiles)))
+        matches = [
+            self._questions[question_id]
+            for _, question_id in reversed(self._questions_by_time)
+            if any(wanted <= hand for hand in self._questions[question_id].hands)
+        ]
+        return matches[skip : skip + limit], len(matches)
+
+    async def read_questions_by_author(
+        self,
+        author_nickname: str,
+        limit: int = 20,
+        after: tuple[datetime, int] | None = None,
+        columns: Sequence[str] | None = None,  # noqa: ARG002 - 레코드를 통째로 들고 있음
+    ) -> list[QuestionRecord]:
+        index = self._questions_by_author.get(author_nickname, [])
+        return [self._questions[i] for i in _newest_before(index, limit, after)]
+
+    async def update_question(
+        self,
+        question_id: int,
+        question_in: QuestionUpdate,
+    ) -> QuestionRecord | None:
+        question = self._questions.get(question_id)
+        if question is None:
+            return None
+
+        update_data = question_in.model_dump(exclude_unset=True)
+        for name, value in update_data.items():
+            setattr(question, name, value)
+        if "content" in update_data:
+            self._unindex_hands(question)
+            self._index_hands(question)
+        question.updated_at = datetime.now(UTC)
+        return question
+
+    async def delete_question(self, question_id: int) -> bool:
+        question = self._questions.pop(question_id, None)
+        if question is None:
+            return False
+
+        key = (question.created_at, question.id)
+        _unindex(self._questions_by_time, key)
+        _unindex(self._questions_by_author[question.author_nickname], key)
+        self._unindex_hands(question)
+        # 답변도 함께 삭제 (FK CASCADE와 같음)
+        for _, answer_id in self._answers_by_question.pop(question_id, []):
+            answer = self._answers.pop(answer_id)
+            _unindex(
+                self._answers_by_author[answer.author_nickname], (answer.created_at, answer_id)
+            )
+        return True
+
+    async def read_similar_hand_questions(
+        self,
+        question_id: int,
+        hands: list[tuple[int, ...]],
+        limit: int = 20,
+    ) -> list[tuple[QuestionRecord, str, int]]:
+        exact, nearby = similar_hand_keys(hands)
+        # 질문마다 (거리, 손패 순서)가 가장 작은 손패 하나
+        best: dict[int, tuple[int, int, str]] = {}
+        for key in nearby:
+            distance = 0 if key in exact else 1
+            for other_id, (position, notation) in self._questions_by_hand_key.get(key, {}).items():
+                if other_id != question_id:
+                    best[other_id] = min(
+                        best.get(other_id, (2, 0, "")), (distance, position, notation)
+                    )
+
+        ranked = sorted(
+            best.items(),
+            key=lambda item: (item[1][0], -self._questions[item[0]].created_at.timestamp()),
+        )
+        return [
+            (self._questions[other_id], notation, distance)
+            for other_id, (distance, _, notation) in ranked[:limit]
+        ]
+
+    def record_view(self, question_id: int) -> None:
+        question = self._questions.get(question_id)
+        if question is not None:
+            question.view_count += 1
+
+    async def create_answer(
+        self, question_id: int, answer_in: AnswerCreate
+    ) -> tuple[AnswerRecord, bool]:
+        now = datetime.now(UTC)
+        answer = AnswerRecord(
+            id=next(self._answer_ids),
+            question_id=question_id,
+            created_at=now,
+            updated_at=now,
+            **answer_in.model_dump(),
+        )
+        self._answers[answer.id] = answer
+
+        key = (answer.created_at, answer.id)
+        insort(self._answers_by_question[question_id], key)
+        insort(self._answers_by_author[answer.author_nickname], key)
+        # 보관 기능이 없으므로 되살릴 질문도 없음
+        return answer, False
+
+    async def read_answer(
+        self,
+        answer_id: int,
+        created_after: datetime | None = None,  # noqa: ARG002 - ID로 바로 찾음
+    ) -> AnswerRecord | None:
+        return self._answers.get(answer_id)
+
+    async def read_answers_by_ids(self, answer_ids: Sequence[int]) -> dict[int, AnswerRecord]:
+        return {
+            answer_id: self._answers[answer_id]
+            for answer_id in answer_ids
+            if answer_id in self._answers
+        }
+
+    async def read_answers_by_question_id(
+        self,
+        question_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        columns: Sequence[str] | None = None,  # noqa: ARG002 - 레코드를 통째로 들고 있음
+    ) -> tuple[list[AnswerRecord], int]:
+        index = self._answers_by_question.get(question_id, [])
+        return [self._answers[i] for i in _newest(index, skip, limit)], len(index)
+
+    async def read_answers_by_author(
+        self,
+        author_nickname: str,
+        limit: int = 20,
+        after: tuple[datetime, int] | None = None,
+        columns: Sequence[str] | None = None,  # noqa: ARG002 - 레코드를 통째로 들고 있음
+    ) -> list[AnswerRecord]:
+        index = self._answers_by_author.get(author_nickname, [])
+        return [self._answers[i] for i in _newest_before(index, limit, after)]
+
+    async def update_answer(
+        self,
+        answer_id: int,
+        answer_in: AnswerUpdate,
+        created_after: datetime | None = None,  # noqa: ARG002 - ID로 바로 찾음
+    ) -> AnswerRecord | None:
+        answer = self._answers.get(answer_id)
+        if answer is None:
+            return None
+
+        for name, value in answer_in.model_dump(exclude_unset=True).items():
+            setattr(answer, name, value)
+        answer.updated_at = datetime.now(UTC)
+        return answer
+
+    async def delete_answer(
+        self,
+        answer_id: int,
+        created_after: datetime | None = None,  # noqa: ARG002 - ID로 바로 찾음
+    ) -> bool:
+        answer = self._answers.pop(answer_id, None)
+        if answer is None:
+            return False
+
+        key = (answer.created_at, answer.id)
+        _unindex(self._answers_by_question[answer.question_id], key)
+        _unindex(self._answers_by_author[answer.author_nickname], key)
+        return True
+
+
+memory_repository = InMemoryRepository()
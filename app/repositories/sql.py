@@ -0,0 +1,143 @@
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud import answer as answer_crud
+from app.crud import hand as hand_crud
+from app.crud import question as question_crud
+from app.crud.archive import read_archived_answers_by_question_id, restore_question
+from app.models.answer import Answer
+from app.models.archive import ArchivedAnswer, ArchivedQuestion
+from app.models.question import Question
+from app.schemas.answer import AnswerCreate, AnswerUpdate
+from app.schemas.question import QuestionCreate, QuestionUpdate
+from app.services.view_counter import view_counter
+
+
+class SQLAlchemyRepository:
+    """요청 세션 하나로 app.crud 함수를 부르는 PostgreSQL 저장소"""
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def commit(self) -> None:
+        await self.db.commit()
+
+    async def close(self) -> None:
+        await self.db.close()
+
+    async def create_question(self, question_in: QuestionCreate) -> Question:
+        return await question_crud.create_question(self.db, question_in)
+
+    async def read_question(self, question_id: int) -> Question | ArchivedQuestion | None:
+        return await question_crud.read_question_by_id(self.db, question_id)
+
+    async def read_questions_by_ids(
+        self,
+        question_ids: Sequence[int],
+    ) -> dict[int, Question | ArchivedQuestion]:
+        return await question_crud.read_questions_by_ids(self.db, question_ids)
+
+    async def read_questions(
+        self,
+        skip: int = 0,
+        limit: int = 10,
+        tiles: Sequence[int] | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> tuple[list[Question], int]:
+        return await question_crud.read_questions(self.db, skip, limit, tiles, columns)
+
+    async def read_questions_by_author(
+        self,
+        author_nickname: str,
+        limit: int = 20,
+        after: tuple[datetime, int] | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> list[Question]:
+        return await question_crud.read_questions_by_author(
+            self.db, author_nickname, limit, after, columns
+        )
+
+    async def update_question(
+        self,
+        question_id: int,
+        question_in: QuestionUpdate,
+    ) -> Question | None:
+        return await question_crud.update_question(self.db, question_id, question_in)
+
+    async def delete_question(self, question_id: int) -> bool:
+        return await question_crud.delete_question(self.db, question_id)
+
+    async def read_similar_hand_questions(
+        self,
+        question_id: int,
+        hands: list[tuple[int, ...]],
+        limit: int = 20,
+    ) -> list[tuple[Question, str, int]]:
+        return await hand_crud.read_similar_hand_questions(self.db, question_id, hands, limit)
+
+    def record_view(self, question_id: int) -> None:
+        view_counter.record(question_id)
+
+    async def create_answer(self, question_id: int, answer_in: AnswerCreate) -> tuple[Answer, bool]:
+        # 보관된 질문에 답변이 달리면 다시 활성 테이블로 옮김. 방금 읽은 활성 질문이면
+        # identity map에서 바로 찾으므로 추가 조회가 없음
+        restored = (
+            await self.db.get(Question, question_id) is None
+            and await restore_question(self.db, question_id) is not None
+        )
+        answer = await answer_crud.create_answer(self.db, question_id, answer_in)
+        return answer, restored
+
+    async def read_answer(
+        self,
+        answer_id: int,
+        created_after: datetime | None = None,
+    ) -> Answer | ArchivedAnswer | None:
+        return await answer_crud.read_answer_by_id(self.db, answer_id, created_after)
+
+    async def read_answers_by_ids(
+        self,
+        answer_ids: Sequence[int],
+    ) -> dict[int, Answer | ArchivedAnswer]:
+        return await answer_crud.read_answers_by_ids(self.db, answer_ids)
+
+    async def read_answers_by_question_id(
+        self,
+        question_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        columns: Sequence[str] | None = None,
+    ) -> tuple[list[Answer] | list[ArchivedAnswer], int]:
+        # 핸들러가 방금 읽은 질문이면 identity map에서 바로 찾음
+        question = await self.db.get(Question, question_id)
+        if question is None:
+            return await read_archived_answers_by_question_id(
+                self.db, question_id, skip, limit, columns
+            )
+        return await answer_crud.read_answers_by_question_id(
+            self.db, question_id, skip, limit, columns, question.created_at
+        )
+
+    async def read_answers_by_author(
+        self,
+        author_nickname: str,
+        limit: int = 20,
+        after: tuple[datetime, int] | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> list[Answer]:
+        return await answer_crud.read_answers_by_author(
+            self.db, author_nickname, limit, after, columns
+        )
+
+    async def update_answer(
+        self,
+        answer_id: int,
+        answer_in: AnswerUpdate,
+        created_after: datetime | None = None,
+    ) -> Answer | ArchivedAnswer | None:
+        return await answer_crud.update_answer(self.db, answer_id, answer_in, created_after)
+
+    async def delete_answer(self, answer_id: int, created_after: datetime | None = None) -> bool:
+        return await answer_crud.delete_answer(self.db, answer_id, created_after)
@@ -0,0 +1,95 @@
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+
+class UkeireTile(BaseModel):
+    tile: str = Field(..., description="유효패", examples=["3m"])
+    remaining: int = Field(..., description="손패 밖에 남은 장수")
+
+
+class DiscardOption(BaseModel):
+    discard: str = Field(..., description="버릴 패", examples=["1z"])
+    shanten: int = Field(..., description="버린 뒤의 샹텐 수")
+    ukeire: list[UkeireTile] = Field(..., description="버린 뒤의 유효패")
+    ukeire_total: int = Field(..., description="유효패 총 장수")
+
+
+class ShantenResponse(BaseModel):
+    hand: str = Field(..., description="정규화된 손패 표기")
+    tile_count: int = Field(..., description="손패 장수")
+    shanten: int = Field(..., description="샹텐 수. -1은 화료, 0은 텐파이")
+    regular: int = Field(..., description="일반형 샹텐 수")
+    chiitoitsu: int | None = Field(None, description="칠대자 샹텐 수 (13/14장일 때만)")
+    kokushi: int | None = Field(None, description="국사무쌍 샹텐 수 (13/14장일 때만)")
+    ukeire: list[UkeireTile] | None = Field(None, description="유효패 (3n+1장일 때)")
+    ukeire_total: int | None = Field(None, description="유효패 총 장수 (3n+1장일 때)")
+    discards: list[DiscardOption] | None = Field(
+        None, description="버릴 패별 결과. 좋은 순으로 정렬 (3n+2장일 때)"
+    )
+
+
+Wind = Literal["east", "south", "west", "north"]
+
+
+class MeldIn(BaseModel):
+    type: Literal["chi", "pon", "kan", "ankan"] = Field(..., description="몸통 종류")
+    tiles: str = Field(..., description="MPSZ 표기", examples=["555z"])
+
+
+class ScoreRequest(BaseModel):
+    hand: str = Field(
+        ...,
+        description="화료패를 포함한 멘젠 부분 (MPSZ 표기)",
+        examples=["234m567m234p567s88s"],
+    )
+    melds: list[MeldIn] = Field(default_factory=list, description="울은 몸통과 안깡")
+    win_tile: str = Field(..., description="화료패", examples=["7s"])
+    tsumo: bool = Field(default=False, description="쯔모 화료 여부")
+    riichi: bool = Field(default=False, description="리치 여부")
+    ippatsu: bool = Field(default=False, description="일발 여부")
+    dora: int = Field(default=0, ge=0, le=40, description="도라 수 (적도라 포함)")
+    round_wind: Wind = Field(default="east", description="장풍")
+    seat_wind: Wind = Field(default="east", description="자풍. east면 친")
+
+
+class YakuItem(BaseModel):
+    name: str = Field(..., description="역 이름")
+    han: int = Field(..., description="판수")
+
+
+class ScoreResponse(BaseModel):
+    yaku: list[YakuItem] = Field(..., description="성립한 역")
+    han: int = Field(..., description="판수 합계")
+    fu: int = Field(..., description="부수")
+    limit: str | None = Field(None, description="만관 이상일 때 이름")
+    total: int = Field(..., description="받는 점수 합계")
+    ron: int | None = Field(None, description="론일 때 방총자가 내는 점수")
+    tsumo_dealer: int | None = Field(None, description="쯔모일 때 친이 내는 점수")
+    tsumo_non_dealer: int | None = Field(None, description="쯔모일 때 자가 각각 내는 점수")
+
+
+class DiscardRequest(BaseModel):
+    hand: str = Field(..., description="3n+2장 손패 (MPSZ 표기)", examples=["123m456p78s1135z29s"])
+    visible: str | None = Field(
+        None, description="버림패, 도라 표시패 등 손패 밖에서 보이는 패", examples=["19m5z"]
+    )
+    draws: int = Field(default=8, ge=1, le=30, description="시뮬레이션할 쯔모 횟수")
+    samples: int | None = Field(default=None, ge=1, description="버릴 패마다의 샘플 수")
+    seed: int | None = Field(default=None, description="재현용 난수 시드")
+
+
+class DiscardEstimateItem(BaseModel):
+    discard: str = Field(..., description="버릴 패")
+    shanten: int = Field(..., description="버린 뒤의 샹텐 수")
+    ukeire: int = Field(..., description="버린 뒤의 유효패 장수 (보이는 패 제외)")
+    tenpai_probability: float = Field(..., description="draws번 안에 텐파이할 확률")
+    win_probability: float = Field(..., description="draws번 안에 쯔모 화료할 확률")
+
+
+class DiscardResponse(BaseModel):
+    hand: str = Field(..., description="정규화된 손패 표기")
+    draws: int = Field(..., description="시뮬레이션한 쯔모 횟수")
+    samples: int = Field(..., description="버릴 패마다의 샘플 수")
+    complete: bool = Field(..., description="마감 시간 안에 모든 후보를 평가했는지 여부")
+    candidates: list[DiscardEstimateItem] = Field(..., description="화료 확률이 높은 순")
@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from pydantic import BaseModel, ConfigDict, Field
 
 
@@ -36,8 +38,19 @@ class AnswerResponse(BaseModel):
 
 
 class AnswerListItem(BaseModel):
+    # fields 파라미터로 고른 필드만 채워서 응답하므로 id 외에는 모두 선택
     id: int = Field(..., description="답변 ID")
-    content: str = Field(..., description="답변 내용")
-    author_nickname: str = Field(..., description="작성자 닉네임")
+    content: str | None = Field(None, description="답변 내용")
+    author_nickname: str | None = Field(None, description="작성자 닉네임")
+    question_id: int | None = Field(None, description="질문 ID")
+    created_at: datetime | None = Field(None, description="작성 시각")
 
     model_config = ConfigDict(from_attributes=True)
+
+
+ANSWER_LIST_FIELDS = ("id", "content", "author_nickname")
+
+
+class AnswerBatchResponse(BaseModel):
+    items: list[AnswerResponse] = Field(..., description="요청한 순서대로 찾은 답변")
+    missing_ids: list[int] = Field(..., description="찾지 못한 답변 ID")
@@ -0,0 +1,39 @@
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class AuthorQuestionItem(BaseModel):
+    # fields 파라미터로 고른 필드만 채워서 응답하므로 id 외에는 모두 선택
+    id: int = Field(..., description="질문 ID")
+    title: str | None = Field(None, description="질문 제목")
+    created_at: datetime | None = Field(None, description="작성 시각")
+    content: str | None = Field(None, description="질문 내용")
+    view_count: int | None = Field(None, description="조회수")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+AUTHOR_QUESTION_FIELDS = ("id", "title", "created_at")
+
+
+class AuthorAnswerItem(BaseModel):
+    id: int = Field(..., description="답변 ID")
+    question_id: int | None = Field(None, description="질문 ID")
+    content: str | None = Field(None, description="답변 내용")
+    created_at: datetime | None = Field(None, description="작성 시각")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+AUTHOR_ANSWER_FIELDS = ("id", "question_id", "content", "created_at")
+
+
+class AuthorQuestionPage(BaseModel):
+    items: list[AuthorQuestionItem] = Field(..., description="질문 목록")
+    next_cursor: str | None = Field(..., description="다음 페이지 커서 (마지막 페이지면 null)")
+
+
+class AuthorAnswerPage(BaseModel):
+    items: list[AuthorAnswerItem] = Field(..., description="답변 목록")
+    next_cursor: str | None = Field(..., description="다음 페이지 커서 (마지막 페이지면 null)")
@@ -0,0 +1,28 @@
+from pydantic import BaseModel, Field
+
+
+class JobQueueStat(BaseModel):
+    kind: str = Field(..., description="작업 종류")
+    status: str = Field(..., description="작업 상태 (pending, running, failed)")
+    count: int = Field(..., description="작업 수")
+    lag_seconds: float | None = Field(
+        ..., description="실행할 차례가 된 가장 오래된 pending 작업이 기다린 시간 (초)"
+    )
+
+
+class JobWorkerStat(BaseModel):
+    concurrency: int = Field(..., description="동시에 실행할 수 있는 작업 수")
+    running: int = Field(..., description="지금 이 프로세스에서 실행 중인 작업 수")
+    completed: dict[str, int] = Field(..., description="종류별 완료한 작업 수")
+    retried: dict[str, int] = Field(..., description="종류별 실패 후 다시 대기열에 넣은 수")
+    failed: dict[str, int] = Field(..., description="종류별 재시도를 다 써서 실패한 수")
+    completed_last_minute: int = Field(..., description="최근 1분 동안 완료한 작업 수")
+    average_duration_seconds: float | None = Field(..., description="평균 실행 시간 (초)")
+    average_start_lag_seconds: float | None = Field(
+        ..., description="실행할 차례가 된 뒤 워커가 가져가기까지 평균 대기 시간 (초)"
+    )
+
+
+class JobMetricsResponse(BaseModel):
+    queues: list[JobQueueStat] = Field(..., description="종류, 상태별 대기열 현황")
+    worker: JobWorkerStat = Field(..., description="이 프로세스 워커의 처리량")
@@ -0,0 +1,27 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class LagBucket(BaseModel):
+    le_ms: float | None = Field(..., description="구간 상한 (ms). null이면 나머지 전부")
+    count: int = Field(..., description="이 구간에 든 표본 수 (누적 아님)")
+
+
+class LoopStallResponse(BaseModel):
+    started_at: datetime = Field(..., description="멈추기 시작한 대략의 시각")
+    duration_ms: float = Field(..., description="멈춘 시간 (ms)")
+    stack: list[str] = Field(..., description="감지한 순간 루프 스레드의 스택 (안쪽이 마지막)")
+
+
+class LoopLagResponse(BaseModel):
+    interval_seconds: float = Field(..., description="표본 간격 (초)")
+    samples: int = Field(..., description="시작 뒤 모은 표본 수")
+    mean_ms: float | None = Field(..., description="평균 지연 (ms)")
+    max_ms: float = Field(..., description="최대 지연 (ms)")
+    p50_ms: float | None = Field(..., description="최근 표본의 중앙값 (ms)")
+    p99_ms: float | None = Field(..., description="최근 표본의 99번째 백분위수 (ms)")
+    buckets: list[LagBucket] = Field(..., description="지연 히스토그램")
+    watchdog: bool = Field(..., description="멈춤 감시 스레드 동작 여부")
+    block_threshold_ms: float = Field(..., description="멈춤으로 보는 기준 (ms)")
+    stalls: list[LoopStallResponse] = Field(..., description="최근 멈춤 (최신순)")
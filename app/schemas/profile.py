@@ -0,0 +1,9 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class ProfileResponse(BaseModel):
+    name: str = Field(..., description="파일 이름. 응답의 X-Profile-Id 헤더와 같음")
+    size_bytes: int = Field(..., description="파일 크기 (바이트)")
+    created_at: datetime = Field(..., description="저장 시각")
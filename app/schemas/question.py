@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from pydantic import BaseModel, ConfigDict, Field
 
 
@@ -29,18 +31,52 @@ class QuestionResponse(BaseModel):
     title: str = Field(..., description="질문 제목")
     content: str = Field(..., description="질문 내용")
     author_nickname: str = Field(..., description="작성자 닉네임")
+    view_count: int = Field(default=0, description="조회수")
 
     model_config = ConfigDict(from_attributes=True)
 
 
-class QuestionListItem(BaseModel):
+class AutocompleteItem(BaseModel):
+    id: int = Field(..., description="질문 ID")
+    title: str = Field(..., description="질문 제목")
+
+
+class DuplicateQuestionItem(BaseModel):
+    id: int = Field(..., description="질문 ID")
+    title: str = Field(..., description="질문 제목")
+    author_nickname: str = Field(..., description="작성자 닉네임")
+    similarity: float = Field(..., description="제목과 본문의 추정 자카드 유사도 (0~1)")
+
+
+class RelatedQuestionItem(BaseModel):
     id: int = Field(..., description="질문 ID")
     title: str = Field(..., description="질문 제목")
     author_nickname: str = Field(..., description="작성자 닉네임")
+    score: float = Field(..., description="TF-IDF 코사인 유사도 (0~1)")
+
+
+class QuestionCreateResponse(QuestionResponse):
+    duplicates: list[DuplicateQuestionItem] = Field(
+        default_factory=list,
+        description="check_duplicates=true일 때 이미 있는 비슷한 질문",
+    )
+
+
+class QuestionListItem(BaseModel):
+    # fields 파라미터로 고른 필드만 채워서 응답하므로 id 외에는 모두 선택
+    id: int = Field(..., description="질문 ID")
+    title: str | None = Field(None, description="질문 제목")
+    author_nickname: str | None = Field(None, description="작성자 닉네임")
+    content: str | None = Field(None, description="질문 내용")
+    view_count: int | None = Field(None, description="조회수")
+    created_at: datetime | None = Field(None, description="작성 시각")
 
     model_config = ConfigDict(from_attributes=True)
 
 
+QUESTION_LIST_FIELDS = ("id", "title", "author_nickname")
+
+
 class PaginationMeta(BaseModel):
     total: int = Field(..., description="전체 항목 수", examples=[100])
     page: int = Field(..., description="현재 페이지", examples=[1])
@@ -53,6 +89,11 @@ class QuestionListResponse(BaseModel):
     pagination: PaginationMeta = Field(..., description="페이지네이션 정보")
 
 
+class QuestionBatchResponse(BaseModel):
+    items: list[QuestionResponse] = Field(..., description="요청한 순서대로 찾은 질문")
+    missing_ids: list[int] = Field(..., description="찾지 못한 질문 ID")
+
+
 class QuestionUpdate(BaseModel):
     title: str | None = Field(
         None,
@@ -67,3 +108,11 @@ class QuestionUpdate(BaseModel):
         description="질문 내용",
         examples=["수정된 질문 내용입니다."],
     )
+
+
+class SimilarHandItem(BaseModel):
+    id: int = Field(..., description="질문 ID")
+    title: str = Field(..., description="질문 제목")
+    author_nickname: str = Field(..., description="작성자 닉네임")
+    notation: str = Field(..., description="비슷한 것으로 찾은 손패 표기")
+    distance: int = Field(..., description="0이면 같은 모양, 1이면 한 장 차이")
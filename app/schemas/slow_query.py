@@ -0,0 +1,24 @@
+from pydantic import BaseModel, Field
+
+
+class SlowQueryRoute(BaseModel):
+    route: str = Field(..., description="메서드와 경로 템플릿")
+    count: int = Field(..., description="이 라우트에서 기준을 넘은 횟수")
+
+
+class SlowQueryStatResponse(BaseModel):
+    sql: str = Field(..., description="값을 지운 쿼리")
+    call_site: str | None = Field(..., description="쿼리를 보낸 app 함수")
+    count: int = Field(..., description="기준을 넘은 횟수")
+    total_ms: float = Field(..., description="누적 실행 시간 (ms)")
+    mean_ms: float = Field(..., description="평균 실행 시간 (ms)")
+    max_ms: float = Field(..., description="가장 오래 걸린 실행 시간 (ms)")
+    rows: int = Field(..., description="돌려주거나 바꾼 행 수 합계")
+    routes: list[SlowQueryRoute] = Field(..., description="많이 호출한 라우트 (최대 5개)")
+
+
+class SlowQueryReport(BaseModel):
+    threshold_ms: float = Field(..., description="느린 쿼리 기준 (ms)")
+    sample_rate: float = Field(..., description="기준 아래 쿼리를 파일에 남기는 비율")
+    tracked: int = Field(..., description="집계 중인 쿼리 모양 수")
+    queries: list[SlowQueryStatResponse] = Field(..., description="정렬 기준 상위 쿼리")
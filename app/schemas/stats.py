@@ -0,0 +1,33 @@
+from datetime import date, datetime
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class DailyActivity(BaseModel):
+    day: date = Field(..., description="집계 일자")
+    question_count: int = Field(..., description="작성된 질문 수")
+    answer_count: int = Field(..., description="작성된 답변 수")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TopAnswerer(BaseModel):
+    author_nickname: str = Field(..., description="작성자 닉네임")
+    answer_count: int = Field(..., description="작성한 답변 수")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class StatsResponse(BaseModel):
+    daily: list[DailyActivity] = Field(..., description="일별 질문/답변 수")
+    top_answerers: list[TopAnswerer] = Field(..., description="답변을 많이 작성한 사용자")
+    median_first_answer_seconds: float | None = Field(
+        ..., description="첫 답변까지 걸린 시간의 중앙값 (초, 근사값)"
+    )
+    answered_question_count: int = Field(..., description="답변이 달린 질문 수")
+    refreshed_at: datetime | None = Field(..., description="마지막 집계 갱신 시각")
+    staleness_bound_seconds: float = Field(..., description="집계가 뒤처질 수 있는 최대 시간 (초)")
+
+
+class StatsRefreshResponse(BaseModel):
+    processed: int = Field(..., description="이번 갱신에서 반영된 원본 행 수")
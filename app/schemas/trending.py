@@ -0,0 +1,12 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class TrendingQuestionItem(BaseModel):
+    id: int = Field(..., description="질문 ID")
+    title: str = Field(..., description="질문 제목")
+    author_nickname: str = Field(..., description="작성자 닉네임")
+    score: float = Field(..., description="시간 감쇠가 적용된 인기 점수")
+    answer_count: int = Field(..., description="점수에 반영된 답변 수")
+    last_answer_at: datetime = Field(..., description="마지막 답변 시각")
@@ -0,0 +1,147 @@
+import asyncio
+import contextlib
+import json
+import logging
+from collections import defaultdict
+from collections.abc import Iterator
+
+import psycopg
+from psycopg import sql
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import get_settings
+from app.crud.answer import ANSWER_EVENTS_CHANNEL, read_answer_by_id
+from app.db.database import AsyncSessionLocal
+from app.schemas.answer import AnswerResponse
+
+
+settings = get_settings()
+
+logger = logging.getLogger(__name__)
+
+RECONNECT_DELAY = 1.0
+
+# (이벤트 이름, JSON 문자열)
+AnswerEvent = tuple[str, str]
+
+
+def listen_dsn(database_url: str) -> str:
+    # SQLAlchemy URL의 드라이버 표기를 떼고 psycopg에 바로 넘길 수 있는 DSN으로
+    url = make_url(database_url).set(drivername="postgresql")
+    return url.render_as_string(hide_password=False)
+
+
+class AnswerEventBroker:
+    """프로세스당 LISTEN 연결 하나로 답변 NOTIFY를 받아 질문별 구독자 큐에 나눠 줌
+
+    생성, 수정 이벤트는 구독자가 있을 때만 답변을 한 번 읽어서 모든 구독자에게 같은
+    JSON을 보낸다. 스트림이 몇 개든 DB 연결은 LISTEN 하나와 이벤트당 조회 한 번이다.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+    ) -> None:
+        self._session_factory = session_factory
+        self._subscribers: defaultdict[int, set[asyncio.Queue[AnswerEvent]]] = defaultdict(set)
+        self._listening = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._fetches: set[asyncio.Task] = set()
+
+    @property
+    def subscriber_count(self) -> int:
+        return sum(len(queues) for queues in self._subscribers.values())
+
+    def start(self, database_url: str | None = None) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        dsn = listen_dsn(database_url or settings.database_url)
+        self._task = asyncio.create_task(self._listen(dsn), name="answer-events")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        for task in list(self._fetches):
+            task.cancel()
+
+    async def wait_until_listening(self, timeout: float) -> None:
+        await asyncio.wait_for(self._listening.wait(), timeout)
+
+    @contextlib.contextmanager
+    def subscribe(self, question_id: int) -> Iterator[asyncio.Queue[AnswerEvent]]:
+        queue: asyncio.Queue[AnswerEvent] = asyncio.Queue(settings.answer_stream_queue_size)
+        self._subscribers[question_id].add(queue)
+        try:
+            yield queue
+        finally:
+            queues = self._subscribers.get(question_id)
+            if queues is not None:
+                queues.discard(queue)
+                if not queues:
+                    del self._subscribers[question_id]
+
+    async def _listen(self, dsn: str) -> None:
+        reconnecting = False
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(dsn, autocommit=True) as conn:
+                    await conn.execute(
+                        sql.SQL("LISTEN {}").format(sql.Identifier(ANSWER_EVENTS_CHANNEL))
+                    )
+                    self._listening.set()
+                    if reconnecting:
+                        # 끊긴 동안 놓친 이벤트가 있을 수 있으니 목록을 다시 읽으라고 알림
+                        self._broadcast("resync", "{}")
+                    async for notify in conn.notifies():
+                        self._dispatch(notify.payload)
+            except Exception:
+                logger.exception("답변 이벤트 LISTEN 연결이 끊겼습니다")
+            self._listening.clear()
+            reconnecting = True
+            await asyncio.sleep(RECONNECT_DELAY)
+
+    def _dispatch(self, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+            event, question_id = message["event"], message["question_id"]
+            answer_id = message["answer_id"]
+        except (ValueError, KeyError):
+            logger.warning(f"알 수 없는 답변 이벤트: {payload}")
+            return
+
+        if question_id not in self._subscribers:
+            return
+        if event == "deleted":
+            self._publish(question_id, event, json.dumps({"id": answer_id}))
+            return
+
+        task = asyncio.create_task(self._fetch_and_publish(event, question_id, answer_id))
+        self._fetches.add(task)
+        task.add_done_callback(self._fetches.discard)
+
+    async def _fetch_and_publish(self, event: str, question_id: int, answer_id: int) -> None:
+        async with self._session_factory() as session:
+            answer = await read_answer_by_id(session, answer_id)
+        if answer is not None:
+            self._publish(
+                question_id, event, AnswerResponse.model_validate(answer).model_dump_json()
+            )
+
+    def _publish(self, question_id: int, event: str, data: str) -> None:
+        for queue in self._subscribers.get(question_id, ()):
+            if queue.full():
+                # 느린 구독자 때문에 다른 구독자가 밀리지 않도록 가장 오래된 이벤트를 버림
+                queue.get_nowait()
+            queue.put_nowait((event, data))
+
+    def _broadcast(self, event: str, data: str) -> None:
+        for question_id in list(self._subscribers):
+            self._publish(question_id, event, data)
+
+
+answer_events = AnswerEventBroker()
@@ -0,0 +1,43 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import text
+
+from app.core.config import get_settings
+from app.crud.archive import archive_questions
+from app.db.database import AsyncSessionLocal
+from app.services.list_cache import question_list_cache
+from app.util.periodic import PeriodicTask
+
+
+settings = get_settings()
+
+# 운영 트래픽이 잡고 있는 행을 기다리지 않고 이번 배치를 포기함
+ARCHIVE_LOCK_TIMEOUT = "500ms"
+
+
+async def archive_cold_questions(now: datetime | None = None) -> int:
+    cutoff = (now or datetime.now(UTC)) - timedelta(days=settings.archive_after_days)
+    total = 0
+    for _ in range(settings.archive_max_batches_per_run):
+        async with AsyncSessionLocal() as session:
+            await session.execute(text(f"SET LOCAL lock_timeout = '{ARCHIVE_LOCK_TIMEOUT}'"))
+            archived = await archive_questions(session, cutoff, settings.archive_batch_size)
+            await session.commit()
+
+        if archived:
+            # 옮긴 질문은 목록에서 빠지므로 전체 개수가 달라짐
+            question_list_cache.invalidate()
+        total += len(archived)
+        if len(archived) < settings.archive_batch_size:
+            break
+        # 배치 사이에 쉬어서 I/O와 WAL 생성이 몰리지 않도록 함
+        await asyncio.sleep(settings.archive_batch_pause)
+    return total
+
+
+archive_mover = PeriodicTask(
+    "archive-mover",
+    settings.archive_interval,
+    archive_cold_questions,
+)
@@ -0,0 +1,202 @@
+import heapq
+import unicodedata
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from collections.abc import Iterator
+
+from app.crud.question import stream_question_texts
+from app.db.database import AsyncSessionLocal
+from app.services.text import NON_WORD_PATTERN, decompose_hangul
+
+
+# 정렬된 키를 이 크기 안팎의 블록으로 나눠 두므로 쓰기 한 번에 블록 하나만 옮김
+BLOCK_SIZE = 512
+# 접두어마다 순위를 매긴 결과를 이만큼 보관 (API limit 상한)
+MAX_RESULTS = 20
+MAX_CACHED_PREFIXES = 10_000
+
+# (키, 어절 위치, 질문 ID)
+Entry = tuple[str, int, int]
+# (어절 위치, -질문 ID). 작을수록 앞 순위
+Rank = tuple[int, int]
+
+
+def search_key(text: str) -> str:
+    """자모로 풀고 공백과 문장부호를 없앤 검색 키
+
+    NFKC는 호환 자모(ㄱ)를 첫가끝 자모로 바꾸므로 NFC만 적용한다.
+    """
+    return NON_WORD_PATTERN.sub("", decompose_hangul(unicodedata.normalize("NFC", text).lower()))
+
+
+class _BlockedList:
+    """정렬된 항목을 여러 블록에 나눠 담은 리스트
+
+    한 리스트에 insort하면 뒤쪽 항목을 모두 옮기므로, 각 블록의 최댓값으로 블록을 찾고
+    그 블록 안에서만 넣고 뺀다. 블록이 BLOCK_SIZE의 두 배를 넘으면 반으로 나눈다.
+    """
+
+    def __init__(self, items: list[Entry] | None = None) -> None:
+        items = sorted(items or [])
+        self._blocks = [items[i : i + BLOCK_SIZE] for i in range(0, len(items), BLOCK_SIZE)]
+        self._maxes = [block[-1] for block in self._blocks]
+
+    def __len__(self) -> int:
+        return sum(len(block) for block in self._blocks)
+
+    def add(self, item: Entry) -> None:
+        if not self._blocks:
+            self._blocks.append([item])
+            self._maxes.append(item)
+            return
+
+        index = min(bisect_left(self._maxes, item), len(self._blocks) - 1)
+        block = self._blocks[index]
+        insort(block, item)
+        self._maxes[index] = block[-1]
+        if len(block) > 2 * BLOCK_SIZE:
+            self._blocks[index : index + 1] = [block[:BLOCK_SIZE], block[BLOCK_SIZE:]]
+            self._maxes[index : index + 1] = [block[BLOCK_SIZE - 1], block[-1]]
+
+    def discard(self, item: Entry) -> None:
+        index = bisect_left(self._maxes, item)
+        if index == len(self._blocks):
+            return
+        block = self._blocks[index]
+        position = bisect_left(block, item)
+        if position == len(block) or block[position] != item:
+            return
+
+        del block[position]
+        if block:
+            self._maxes[index] = block[-1]
+        else:
+            del self._blocks[index]
+            del self._maxes[index]
+
+    def irange(self, start: tuple) -> Iterator[Entry]:
+        """start 이상인 항목을 순서대로"""
+        index = bisect_left(self._maxes, start)
+        if index == len(self._blocks):
+            return
+        block = self._blocks[index]
+        for position in range(bisect_left(block, start), len(block)):
+            yield block[position]
+        for block in self._blocks[index + 1 :]:
+            yield from block
+
+
+class TitleIndex:
+    """제목의 각 어절부터 끝까지를 자모 키로 만들어 정렬해 둔 자동완성 색인
+
+    "후리텐 론" 제목은 "ㅎㅜㄹㅣㅌㅔㄴㄹㅗㄴ"과 "ㄹㅗㄴ" 두 키로 들어가므로
+    제목 앞부분과 중간 어절 어느 쪽으로 입력해도 이분 탐색 한 번으로 찾는다.
+
+    짧은 접두어는 일치하는 키가 많으므로, 한 번 순위를 매긴 접두어는 상위 MAX_RESULTS개를
+    보관해 둔다. 질문이 추가되면 보관된 순위에 끼워 넣고, 상위에 있던 질문이 빠지면 그
+    접두어만 버려서 다음 조회 때 일치하는 키 전체로 다시 매긴다.
+    """
+
+    def __init__(self) -> None:
+        self._entries = _BlockedList()
+        self._titles: dict[int, str] = {}
+        # 검색 키 접두어 -> 상위 MAX_RESULTS개 순위. 이보다 적으면 일치하는 질문 전부
+        self._ranked: OrderedDict[str, list[Rank]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    @staticmethod
+    def _keys(title: str) -> list[tuple[str, int]]:
+        words = title.split()
+        keys = []
+        for position in range(len(words)):
+            key = search_key("".join(words[position:]))
+            if key:
+                keys.append((key, position))
+        return keys
+
+    def add(self, question_id: int, title: str) -> None:
+        self.remove(question_id)
+        self._titles[question_id] = title
+
+        # 보관된 접두어마다 이 질문의 가장 앞 어절 위치. 키는 어절 위치 순으로 나옴
+        positions: dict[str, int] = {}
+        for key, position in self._keys(title):
+            self._entries.add((key, position, question_id))
+            for end in range(1, len(key) + 1):
+                if key[:end] in self._ranked:
+                    positions.setdefault(key[:end], position)
+
+        for prefix, position in positions.items():
+            ranked = self._ranked[prefix]
+            rank = (position, -question_id)
+            if len(ranked) < MAX_RESULTS or rank < ranked[-1]:
+                insort(ranked, rank)
+                del ranked[MAX_RESULTS:]
+
+    def remove(self, question_id: int) -> None:
+        title = self._titles.pop(question_id, None)
+        if title is None:
+            return
+        for key, position in self._keys(title):
+            self._entries.discard((key, position, question_id))
+            for end in range(1, len(key) + 1):
+                ranked = self._ranked.get(key[:end])
+                if ranked is not None and any(-rank[1] == question_id for rank in ranked):
+                    del self._ranked[key[:end]]
+
+    def load(self, titles: list[tuple[int, str]]) -> None:
+        # 시작할 때는 하나씩 넣지 않고 한 번에 정렬
+        self._titles = dict(titles)
+        self._entries = _BlockedList(
+            [
+                (key, position, question_id)
+                for question_id, title in titles
+                for key, position in self._keys(title)
+            ]
+        )
+        self._ranked.clear()
+
+    def search(self, prefix: str, limit: int = 10) -> list[tuple[int, str]]:
+        """제목 앞부분이 맞는 질문을 먼저, 그다음 중간 어절이 맞는 질문. 같으면 최신순
+
+        limit는 MAX_RESULTS까지만 의미가 있다.
+        """
+        key = search_key(prefix)
+        if not key:
+            return []
+
+        ranked = self._ranked.get(key)
+        if ranked is None:
+            ranked = self._rank(key)
+            self._ranked[key] = ranked
+            if len(self._ranked) > MAX_CACHED_PREFIXES:
+                self._ranked.popitem(last=False)
+        else:
+            self._ranked.move_to_end(key)
+
+        return [(-negative_id, self._titles[-negative_id]) for _, negative_id in ranked[:limit]]
+
+    def _rank(self, key: str) -> list[Rank]:
+        best: dict[int, int] = {}
+        for entry_key, position, question_id in self._entries.irange((key,)):
+            if not entry_key.startswith(key):
+                break
+            if position < best.get(question_id, position + 1):
+                best[question_id] = position
+        return heapq.nsmallest(
+            MAX_RESULTS, ((position, -question_id) for question_id, position in best.items())
+        )
+
+
+title_index = TitleIndex()
+
+
+async def load_title_index() -> int:
+    async with AsyncSessionLocal() as session:
+        titles = [
+            (question_id, title) async for question_id, title, _ in stream_question_texts(session)
+        ]
+    title_index.load(titles)
+    return len(title_index)
@@ -0,0 +1,226 @@
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+from app.core.config import get_settings
+from app.services.shanten import load_tables, shanten_of, ukeire
+from app.services.tiles import MAX_COPIES, TILE_KINDS
+
+
+settings = get_settings()
+
+
+class SimulationDeadlineError(RuntimeError):
+    """마감 시각이 지나 시뮬레이션을 중간에 그만둠"""
+
+
+@dataclass(frozen=True)
+class DiscardEstimate:
+    tile: int
+    shanten: int
+    ukeire: int
+    tenpai_probability: float
+    win_probability: float
+
+
+def _connectivity(counts: list[int], tile: int) -> int:
+    # 버릴 패를 고를 때 주변 패가 적은 고립패를 먼저 버리기 위한 점수
+    if tile >= 27:
+        return counts[tile]
+    suit_start = tile - tile % 9
+    low, high = max(suit_start, tile - 2), min(suit_start + 8, tile + 2)
+    return sum(counts[low : high + 1])
+
+
+class _StateGraph:
+    """시뮬레이션 중 나타나는 손패 상태와 "이 패를 뽑으면 어느 상태로 가는지"를 캐시
+
+    모든 샘플이 같은 손패에서 출발하고, 샹텐이 줄어드는 패를 뽑았을 때만 상태가 바뀌므로
+    실제로 방문하는 상태 수는 샘플 수와 무관하게 작다.
+    """
+
+    def __init__(self) -> None:
+        self.ids: dict[tuple[int, ...], int] = {}
+        self.counts: list[tuple[int, ...]] = []
+        self.shanten: list[int] = []
+        self._transitions: dict[int, np.ndarray] = {}
+
+    def state(self, counts: tuple[int, ...], shanten: int | None = None) -> int:
+        state_id = self.ids.get(counts)
+        if state_id is None:
+            state_id = len(self.counts)
+            self.ids[counts] = state_id
+            self.counts.append(counts)
+            self.shanten.append(shanten_of(list(counts)) if shanten is None else shanten)
+        return state_id
+
+    def transitions(self, state_id: int) -> np.ndarray:
+        # next_state[tile]: 그 패를 뽑았을 때 넘어갈 상태. 샹텐이 줄지 않으면 제자리
+        cached = self._transitions.get(state_id)
+        if cached is not None:
+            return cached
+
+        counts = list(self.counts[state_id])
+        shanten = self.shanten[state_id]
+        next_state = np.full(TILE_KINDS, state_id, dtype=np.int32)
+        for drawn in ukeire(counts, shanten):
+            counts[drawn] += 1
+            if shanten == 0:
+                # 텐파이에서 유효패를 뽑으면 화료
+                next_state[drawn] = self.state(tuple(counts), -1)
+            else:
+                next_state[drawn] = self.state(*self._best_discard(counts))
+            counts[drawn] -= 1
+
+        self._transitions[state_id] = next_state
+        return next_state
+
+    @staticmethod
+    def _best_discard(counts: list[int]) -> tuple[tuple[int, ...], int]:
+        best = None
+        for tile in range(TILE_KINDS):
+            if counts[tile] == 0:
+                continue
+            counts[tile] -= 1
+            key = (shanten_of(counts), _connectivity(counts, tile))
+            if best is None or key < best[0]:
+                best = (key, tuple(counts))
+            counts[tile] += 1
+        return best[1], best[0][0]
+
+
+def simulate_discard(
+    counts: tuple[int, ...],
+    discard: int,
+    wall: tuple[int, ...],
+    draws: int,
+    samples: int,
+    seed: int | None = None,
+    deadline: float | None = None,
+) -> DiscardEstimate:
+    """discard를 버린 뒤 draws번 쯔모 안에 텐파이/화료할 확률을 몬테카를로로 추정
+
+    산은 wall(패 종류별 남은 장수)에서 비복원 추출하고, 샘플 전체를 한 번에 섞는다.
+    유효패를 뽑으면 샹텐이 가장 낮아지는 패를 버리고, 아니면 뽑은 패를 그대로 버린다.
+    deadline(time.time() 기준 시각)이 지나면 쯔모마다 확인해서 SimulationDeadlineError를
+    낸다. 쯔모 수가 모자란 확률은 다른 패와 비교할 수 없으므로 중간 결과는 돌려주지 않는다.
+    """
+    hand = list(counts)
+    hand[discard] -= 1
+    graph = _StateGraph()
+    start = graph.state(tuple(hand))
+    accepted = ukeire(hand, graph.shanten[start])
+
+    rng = np.random.default_rng(seed)
+    tiles = np.repeat(np.arange(TILE_KINDS), wall)
+    drawn = rng.permuted(np.broadcast_to(tiles, (samples, len(tiles))), axis=1)[:, :draws]
+
+    state = np.full(samples, start, dtype=np.int32)
+    tenpai = np.zeros(samples, dtype=bool)
+    won = np.zeros(samples, dtype=bool)
+    for step in range(drawn.shape[1]):
+        if deadline is not None and time.time() > deadline:
+            raise SimulationDeadlineError(f"{discard}번 패 시뮬레이션이 마감 시각을 넘김")
+        for state_id in np.unique(state):
+            if graph.shanten[state_id] < 0:
+                continue
+            mask = state == state_id
+            state[mask] = graph.transitions(state_id)[drawn[mask, step]]
+        shanten = np.asarray(graph.shanten, dtype=np.int8)[state]
+        tenpai |= shanten <= 0
+        won |= shanten < 0
+
+    return DiscardEstimate(
+        tile=discard,
+        shanten=graph.shanten[start],
+        ukeire=sum(min(left, wall[tile]) for tile, left in accepted.items()),
+        tenpai_probability=float(tenpai.mean()),
+        win_probability=float(won.mean()),
+    )
+
+
+def remaining_wall(counts: list[int], visible: list[int]) -> tuple[int, ...]:
+    wall = []
+    for tile in range(TILE_KINDS):
+        left = MAX_COPIES - counts[tile] - visible[tile]
+        if left < 0:
+            raise ValueError("손패와 보이는 패를 합쳐 같은 패가 4장을 넘습니다")
+        wall.append(left)
+    return tuple(wall)
+
+
+_pool: ProcessPoolExecutor | None = None
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        # 이벤트 루프 스레드가 있는 프로세스를 fork하지 않도록 spawn을 쓰고,
+        # 워커마다 샹텐 테이블을 시작할 때 한 번 만들어 둠
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.analysis_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=load_tables,
+        )
+    return _pool
+
+
+def shutdown_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+async def evaluate_discards(
+    counts: list[int],
+    visible: list[int],
+    draws: int,
+    samples: int,
+    seed: int | None = None,
+) -> tuple[list[DiscardEstimate], bool]:
+    """버릴 수 있는 패마다 프로세스 풀에서 시뮬레이션. 마감 시간 안에 끝난 결과만 돌려줌"""
+    if sum(counts) % 3 != 2:
+        raise ValueError("버릴 패를 평가하려면 3n+2장 손패여야 합니다")
+    wall = remaining_wall(counts, visible)
+    draws = min(draws, sum(wall))
+
+    loop = asyncio.get_running_loop()
+    pool = _get_pool()
+    # 취소해도 이미 워커에서 돌고 있는 작업은 멈추지 않으므로 작업 안에서 마감을 확인함.
+    # 다른 프로세스와 비교하므로 벽시계 시각을 넘김
+    deadline = time.time() + settings.discard_simulation_deadline
+    futures = [
+        loop.run_in_executor(
+            pool,
+            simulate_discard,
+            tuple(counts),
+            tile,
+            wall,
+            draws,
+            samples,
+            None if seed is None else seed + tile,
+            deadline,
+        )
+        for tile in range(TILE_KINDS)
+        if counts[tile]
+    ]
+    done, pending = await asyncio.wait(futures, timeout=settings.discard_simulation_deadline)
+    for future in pending:
+        future.cancel()
+
+    estimates = []
+    complete = not pending
+    for future in done:
+        try:
+            estimates.append(future.result())
+        except SimulationDeadlineError:
+            complete = False
+    estimates.sort(
+        key=lambda e: (-e.win_probability, -e.tenpai_probability, e.shanten, -e.ukeire, e.tile)
+    )
+    return estimates, complete
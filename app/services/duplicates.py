@@ -0,0 +1,132 @@
+import zlib
+from collections import defaultdict
+
+import numpy as np
+
+from app.core.config import get_settings
+from app.crud.question import stream_question_texts
+from app.db.database import AsyncSessionLocal
+from app.services.text import char_shingles
+
+
+settings = get_settings()
+
+NUM_PERMUTATIONS = 128
+# 32밴드 x 4행: 자카드 유사도 약 0.42 이상부터 후보로 잡히기 시작
+BANDS = 32
+ROWS_PER_BAND = NUM_PERMUTATIONS // BANDS
+
+# 2^32보다 큰 소수. a * x + b가 uint64를 넘지 않도록 a, b, x는 모두 2^32 미만
+MERSENNE_PRIME = np.uint64(4294967311)
+
+
+def question_text(title: str, content: str) -> str:
+    return f"{title}\n{content}"
+
+
+class MinHashIndex:
+    """질문 본문 shingle의 MinHash 서명을 LSH 밴드 버킷에 넣어 둔 메모리 색인"""
+
+    def __init__(self, seed: int = 1) -> None:
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, 2**32, size=NUM_PERMUTATIONS, dtype=np.uint64)
+        self._b = rng.integers(0, 2**32, size=NUM_PERMUTATIONS, dtype=np.uint64)
+        self._signatures: dict[int, np.ndarray] = {}
+        self._buckets: list[defaultdict[bytes, set[int]]] = [defaultdict(set) for _ in range(BANDS)]
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, question_id: int) -> bool:
+        return question_id in self._signatures
+
+    def signature(self, text: str) -> np.ndarray | None:
+        shingles = char_shingles(text)
+        if not shingles:
+            return None
+        hashes = np.fromiter(
+            (zlib.crc32(shingle.encode()) for shingle in shingles),
+            dtype=np.uint64,
+            count=len(shingles),
+        )
+        permuted = (self._a[:, None] * hashes[None, :] + self._b[:, None]) % MERSENNE_PRIME
+        return permuted.min(axis=1).astype(np.uint32)
+
+    def _bands(self, signature: np.ndarray):
+        for band in range(BANDS):
+            yield band, signature[band * ROWS_PER_BAND : (band + 1) * ROWS_PER_BAND].tobytes()
+
+    def add(self, question_id: int, text: str) -> None:
+        self.remove(question_id)
+        signature = self.signature(text)
+        if signature is None:
+            return
+        self._signatures[question_id] = signature
+        for band, key in self._bands(signature):
+            self._buckets[band][key].add(question_id)
+
+    def remove(self, question_id: int) -> None:
+        signature = self._signatures.pop(question_id, None)
+        if signature is None:
+            return
+        for band, key in self._bands(signature):
+            bucket = self._buckets[band].get(key)
+            if bucket is not None:
+                bucket.discard(question_id)
+                if not bucket:
+                    del self._buckets[band][key]
+
+    def query(
+        self,
+        text: str,
+        threshold: float,
+        limit: int = 10,
+        exclude: int | None = None,
+    ) -> list[tuple[int, float]]:
+        """추정 자카드 유사도가 threshold 이상인 질문을 유사도 순으로"""
+        signature = self.signature(text)
+        if signature is None:
+            return []
+
+        candidates = set()
+        for band, key in self._bands(signature):
+            candidates |= self._buckets[band].get(key, set())
+        candidates.discard(exclude)
+
+        scored = []
+        for question_id in candidates:
+            similarity = float(np.mean(self._signatures[question_id] == signature))
+            if similarity >= threshold:
+                scored.append((question_id, similarity))
+        scored.sort(key=lambda item: (-item[1], -item[0]))
+        return scored[:limit]
+
+    def clear(self) -> None:
+        self._signatures.clear()
+        for buckets in self._buckets:
+            buckets.clear()
+
+
+duplicate_index = MinHashIndex()
+
+
+async def load_duplicate_index() -> int:
+    duplicate_index.clear()
+    async with AsyncSessionLocal() as session:
+        async for question_id, title, content in stream_question_texts(session):
+            duplicate_index.add(question_id, question_text(title, content))
+    return len(duplicate_index)
+
+
+def find_duplicates(
+    title: str,
+    content: str,
+    limit: int = 5,
+    exclude: int | None = None,
+) -> list[tuple[int, float]]:
+    return duplicate_index.query(
+        question_text(title, content),
+        settings.duplicate_threshold,
+        limit=limit,
+        exclude=exclude,
+    )
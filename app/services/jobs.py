@@ -0,0 +1,249 @@
+import asyncio
+import contextlib
+import logging
+import time
+from collections import Counter, deque
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import get_settings
+from app.crud.job import (
+    claim_jobs,
+    complete_job,
+    delete_finished_jobs,
+    fail_job,
+    requeue_stale_jobs,
+    touch_job,
+)
+from app.db.database import AsyncSessionLocal
+from app.models.job import Job
+from app.services.stats import refresh_stats
+
+
+settings = get_settings()
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[AsyncSession, dict], Awaitable[None]]
+
+JOB_HANDLERS: dict[str, JobHandler] = {}
+
+THROUGHPUT_WINDOW = 60.0
+SHUTDOWN_TIMEOUT = 10.0
+
+
+def job_handler(kind: str) -> Callable[[JobHandler], JobHandler]:
+    """enqueue_job(db, kind, payload)로 넣은 작업을 처리할 함수를 등록"""
+
+    def register(func: JobHandler) -> JobHandler:
+        JOB_HANDLERS[kind] = func
+        return func
+
+    return register
+
+
+@job_handler("stats.refresh")
+async def _refresh_stats(db: AsyncSession, _payload: dict) -> None:
+    await refresh_stats(db)
+
+
+def retry_delay(attempts: int) -> timedelta:
+    # 5초, 10초, 20초, ... 최대 JOB_RETRY_MAX_DELAY
+    delay = settings.job_retry_base_delay * 2 ** (attempts - 1)
+    return timedelta(seconds=min(delay, settings.job_retry_max_delay))
+
+
+class JobMetrics:
+    def __init__(self) -> None:
+        self.completed: Counter[str] = Counter()
+        self.failed: Counter[str] = Counter()
+        self.retried: Counter[str] = Counter()
+        self._recent: deque[float] = deque()
+        self._duration_total = 0.0
+        self._start_lag_total = 0.0
+        self._finished = 0
+
+    def record(
+        self,
+        kind: str,
+        outcome: str,
+        duration: float,
+        start_lag: float,
+        now: float | None = None,
+    ) -> None:
+        getattr(self, outcome)[kind] += 1
+        self._duration_total += duration
+        self._start_lag_total += start_lag
+        self._finished += 1
+        if outcome == "completed":
+            self._recent.append(time.monotonic() if now is None else now)
+
+    def completed_last_minute(self, now: float | None = None) -> int:
+        now = time.monotonic() if now is None else now
+        while self._recent and self._recent[0] <= now - THROUGHPUT_WINDOW:
+            self._recent.popleft()
+        return len(self._recent)
+
+    @property
+    def average_duration(self) -> float | None:
+        return self._duration_total / self._finished if self._finished else None
+
+    @property
+    def average_start_lag(self) -> float | None:
+        return self._start_lag_total / self._finished if self._finished else None
+
+
+class JobWorker:
+    """jobs 테이블에서 실행할 차례가 된 작업을 SKIP LOCKED로 가져와 동시에 최대
+    concurrency개까지 실행
+
+    핸들러와 완료 표시는 같은 트랜잭션에서 커밋되고, 실패하면 지수 백오프로 다시 pending이 된다.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+        concurrency: int = settings.job_worker_concurrency,
+        batch_size: int = settings.job_batch_size,
+        poll_interval: float = settings.job_poll_interval,
+    ) -> None:
+        self._session_factory = session_factory
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.metrics = JobMetrics()
+        self._running: set[asyncio.Task] = set()
+        self._task: asyncio.Task | None = None
+        self._maintained_at = float("-inf")
+
+    @property
+    def running_count(self) -> int:
+        return len(self._running)
+
+    def start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run(), name="job-worker")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        # 실행 중인 작업은 잠깐 기다리고, 그래도 안 끝나면 취소. 남은 running 행은
+        # 다음 maintain에서 pending으로 돌아감
+        if self._running:
+            _, pending = await asyncio.wait(self._running, timeout=SHUTDOWN_TIMEOUT)
+            for task in pending:
+                task.cancel()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.maintain()
+                claimed = await self.run_once()
+            except Exception:
+                logger.exception("작업 큐 조회 실패")
+                claimed = 0
+            if claimed < self.batch_size:
+                await asyncio.sleep(self.poll_interval)
+
+    async def run_once(self) -> int:
+        """빈 자리만큼 작업을 가져와 실행을 시작. 자리가 없으면 하나 끝날 때까지 기다림"""
+        if len(self._running) >= self.concurrency:
+            await asyncio.wait(self._running, return_when=asyncio.FIRST_COMPLETED)
+
+        limit = min(self.batch_size, self.concurrency - len(self._running))
+        async with self._session_factory() as session:
+            jobs = await claim_jobs(session, limit)
+            await session.commit()
+
+        for job in jobs:
+            task = asyncio.create_task(self._execute(job), name=f"job-{job.id}")
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+        return len(jobs)
+
+    async def drain(self) -> None:
+        while self._running:
+            await asyncio.wait(self._running)
+
+    async def _execute(self, job: Job) -> None:
+        start_lag = (job.locked_at - job.run_at).total_seconds()
+        started = time.monotonic()
+        heartbeat = asyncio.create_task(self._heartbeat(job), name=f"job-{job.id}-heartbeat")
+        try:
+            outcome = await self._run_handler(job)
+        finally:
+            heartbeat.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await heartbeat
+        if outcome is not None:
+            self.metrics.record(job.kind, outcome, time.monotonic() - started, start_lag)
+
+    async def _run_handler(self, job: Job) -> str | None:
+        try:
+            handler = JOB_HANDLERS.get(job.kind)
+            if handler is None:
+                raise LookupError(f"등록되지 않은 작업 종류입니다: {job.kind}")
+            async with self._session_factory() as session:
+                await handler(session, job.payload)
+                # 멈춘 것으로 보고 다른 워커에게 넘어간 작업이면 핸들러가 한 일도 버림
+                if not await complete_job(session, job.id, job.attempts):
+                    await session.rollback()
+                    logger.warning(f"이미 다른 워커로 넘어간 작업입니다: {job.kind} (ID: {job.id})")
+                    return None
+                await session.commit()
+        except Exception as e:
+            logger.exception(f"작업 실패: {job.kind} (ID: {job.id}, {job.attempts}회째)")
+            final = job.attempts >= job.max_attempts or isinstance(e, LookupError)
+            try:
+                async with self._session_factory() as session:
+                    await fail_job(
+                        session,
+                        job.id,
+                        job.attempts,
+                        repr(e),
+                        None if final else retry_delay(job.attempts),
+                    )
+                    await session.commit()
+            except Exception:
+                # running으로 남은 행은 locked_at 갱신이 멈췄으므로 maintain이 다시 넣음
+                logger.exception(f"작업 실패 기록 실패: {job.kind} (ID: {job.id})")
+            return "failed" if final else "retried"
+        return "completed"
+
+    async def _heartbeat(self, job: Job) -> None:
+        # JOB_STALE_AFTER 안에 여러 번 갱신해서 한 번 놓쳐도 멈춘 작업으로 보지 않게 함
+        while True:
+            await asyncio.sleep(settings.job_stale_after / 3)
+            try:
+                async with self._session_factory() as session:
+                    claimed = await touch_job(session, job.id, job.attempts)
+                    await session.commit()
+            except Exception:
+                logger.exception(f"작업 잠금 갱신 실패: {job.kind} (ID: {job.id})")
+                continue
+            if not claimed:
+                return
+
+    async def maintain(self, now: datetime | None = None) -> None:
+        if time.monotonic() - self._maintained_at < settings.job_stale_after / 2:
+            return
+        self._maintained_at = time.monotonic()
+
+        now = now or datetime.now(UTC)
+        async with self._session_factory() as session:
+            requeued = await requeue_stale_jobs(
+                session, now - timedelta(seconds=settings.job_stale_after)
+            )
+            await delete_finished_jobs(session, now - timedelta(days=settings.job_retention_days))
+            await session.commit()
+        if requeued:
+            logger.warning(f"멈춘 작업 {requeued}개를 다시 대기열에 넣었습니다")
+
+
+job_worker = JobWorker()
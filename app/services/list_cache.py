@@ -0,0 +1,83 @@
+import time
+from collections import OrderedDict
+
+from app.core.config import get_settings
+
+
+settings = get_settings()
+
+
+class QuestionListCache:
+    """질문 목록 앞쪽 페이지의 직렬화된 응답 본문을 (page, size)별로 보관
+
+    질문을 만들거나 고치거나 지우면 invalidate로 세대 번호를 올리고 항목을 비운다. 저장할
+    때는 조회 직전에 읽은 세대를 함께 넘겨서, 조회 중에 쓰기가 끝났으면 옛 응답을 버린다.
+    세대는 프로세스마다 따로이므로 다른 워커의 쓰기는 QUESTION_LIST_CACHE_TTL이 지나야
+    반영된다. 항목 수와 본문 크기 합으로 메모리를 제한하고 넘치면 가장 오래 안 쓴 것부터
+    버린다.
+    """
+
+    def __init__(self) -> None:
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        # (page, size) -> (만료 시각, 본문)
+        self._entries: OrderedDict[tuple[int, int], tuple[float, bytes]] = OrderedDict()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def accepts(self, page: int) -> bool:
+        return settings.question_list_cache_entries > 0 and (
+            page <= settings.question_list_cache_max_page
+        )
+
+    def get(self, page: int, size: int) -> bytes | None:
+        key = (page, size)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, body = entry
+        if expires_at <= time.monotonic():
+            self._discard(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return body
+
+    def put(self, page: int, size: int, generation: int, body: bytes) -> None:
+        # 조회하는 동안 쓰기가 있었으면 이미 낡은 응답
+        if generation != self.generation or len(body) > settings.question_list_cache_max_bytes:
+            return
+
+        key = (page, size)
+        self._discard(key)
+        self._entries[key] = (time.monotonic() + settings.question_list_cache_ttl, body)
+        self._bytes += len(body)
+        while (
+            len(self._entries) > settings.question_list_cache_entries
+            or self._bytes > settings.question_list_cache_max_bytes
+        ):
+            self._discard(next(iter(self._entries)))
+
+    def invalidate(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+        self._bytes = 0
+
+    def _discard(self, key: tuple[int, int]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[1])
+
+
+question_list_cache = QuestionListCache()
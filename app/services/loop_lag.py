@@ -0,0 +1,150 @@
+import asyncio
+import contextlib
+import logging
+import sys
+import threading
+import time
+import traceback
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+from app.core.config import get_settings
+
+
+settings = get_settings()
+
+logger = logging.getLogger(__name__)
+
+# 히스토그램 구간 상한 (ms). 마지막 구간은 그보다 큰 모든 값
+LAG_BUCKETS_MS = (1.0, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 2500.0)
+# 백분위수는 최근 표본으로만 계산 (기본 간격 0.5초면 5분)
+RECENT_SAMPLES = 600
+MAX_STALLS = 20
+STACK_LIMIT = 30
+
+
+class LagHistogram:
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LAG_BUCKETS_MS) + 1)
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+        self.recent: deque[float] = deque(maxlen=RECENT_SAMPLES)
+
+    def observe(self, lag_ms: float) -> None:
+        self.counts[bisect_left(LAG_BUCKETS_MS, lag_ms)] += 1
+        self.count += 1
+        self.sum_ms += lag_ms
+        self.max_ms = max(self.max_ms, lag_ms)
+        self.recent.append(lag_ms)
+
+    @property
+    def mean_ms(self) -> float | None:
+        return self.sum_ms / self.count if self.count else None
+
+    def quantile(self, q: float) -> float | None:
+        if not self.recent:
+            return None
+        ordered = sorted(self.recent)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+@dataclass(frozen=True)
+class LoopStall:
+    started_at: datetime
+    duration_ms: float
+    stack: list[str]
+
+
+class LoopLagMonitor:
+    """이벤트 루프 지연을 재고, 켜 두면 루프를 오래 붙잡은 코드의 스택을 남김
+
+    샘플러는 LOOP_LAG_INTERVAL마다 잠들었다 깨어나면서 예정보다 늦게 깬 만큼을 지연으로
+    기록한다. LOOP_WATCHDOG=true이면 별도 스레드가 루프에 콜백을 넣고 LOOP_BLOCK_THRESHOLD
+    안에 실행되지 않으면 그 순간 루프 스레드의 스택을 로그로 남긴다. 동기 DB 호출이나 큰
+    목록의 model_validate처럼 루프를 막는 핸들러 코드를 찾는 용도다.
+    """
+
+    def __init__(self) -> None:
+        self.histogram = LagHistogram()
+        self.stalls: deque[LoopStall] = deque(maxlen=MAX_STALLS)
+        self._task: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stop_watchdog = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def watchdog_running(self) -> bool:
+        return self._watchdog is not None and self._watchdog.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        loop = asyncio.get_running_loop()
+        self._task = asyncio.create_task(self._sample(loop), name="loop-lag")
+        if settings.loop_watchdog:
+            self._stop_watchdog.clear()
+            self._watchdog = threading.Thread(
+                target=self._watch,
+                args=(loop, threading.get_ident()),
+                name="loop-watchdog",
+                daemon=True,
+            )
+            self._watchdog.start()
+
+    async def stop(self) -> None:
+        if self._watchdog is not None:
+            self._stop_watchdog.set()
+            # 감시 스레드가 루프에 넣은 콜백을 기다리는 중일 수 있으므로 루프를 막지 않고 기다림
+            await asyncio.to_thread(self._watchdog.join)
+            self._watchdog = None
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _sample(self, loop: asyncio.AbstractEventLoop) -> None:
+        interval = settings.loop_lag_interval
+        while True:
+            started = loop.time()
+            await asyncio.sleep(interval)
+            lag = loop.time() - started - interval
+            self.histogram.observe(max(lag, 0.0) * 1000)
+
+    def _watch(self, loop: asyncio.AbstractEventLoop, loop_thread_id: int) -> None:
+        threshold = settings.loop_block_threshold
+        while not self._stop_watchdog.wait(threshold):
+            ran = threading.Event()
+            try:
+                loop.call_soon_threadsafe(ran.set)
+            except RuntimeError:
+                # 루프가 닫힘
+                return
+            if ran.wait(threshold):
+                continue
+
+            # 멈춘 동안 스택은 한 번만 남기고, 풀리면 걸린 시간을 기록
+            started_at = datetime.now(UTC) - timedelta(seconds=threshold)
+            blocked_since = time.monotonic() - threshold
+            frame = sys._current_frames().get(loop_thread_id)
+            stack = traceback.format_stack(frame, limit=STACK_LIMIT) if frame else []
+            logger.warning(
+                f"이벤트 루프가 {threshold * 1000:.0f} ms 넘게 멈춤. 실행 중인 코드:\n"
+                + "".join(stack)
+            )
+            while not ran.wait(threshold):
+                if self._stop_watchdog.is_set():
+                    return
+            duration_ms = (time.monotonic() - blocked_since) * 1000
+            self.stalls.append(LoopStall(started_at, duration_ms, stack))
+            logger.warning(f"이벤트 루프가 약 {duration_ms:.0f} ms 동안 멈췄다가 풀림")
+
+
+loop_lag_monitor = LoopLagMonitor()
@@ -0,0 +1,21 @@
+from app.core.config import get_settings
+from app.db.database import AsyncSessionLocal
+from app.db.partitions import ensure_answer_partitions
+from app.util.periodic import PeriodicTask
+
+
+settings = get_settings()
+
+
+async def maintain_answer_partitions() -> list[str]:
+    async with AsyncSessionLocal() as session:
+        created = await ensure_answer_partitions(session, settings.answer_partition_months_ahead)
+        await session.commit()
+    return created
+
+
+answer_partition_maintainer = PeriodicTask(
+    "answer-partitions",
+    settings.answer_partition_check_interval,
+    maintain_answer_partitions,
+)
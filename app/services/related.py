@@ -0,0 +1,274 @@
+import asyncio
+import time
+from collections import Counter
+from dataclasses import dataclass
+
+import numpy as np
+
+from app.core.config import get_settings
+from app.crud.question import stream_question_texts
+from app.db.database import AsyncSessionLocal
+from app.services.duplicates import question_text
+from app.services.text import terms
+from app.util.periodic import PeriodicTask
+
+
+settings = get_settings()
+
+# 이웃 목록은 이 개수만큼 계산해서 캐시하고 limit만큼 잘라서 돌려줌
+NEIGHBOR_DEPTH = 50
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    """한 시점의 문서 빈도로 가중치를 매긴 행 우선(CSR)/단어 우선(CSC) 배열"""
+
+    question_ids: np.ndarray
+    rows: dict[int, int]
+    row_offsets: np.ndarray
+    row_terms: np.ndarray
+    row_weights: np.ndarray
+    term_offsets: np.ndarray
+    posting_rows: np.ndarray
+    posting_weights: np.ndarray
+
+    @classmethod
+    def empty(cls) -> "_Snapshot":
+        return cls(
+            question_ids=np.empty(0, dtype=np.int64),
+            rows={},
+            row_offsets=np.zeros(1, dtype=np.int64),
+            row_terms=np.empty(0, dtype=np.int32),
+            row_weights=np.empty(0, dtype=np.float32),
+            term_offsets=np.zeros(1, dtype=np.int64),
+            posting_rows=np.empty(0, dtype=np.int32),
+            posting_weights=np.empty(0, dtype=np.float32),
+        )
+
+
+def _build_snapshot(
+    documents: list[tuple[int, tuple[np.ndarray, np.ndarray]]],
+    document_frequency: list[int],
+    vocabulary_size: int,
+) -> _Snapshot:
+    # 이벤트 루프 밖(스레드)에서 돌므로 색인 객체는 건드리지 않고 넘겨받은 복사본만 씀
+    document_count = len(documents)
+    frequency = np.asarray(document_frequency, dtype=np.float32)
+    idf = np.log((1 + document_count) / (1 + frequency)) + 1
+
+    question_ids = np.fromiter(
+        (question_id for question_id, _ in documents), dtype=np.int64, count=document_count
+    )
+    lengths = np.fromiter(
+        (len(term_ids) for _, (term_ids, _) in documents), dtype=np.int64, count=document_count
+    )
+    row_offsets = np.zeros(document_count + 1, dtype=np.int64)
+    np.cumsum(lengths, out=row_offsets[1:])
+    rows = np.repeat(np.arange(document_count, dtype=np.int32), lengths)
+    if document_count:
+        term_ids = np.concatenate([term_ids for _, (term_ids, _) in documents])
+        counts = np.concatenate([counts for _, (_, counts) in documents])
+    else:
+        term_ids = np.empty(0, dtype=np.int32)
+        counts = np.empty(0, dtype=np.float32)
+    weights = (1 + np.log(counts)) * idf[term_ids]
+    norms = np.sqrt(np.bincount(rows, weights=weights**2, minlength=document_count))
+    weights = (weights / norms[rows]).astype(np.float32)
+
+    # 같은 값을 단어 우선으로 정렬해 단어별 게시 목록으로 씀
+    order = np.argsort(term_ids, kind="stable")
+    term_offsets = np.zeros(vocabulary_size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(term_ids, minlength=vocabulary_size), out=term_offsets[1:])
+    return _Snapshot(
+        question_ids=question_ids,
+        rows={int(question_id): row for row, question_id in enumerate(question_ids)},
+        row_offsets=row_offsets,
+        row_terms=term_ids,
+        row_weights=weights,
+        term_offsets=term_offsets,
+        posting_rows=rows[order],
+        posting_weights=weights[order],
+    )
+
+
+class TfidfIndex:
+    """질문별 단어 빈도를 들고 있다가, TF-IDF 가중치를 매긴 단어별 역색인
+    (CSC 형태의 numpy 배열)으로 코사인 유사도 상위 k개를 계산
+
+    쓰기는 질문 하나의 단어 빈도와 문서 빈도만 바꾸고 그 질문을 바뀐 목록에 넣는다.
+    조회할 때 바뀐 질문은 현재 문서 빈도로 그 자리에서 벡터를 계산하고, 나머지는 마지막
+    스냅샷의 역색인으로 계산한다. 문서 빈도가 바뀌어 생기는 차이(idf drift)는
+    related_rebuilder가 주기마다 스레드에서 스냅샷을 새로 만들어 정리하며, 다 만들 때까지는
+    이전 스냅샷을 그대로 쓴다. 쓰기나 조회가 전체 재구성을 부르지는 않는다.
+    """
+
+    def __init__(self) -> None:
+        self._vocabulary: dict[str, int] = {}
+        self._document_frequency: list[int] = []
+        self._documents: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+        # 스냅샷에 반영되지 않은 질문. 재구성 중인 것은 _building에 따로 둠
+        self._changed: set[int] = set()
+        self._building: set[int] = set()
+        self._snapshot = _Snapshot.empty()
+
+        self._neighbors: dict[int, tuple[float, list[tuple[int, float]]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def __contains__(self, question_id: int) -> bool:
+        return question_id in self._documents
+
+    @property
+    def pending(self) -> int:
+        """스냅샷 밖에서 따로 계산하는 질문 수"""
+        return len(self._changed | self._building)
+
+    def add(self, question_id: int, text: str) -> None:
+        self.remove(question_id)
+        frequencies = Counter(terms(text))
+        if not frequencies:
+            return
+
+        term_ids = np.empty(len(frequencies), dtype=np.int32)
+        for position, term in enumerate(frequencies):
+            term_id = self._vocabulary.setdefault(term, len(self._vocabulary))
+            if term_id == len(self._document_frequency):
+                self._document_frequency.append(0)
+            self._document_frequency[term_id] += 1
+            term_ids[position] = term_id
+        counts = np.fromiter(frequencies.values(), dtype=np.float32, count=len(frequencies))
+
+        self._documents[question_id] = (term_ids, counts)
+        self._changed.add(question_id)
+
+    def remove(self, question_id: int) -> None:
+        # 바뀐 질문의 이웃 목록만 바로 지우고, 다른 질문의 목록은 만료될 때까지 그대로 씀
+        self._neighbors.pop(question_id, None)
+        document = self._documents.pop(question_id, None)
+        if document is None:
+            return
+        for term_id in document[0]:
+            self._document_frequency[term_id] -= 1
+        self._changed.add(question_id)
+
+    def clear(self) -> None:
+        self.__init__()
+
+    async def rebuild(self) -> None:
+        """바뀐 질문이 있으면 스레드에서 스냅샷을 새로 만들어 교체"""
+        if not self._changed or self._building:
+            return
+
+        self._building, self._changed = self._changed, set()
+        documents = list(self._documents.items())
+        frequency = list(self._document_frequency)
+        try:
+            snapshot = await asyncio.to_thread(
+                _build_snapshot, documents, frequency, len(self._vocabulary)
+            )
+        except BaseException:
+            # 다음 주기에 다시 만듦
+            self._changed |= self._building
+            raise
+        finally:
+            self._building = set()
+        # 재구성하는 동안 다시 바뀐 질문은 _changed에 남아 다음 주기에 반영됨
+        self._snapshot = snapshot
+
+    def _vector(self, question_id: int) -> tuple[np.ndarray, np.ndarray]:
+        # 스냅샷 밖의 질문은 현재 문서 빈도로 가중치를 매김
+        term_ids, counts = self._documents[question_id]
+        document_count = len(self._documents)
+        frequency = np.fromiter(
+            (self._document_frequency[term_id] for term_id in term_ids),
+            dtype=np.float32,
+            count=len(term_ids),
+        )
+        weights = (1 + np.log(counts)) * (np.log((1 + document_count) / (1 + frequency)) + 1)
+        return term_ids, (weights / np.sqrt(np.sum(weights**2))).astype(np.float32)
+
+    def _compute(self, question_id: int) -> list[tuple[int, float]]:
+        snapshot = self._snapshot
+        changed = self._changed | self._building
+        row = snapshot.rows.get(question_id)
+        if row is None or question_id in changed:
+            query_terms, query_weights = self._vector(question_id)
+        else:
+            start, end = snapshot.row_offsets[row], snapshot.row_offsets[row + 1]
+            query_terms = snapshot.row_terms[start:end]
+            query_weights = snapshot.row_weights[start:end]
+
+        candidates: list[tuple[int, float]] = []
+        known = query_terms < len(snapshot.term_offsets) - 1
+        if len(snapshot.question_ids) and known.any():
+            rows, weights = [], []
+            for term_id, query_weight in zip(query_terms[known], query_weights[known], strict=True):
+                posting_start, posting_end = snapshot.term_offsets[term_id : term_id + 2]
+                rows.append(snapshot.posting_rows[posting_start:posting_end])
+                weights.append(snapshot.posting_weights[posting_start:posting_end] * query_weight)
+            scores = np.bincount(
+                np.concatenate(rows),
+                weights=np.concatenate(weights),
+                minlength=len(snapshot.question_ids),
+            )
+            # 스냅샷의 벡터가 낡았거나 지워진 질문은 아래에서 따로 계산
+            stale = [snapshot.rows[i] for i in changed | {question_id} if i in snapshot.rows]
+            scores[stale] = 0
+
+            depth = min(NEIGHBOR_DEPTH, len(scores))
+            top = np.argpartition(-scores, depth - 1)[:depth]
+            top = top[np.argsort(-scores[top], kind="stable")]
+            candidates = [
+                (int(snapshot.question_ids[i]), float(scores[i])) for i in top if scores[i] > 0
+            ]
+
+        for other_id in changed:
+            if other_id == question_id or other_id not in self._documents:
+                continue
+            other_terms, other_weights = self._vector(other_id)
+            _, query_positions, other_positions = np.intersect1d(
+                query_terms, other_terms, assume_unique=True, return_indices=True
+            )
+            score = float(query_weights[query_positions] @ other_weights[other_positions])
+            if score > 0:
+                candidates.append((other_id, score))
+
+        candidates.sort(key=lambda candidate: -candidate[1])
+        return candidates[:NEIGHBOR_DEPTH]
+
+    def related(
+        self,
+        question_id: int,
+        limit: int = 10,
+        now: float | None = None,
+    ) -> list[tuple[int, float]]:
+        """코사인 유사도가 높은 질문 limit개. 색인에 없는 질문이면 빈 목록"""
+        if question_id not in self._documents:
+            return []
+
+        now = time.monotonic() if now is None else now
+        cached = self._neighbors.get(question_id)
+        if cached is None or cached[0] <= now:
+            cached = (now + settings.related_cache_ttl, self._compute(question_id))
+            self._neighbors[question_id] = cached
+        return cached[1][:limit]
+
+
+related_index = TfidfIndex()
+
+
+async def load_related_index() -> int:
+    related_index.clear()
+    async with AsyncSessionLocal() as session:
+        async for question_id, title, content in stream_question_texts(session):
+            related_index.add(question_id, question_text(title, content))
+    await related_index.rebuild()
+    return len(related_index)
+
+
+related_rebuilder = PeriodicTask(
+    "related-rebuilder",
+    settings.related_rebuild_interval,
+    related_index.rebuild,
+)
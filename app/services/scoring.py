@@ -0,0 +1,451 @@
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import product
+
+from app.services.tiles import TILE_KINDS, tile_counts
+
+
+SEQUENCE = "sequence"
+TRIPLET = "triplet"
+QUAD = "quad"
+PAIR = "pair"
+
+EAST, SOUTH, WEST, NORTH = 27, 28, 29, 30
+DRAGONS = (31, 32, 33)
+GREEN_TILES = frozenset((19, 20, 21, 23, 25, 32))
+YAOCHU = frozenset((0, 8, 9, 17, 18, 26, *range(27, TILE_KINDS)))
+
+YAKUMAN_HAN = 13
+DECOMPOSITION_CACHE_SIZE = 65536
+
+
+def is_honor(tile: int) -> bool:
+    return tile >= 27
+
+
+@dataclass(frozen=True)
+class Group:
+    kind: str
+    tile: int
+    concealed: bool = True
+
+    @property
+    def tiles(self) -> tuple[int, ...]:
+        if self.kind == SEQUENCE:
+            return (self.tile, self.tile + 1, self.tile + 2)
+        size = {PAIR: 2, TRIPLET: 3, QUAD: 4}[self.kind]
+        return (self.tile,) * size
+
+    @property
+    def is_set(self) -> bool:
+        # 커쯔와 깡쯔는 부수와 역 판정에서 같이 취급
+        return self.kind in (TRIPLET, QUAD)
+
+    @property
+    def has_yaochu(self) -> bool:
+        return any(tile in YAOCHU for tile in self.tiles)
+
+
+@dataclass(frozen=True)
+class WinContext:
+    win_tile: int
+    round_wind: int
+    seat_wind: int
+    tsumo: bool = False
+    riichi: bool = False
+    ippatsu: bool = False
+    dora: int = 0
+
+    @property
+    def dealer(self) -> bool:
+        return self.seat_wind == EAST
+
+
+@dataclass
+class Score:
+    yaku: list[tuple[str, int]]
+    han: int
+    fu: int
+    limit: str | None
+    total: int
+    ron: int | None = None
+    tsumo_dealer: int | None = None
+    tsumo_non_dealer: int | None = None
+    yakuman: int = 0
+
+
+@lru_cache(maxsize=DECOMPOSITION_CACHE_SIZE)
+def _suit_decompositions(
+    counts: tuple[int, ...],
+    sequences: bool,
+) -> tuple[tuple[tuple[str, int], ...], ...]:
+    """한 패 종류를 몸통들과 최대 하나의 머리로 나누는 모든 방법 (패 번호는 종류 안에서의 위치)
+
+    색만 다르고 모양이 같은 부분은 같은 키가 되므로 비슷한 손패끼리 결과를 공유한다.
+    """
+    start = next((i for i, count in enumerate(counts) if count), None)
+    if start is None:
+        return ((),)
+
+    results = []
+    remaining = list(counts)
+
+    def follow(kind: str, used: tuple[int, ...]) -> None:
+        for i in used:
+            remaining[i] -= 1
+        for rest in _suit_decompositions(tuple(remaining), sequences):
+            if kind == PAIR and any(group_kind == PAIR for group_kind, _ in rest):
+                continue
+            results.append(((kind, start), *rest))
+        for i in used:
+            remaining[i] += 1
+
+    if counts[start] >= 3:
+        follow(TRIPLET, (start,) * 3)
+    if counts[start] >= 2:
+        follow(PAIR, (start,) * 2)
+    if sequences and start + 2 < len(counts) and counts[start + 1] and counts[start + 2]:
+        follow(SEQUENCE, (start, start + 1, start + 2))
+    return tuple(results)
+
+
+@lru_cache(maxsize=DECOMPOSITION_CACHE_SIZE)
+def decompose(counts: tuple[int, ...]) -> tuple[tuple[Group, ...], ...]:
+    """멘젠 부분의 장수 배열을 (몸통..., 머리) 조합들로 분해. 분해가 없으면 빈 튜플"""
+    parts = []
+    for offset, length, sequences in ((0, 9, True), (9, 9, True), (18, 9, True), (27, 7, False)):
+        options = _suit_decompositions(counts[offset : offset + length], sequences)
+        if not options:
+            return ()
+        parts.append([tuple(Group(kind, offset + tile) for kind, tile in o) for o in options])
+
+    results = []
+    for combination in product(*parts):
+        groups = tuple(group for part in combination for group in part)
+        if sum(group.kind == PAIR for group in groups) == 1:
+            results.append(groups)
+    return tuple(results)
+
+
+def _is_kokushi(counts: list[int]) -> bool:
+    return all(counts[tile] for tile in YAOCHU) and sum(counts[tile] for tile in YAOCHU) == 14
+
+
+def _is_chiitoitsu(counts: list[int]) -> bool:
+    return sum(count == 2 for count in counts) == 7
+
+
+def _is_chuuren(counts: list[int]) -> bool:
+    for offset in (0, 9, 18):
+        suit = counts[offset : offset + 9]
+        if sum(suit) == 14:
+            base = [3, 1, 1, 1, 1, 1, 1, 1, 3]
+            return all(have >= need for have, need in zip(suit, base, strict=True))
+    return False
+
+
+def _wait_fu(group: Group, win_tile: int) -> tuple[str, int]:
+    if group.kind == PAIR:
+        return "tanki", 2
+    if group.kind != SEQUENCE:
+        return "shanpon", 0
+    position = win_tile - group.tile
+    if position == 1:
+        return "kanchan", 2
+    if (position == 2 and group.tile % 9 == 0) or (position == 0 and group.tile % 9 == 6):
+        return "penchan", 2
+    return "ryanmen", 0
+
+
+def _value_tiles(context: WinContext) -> list[tuple[str, int]]:
+    names = {31: "역패 백", 32: "역패 발", 33: "역패 중"}
+    values = [(names[tile], tile) for tile in DRAGONS]
+    values.append(("자풍패", context.seat_wind))
+    values.append(("장풍패", context.round_wind))
+    return values
+
+
+def _yakuman(
+    groups: list[Group],
+    all_tiles: list[int],
+    concealed_counts: list[int],
+    closed: bool,
+) -> list[tuple[str, int]]:
+    sets = [group for group in groups if group.is_set]
+    pair = next(group for group in groups if group.kind == PAIR)
+    yakuman = []
+
+    if sum(group.concealed for group in sets) == 4:
+        yakuman.append(("스안커", 1))
+    dragon_sets = sum(group.tile in DRAGONS for group in sets)
+    if dragon_sets == 3:
+        yakuman.append(("대삼원", 1))
+    wind_sets = sum(EAST <= group.tile <= NORTH for group in sets)
+    if wind_sets == 4:
+        yakuman.append(("대사희", 1))
+    elif wind_sets == 3 and EAST <= pair.tile <= NORTH:
+        yakuman.append(("소사희", 1))
+    if all(is_honor(tile) for tile in all_tiles):
+        yakuman.append(("자일색", 1))
+    if all(tile in GREEN_TILES for tile in all_tiles):
+        yakuman.append(("녹일색", 1))
+    if all(tile in YAOCHU and not is_honor(tile) for tile in all_tiles):
+        yakuman.append(("청노두", 1))
+    if sum(group.kind == QUAD for group in groups) == 4:
+        yakuman.append(("스깡쯔", 1))
+    if closed and _is_chuuren(concealed_counts):
+        yakuman.append(("구련보등", 1))
+    return yakuman
+
+
+def _flush_yaku(all_tiles: list[int], closed: bool) -> list[tuple[str, int]]:
+    suits = {tile // 9 for tile in all_tiles if not is_honor(tile)}
+    if len(suits) != 1:
+        return []
+    if any(is_honor(tile) for tile in all_tiles):
+        return [("혼일색", 3 if closed else 2)]
+    return [("청일색", 6 if closed else 5)]
+
+
+def _regular_yaku(  # noqa: C901
+    groups: list[Group],
+    wait: str,
+    context: WinContext,
+    closed: bool,
+) -> list[tuple[str, int]]:
+    all_tiles = [tile for group in groups for tile in group.tiles]
+    sets = [group for group in groups if group.is_set]
+    sequences = [group for group in groups if group.kind == SEQUENCE]
+    pair = next(group for group in groups if group.kind == PAIR)
+    value_tiles = _value_tiles(context)
+    yaku = []
+
+    if closed and context.tsumo:
+        yaku.append(("멘젠쯔모", 1))
+    if (
+        closed
+        and len(sequences) == 4
+        and wait == "ryanmen"
+        and all(pair.tile != tile for _, tile in value_tiles)
+    ):
+        yaku.append(("핑후", 1))
+    if not any(tile in YAOCHU for tile in all_tiles):
+        yaku.append(("탕야오", 1))
+
+    if closed:
+        repeated = sum(count // 2 for count in Counter(g.tile for g in sequences).values())
+        if repeated == 2:
+            yaku.append(("량페코", 3))
+        elif repeated == 1:
+            yaku.append(("이페코", 1))
+
+    for name, tile in value_tiles:
+        if any(group.tile == tile for group in sets):
+            yaku.append((name, 1))
+
+    sequence_starts = {group.tile for group in sequences}
+    if any(all(number + suit * 9 in sequence_starts for suit in range(3)) for number in range(7)):
+        yaku.append(("삼색동순", 2 if closed else 1))
+    if any(all(suit * 9 + start in sequence_starts for start in (0, 3, 6)) for suit in range(3)):
+        yaku.append(("일기통관", 2 if closed else 1))
+
+    set_tiles = {group.tile for group in sets}
+    if any(all(number + suit * 9 in set_tiles for suit in range(3)) for number in range(9)):
+        yaku.append(("삼색동각", 2))
+    if len(sets) == 4:
+        yaku.append(("또이또이", 2))
+    if sum(group.concealed for group in sets) == 3:
+        yaku.append(("산안커", 2))
+    if sum(group.kind == QUAD for group in groups) == 3:
+        yaku.append(("산깡쯔", 2))
+    if sum(group.tile in DRAGONS for group in sets) == 2 and pair.tile in DRAGONS:
+        yaku.append(("소삼원", 2))
+
+    if all(tile in YAOCHU for tile in all_tiles):
+        yaku.append(("혼노두", 2))
+    elif sequences and all(group.has_yaochu for group in groups):
+        if any(is_honor(tile) for tile in all_tiles):
+            yaku.append(("찬타", 2 if closed else 1))
+        else:
+            yaku.append(("준찬타", 3 if closed else 2))
+
+    yaku.extend(_flush_yaku(all_tiles, closed))
+    return yaku
+
+
+def _fu(groups: list[Group], wait_fu: int, context: WinContext, closed: bool, pinfu: bool) -> int:
+    if pinfu:
+        return 20 if context.tsumo else 30
+
+    fu = 20
+    if closed and not context.tsumo:
+        fu += 10
+    if context.tsumo:
+        fu += 2
+    fu += wait_fu
+
+    for group in groups:
+        if group.kind == PAIR:
+            for tile in (*DRAGONS, context.seat_wind, context.round_wind):
+                if group.tile == tile:
+                    fu += 2
+        elif group.is_set:
+            value = 2 if group.tile not in YAOCHU else 4
+            value *= 4 if group.kind == QUAD else 1
+            value *= 2 if group.concealed else 1
+            fu += value
+
+    # 울어서 부수가 20부뿐인 손패는 30부로 계산
+    if fu == 20:
+        return 30
+    return (fu + 9) // 10 * 10
+
+
+def _round_up(points: float) -> int:
+    return int(-(-points // 100) * 100)
+
+
+def _payments(yaku: list[tuple[str, int]], fu: int, context: WinContext, yakuman: int) -> Score:
+    han = sum(han for _, han in yaku)
+    if yakuman:
+        base, limit = 8000 * yakuman, "역만" if yakuman == 1 else f"{yakuman}배 역만"
+    elif han >= 13:
+        base, limit = 8000, "헤아림 역만"
+    elif han >= 11:
+        base, limit = 6000, "삼배만"
+    elif han >= 8:
+        base, limit = 4000, "배만"
+    elif han >= 6:
+        base, limit = 3000, "하네만"
+    else:
+        base, limit = fu * 2 ** (han + 2), None
+        if han >= 5 or base > 2000:
+            base, limit = 2000, "만관"
+
+    score = Score(yaku=yaku, han=han, fu=fu, limit=limit, total=0, yakuman=yakuman)
+    if not context.tsumo:
+        score.ron = _round_up(base * (6 if context.dealer else 4))
+        score.total = score.ron
+    elif context.dealer:
+        score.tsumo_non_dealer = _round_up(base * 2)
+        score.total = score.tsumo_non_dealer * 3
+    else:
+        score.tsumo_dealer = _round_up(base * 2)
+        score.tsumo_non_dealer = _round_up(base)
+        score.total = score.tsumo_dealer + score.tsumo_non_dealer * 2
+    return score
+
+
+def _situational_yaku(context: WinContext, closed: bool) -> list[tuple[str, int]]:
+    yaku = []
+    if context.riichi:
+        if not closed:
+            raise ValueError("리치는 울지 않은 손패에서만 선언할 수 있습니다")
+        yaku.append(("리치", 1))
+        if context.ippatsu:
+            yaku.append(("일발", 1))
+    return yaku
+
+
+def _finish(yaku: list[tuple[str, int]], fu: int, context: WinContext) -> Score | None:
+    if not yaku:
+        return None
+    if context.dora:
+        yaku = [*yaku, ("도라", context.dora)]
+    return _payments(yaku, fu, context, yakuman=0)
+
+
+def _special_forms(concealed: list[int], context: WinContext, closed: bool) -> list[Score]:
+    scores = []
+    if not closed or sum(concealed) != 14:
+        return scores
+
+    if _is_kokushi(concealed):
+        scores.append(_payments([("국사무쌍", YAKUMAN_HAN)], 0, context, yakuman=1))
+    if _is_chiitoitsu(concealed):
+        tiles = [tile for tile in range(TILE_KINDS) for _ in range(concealed[tile])]
+        if all(is_honor(tile) for tile in tiles):
+            scores.append(_payments([("자일색", YAKUMAN_HAN)], 25, context, yakuman=1))
+        yaku = [*_situational_yaku(context, closed), ("치또이쯔", 2)]
+        if context.tsumo:
+            yaku.append(("멘젠쯔모", 1))
+        if not any(tile in YAOCHU for tile in tiles):
+            yaku.append(("탕야오", 1))
+        if all(tile in YAOCHU for tile in tiles):
+            yaku.append(("혼노두", 2))
+        yaku.extend(_flush_yaku(tiles, closed))
+        scores.append(_finish(yaku, 25, context))
+    return scores
+
+
+def score_hand(concealed_tiles: tuple[int, ...], melds: list[Group], context: WinContext) -> Score:
+    """화료한 손패의 역, 판, 부, 점수. 가장 점수가 높은 해석을 고름
+
+    concealed_tiles는 화료패를 포함한 멘젠 부분, melds는 운 몸통과 안깡.
+    """
+    if len(concealed_tiles) + 3 * len(melds) != 14:
+        raise ValueError("화료 손패는 멘젠 부분과 울은 몸통을 합쳐 14장이어야 합니다")
+    if context.win_tile not in concealed_tiles:
+        raise ValueError("화료패가 손패에 없습니다")
+
+    concealed = tile_counts(concealed_tiles)
+    all_counts = tile_counts([*concealed_tiles, *(t for meld in melds for t in meld.tiles)])
+    if max(all_counts) > 4:
+        raise ValueError("같은 패는 4장까지만 있습니다")
+
+    closed = all(meld.concealed for meld in melds)
+    candidates = _special_forms(concealed, context, closed)
+    decompositions = decompose(tuple(concealed))
+    if not candidates and not decompositions:
+        raise ValueError("화료 형태가 아닙니다")
+
+    for decomposition in decompositions:
+        # 같은 모양의 몸통이 여러 개면 하나만 보면 됨
+        for win_group in dict.fromkeys(g for g in decomposition if context.win_tile in g.tiles):
+            groups = [*decomposition, *melds]
+            if win_group.is_set and not context.tsumo:
+                # 샨퐁 론으로 완성된 커쯔는 밍커로 취급
+                groups[decomposition.index(win_group)] = Group(TRIPLET, win_group.tile, False)
+            wait, wait_fu = _wait_fu(win_group, context.win_tile)
+
+            all_tiles = [tile for group in groups for tile in group.tiles]
+            yakuman = _yakuman(groups, all_tiles, concealed, closed)
+            if yakuman:
+                yaku = [(name, YAKUMAN_HAN) for name, _ in yakuman]
+                candidates.append(_payments(yaku, 0, context, yakuman=len(yakuman)))
+                continue
+
+            yaku = _situational_yaku(context, closed) + _regular_yaku(groups, wait, context, closed)
+            pinfu = any(name == "핑후" for name, _ in yaku)
+            candidates.append(_finish(yaku, _fu(groups, wait_fu, context, closed, pinfu), context))
+
+    candidates = [score for score in candidates if score is not None]
+    if not candidates:
+        raise ValueError("역이 없습니다")
+    return max(candidates, key=lambda score: (score.total, score.han, score.fu))
+
+
+def parse_meld(kind: str, tiles: tuple[int, ...]) -> Group:
+    """울은 몸통(chi, pon, kan)이나 안깡(ankan)을 Group으로 변환"""
+    first = tiles[0] if tiles else -1
+    if kind == "chi":
+        valid = (
+            len(tiles) == 3
+            and not is_honor(first)
+            and first % 9 <= 6
+            and tiles == (first, first + 1, first + 2)
+        )
+        group = Group(SEQUENCE, first, concealed=False)
+    elif kind == "pon":
+        valid = len(tiles) == 3 and len(set(tiles)) == 1
+        group = Group(TRIPLET, first, concealed=False)
+    elif kind in ("kan", "ankan"):
+        valid = len(tiles) == 4 and len(set(tiles)) == 1
+        group = Group(QUAD, first, concealed=kind == "ankan")
+    else:
+        raise ValueError(f"알 수 없는 몸통 종류입니다: {kind}")
+
+    if not valid:
+        raise ValueError(f"{kind}로 만들 수 없는 패입니다")
+    return group
@@ -0,0 +1,209 @@
+from dataclasses import dataclass
+from functools import cache
+from operator import add, itemgetter, mul
+
+import numpy as np
+
+from app.services.tiles import MAX_COPIES, TILE_KINDS, tile_counts
+
+
+# 한 패 종류(수패 한 색 또는 자패)에서 만들 몸통 수 0~4, 머리 수 0~1의 조합
+MAX_MELDS = 4
+TARGETS = (MAX_MELDS + 1) * 2
+
+UNREACHABLE = 99
+
+TERMINALS = (0, 8, 9, 17, 18, 26, 27, 28, 29, 30, 31, 32, 33)
+
+
+def _build_table(length: int, sequences: bool) -> bytes:
+    """패 종류 하나에 대해 장수 배열(5진수 인덱스)마다 (몸통 m, 머리 h)를 완성하는 데
+    더 필요한 최소 장수를 계산
+
+    왼쪽 패부터 한 장씩 보면서 "아직 다 채우지 못한 슌쯔" 상태를 들고 가는 DP를
+    모든 장수 배열에 대해 numpy로 한 번에 돌린다. 결과는 행마다 TARGETS 바이트.
+    """
+    counts = np.arange(MAX_COPIES + 1, dtype=np.int16)
+    # 상태: (몸통 수, 머리 수, 한 칸 전에 시작한 슌쯔 수, 두 칸 전에 시작한 슌쯔 수)
+    frontier = {(0, 0, 0, 0): np.zeros(1, dtype=np.int16)}
+
+    for position in range(length):
+        can_start_sequence = sequences and position <= length - 3
+        following: dict[tuple[int, int, int, int], np.ndarray] = {}
+
+        for (melds, heads, started_1, started_2), cost in frontier.items():
+            for new_sequences in range(MAX_MELDS - melds + 1 if can_start_sequence else 1):
+                for triplets in range(MAX_MELDS - melds - new_sequences + 1):
+                    for pairs in range(2 - heads):
+                        need = started_1 + started_2 + new_sequences + 3 * triplets + 2 * pairs
+                        if need > MAX_COPIES:
+                            continue
+
+                        state = (
+                            melds + new_sequences + triplets,
+                            heads + pairs,
+                            new_sequences,
+                            started_1,
+                        )
+                        missing = np.maximum(need - counts, 0)
+                        candidate = (cost[:, None] + missing[None, :]).reshape(-1)
+                        if state in following:
+                            np.minimum(following[state], candidate, out=following[state])
+                        else:
+                            following[state] = candidate
+
+        frontier = following
+
+    table = np.full(((MAX_COPIES + 1) ** length, TARGETS), UNREACHABLE, dtype=np.uint8)
+    for (melds, heads, started_1, started_2), cost in frontier.items():
+        if started_1 == 0 and started_2 == 0:
+            table[:, melds * 2 + heads] = cost
+    return table.tobytes()
+
+
+@cache
+def suit_table() -> bytes:
+    return _build_table(9, sequences=True)
+
+
+@cache
+def honor_table() -> bytes:
+    return _build_table(7, sequences=False)
+
+
+def load_tables() -> None:
+    suit_table()
+    honor_table()
+
+
+SUIT_WEIGHTS = tuple((MAX_COPIES + 1) ** (8 - position) for position in range(9))
+HONOR_WEIGHTS = SUIT_WEIGHTS[2:]
+
+
+@cache
+def _combinations(melds: int) -> tuple[tuple[itemgetter, itemgetter], ...]:
+    """두 패 종류의 (몸통, 머리) 결과를 합쳐 목표 (m, h)를 만드는 모든 분할.
+
+    목표마다 양쪽에서 골라야 할 열을 itemgetter로 묶어 두어 조회 시 min(map(add, ...))
+    한 번으로 끝나게 한다.
+    """
+    combinations = []
+    for target in range((melds + 1) * 2):
+        m, h = divmod(target, 2)
+        left, right = [], []
+        for k in range(m + 1):
+            for j in range(h + 1):
+                left.append((m - k) * 2 + h - j)
+                right.append(k * 2 + j)
+        # 항목이 하나뿐이어도 튜플을 돌려받도록 빈 열 하나를 덧붙임
+        combinations.append((itemgetter(*left, 0), itemgetter(*right, TARGETS)))
+    return tuple(combinations)
+
+
+def _row(table: bytes, counts: list[int], start: int, weights: tuple[int, ...]) -> bytes:
+    index = sum(map(mul, counts[start : start + len(weights)], weights))
+    # 마지막 바이트는 _combinations에서 덧붙이는 빈 열 자리
+    return table[index * TARGETS : (index + 1) * TARGETS] + b"\xff"
+
+
+def regular_shanten(counts: list[int], melds: int | None = None) -> int:
+    """일반형(4몸통 1머리) 샹텐. 울어서 손패가 줄었으면 남은 몸통 수로 계산"""
+    if melds is None:
+        melds = sum(counts) // 3
+
+    suits = suit_table()
+    rows = [_row(suits, counts, start, SUIT_WEIGHTS) for start in (0, 9, 18)]
+    rows.append(_row(honor_table(), counts, 27, HONOR_WEIGHTS))
+
+    # best[m * 2 + h]: 지금까지 본 패 종류로 몸통 m개, 머리 h개를 만드는 최소 장수
+    combinations = _combinations(melds)
+    best = rows[0]
+    for row in rows[1:-1]:
+        best = [min(map(add, left(best), right(row))) for left, right in combinations]
+        best.append(UNREACHABLE)
+    left, right = combinations[melds * 2 + 1]
+    return min(map(add, left(best), right(rows[-1]))) - 1
+
+
+def chiitoitsu_shanten(counts: list[int]) -> int:
+    pairs = sum(1 for count in counts if count >= 2)
+    kinds = sum(1 for count in counts if count > 0)
+    return 6 - pairs + max(0, 7 - kinds)
+
+
+def kokushi_shanten(counts: list[int]) -> int:
+    kinds = sum(1 for tile in TERMINALS if counts[tile] > 0)
+    has_pair = any(counts[tile] >= 2 for tile in TERMINALS)
+    return 13 - kinds - has_pair
+
+
+@dataclass(frozen=True)
+class Shanten:
+    shanten: int
+    regular: int
+    chiitoitsu: int | None
+    kokushi: int | None
+
+
+def calculate_shanten(counts: list[int]) -> Shanten:
+    total = sum(counts)
+    if total % 3 == 0 or total > 14:
+        raise ValueError(f"샹텐을 계산할 수 없는 장수입니다: {total}장")
+
+    regular = regular_shanten(counts)
+    # 칠대자와 국사무쌍은 울지 않은 13/14장 손패에서만 성립
+    if total >= 13:
+        chiitoitsu = chiitoitsu_shanten(counts)
+        kokushi = kokushi_shanten(counts)
+        return Shanten(min(regular, chiitoitsu, kokushi), regular, chiitoitsu, kokushi)
+    return Shanten(regular, regular, None, None)
+
+
+def shanten_of(counts: list[int]) -> int:
+    return calculate_shanten(counts).shanten
+
+
+def ukeire(counts: list[int], shanten: int | None = None) -> dict[int, int]:
+    """3n+1장 손패에서 샹텐 수를 줄이는 패와 남은 장수"""
+    if shanten is None:
+        shanten = shanten_of(counts)
+
+    accepted = {}
+    for tile in range(TILE_KINDS):
+        if counts[tile] >= MAX_COPIES:
+            continue
+        counts[tile] += 1
+        if shanten_of(counts) < shanten:
+            accepted[tile] = MAX_COPIES - counts[tile] + 1
+        counts[tile] -= 1
+    return accepted
+
+
+@dataclass(frozen=True)
+class Discard:
+    tile: int
+    shanten: int
+    ukeire: dict[int, int]
+
+
+def discard_options(counts: list[int]) -> list[Discard]:
+    """3n+2장 손패에서 버릴 수 있는 패마다 버린 뒤의 샹텐과 유효패"""
+    options = []
+    for tile in range(TILE_KINDS):
+        if counts[tile] == 0:
+            continue
+        counts[tile] -= 1
+        shanten = shanten_of(counts)
+        options.append(Discard(tile, shanten, ukeire(counts, shanten)))
+        counts[tile] += 1
+
+    options.sort(key=lambda option: (option.shanten, -sum(option.ukeire.values()), option.tile))
+    return options
+
+
+def analyze_hand(tiles: tuple[int, ...]) -> tuple[Shanten, dict[int, int] | list[Discard]]:
+    counts = tile_counts(tiles)
+    result = calculate_shanten(counts)
+    if len(tiles) % 3 == 1:
+        return result, ukeire(counts, result.shanten)
+    return result, discard_options(counts)
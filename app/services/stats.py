@@ -0,0 +1,45 @@
+from datetime import timedelta
+from zoneinfo import ZoneInfo
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.crud.stats import refresh_answer_stats, refresh_question_stats
+from app.db.database import AsyncSessionLocal
+from app.util.periodic import PeriodicTask
+
+
+settings = get_settings()
+
+STATS_TIMEZONE = ZoneInfo(settings.stats_timezone)
+
+# 커밋된 질문과 답변은 다음 갱신에 반영되므로 통계는 갱신 주기보다 오래되지 않음
+STATS_STALENESS_BOUND = timedelta(seconds=settings.stats_refresh_interval)
+
+
+async def refresh_stats(db: AsyncSession) -> int:
+    total = 0
+    for refresh in (refresh_question_stats, refresh_answer_stats):
+        while True:
+            processed = await refresh(
+                db,
+                STATS_TIMEZONE,
+                batch_size=settings.stats_batch_size,
+            )
+            await db.commit()
+            total += processed
+            if processed < settings.stats_batch_size:
+                break
+    return total
+
+
+async def _refresh_stats_periodically() -> int:
+    async with AsyncSessionLocal() as session:
+        return await refresh_stats(session)
+
+
+stats_refresher = PeriodicTask(
+    "stats-refresh",
+    settings.stats_refresh_interval,
+    _refresh_stats_periodically,
+)
@@ -0,0 +1,72 @@
+import re
+import unicodedata
+
+
+NON_WORD_PATTERN = re.compile(r"[^\w]+")
+HANGUL_PATTERN = re.compile(r"[가-힣]")
+
+
+def normalize_text(text: str) -> str:
+    """NFKC 정규화, 소문자화, 문장부호를 공백으로 바꾸고 공백을 하나로 합침"""
+    text = unicodedata.normalize("NFKC", text).lower()
+    return " ".join(NON_WORD_PATTERN.sub(" ", text).split())
+
+
+def char_shingles(text: str, size: int = 2) -> set[str]:
+    """띄어쓰기를 지운 문자 n-gram 집합
+
+    한국어는 띄어쓰기가 사람마다 달라서 공백을 없앤 음절 단위 n-gram이 단어 단위보다 안정적이다.
+    음절 하나에 정보가 많아 기본값은 2음절.
+    """
+    compact = normalize_text(text).replace(" ", "")
+    if len(compact) <= size:
+        return {compact} if compact else set()
+    return {compact[i : i + size] for i in range(len(compact) - size + 1)}
+
+
+def terms(text: str) -> list[str]:
+    """TF-IDF용 단어 목록. 한글 어절은 조사가 붙어 형태가 바뀌므로 2음절 단위로 쪼갬"""
+    result = []
+    for word in normalize_text(text).split():
+        if len(word) > 2 and HANGUL_PATTERN.search(word):
+            result.extend(word[i : i + 2] for i in range(len(word) - 1))
+        else:
+            result.append(word)
+    return result
+
+
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = [
+    "ㅏ", "ㅐ", "ㅑ", "ㅒ", "ㅓ", "ㅔ", "ㅕ", "ㅖ", "ㅗ", "ㅗㅏ", "ㅗㅐ",
+    "ㅗㅣ", "ㅛ", "ㅜ", "ㅜㅓ", "ㅜㅔ", "ㅜㅣ", "ㅠ", "ㅡ", "ㅡㅣ", "ㅣ",
+]  # fmt: skip
+JONGSEONG = [
+    "", "ㄱ", "ㄲ", "ㄱㅅ", "ㄴ", "ㄴㅈ", "ㄴㅎ", "ㄷ", "ㄹ", "ㄹㄱ",
+    "ㄹㅁ", "ㄹㅂ", "ㄹㅅ", "ㄹㅌ", "ㄹㅍ", "ㄹㅎ", "ㅁ", "ㅂ", "ㅂㅅ",
+    "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+]  # fmt: skip
+# 입력 중에 보이는 겹모음, 겹받침 자모도 키 입력 순서대로 풂
+COMPOUND_JAMO = {
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ", "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ", "ㅘ": "ㅗㅏ",
+    "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+}  # fmt: skip
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+
+
+def decompose_hangul(text: str) -> str:
+    """한글 음절을 키보드로 치는 순서의 자모로 풂. "닭" -> "ㄷㅏㄹㄱ"
+
+    입력 중인 "달ㄱ"도 같은 접두어가 되도록 겹모음과 겹받침까지 나눈다.
+    """
+    result = []
+    for char in text:
+        code = ord(char) - HANGUL_BASE
+        if 0 <= code <= HANGUL_LAST - HANGUL_BASE:
+            initial, rest = divmod(code, 21 * 28)
+            medial, final = divmod(rest, 28)
+            result.append(CHOSEONG[initial] + JUNGSEONG[medial] + JONGSEONG[final])
+        else:
+            result.append(COMPOUND_JAMO.get(char, char))
+    return "".join(result)
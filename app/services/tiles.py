@@ -0,0 +1,136 @@
+import re
+from functools import lru_cache
+
+
+# 타일 번호: 만수 1~9m = 0~8, 통수 1~9p = 9~17, 삭수 1~9s = 18~26, 자패 1~7z = 27~33
+SUITS = "mpsz"
+TILE_KINDS = 34
+MAX_COPIES = 4
+
+# 깡이 네 번 있는 손패까지 허용
+MAX_HAND_TILES = 18
+
+# 몇 장 안 되는 표기(예: "2m을 버림")는 비슷한 손패 검색에서 제외
+SIMILAR_HAND_MIN_TILES = 7
+
+HAND_PATTERN = re.compile(r"(?<![0-9A-Za-z])((?:[0-9]+[mpsz])+)(?![0-9A-Za-z])")
+GROUP_PATTERN = re.compile(r"([0-9]+)([mpsz])")
+
+
+def tile_index(number: int, suit: str) -> int:
+    if suit == "z" and not 1 <= number <= 7:
+        raise ValueError(f"자패는 1z~7z만 있습니다: {number}z")
+    # 수패의 0은 적5(아카도라)로 쓰이므로 일반 5와 같은 패로 취급
+    if number == 0:
+        number = 5
+    return SUITS.index(suit) * 9 + number - 1
+
+
+def tile_name(tile: int) -> str:
+    return f"{tile % 9 + 1}{SUITS[tile // 9]}"
+
+
+def parse_tiles(notation: str) -> tuple[int, ...]:
+    """MPSZ 표기를 장수 제한 없이 해석. 버림패처럼 손패가 아닌 패 묶음에 사용"""
+    if not re.fullmatch(r"(?:[0-9]+[mpsz])+", notation):
+        raise ValueError(f"잘못된 패 표기입니다: {notation}")
+
+    tiles = []
+    for numbers, suit in GROUP_PATTERN.findall(notation):
+        tiles.extend(tile_index(int(number), suit) for number in numbers)
+
+    counts = tile_counts(tiles)
+    if max(counts) > MAX_COPIES:
+        raise ValueError(f"같은 패는 {MAX_COPIES}장까지만 있습니다: {notation}")
+    return tuple(sorted(tiles))
+
+
+@lru_cache(maxsize=4096)
+def parse_hand(notation: str) -> tuple[int, ...]:
+    """MPSZ 표기(예: 123m456p789s11z)를 정렬된 타일 번호 튜플로 변환"""
+    tiles = parse_tiles(notation)
+    if len(tiles) > MAX_HAND_TILES:
+        raise ValueError(f"패가 너무 많습니다: {len(tiles)}장")
+    return tiles
+
+
+def format_hand(tiles: tuple[int, ...] | list[int]) -> str:
+    groups: dict[str, list[str]] = {suit: [] for suit in SUITS}
+    for tile in sorted(tiles):
+        groups[SUITS[tile // 9]].append(str(tile % 9 + 1))
+    return "".join("".join(numbers) + suit for suit, numbers in groups.items() if numbers)
+
+
+def tile_counts(tiles: tuple[int, ...] | list[int]) -> list[int]:
+    counts = [0] * TILE_KINDS
+    for tile in tiles:
+        counts[tile] += 1
+    return counts
+
+
+def encode_tiles(tiles: tuple[int, ...] | list[int]) -> list[int]:
+    """n번째로 등장한 같은 패를 tile * 4 + n으로 인코딩
+
+    배열 포함(@>) 연산만으로 "이 패들을 최소 이만큼 포함하는가"를 판단할 수 있다.
+    """
+    seen = [0] * TILE_KINDS
+    encoded = []
+    for tile in sorted(tiles):
+        encoded.append(tile * MAX_COPIES + seen[tile])
+        seen[tile] += 1
+    return encoded
+
+
+def extract_hands(text: str) -> list[tuple[int, ...]]:
+    """본문에서 MPSZ 표기를 찾아 중복 없이 반환. 해석할 수 없는 표기는 무시"""
+    hands = []
+    for notation in HAND_PATTERN.findall(text):
+        try:
+            hand = parse_hand(notation)
+        except ValueError:
+            continue
+        if hand not in hands:
+            hands.append(hand)
+    return hands
+
+
+def canonical_key(counts: list[int] | tuple[int, ...]) -> str:
+    """수패 세 색의 순서를 지운 손패 모양 키
+
+    색만 바꾼 손패(123m456p ↔ 123p456s)는 같은 키가 된다. 자패는 바람패와 삼원패의 역이
+    달라 서로 바꿀 수 없으므로 종류별 장수를 자리 그대로 둔다(11z ≠ 77z).
+    """
+    suits = sorted("".join(map(str, counts[start : start + 9])) for start in (0, 9, 18))
+    honors = "".join(map(str, counts[27:]))
+    return "/".join([*suits, honors])
+
+
+def neighbor_keys(tiles: tuple[int, ...] | list[int]) -> set[str]:
+    """한 장을 바꾸거나, 빼거나, 더한 손패들의 canonical_key"""
+    counts = tile_counts(tiles)
+    keys = set()
+    for removed in [None, *set(tiles)]:
+        if removed is not None:
+            counts[removed] -= 1
+        for added in [None, *range(TILE_KINDS)]:
+            if added is not None:
+                if counts[added] >= MAX_COPIES:
+                    continue
+                counts[added] += 1
+            keys.add(canonical_key(counts))
+            if added is not None:
+                counts[added] -= 1
+        if removed is not None:
+            counts[removed] += 1
+    return keys
+
+
+def similar_hand_keys(hands: list[tuple[int, ...]]) -> tuple[set[str], set[str]]:
+    """(같은 모양의 키, 한 장 차이 이내의 키). 짧은 표기는 건너뜀"""
+    exact, nearby = set(), set()
+    for hand in hands:
+        if len(hand) < SIMILAR_HAND_MIN_TILES:
+            continue
+        exact.add(canonical_key(tile_counts(hand)))
+        nearby |= neighbor_keys(hand)
+    return exact, nearby
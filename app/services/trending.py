@@ -0,0 +1,39 @@
+from datetime import timedelta
+
+from app.core.config import get_settings
+from app.crud.trending import prune_trending_scores, refresh_trending_scores
+from app.db.database import AsyncSessionLocal
+from app.util.periodic import PeriodicTask
+
+
+settings = get_settings()
+
+TRENDING_HALF_LIFE = timedelta(hours=settings.trending_half_life_hours)
+
+
+async def refresh_trending() -> int:
+    """마지막 갱신 이후 새로 달린 답변만 점수에 더하고, 충분히 식은 질문은 제거"""
+    total = 0
+    async with AsyncSessionLocal() as session:
+        while True:
+            processed = await refresh_trending_scores(
+                session,
+                TRENDING_HALF_LIFE,
+                batch_size=settings.trending_batch_size,
+            )
+            await session.commit()
+            total += processed
+            if processed < settings.trending_batch_size:
+                break
+
+        await prune_trending_scores(session, TRENDING_HALF_LIFE)
+        await session.commit()
+
+    return total
+
+
+trending_refresher = PeriodicTask(
+    "trending-refresh",
+    settings.trending_refresh_interval,
+    refresh_trending,
+)
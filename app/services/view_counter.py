@@ -0,0 +1,96 @@
+import asyncio
+import contextvars
+import logging
+from collections.abc import Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.crud.view_count import add_view_counts
+from app.db.database import AsyncSessionLocal
+from app.util.periodic import PeriodicTask
+
+
+settings = get_settings()
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCounter:
+    """프로세스 단위로 조회수를 메모리에 모아 두었다가 배치로 반영하는 카운터
+
+    조회마다 UPDATE를 하지 않고 flush 시점에 한 번의 upsert로 누적한다.
+    대기 중인 조회수가 max_pending에 도달하면 주기를 기다리지 않고 바로 flush하므로
+    프로세스가 비정상 종료되어도 잃는 조회수는 대략 max_pending 이하로 제한된다.
+    """
+
+    def __init__(
+        self,
+        max_pending: int,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+    ) -> None:
+        self.max_pending = max_pending
+        self._session_factory = session_factory
+        self._pending: dict[int, int] = {}
+        self._pending_total = 0
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: asyncio.Task | None = None
+
+    @property
+    def pending_total(self) -> int:
+        return self._pending_total
+
+    def pending(self, question_id: int) -> int:
+        return self._pending.get(question_id, 0)
+
+    def record(self, question_id: int) -> None:
+        self._pending[question_id] = self._pending.get(question_id, 0) + 1
+        self._pending_total += 1
+
+        if self._pending_total >= self.max_pending and (
+            self._flush_task is None or self._flush_task.done()
+        ):
+            # 조회 요청의 쿼리 수 한도와 라우트 이름을 물려받지 않도록 빈 컨텍스트에서 실행
+            self._flush_task = asyncio.create_task(self.flush(), context=contextvars.Context())
+
+    async def flush(self) -> int:
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+
+            deltas, self._pending = self._pending, {}
+            flushed, self._pending_total = self._pending_total, 0
+
+            committed = False
+            try:
+                async with self._session_factory() as session:
+                    await add_view_counts(session, deltas)
+                    await session.commit()
+                    committed = True
+            except Exception as e:
+                logger.error(f"조회수 반영 실패: {e}")
+                return 0
+            finally:
+                # 실패하거나 종료 중에 취소되어도 다음 flush에서 다시 반영하도록 되돌려 놓음
+                if not committed:
+                    for question_id, count in deltas.items():
+                        self._pending[question_id] = self._pending.get(question_id, 0) + count
+                    self._pending_total += flushed
+
+            return flushed
+
+    async def close(self) -> None:
+        """종료할 때 호출. 진행 중인 flush를 기다린 뒤 남은 조회수를 모두 반영"""
+        if self._flush_task is not None:
+            await self._flush_task
+            self._flush_task = None
+        await self.flush()
+
+
+view_counter = ViewCounter(max_pending=settings.view_count_max_pending)
+
+view_count_flusher = PeriodicTask(
+    "view-count-flush",
+    settings.view_count_flush_interval,
+    view_counter.flush,
+)
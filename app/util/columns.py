@@ -0,0 +1,11 @@
+from collections.abc import Sequence
+
+from sqlalchemy.orm import load_only
+from sqlalchemy.sql import Select
+
+
+def only_columns(query: Select, model: type, columns: Sequence[str] | None) -> Select:
+    """columns가 있으면 그 컬럼만 SELECT. 목록에서 쓰지 않는 긴 본문을 읽지 않기 위함"""
+    if columns is None:
+        return query
+    return query.options(load_only(*(getattr(model, column) for column in columns)))
@@ -0,0 +1,49 @@
+import asyncio
+import contextlib
+import contextvars
+import logging
+from collections.abc import Awaitable, Callable
+
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicTask:
+    """interval 초마다 func를 실행하는 백그라운드 태스크"""
+
+    def __init__(
+        self,
+        name: str,
+        interval: float,
+        func: Callable[[], Awaitable[object]],
+    ) -> None:
+        self.name = name
+        self.interval = interval
+        self._func = func
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        # 요청 처리 중에 시작되더라도 그 요청의 컨텍스트 변수를 물려받지 않게 함
+        self._task = asyncio.create_task(self._run(), name=self.name, context=contextvars.Context())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self._func()
+            except Exception:
+                logger.exception(f"주기 작업 실패: {self.name}")
@@ -0,0 +1,178 @@
+"""answers 힙 테이블과 월별 파티션 테이블의 목록 조회/삽입/VACUUM 비교
+
+로컬 PostgreSQL(DATABASE_URL)에 bench_partitioning 스키마를 만들어 측정하고 지운다.
+
+    uv run python -m benchmarks.answer_partitioning --questions 20000 --answers-per-question 10
+"""
+
+import argparse
+import math
+import random
+import statistics
+import time
+from datetime import UTC, date, datetime
+
+import psycopg
+
+from app.core.config import get_settings
+
+
+SCHEMA = "bench_partitioning"
+MONTHS = 24
+
+
+def month_start(day: date, offset: int = 0) -> date:
+    index = day.year * 12 + (day.month - 1) + offset
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def setup(conn: psycopg.Connection, questions: int, answers_per_question: int) -> None:
+    conn.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+    conn.execute(f"CREATE SCHEMA {SCHEMA}")
+    conn.execute(f"SET search_path TO {SCHEMA}")
+
+    conn.execute("CREATE TABLE questions (id int PRIMARY KEY, created_at timestamptz NOT NULL)")
+    columns = """
+        id int GENERATED BY DEFAULT AS IDENTITY,
+        question_id int NOT NULL REFERENCES questions(id) ON DELETE CASCADE,
+        content text NOT NULL,
+        author_nickname varchar(50) NOT NULL,
+        created_at timestamptz NOT NULL,
+        updated_at timestamptz NOT NULL
+    """
+    conn.execute(f"CREATE TABLE answers_heap ({columns}, PRIMARY KEY (id))")
+    conn.execute(
+        f"CREATE TABLE answers_part ({columns}, PRIMARY KEY (id, created_at)) "
+        "PARTITION BY RANGE (created_at)"
+    )
+
+    this_month = month_start(datetime.now(UTC).date())
+    for offset in range(-MONTHS, 4):
+        start = month_start(this_month, offset)
+        conn.execute(
+            f"CREATE TABLE answers_part_p{start:%Y%m} PARTITION OF answers_part "
+            f"FOR VALUES FROM ('{start}') TO ('{month_start(start, 1)}')"
+        )
+    conn.execute("CREATE TABLE answers_part_default PARTITION OF answers_part DEFAULT")
+
+    conn.execute(
+        """
+        INSERT INTO questions
+        SELECT g, now() - (random() * %(months)s * interval '30 days')
+        FROM generate_series(1, %(questions)s) g
+        """,
+        {"questions": questions, "months": MONTHS - 1},
+    )
+    for table in ("answers_heap", "answers_part"):
+        conn.execute(
+            f"""
+            INSERT INTO {table} (question_id, content, author_nickname, created_at, updated_at)
+            SELECT q.id, repeat('답변 내용 ', 20), 'user' || (random() * 1000)::int,
+                   least(q.created_at + random() * interval '30 days', now()), now()
+            FROM questions q, generate_series(1, %(per_question)s)
+            """,
+            {"per_question": answers_per_question},
+        )
+        conn.execute(f"CREATE INDEX ON {table} (question_id)")
+        conn.execute(f"ANALYZE {table}")
+    conn.execute("ANALYZE questions")
+    conn.commit()
+
+
+def timed(func, iterations: int) -> list[float]:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def report(name: str, samples: list[float]) -> None:
+    samples = sorted(samples)
+    p95 = samples[min(len(samples) - 1, math.ceil(len(samples) * 0.95) - 1)]
+    print(f"{name:<42} mean {statistics.mean(samples):8.3f} ms   p95 {p95:8.3f} ms")
+
+
+def bench_list(conn: psycopg.Connection, recent: list[dict], iterations: int) -> None:
+    # app.crud.answer.read_answers_by_question_id와 같은 모양의 쿼리
+    queries = {
+        "list  heap": "SELECT * FROM answers_heap WHERE question_id = %(q)s "
+        "ORDER BY created_at DESC LIMIT 100",
+        "list  partitioned (question_id only)": "SELECT * FROM answers_part "
+        "WHERE question_id = %(q)s ORDER BY created_at DESC LIMIT 100",
+        "list  partitioned (subquery bound)": "SELECT * FROM answers_part "
+        "WHERE question_id = %(q)s "
+        "AND created_at >= (SELECT created_at FROM questions WHERE id = %(q)s) "
+        "ORDER BY created_at DESC LIMIT 100",
+        "list  partitioned (parameter bound)": "SELECT * FROM answers_part "
+        "WHERE question_id = %(q)s AND created_at >= %(since)s "
+        "ORDER BY created_at DESC LIMIT 100",
+    }
+    for name, sql in queries.items():
+        report(
+            name,
+            timed(
+                lambda sql=sql: conn.execute(sql, random.choice(recent)).fetchall(),
+                iterations,
+            ),
+        )
+
+
+def bench_insert(conn: psycopg.Connection, recent: list[dict], iterations: int) -> None:
+    for table, name in (("answers_heap", "insert heap"), ("answers_part", "insert partitioned")):
+        sql = (
+            f"INSERT INTO {table} (question_id, content, author_nickname, created_at, updated_at) "
+            "VALUES (%(q)s, 'benchmark answer', 'bench', now(), now())"
+        )
+        report(
+            name,
+            timed(lambda sql=sql: conn.execute(sql, random.choice(recent)), iterations),
+        )
+        conn.commit()
+
+
+def bench_vacuum(conn: psycopg.Connection) -> None:
+    conn.autocommit = True
+    this_month = month_start(datetime.now(UTC).date())
+    targets = (
+        ("vacuum heap (whole table)", "answers_heap"),
+        ("vacuum partitioned (current month only)", f"answers_part_p{this_month:%Y%m}"),
+    )
+    for name, table in targets:
+        report(name, timed(lambda table=table: conn.execute(f"VACUUM {table}"), 3))
+    conn.autocommit = False
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--questions", type=int, default=20000)
+    parser.add_argument("--answers-per-question", type=int, default=10)
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--keep", action="store_true", help="측정 후 스키마를 지우지 않음")
+    args = parser.parse_args()
+
+    url = get_settings().database_url.replace("+psycopg", "")
+    with psycopg.connect(url) as conn:
+        print(f"seeding {args.questions} questions x {args.answers_per_question} answers ...")
+        setup(conn, args.questions, args.answers_per_question)
+
+        # 최근 3개월 질문: 실제 트래픽의 대부분
+        recent = [
+            {"q": question_id, "since": created_at}
+            for question_id, created_at in conn.execute(
+                "SELECT id, created_at FROM questions WHERE created_at > now() - interval '90 days'"
+            )
+        ]
+
+        bench_list(conn, recent, args.iterations)
+        bench_insert(conn, recent, args.iterations)
+        bench_vacuum(conn)
+
+        if not args.keep:
+            conn.execute(f"DROP SCHEMA {SCHEMA} CASCADE")
+            conn.commit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""DB 없이 HTTP 라우팅, 의존성, 직렬화 계층만 측정
+
+질문/답변 API를 메모리 저장소(app.repositories.memory)에 붙여 ASGI로 직접 호출한다.
+PostgreSQL 왕복이 빠지므로 남는 시간은 FastAPI와 pydantic에서 쓰는 시간이다.
+
+    uv run python -m benchmarks.http_layer --questions 5000 --answers-per-question 5
+"""
+
+import argparse
+import asyncio
+import logging
+import math
+import random
+import statistics
+import time
+
+from httpx import ASGITransport, AsyncClient
+
+from app.dependencies.repository import get_repository
+from app.main import app
+from app.repositories.memory import InMemoryRepository
+from app.schemas.answer import AnswerCreate
+from app.schemas.question import QuestionCreate
+
+
+AUTHORS = 50
+
+
+async def seed(repo: InMemoryRepository, questions: int, answers_per_question: int) -> list[int]:
+    question_ids = []
+    for i in range(questions):
+        question = await repo.create_question(
+            QuestionCreate(
+                title=f"벤치마크 질문 {i}번",
+                content=f"123m456p789s11z 손패에서 무엇을 버리나요? {'본문 ' * 100}",
+                author_nickname=f"작성자{i % AUTHORS}",
+            )
+        )
+        for j in range(answers_per_question):
+            await repo.create_answer(
+                question.id,
+                AnswerCreate(content=f"답변 {j}번입니다. {'설명 ' * 50}", author_nickname="답변자"),
+            )
+        question_ids.append(question.id)
+    return question_ids
+
+
+async def timed(client: AsyncClient, paths: list[str]) -> list[float]:
+    samples = []
+    for path in paths:
+        start = time.perf_counter()
+        response = await client.get(path)
+        samples.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+    return samples
+
+
+def report(name: str, samples: list[float]) -> None:
+    samples = sorted(samples)
+    p95 = samples[min(len(samples) - 1, math.ceil(len(samples) * 0.95) - 1)]
+    print(f"{name:<32} mean {statistics.mean(samples):8.3f} ms   p95 {p95:8.3f} ms")
+
+
+async def run(args: argparse.Namespace) -> None:
+    # app.main이 INFO로 설정하므로 요청마다 찍히는 httpx 로그를 끔
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    rng = random.Random(args.seed)
+    repo = InMemoryRepository()
+    print(f"seeding {args.questions} questions x {args.answers_per_question} answers ...")
+    question_ids = await seed(repo, args.questions, args.answers_per_question)
+
+    def sample(template: str) -> list[str]:
+        return [template.format(id=rng.choice(question_ids)) for _ in range(args.iterations)]
+
+    cases = {
+        "GET /questions": ["/questions?size=20"] * args.iterations,
+        "GET /questions (content)": ["/questions?size=20&fields=title,content"] * args.iterations,
+        "GET /questions?ids=": [
+            "/questions?ids=" + ",".join(str(i) for i in rng.sample(question_ids, 20))
+            for _ in range(args.iterations)
+        ],
+        "GET /questions/{id}": sample("/questions/{id}"),
+        "GET /questions/{id}/answers": sample("/questions/{id}/answers"),
+        "GET /authors/{nick}/questions": [
+            f"/authors/작성자{rng.randrange(AUTHORS)}/questions" for _ in range(args.iterations)
+        ],
+    }
+
+    app.dependency_overrides[get_repository] = lambda: repo
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+            for name, paths in cases.items():
+                await timed(client, paths[: args.iterations // 10])
+                report(name, await timed(client, paths))
+    finally:
+        app.dependency_overrides.clear()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--questions", type=int, default=5000)
+    parser.add_argument("--answers-per-question", type=int, default=5)
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
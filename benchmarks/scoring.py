@@ -0,0 +1,82 @@
+"""점수 계산 처리량 측정 (분해 캐시를 비운 경우와 데워진 경우)
+
+무작위 화료 손패를 만들어 app.services.scoring.score_hand를 반복 호출한다.
+
+    uv run python -m benchmarks.scoring --hands 5000
+"""
+
+import argparse
+import random
+import time
+
+from app.services.scoring import (
+    PAIR,
+    SEQUENCE,
+    TRIPLET,
+    Group,
+    WinContext,
+    _suit_decompositions,
+    decompose,
+    score_hand,
+)
+from app.services.tiles import MAX_COPIES, TILE_KINDS, tile_counts
+
+
+def random_winning_hand(rng: random.Random) -> tuple[tuple[int, ...], WinContext]:
+    while True:
+        groups = []
+        for _ in range(4):
+            if rng.random() < 0.6:
+                suit, start = rng.randrange(3), rng.randrange(7)
+                groups.append(Group(SEQUENCE, suit * 9 + start))
+            else:
+                groups.append(Group(TRIPLET, rng.randrange(TILE_KINDS)))
+        groups.append(Group(PAIR, rng.randrange(TILE_KINDS)))
+
+        tiles = tuple(sorted(tile for group in groups for tile in group.tiles))
+        if max(tile_counts(tiles)) <= MAX_COPIES:
+            context = WinContext(
+                win_tile=rng.choice(tiles),
+                round_wind=27,
+                seat_wind=rng.randrange(27, 31),
+                tsumo=rng.random() < 0.4,
+                riichi=True,
+            )
+            return tiles, context
+
+
+def run(hands: list, clear_cache: bool) -> float:
+    start = time.perf_counter()
+    for tiles, context in hands:
+        if clear_cache:
+            decompose.cache_clear()
+            _suit_decompositions.cache_clear()
+        score_hand(tiles, [], context)
+    return len(hands) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hands", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    hands = [random_winning_hand(rng) for _ in range(args.hands)]
+
+    cold = run(hands, clear_cache=True)
+
+    decompose.cache_clear()
+    _suit_decompositions.cache_clear()
+    first_pass = run(hands, clear_cache=False)
+    warm = run(hands, clear_cache=False)
+
+    print(f"cold cache   {cold:10.0f} hands/s")
+    print(f"first pass   {first_pass:10.0f} hands/s   (cache filling)")
+    print(f"warm cache   {warm:10.0f} hands/s")
+    print(f"decompose    {decompose.cache_info()}")
+    print(f"per suit     {_suit_decompositions.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""테이블 기반 샹텐 계산과 단순 재귀 탐색 비교
+
+무작위 13장 손패로 두 구현의 결과가 같은지 확인하고 호출당 시간을 잰다.
+
+    uv run python -m benchmarks.shanten --hands 2000
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from app.services.shanten import load_tables, regular_shanten
+from app.services.tiles import MAX_COPIES, TILE_KINDS, tile_counts
+
+
+def naive_regular_shanten(counts: list[int]) -> int:  # noqa: C901
+    """몸통, 탑쯔(두 장 조합), 머리를 하나씩 떼어 보며 모든 분해를 재귀로 탐색"""
+    melds_needed = sum(counts) // 3
+    counts = list(counts)
+    best = 2 * melds_needed
+
+    def search(tile: int, melds: int, partials: int, pair: int) -> None:  # noqa: C901
+        nonlocal best
+        while tile < TILE_KINDS and counts[tile] == 0:
+            tile += 1
+        if tile == TILE_KINDS:
+            usable = min(partials, melds_needed - melds)
+            best = min(best, 2 * melds_needed - 2 * melds - usable - pair)
+            return
+
+        in_suit = tile < 27
+        position = tile % 9
+        groups = []
+        if counts[tile] >= 3:
+            groups.append(((tile, tile, tile), 1, 0, 0))
+        if in_suit and position <= 6 and counts[tile + 1] and counts[tile + 2]:
+            groups.append(((tile, tile + 1, tile + 2), 1, 0, 0))
+        if counts[tile] >= 2:
+            if not pair:
+                groups.append(((tile, tile), 0, 0, 1))
+            groups.append(((tile, tile), 0, 1, 0))
+        if in_suit and position <= 7 and counts[tile + 1]:
+            groups.append(((tile, tile + 1), 0, 1, 0))
+        if in_suit and position <= 6 and counts[tile + 2]:
+            groups.append(((tile, tile + 2), 0, 1, 0))
+
+        for group, meld, partial, head in groups:
+            for t in group:
+                counts[t] -= 1
+            search(tile, melds + meld, partials + partial, pair + head)
+            for t in group:
+                counts[t] += 1
+
+        # 이 패를 고립패로 두고 넘어감
+        counts[tile] -= 1
+        search(tile, melds, partials, pair)
+        counts[tile] += 1
+
+    search(0, 0, 0, 0)
+    return best
+
+
+def random_hand(rng: random.Random, size: int = 13) -> list[int]:
+    wall = [tile for tile in range(TILE_KINDS) for _ in range(MAX_COPIES)]
+    return tile_counts(rng.sample(wall, size))
+
+
+def timed(func, hands: list[list[int]]) -> tuple[list[int], list[float]]:
+    results, samples = [], []
+    for counts in hands:
+        start = time.perf_counter()
+        results.append(func(counts))
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return results, samples
+
+
+def report(name: str, samples: list[float]) -> None:
+    samples = sorted(samples)
+    p99 = samples[int(len(samples) * 0.99) - 1]
+    print(f"{name:<10} mean {statistics.mean(samples):10.1f} us   p99 {p99:10.1f} us")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hands", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    load_tables()
+    print(f"table build {time.perf_counter() - start:.2f} s")
+
+    rng = random.Random(args.seed)
+    hands = [random_hand(rng) for _ in range(args.hands)]
+
+    table_results, table_samples = timed(regular_shanten, hands)
+    naive_results, naive_samples = timed(naive_regular_shanten, hands)
+
+    report("table", table_samples)
+    report("naive", naive_samples)
+    mismatches = sum(a != b for a, b in zip(table_results, naive_results, strict=True))
+    print(f"mismatches {mismatches} / {args.hands}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.database import get_session
 from app.main import app
+from app.services.list_cache import question_list_cache
 
 
 @pytest.fixture
@@ -12,6 +13,8 @@ async def api_client(db_session: AsyncSession):
         yield db_session
 
     app.dependency_overrides[get_session] = override_get_session
+    # 테스트마다 DB를 되돌리므로 앞 테스트가 캐시한 목록이 남지 않게 함
+    question_list_cache.invalidate()
 
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
         yield client
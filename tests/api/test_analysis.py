@@ -0,0 +1,96 @@
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+class TestAnalysisAPI:
+    async def test_shanten_with_ukeire(self, api_client: AsyncClient):
+        response = await api_client.get("/analysis/shanten", params={"hand": "11z123m456p789s23z"})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["hand"] == "123m456p789s1123z"
+        assert data["shanten"] == 1
+        assert "discards" not in data
+        assert {item["tile"] for item in data["ukeire"]} >= {"1z", "2z", "3z"}
+        assert data["ukeire_total"] == sum(item["remaining"] for item in data["ukeire"])
+
+    async def test_shanten_with_discards(self, api_client: AsyncClient):
+        response = await api_client.get("/analysis/shanten", params={"hand": "123m456p789s11225z"})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert "ukeire" not in data
+        assert data["discards"][0]["discard"] == "5z"
+        assert data["discards"][0]["shanten"] == 0
+
+    async def test_shanten_invalid_hand(self, api_client: AsyncClient):
+        response = await api_client.get("/analysis/shanten", params={"hand": "123m"})
+
+        assert response.status_code == 400
+
+    async def test_score(self, api_client: AsyncClient):
+        response = await api_client.post(
+            "/analysis/score",
+            json={"hand": "234m567m234p567s88s", "win_tile": "7s", "riichi": True},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["han"] == 3
+        assert data["fu"] == 30
+        assert data["ron"] == 5800
+        assert "tsumo_dealer" not in data
+
+    async def test_score_with_melds(self, api_client: AsyncClient):
+        response = await api_client.post(
+            "/analysis/score",
+            json={
+                "hand": "22m",
+                "win_tile": "2m",
+                "melds": [
+                    {"type": "pon", "tiles": "555z"},
+                    {"type": "chi", "tiles": "234p"},
+                    {"type": "pon", "tiles": "888s"},
+                    {"type": "chi", "tiles": "678m"},
+                ],
+                "seat_wind": "south",
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.json()["ron"] == 1000
+
+    async def test_score_no_yaku(self, api_client: AsyncClient):
+        response = await api_client.post(
+            "/analysis/score",
+            json={
+                "hand": "123m456p789s11z",
+                "win_tile": "1z",
+                "melds": [{"type": "chi", "tiles": "123m"}],
+            },
+        )
+
+        assert response.status_code == 400
+
+    async def test_discard(self, api_client: AsyncClient):
+        response = await api_client.post(
+            "/analysis/discard",
+            json={"hand": "123m456p789s11z23m5z", "draws": 4, "samples": 200, "seed": 1},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["complete"] is True
+        assert data["samples"] == 200
+        best = data["candidates"][0]
+        assert best["discard"] == "5z"
+        assert best["tenpai_probability"] == 1.0
+
+    async def test_discard_rejects_impossible_visible_tiles(self, api_client: AsyncClient):
+        response = await api_client.post(
+            "/analysis/discard",
+            json={"hand": "123m456p789s11z23m5z", "visible": "111z"},
+        )
+
+        assert response.status_code == 400
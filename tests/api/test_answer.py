@@ -1,11 +1,17 @@
+from datetime import UTC, datetime, timedelta
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.answer import create_answer
+from app.crud.archive import archive_questions
 from app.crud.question import create_question
+from app.models.question import Question
 from app.schemas.answer import AnswerCreate
 from app.schemas.question import QuestionCreate
+from app.services.list_cache import question_list_cache
 
 
 @pytest.mark.asyncio
@@ -84,6 +90,23 @@ class TestAnswerAPI:
         assert response.status_code == 200
         assert len(response.json()) == 3
 
+    async def test_list_answers_fields(
+        self,
+        api_client: AsyncClient,
+        db_session: AsyncSession,
+        question_id: int,
+        sample_answer_data: dict,
+    ):
+        await create_answer(db_session, question_id, AnswerCreate(**sample_answer_data))
+        await db_session.commit()
+
+        response = await api_client.get(
+            f"/questions/{question_id}/answers", params={"fields": "author_nickname,created_at"}
+        )
+
+        assert response.status_code == 200
+        assert response.json()[0].keys() == {"id", "author_nickname", "created_at"}
+
     async def test_list_answers_question_not_found(self, api_client: AsyncClient):
         response = await api_client.get("/questions/999999/answers")
 
@@ -241,3 +264,76 @@ class TestAnswerAPI:
 
         list_response = await api_client.get(f"/questions/{question.id}/answers")
         assert list_response.status_code == 404
+
+    async def test_archived_question_answers(
+        self,
+        api_client: AsyncClient,
+        db_session: AsyncSession,
+        question_id: int,
+        sample_answer_data: dict,
+    ):
+        answer_in = AnswerCreate(**sample_answer_data)
+        answer = await create_answer(db_session, question_id, answer_in)
+        old = datetime.now(UTC) - timedelta(days=800)
+        answer.created_at = old
+        await db_session.execute(
+            update(Question).where(Question.id == question_id).values(created_at=old)
+        )
+        await archive_questions(db_session, datetime.now(UTC) - timedelta(days=365))
+        await db_session.commit()
+
+        question = await api_client.get(f"/questions/{question_id}")
+        listed = await api_client.get(f"/questions/{question_id}/answers")
+        generation = question_list_cache.generation
+        created = await api_client.post(
+            f"/questions/{question_id}/answers",
+            json=sample_answer_data,
+        )
+        relisted = await api_client.get(f"/questions/{question_id}/answers")
+
+        assert question.status_code == 200
+        assert len(listed.json()) == 1
+        assert created.status_code == 201
+        assert len(relisted.json()) == 2
+        # 되살린 질문이 목록에 다시 나타나야 하므로 커밋 뒤 캐시를 비움
+        assert question_list_cache.generation > generation
+
+    async def test_stream_answers_not_found(self, api_client: AsyncClient):
+        response = await api_client.get("/questions/999999/answers/stream")
+
+        assert response.status_code == 404
+
+    async def test_batch_answers_with_archived(
+        self,
+        api_client: AsyncClient,
+        db_session: AsyncSession,
+        question_id: int,
+        sample_question_data: dict,
+        sample_answer_data: dict,
+    ):
+        answer_in = AnswerCreate(**sample_answer_data)
+        archived = await create_answer(db_session, question_id, answer_in)
+        old = datetime.now(UTC) - timedelta(days=800)
+        archived.created_at = old
+        await db_session.execute(
+            update(Question).where(Question.id == question_id).values(created_at=old)
+        )
+        await archive_questions(db_session, datetime.now(UTC) - timedelta(days=365))
+        other = await create_question(db_session, QuestionCreate(**sample_question_data))
+        active = await create_answer(db_session, other.id, answer_in)
+        await db_session.commit()
+
+        response = await api_client.get(
+            "/answers", params={"ids": f"{active.id},999999,{archived.id}"}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["id"] for item in data["items"]] == [active.id, archived.id]
+        assert data["items"][1]["question_id"] == question_id
+        assert data["missing_ids"] == [999999]
+
+    async def test_batch_answers_requires_ids(self, api_client: AsyncClient):
+        response = await api_client.get("/answers")
+
+        assert response.status_code == 400
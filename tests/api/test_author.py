@@ -0,0 +1,76 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.answer import create_answer
+from app.crud.question import create_question
+from app.schemas.answer import AnswerCreate
+from app.schemas.question import QuestionCreate
+
+
+@pytest.mark.asyncio
+class TestAuthorAPI:
+    async def test_list_author_questions_pages(
+        self,
+        api_client: AsyncClient,
+        db_session: AsyncSession,
+        sample_question_data: dict,
+    ):
+        for i in range(5):
+            data = {**sample_question_data, "title": f"작성자 질문 {i + 1}번"}
+            await create_question(db_session, QuestionCreate(**data))
+        await db_session.commit()
+
+        first = await api_client.get("/authors/테스터/questions?limit=3")
+        cursor = first.json()["next_cursor"]
+        second = await api_client.get(f"/authors/테스터/questions?limit=3&cursor={cursor}")
+
+        assert first.status_code == 200
+        assert len(first.json()["items"]) == 3
+        assert cursor is not None
+        assert len(second.json()["items"]) == 2
+        assert second.json()["next_cursor"] is None
+
+    async def test_list_author_answers(
+        self,
+        api_client: AsyncClient,
+        db_session: AsyncSession,
+        sample_question_data: dict,
+        sample_answer_data: dict,
+    ):
+        question = await create_question(db_session, QuestionCreate(**sample_question_data))
+        await create_answer(db_session, question.id, AnswerCreate(**sample_answer_data))
+        await db_session.commit()
+
+        response = await api_client.get("/authors/답변자/answers")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["items"]) == 1
+        assert data["items"][0]["question_id"] == question.id
+        assert data["next_cursor"] is None
+
+    async def test_list_author_questions_fields(
+        self,
+        api_client: AsyncClient,
+        db_session: AsyncSession,
+        sample_question_data: dict,
+    ):
+        for i in range(3):
+            data = {**sample_question_data, "title": f"작성자 질문 {i + 1}번"}
+            await create_question(db_session, QuestionCreate(**data))
+        await db_session.commit()
+
+        first = await api_client.get("/authors/테스터/questions?limit=2&fields=title")
+        cursor = first.json()["next_cursor"]
+        second = await api_client.get(
+            f"/authors/테스터/questions?limit=2&fields=title&cursor={cursor}"
+        )
+
+        assert first.json()["items"][0].keys() == {"id", "title"}
+        assert second.json()["items"][0]["title"] == "작성자 질문 1번"
+
+    async def test_invalid_cursor(self, api_client: AsyncClient):
+        response = await api_client.get("/authors/테스터/questions?cursor=invalid")
+
+        assert response.status_code == 400
@@ -0,0 +1,58 @@
+import pstats
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.config import get_settings
+
+
+ADMIN = {"X-Admin-Token": "test-token"}
+
+
+@pytest.fixture
+def profile_dir(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    monkeypatch.setattr(get_settings(), "admin_token", "test-token")
+    monkeypatch.setattr(get_settings(), "profile_dir", str(tmp_path))
+    return tmp_path
+
+
+@pytest.mark.asyncio
+class TestProfiling:
+    async def test_profiles_request_with_admin_header(self, api_client: AsyncClient, profile_dir):
+        response = await api_client.get("/questions", headers={"X-Profile": "1", **ADMIN})
+
+        assert response.status_code == 200
+        name = response.headers["X-Profile-Id"]
+        assert name.endswith("_GET_questions.prof")
+
+        listing = await api_client.get("/admin/profiles", headers=ADMIN)
+        assert [p["name"] for p in listing.json()] == [name]
+
+        download = await api_client.get(f"/admin/profiles/{name}", headers=ADMIN)
+        assert download.status_code == 200
+        path = profile_dir / "downloaded.prof"
+        path.write_bytes(download.content)
+        assert pstats.Stats(str(path)).total_calls > 0
+
+    async def test_profile_header_requires_admin_token(self, api_client: AsyncClient, profile_dir):
+        response = await api_client.get("/questions", headers={"X-Profile": "1"})
+
+        assert response.status_code == 200
+        assert "X-Profile-Id" not in response.headers
+        assert list(profile_dir.iterdir()) == []
+
+    async def test_sampled_requests_are_pruned(
+        self, api_client: AsyncClient, profile_dir, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(get_settings(), "profile_sample_rate", 1.0)
+        monkeypatch.setattr(get_settings(), "profile_max_files", 2)
+
+        names = [(await api_client.get("/questions")).headers["X-Profile-Id"] for _ in range(3)]
+
+        assert sorted(p.name for p in profile_dir.iterdir()) == names[1:]
+
+    @pytest.mark.usefixtures("profile_dir")
+    async def test_download_rejects_unknown_names(self, api_client: AsyncClient):
+        for name in ("missing.prof", "..%2Fsecret.prof"):
+            response = await api_client.get(f"/admin/profiles/{name}", headers=ADMIN)
+            assert response.status_code == 404
@@ -2,8 +2,10 @@ import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import get_settings
 from app.crud.question import create_question
 from app.schemas.question import QuestionCreate
+from app.services.list_cache import question_list_cache
 
 
 @pytest.mark.asyncio
@@ -110,3 +112,231 @@ class TestQuestionAPI:
         response = await api_client.delete("/questions/999999")
 
         assert response.status_code == 404
+
+    async def test_get_question_counts_views(
+        self,
+        api_client: AsyncClient,
+        db_session: AsyncSession,
+        sample_question_data: dict,
+    ):
+        question_in = QuestionCreate(**sample_question_data)
+        question = await create_question(db_session, question_in)
+        await db_session.commit()
+
+        first = await api_client.get(f"/questions/{question.id}")
+        second = await api_client.get(f"/questions/{question.id}")
+
+        assert second.json()["view_count"] == first.json()["view_count"] + 1
+
+    async def test_list_questions_by_tiles(
+        self,
+        api_client: AsyncClient,
+        db_session: AsyncSession,
+        sample_question_data: dict,
+    ):
+        data = {**sample_question_data, "content": "손패 55m789p123s 에서 무엇을 버리나요?"}
+        await create_question(db_session, QuestionCreate(**data))
+        await create_question(db_session, QuestionCreate(**sample_question_data))
+        await db_session.commit()
+
+        response = await api_client.get("/questions", params={"tiles": "789p"})
+
+        assert response.status_code == 200
+        assert response.json()["pagination"]["total"] == 1
+
+    async def test_list_questions_by_invalid_tiles(self, api_client: AsyncClient):
+        response = await api_client.get("/questions", params={"tiles": "9z"})
+
+        assert response.status_code == 400
+
+    async def test_similar_hands(
+        self,
+        api_client: AsyncClient,
+        db_session: AsyncSession,
+        sample_question_data: dict,
+    ):
+        source = await create_question(
+            db_session,
+            QuestionCreate(**{**sample_question_data, "content": "손패 123m456p789s1122z 질문"}),
+        )
+        other = await create_question(
+            db_session,
+            QuestionCreate(**{**sample_question_data, "content": "손패 123p456s789m1122z 질문"}),
+        )
+        await db_session.commit()
+
+        response = await api_client.get(f"/questions/{source.id}/similar-hands")
+
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()] == [other.id]
+        assert response.json()[0]["distance"] == 0
+
+    async def test_similar_hands_not_found(self, api_client: AsyncClient):
+        response = await api_client.get("/questions/999999/similar-hands")
+
+        assert response.status_code == 404
+
+    async def test_create_question_check_duplicates(
+        self,
+        api_client: AsyncClient,
+        sample_question_data: dict,
+    ):
+        data = {
+            **sample_question_data,
+            "title": "리치 후에 후리텐이면 론 할 수 있나요?",
+            "content": "리치를 걸고 나서 내가 버린 패로 대기가 후리텐이 되었습니다. 쯔모만 되나요?",
+        }
+        first = await api_client.post("/questions", json=data)
+        assert first.json()["duplicates"] == []
+
+        data["title"] = "리치 후 후리텐 이면 론 가능한가요?"
+        response = await api_client.post(
+            "/questions", json=data, params={"check_duplicates": "true"}
+        )
+
+        assert response.status_code == 201
+        duplicates = response.json()["duplicates"]
+        assert [item["id"] for item in duplicates] == [first.json()["id"]]
+        assert duplicates[0]["similarity"] >= 0.5
+
+        listed = await api_client.get(f"/questions/{first.json()['id']}/duplicates")
+        assert [item["id"] for item in listed.json()] == [response.json()["id"]]
+
+    async def test_duplicates_not_found(self, api_client: AsyncClient):
+        response = await api_client.get("/questions/999999/duplicates")
+
+        assert response.status_code == 404
+
+    async def test_related_questions(
+        self,
+        api_client: AsyncClient,
+        db_session: AsyncSession,
+        sample_question_data: dict,
+    ):
+        source = await create_question(
+            db_session,
+            QuestionCreate(
+                **{**sample_question_data, "title": "후리텐 질문", "content": "후리텐이면 론 가능?"}
+            ),
+        )
+        other = await create_question(
+            db_session,
+            QuestionCreate(
+                **{
+                    **sample_question_data,
+                    "title": "후리텐 론",
+                    "content": "후리텐 상태에서 론 가능?",
+                }
+            ),
+        )
+        await db_session.commit()
+        await api_client.patch(f"/questions/{other.id}", json={"title": "후리텐 론 질문"})
+
+        response = await api_client.get(f"/questions/{source.id}/related")
+
+        assert response.status_code == 200
+        assert other.id in [item["id"] for item in response.json()]
+
+    async def test_related_questions_not_found(self, api_client: AsyncClient):
+        response = await api_client.get("/questions/999999/related")
+
+        assert response.status_code == 404
+
+    async def test_autocomplete(self, api_client: AsyncClient, sample_question_data: dict):
+        created = await api_client.post(
+            "/questions", json={**sample_question_data, "title": "쿠이탕 자동완성 확인"}
+        )
+
+        response = await api_client.get("/questions/autocomplete", params={"q": "쿠이ㅌ"})
+
+        assert response.status_code == 200
+        assert response.json()[0] == {"id": created.json()["id"], "title": "쿠이탕 자동완성 확인"}
+
+        await api_client.delete(f"/questions/{created.json()['id']}")
+        response = await api_client.get("/questions/autocomplete", params={"q": "쿠이ㅌ"})
+        assert response.json() == []
+
+    async def test_batch_questions_preserves_order(
+        self,
+        api_client: AsyncClient,
+        db_session: AsyncSession,
+        sample_question_data: dict,
+    ):
+        first = await create_question(db_session, QuestionCreate(**sample_question_data))
+        second = await create_question(db_session, QuestionCreate(**sample_question_data))
+        await db_session.commit()
+
+        response = await api_client.get(
+            "/questions", params={"ids": f"{second.id},999999,{first.id},{second.id}"}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["id"] for item in data["items"]] == [second.id, first.id]
+        assert data["items"][0]["content"] == sample_question_data["content"]
+        assert data["missing_ids"] == [999999]
+
+    @pytest.mark.parametrize("ids", ["1,abc", ",", ",".join(str(i) for i in range(101))])
+    async def test_batch_questions_invalid_ids(self, api_client: AsyncClient, ids: str):
+        response = await api_client.get("/questions", params={"ids": ids})
+
+        assert response.status_code == 400
+
+    async def test_list_questions_fields(
+        self,
+        api_client: AsyncClient,
+        db_session: AsyncSession,
+        sample_question_data: dict,
+    ):
+        question = await create_question(db_session, QuestionCreate(**sample_question_data))
+        await db_session.commit()
+
+        default = await api_client.get("/questions")
+        selected = await api_client.get("/questions", params={"fields": "title,view_count"})
+
+        assert default.json()["items"][0].keys() == {"id", "title", "author_nickname"}
+        assert selected.status_code == 200
+        assert selected.json()["items"][0] == {
+            "id": question.id,
+            "title": sample_question_data["title"],
+            "view_count": 0,
+        }
+
+    async def test_list_questions_unknown_field(self, api_client: AsyncClient):
+        response = await api_client.get("/questions", params={"fields": "title,password"})
+
+        assert response.status_code == 400
+
+    async def test_list_questions_cached_until_write(
+        self,
+        api_client: AsyncClient,
+        sample_question_data: dict,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        await api_client.post("/questions", json=sample_question_data)
+        first = await api_client.get("/questions?page=1&size=10")
+        hits = question_list_cache.hits
+        cached = await api_client.get("/questions?page=1&size=10")
+
+        assert question_list_cache.hits == hits + 1
+        assert cached.content == first.content
+        assert cached.headers["content-type"] == "application/json"
+
+        # 캐시를 거치지 않은 응답과 본문이 같아야 함
+        monkeypatch.setattr(get_settings(), "question_list_cache_entries", 0)
+        assert (await api_client.get("/questions?page=1&size=10")).json() == cached.json()
+        monkeypatch.undo()
+
+        created = await api_client.post("/questions", json=sample_question_data)
+        after_create = await api_client.get("/questions?page=1&size=10")
+        assert after_create.json()["pagination"]["total"] == 2
+
+        question_id = created.json()["id"]
+        await api_client.patch(f"/questions/{question_id}", json={"title": "고친 질문 제목입니다"})
+        after_update = await api_client.get("/questions?page=1&size=10")
+        titles = {item["id"]: item["title"] for item in after_update.json()["items"]}
+        assert titles[question_id] == "고친 질문 제목입니다"
+
+        await api_client.delete(f"/questions/{question_id}")
+        after_delete = await api_client.get("/questions?page=1&size=10")
+        assert after_delete.json()["pagination"]["total"] == 1
@@ -0,0 +1,97 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.crud.job import enqueue_job
+from app.db.slow_queries import slow_query_log
+
+
+@pytest.mark.asyncio
+class TestStatsAPI:
+    async def test_get_stats(self, api_client: AsyncClient):
+        response = await api_client.get("/stats?days=7&top=5")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["daily"] == []
+        assert data["top_answerers"] == []
+        assert data["median_first_answer_seconds"] is None
+        assert data["staleness_bound_seconds"] > 0
+
+    async def test_refresh_requires_admin(self, api_client: AsyncClient):
+        response = await api_client.post("/admin/stats/refresh")
+
+        assert response.status_code == 403
+
+    async def test_refresh_with_admin_token(
+        self,
+        api_client: AsyncClient,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.setattr(get_settings(), "admin_token", "test-token")
+
+        response = await api_client.post(
+            "/admin/stats/refresh", headers={"X-Admin-Token": "test-token"}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["processed"] == 0
+
+        stats = await api_client.get("/stats")
+        assert stats.json()["refreshed_at"] is not None
+
+    async def test_job_metrics(
+        self,
+        api_client: AsyncClient,
+        db_session: AsyncSession,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.setattr(get_settings(), "admin_token", "test-token")
+        await enqueue_job(db_session, "stats.refresh")
+        await db_session.commit()
+
+        response = await api_client.get(
+            "/admin/jobs/metrics", headers={"X-Admin-Token": "test-token"}
+        )
+
+        assert response.status_code == 200
+        queue = response.json()["queues"][0]
+        assert (queue["kind"], queue["status"], queue["count"]) == ("stats.refresh", "pending", 1)
+        assert queue["lag_seconds"] >= 0
+        assert response.json()["worker"]["running"] == 0
+
+    async def test_slow_queries_report(
+        self,
+        api_client: AsyncClient,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.setattr(get_settings(), "admin_token", "test-token")
+        headers = {"X-Admin-Token": "test-token"}
+        monkeypatch.setattr(slow_query_log, "stats", {})
+        slow_query_log._aggregate("SELECT ?", "app.crud.a", "GET /a", 5.0, 1)
+        slow_query_log._aggregate("SELECT ?", "app.crud.a", "GET /a", 5.0, 1)
+        slow_query_log._aggregate("SELECT ? FROM b", "app.crud.b", None, 30.0, 0)
+
+        response = await api_client.get("/admin/slow-queries?order_by=count", headers=headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["tracked"] == 2
+        first = data["queries"][0]
+        assert (first["call_site"], first["count"], first["mean_ms"]) == ("app.crud.a", 2, 5.0)
+        assert first["routes"] == [{"route": "GET /a", "count": 2}]
+
+        response = await api_client.delete("/admin/slow-queries", headers=headers)
+        assert response.status_code == 204
+        assert slow_query_log.stats == {}
+
+    async def test_loop_lag(self, api_client: AsyncClient, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(get_settings(), "admin_token", "test-token")
+
+        response = await api_client.get("/admin/loop-lag", headers={"X-Admin-Token": "test-token"})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["buckets"][-1]["le_ms"] is None
+        assert data["watchdog"] is False
@@ -0,0 +1,40 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.answer import create_answer
+from app.crud.question import create_question
+from app.crud.trending import refresh_trending_scores
+from app.schemas.answer import AnswerCreate
+from app.schemas.question import QuestionCreate
+
+
+@pytest.mark.asyncio
+class TestTrendingAPI:
+    async def test_list_trending_questions(
+        self,
+        api_client: AsyncClient,
+        db_session: AsyncSession,
+        sample_question_data: dict,
+        sample_answer_data: dict,
+    ):
+        question = await create_question(db_session, QuestionCreate(**sample_question_data))
+        answer = await create_answer(db_session, question.id, AnswerCreate(**sample_answer_data))
+        answer.created_at = datetime.now(UTC) - timedelta(minutes=10)
+        await refresh_trending_scores(db_session, timedelta(hours=24))
+        await db_session.commit()
+
+        response = await api_client.get("/questions/trending")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data[0]["id"] == question.id
+        assert data[0]["answer_count"] == 1
+
+    async def test_list_trending_questions_empty(self, api_client: AsyncClient):
+        response = await api_client.get("/questions/trending?limit=5")
+
+        assert response.status_code == 200
+        assert response.json() == []
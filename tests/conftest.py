@@ -64,6 +64,28 @@ async def drop_test_database():
     await engine.dispose()
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-plans",
+        action="store_true",
+        help="큰 데이터로 실행 계획 회귀 검사(tests/plans)를 실행",
+    )
+    parser.addoption(
+        "--update-plans",
+        action="store_true",
+        help="실행 계획 골든 파일을 현재 계획으로 갱신",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-plans"):
+        return
+    skip = pytest.mark.skip(reason="--run-plans를 주면 실행")
+    for item in items:
+        if item.get_closest_marker("plans") is not None:
+            item.add_marker(skip)
+
+
 @pytest.fixture(scope="session")
 def event_loop():
     loop = asyncio.get_event_loop_policy().new_event_loop()
@@ -1,3 +1,5 @@
+from datetime import timedelta
+
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -5,6 +7,7 @@ from app.crud.answer import (
     create_answer,
     delete_answer,
     read_answer_by_id,
+    read_answers_by_author,
     read_answers_by_question_id,
     update_answer,
 )
@@ -59,6 +62,21 @@ class TestAnswerCRUD:
 
         assert answer is None
 
+    async def test_read_answer_by_id_created_after(
+        self,
+        db_session: AsyncSession,
+        question_id: int,
+        sample_answer_data: dict,
+    ):
+        answer_in = AnswerCreate(**sample_answer_data)
+        created_answer = await create_answer(db_session, question_id, answer_in)
+        created_at = created_answer.created_at
+
+        assert await read_answer_by_id(db_session, created_answer.id, created_at) is not None
+        # 하한 이전에 달린 답변은 찾지 않음
+        later = created_at + timedelta(seconds=1)
+        assert await read_answer_by_id(db_session, created_answer.id, later) is None
+
     async def test_read_answers_by_question_id(
         self,
         db_session: AsyncSession,
@@ -256,3 +274,22 @@ class TestAnswerCRUD:
         )
         assert len(page_last) == 1
         assert total == 10
+
+    async def test_read_answers_by_author_keyset(
+        self,
+        db_session: AsyncSession,
+        question_id: int,
+        sample_answer_data: dict,
+    ):
+        for _ in range(3):
+            await create_answer(db_session, question_id, AnswerCreate(**sample_answer_data))
+
+        first_page = await read_answers_by_author(db_session, "답변자", limit=2)
+        last = first_page[-1]
+        second_page = await read_answers_by_author(
+            db_session, "답변자", limit=2, after=(last.created_at, last.id)
+        )
+
+        assert len(first_page) == 2
+        assert len(second_page) == 1
+        assert await read_answers_by_author(db_session, "없는사람") == []
@@ -0,0 +1,150 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.answer import create_answer, read_answer_by_id
+from app.crud.archive import (
+    archive_questions,
+    read_archived_answers_by_question_id,
+    restore_question,
+)
+from app.crud.question import create_question, read_question_by_id, read_questions
+from app.crud.view_count import add_view_counts
+from app.models.archive import ArchivedAnswer, ArchivedQuestion
+from app.models.question import Question
+from app.schemas.answer import AnswerCreate
+from app.schemas.question import QuestionCreate
+
+
+CUTOFF = datetime.now(UTC) - timedelta(days=365)
+
+
+@pytest.mark.asyncio
+class TestArchiveCRUD:
+    @pytest.fixture
+    def add_question(
+        self,
+        db_session: AsyncSession,
+        sample_question_data: dict,
+        sample_answer_data: dict,
+    ):
+        async def _add_question(age: timedelta, answer_age: timedelta | None = None):
+            question = await create_question(db_session, QuestionCreate(**sample_question_data))
+            question.created_at = datetime.now(UTC) - age
+            answer_id = None
+            if answer_age is not None:
+                answer = await create_answer(
+                    db_session, question.id, AnswerCreate(**sample_answer_data)
+                )
+                answer.created_at = datetime.now(UTC) - answer_age
+                answer_id = answer.id
+            await db_session.flush()
+            return question.id, answer_id
+
+        return _add_question
+
+    async def test_archive_moves_only_cold_questions(
+        self,
+        db_session: AsyncSession,
+        add_question,
+    ):
+        cold_id, cold_answer_id = await add_question(timedelta(days=800), timedelta(days=700))
+        answered_id, _ = await add_question(timedelta(days=800), timedelta(days=3))
+        fresh_id, _ = await add_question(timedelta(days=10))
+
+        archived = await archive_questions(db_session, CUTOFF)
+        db_session.expire_all()
+
+        assert archived == [cold_id]
+        question = await read_question_by_id(db_session, cold_id)
+        assert isinstance(question, ArchivedQuestion)
+        answer = await read_answer_by_id(db_session, cold_answer_id)
+        assert isinstance(answer, ArchivedAnswer)
+        assert isinstance(await read_question_by_id(db_session, answered_id), Question)
+        assert isinstance(await read_question_by_id(db_session, fresh_id), Question)
+
+        questions, total = await read_questions(db_session)
+        assert total == 2
+        assert cold_id not in [q.id for q in questions]
+
+    async def test_archive_keeps_recently_viewed_questions(
+        self,
+        db_session: AsyncSession,
+        add_question,
+    ):
+        question_id, _ = await add_question(timedelta(days=800))
+        await add_view_counts(db_session, {question_id: 3})
+
+        archived = await archive_questions(db_session, CUTOFF)
+
+        assert archived == []
+
+    async def test_view_counts_reach_archived_question(
+        self,
+        db_session: AsyncSession,
+        add_question,
+    ):
+        question_id, _ = await add_question(timedelta(days=800))
+        await archive_questions(db_session, CUTOFF)
+
+        await add_view_counts(db_session, {question_id: 3})
+        await add_view_counts(db_session, {question_id: 2})
+        db_session.expire_all()
+
+        question = await read_question_by_id(db_session, question_id)
+        assert isinstance(question, ArchivedQuestion)
+        assert question.view_count == 5
+
+    async def test_archive_respects_batch_size(
+        self,
+        db_session: AsyncSession,
+        add_question,
+    ):
+        for _ in range(3):
+            await add_question(timedelta(days=800))
+
+        first = await archive_questions(db_session, CUTOFF, batch_size=2)
+        second = await archive_questions(db_session, CUTOFF, batch_size=2)
+
+        assert len(first) == 2
+        assert len(second) == 1
+
+    async def test_restore_question_moves_answers_back(
+        self,
+        db_session: AsyncSession,
+        add_question,
+    ):
+        question_id, answer_id = await add_question(timedelta(days=800), timedelta(days=700))
+        await archive_questions(db_session, CUTOFF)
+        answers, total = await read_archived_answers_by_question_id(db_session, question_id)
+        assert total == 1
+        assert answers[0].id == answer_id
+
+        restored = await restore_question(db_session, question_id)
+        db_session.expire_all()
+
+        assert restored is not None
+        assert isinstance(await read_question_by_id(db_session, question_id), Question)
+        assert await read_archived_answers_by_question_id(db_session, question_id) == ([], 0)
+        answer = await read_answer_by_id(db_session, answer_id)
+        assert answer is not None
+        assert answer.question_id == question_id
+
+    async def test_restore_question_twice_returns_active_question(
+        self,
+        db_session: AsyncSession,
+        add_question,
+    ):
+        question_id, _ = await add_question(timedelta(days=800), timedelta(days=700))
+        await archive_questions(db_session, CUTOFF)
+        first = await restore_question(db_session, question_id)
+
+        # 다른 요청이 먼저 되살린 경우처럼 보관 행이 이미 없음
+        second = await restore_question(db_session, question_id)
+
+        assert second is not None
+        assert second.id == first.id
+
+    async def test_restore_question_not_archived(self, db_session: AsyncSession):
+        assert await restore_question(db_session, 999999) is None
@@ -0,0 +1,46 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.hand import read_similar_hand_questions
+from app.crud.question import create_question
+from app.schemas.question import QuestionCreate
+from app.services.tiles import parse_hand
+
+
+@pytest.mark.asyncio
+class TestHandCRUD:
+    @pytest.fixture
+    def add_question(self, db_session: AsyncSession, sample_question_data: dict):
+        async def _add_question(content: str) -> int:
+            data = {**sample_question_data, "content": content}
+            question = await create_question(db_session, QuestionCreate(**data))
+            return question.id
+
+        return _add_question
+
+    async def test_similar_hands_by_distance(self, db_session: AsyncSession, add_question):
+        source = await add_question("손패 123m456p789s1122z 에서 어떻게 하나요?")
+        permuted = await add_question("손패 123s456m789p1122z 질문입니다.")
+        one_off = await add_question("손패 124m456p789s1122z 질문입니다.")
+        # 자패 종류가 다르면 같은 모양이 아님
+        await add_question("손패 123m456p789s5566z 질문입니다.")
+        await add_question("손패 19m19p19s1234567z 질문입니다.")
+        await add_question("2m 하나만 적은 짧은 질문입니다.")
+
+        rows = await read_similar_hand_questions(
+            db_session, source, [parse_hand("123m456p789s1122z")]
+        )
+
+        assert [(question.id, distance) for question, _, distance in rows] == [
+            (permuted, 0),
+            (one_off, 1),
+        ]
+        assert rows[0][1] == "456m789p123s1122z"
+
+    async def test_similar_hands_skip_short_notation(self, db_session: AsyncSession, add_question):
+        source = await add_question("2m 과 3m 중 어느 것을 버리나요?")
+        await add_question("2m 이 좋다고 생각합니다.")
+
+        rows = await read_similar_hand_questions(db_session, source, [parse_hand("2m")])
+
+        assert rows == []
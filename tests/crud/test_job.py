@@ -0,0 +1,111 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.job import (
+    claim_jobs,
+    complete_job,
+    delete_finished_jobs,
+    enqueue_job,
+    fail_job,
+    read_job_queue_stats,
+    requeue_stale_jobs,
+    touch_job,
+)
+from app.models.job import Job
+
+
+@pytest.mark.asyncio
+class TestJobCRUD:
+    async def test_claim_only_ready_jobs_in_order(self, db_session: AsyncSession):
+        later = await enqueue_job(
+            db_session, "test.later", run_at=datetime.now(UTC) + timedelta(hours=1)
+        )
+        first = await enqueue_job(db_session, "test.first", {"n": 1})
+        second = await enqueue_job(db_session, "test.second")
+
+        claimed = await claim_jobs(db_session, 10)
+
+        assert [job.id for job in claimed] == [first.id, second.id]
+        assert all(job.status == "running" and job.attempts == 1 for job in claimed)
+        assert claimed[0].payload == {"n": 1}
+        assert later.id not in [job.id for job in await claim_jobs(db_session, 10)]
+
+    async def test_claim_skips_locked_rows(self, test_engine):
+        # 다른 연결에서 잠근 행을 보려면 실제로 커밋되어야 하므로 테스트 트랜잭션 밖에서 실행
+        async with AsyncSession(test_engine, expire_on_commit=False) as session:
+            job = await enqueue_job(session, "test.locked")
+            await session.commit()
+
+        try:
+            async with test_engine.connect() as other:
+                await other.execute(select(Job.id).where(Job.id == job.id).with_for_update())
+                async with AsyncSession(test_engine) as session:
+                    assert await claim_jobs(session, 10) == []
+                await other.rollback()
+        finally:
+            async with test_engine.begin() as conn:
+                await conn.execute(delete(Job).where(Job.id == job.id))
+
+    async def test_fail_with_retry_and_final(self, db_session: AsyncSession):
+        retried = await enqueue_job(db_session, "test.fail")
+        failed = await enqueue_job(db_session, "test.fail")
+        await claim_jobs(db_session, 10)
+
+        assert await fail_job(db_session, retried.id, 1, "boom", timedelta(minutes=5))
+        await db_session.refresh(retried)
+        assert (retried.status, retried.last_error) == ("pending", "boom")
+        assert retried.run_at > await db_session.scalar(select(func.now()))
+
+        assert await fail_job(db_session, failed.id, 1, "boom again", None)
+        await db_session.refresh(failed)
+        assert failed.status == "failed"
+        assert failed.finished_at is not None
+
+    async def test_lost_claim_cannot_finish_job(self, db_session: AsyncSession):
+        job = await enqueue_job(db_session, "test.lost")
+        await claim_jobs(db_session, 10)
+        assert await touch_job(db_session, job.id, 1)
+
+        # 멈춘 것으로 보고 다시 넣은 작업을 다른 워커가 가져감
+        await requeue_stale_jobs(db_session, datetime.now(UTC) + timedelta(seconds=1))
+        await claim_jobs(db_session, 10)
+
+        assert not await touch_job(db_session, job.id, 1)
+        assert not await complete_job(db_session, job.id, 1)
+        assert not await fail_job(db_session, job.id, 1, "late", None)
+        assert await complete_job(db_session, job.id, 2)
+
+    async def test_requeue_stale_and_delete_finished(self, db_session: AsyncSession):
+        stale = await enqueue_job(db_session, "test.stale")
+        done = await enqueue_job(db_session, "test.done")
+        done_id = done.id
+        await claim_jobs(db_session, 10)
+        await complete_job(db_session, done_id, 1)
+        long_ago = datetime.now(UTC) - timedelta(days=30)
+        await db_session.execute(update(Job).where(Job.id == stale.id).values(locked_at=long_ago))
+        await db_session.execute(update(Job).where(Job.id == done_id).values(finished_at=long_ago))
+
+        cutoff = datetime.now(UTC) - timedelta(days=1)
+        assert await requeue_stale_jobs(db_session, cutoff) == 1
+        assert await delete_finished_jobs(db_session, cutoff) == 1
+
+        await db_session.refresh(stale)
+        assert stale.status == "pending"
+        remaining = select(func.count()).select_from(Job).where(Job.id == done_id)
+        assert await db_session.scalar(remaining) == 0
+
+    async def test_queue_stats(self, db_session: AsyncSession):
+        await enqueue_job(db_session, "test.stats")
+        await enqueue_job(db_session, "test.stats", run_at=datetime.now(UTC) + timedelta(hours=1))
+
+        stats = {
+            (kind, status): (count, oldest)
+            for kind, status, count, oldest in await read_job_queue_stats(db_session)
+        }
+
+        count, oldest = stats[("test.stats", "pending")]
+        assert count == 2
+        assert oldest is not None
@@ -6,9 +6,11 @@ from app.crud.question import (
     delete_question,
     read_question_by_id,
     read_questions,
+    read_questions_by_author,
     update_question,
 )
 from app.schemas.question import QuestionCreate, QuestionUpdate
+from app.services.tiles import parse_hand
 
 
 @pytest.mark.asyncio
@@ -216,3 +218,63 @@ class TestQuestionCRUD:
         page_last, total = await read_questions(db_session, skip=9, limit=3)
         assert len(page_last) == 1
         assert total == 10
+
+    async def test_read_questions_by_author_keyset(
+        self,
+        db_session: AsyncSession,
+        sample_question_data: dict,
+    ):
+        for i in range(5):
+            data = {**sample_question_data, "title": f"작성자 질문 {i + 1}번"}
+            await create_question(db_session, QuestionCreate(**data))
+        other = {**sample_question_data, "author_nickname": "다른사람"}
+        await create_question(db_session, QuestionCreate(**other))
+
+        first_page = await read_questions_by_author(db_session, "테스터", limit=3)
+        last = first_page[-1]
+        second_page = await read_questions_by_author(
+            db_session, "테스터", limit=3, after=(last.created_at, last.id)
+        )
+
+        assert len(first_page) == 3
+        assert len(second_page) == 2
+        ids = [q.id for q in first_page + second_page]
+        assert ids == sorted(ids, reverse=True)
+
+    async def test_read_questions_by_tiles(
+        self,
+        db_session: AsyncSession,
+        sample_question_data: dict,
+    ):
+        for content in (
+            "손패 123m456p789s1155z 에서 무엇을 버리나요?",
+            "손패 123m456p789s11z 에서 무엇을 버리나요?",
+            "패 표기가 없는 일반적인 질문입니다.",
+        ):
+            data = {**sample_question_data, "content": content}
+            await create_question(db_session, QuestionCreate(**data))
+
+        both, both_total = await read_questions(db_session, tiles=parse_hand("11z"))
+        white_pair, pair_total = await read_questions(db_session, tiles=parse_hand("55z"))
+        missing, missing_total = await read_questions(db_session, tiles=parse_hand("111z"))
+
+        assert both_total == 2
+        assert pair_total == 1
+        assert "1155z" in white_pair[0].content
+        assert missing_total == 0
+
+    async def test_update_question_reindexes_hands(
+        self,
+        db_session: AsyncSession,
+        sample_question_data: dict,
+    ):
+        question = await create_question(db_session, QuestionCreate(**sample_question_data))
+
+        await update_question(
+            db_session,
+            question.id,
+            QuestionUpdate(content="이제는 손패 234p567s 를 묻습니다."),
+        )
+
+        _, total = await read_questions(db_session, tiles=parse_hand("234p"))
+        assert total == 1
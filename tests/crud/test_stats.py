@@ -0,0 +1,124 @@
+from datetime import UTC, date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.answer import create_answer
+from app.crud.question import create_question
+from app.crud.stats import (
+    bucket_midpoint,
+    latency_bucket,
+    read_daily_activity,
+    read_first_answer_latency,
+    read_stats_refreshed_at,
+    read_top_answerers,
+    refresh_answer_stats,
+    refresh_question_stats,
+)
+from app.crud.watermark import ANSWER_STATS_WATERMARK, add_deltas
+from app.models.watermark import AggregateDelta
+from app.schemas.answer import AnswerCreate
+from app.schemas.question import QuestionCreate
+
+
+TZ = ZoneInfo("Asia/Seoul")
+
+
+@pytest.mark.asyncio
+class TestStatsCRUD:
+    @pytest.fixture
+    async def question(self, db_session: AsyncSession, sample_question_data: dict):
+        question = await create_question(db_session, QuestionCreate(**sample_question_data))
+        question.created_at = datetime(2026, 3, 1, 0, 0, tzinfo=UTC)
+        await db_session.flush()
+        return question
+
+    @pytest.fixture
+    def add_answer(self, db_session: AsyncSession, sample_answer_data: dict):
+        async def _add_answer(question_id: int, author: str, created_at: datetime):
+            data = {**sample_answer_data, "author_nickname": author}
+            answer = await create_answer(db_session, question_id, AnswerCreate(**data))
+            answer.created_at = created_at
+            await db_session.flush()
+            return answer
+
+        return _add_answer
+
+    async def test_latency_bucket_midpoint_is_close(self):
+        for seconds in (1, 60, 3600, 86400):
+            assert bucket_midpoint(latency_bucket(seconds)) == pytest.approx(seconds, rel=0.2)
+
+    async def test_refresh_builds_rollups(
+        self,
+        db_session: AsyncSession,
+        question,
+        add_answer,
+    ):
+        base = question.created_at
+        await add_answer(question.id, "고수", base + timedelta(hours=2))
+        await add_answer(question.id, "고수", base + timedelta(hours=3))
+        await add_answer(question.id, "초보", base + timedelta(days=1))
+
+        assert await refresh_question_stats(db_session, TZ) == 1
+        assert await refresh_answer_stats(db_session, TZ) == 3
+
+        daily = await read_daily_activity(db_session, date(2026, 3, 1))
+        assert [(d.day, d.question_count, d.answer_count) for d in daily] == [
+            (date(2026, 3, 1), 1, 2),
+            (date(2026, 3, 2), 0, 1),
+        ]
+
+        top = await read_top_answerers(db_session)
+        assert [(a.author_nickname, a.answer_count) for a in top] == [("고수", 2), ("초보", 1)]
+
+        median, answered = await read_first_answer_latency(db_session)
+        assert answered == 1
+        assert median == pytest.approx(7200, rel=0.2)
+
+    async def test_refresh_counts_first_answer_once(
+        self,
+        db_session: AsyncSession,
+        question,
+        add_answer,
+    ):
+        base = question.created_at
+        await add_answer(question.id, "고수", base + timedelta(minutes=10))
+        await refresh_answer_stats(db_session, TZ)
+
+        await add_answer(question.id, "고수", base + timedelta(minutes=20))
+        assert await refresh_answer_stats(db_session, TZ) == 1
+
+        _, answered = await read_first_answer_latency(db_session)
+        assert answered == 1
+
+    async def test_refresh_picks_up_late_commits(
+        self,
+        db_session: AsyncSession,
+        question,
+        add_answer,
+    ):
+        base = question.created_at
+        late = await add_answer(question.id, "고수", base + timedelta(minutes=10))
+        # ID를 먼저 받았지만 아직 커밋되지 않은 답변처럼 delta를 숨김
+        await db_session.execute(delete(AggregateDelta).where(AggregateDelta.row_id == late.id))
+        await add_answer(question.id, "초보", base + timedelta(minutes=20))
+        assert await refresh_answer_stats(db_session, TZ) == 1
+
+        await add_deltas(db_session, [ANSWER_STATS_WATERMARK], late.id)
+
+        assert await refresh_answer_stats(db_session, TZ) == 1
+        top = await read_top_answerers(db_session)
+        assert [(a.author_nickname, a.answer_count) for a in top] == [("고수", 1), ("초보", 1)]
+
+    async def test_refresh_records_time_without_new_rows(self, db_session: AsyncSession):
+        assert await read_stats_refreshed_at(db_session) is None
+
+        await refresh_question_stats(db_session, TZ)
+        await refresh_answer_stats(db_session, TZ)
+
+        assert await read_stats_refreshed_at(db_session) is not None
+
+    async def test_read_first_answer_latency_empty(self, db_session: AsyncSession):
+        assert await read_first_answer_latency(db_session) == (None, 0)
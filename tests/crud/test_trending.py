@@ -0,0 +1,113 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.answer import create_answer
+from app.crud.question import create_question
+from app.crud.trending import (
+    prune_trending_scores,
+    read_trending_questions,
+    refresh_trending_scores,
+)
+from app.crud.watermark import TRENDING_WATERMARK, add_deltas
+from app.models.watermark import AggregateDelta
+from app.schemas.answer import AnswerCreate
+from app.schemas.question import QuestionCreate
+
+
+HALF_LIFE = timedelta(hours=24)
+
+
+@pytest.mark.asyncio
+class TestTrendingCRUD:
+    @pytest.fixture
+    def add_answer(self, db_session: AsyncSession, sample_answer_data: dict):
+        async def _add_answer(question_id: int, age: timedelta):
+            answer_in = AnswerCreate(**sample_answer_data)
+            answer = await create_answer(db_session, question_id, answer_in)
+            answer.created_at = datetime.now(UTC) - age
+            await db_session.flush()
+            return answer
+
+        return _add_answer
+
+    @pytest.fixture
+    def add_question(self, db_session: AsyncSession, sample_question_data: dict):
+        async def _add_question() -> int:
+            question = await create_question(db_session, QuestionCreate(**sample_question_data))
+            return question.id
+
+        return _add_question
+
+    async def test_refresh_ranks_by_decayed_activity(
+        self,
+        db_session: AsyncSession,
+        add_question,
+        add_answer,
+    ):
+        old_id = await add_question()
+        fresh_id = await add_question()
+        for _ in range(3):
+            await add_answer(old_id, timedelta(days=3))
+        await add_answer(fresh_id, timedelta(minutes=5))
+
+        processed = await refresh_trending_scores(db_session, HALF_LIFE)
+        rows = await read_trending_questions(db_session, HALF_LIFE)
+
+        assert processed == 4
+        assert [row.id for row, _ in rows] == [fresh_id, old_id]
+        assert rows[0][1] == pytest.approx(1.0, abs=0.01)
+        assert rows[1][1] == pytest.approx(3 / 8, rel=0.01)
+
+    async def test_refresh_is_incremental(
+        self,
+        db_session: AsyncSession,
+        add_question,
+        add_answer,
+    ):
+        question_id = await add_question()
+        await add_answer(question_id, timedelta(hours=1))
+        await refresh_trending_scores(db_session, HALF_LIFE)
+
+        assert await refresh_trending_scores(db_session, HALF_LIFE) == 0
+
+        await add_answer(question_id, timedelta(hours=1))
+        assert await refresh_trending_scores(db_session, HALF_LIFE) == 1
+
+        rows = await read_trending_questions(db_session, HALF_LIFE)
+        assert rows[0][0].answer_count == 2
+
+    async def test_refresh_picks_up_late_commits(
+        self,
+        db_session: AsyncSession,
+        add_question,
+        add_answer,
+    ):
+        question_id = await add_question()
+        late = await add_answer(question_id, timedelta(seconds=0))
+        # ID를 먼저 받았지만 아직 커밋되지 않은 답변처럼 delta를 숨김
+        await db_session.execute(delete(AggregateDelta).where(AggregateDelta.row_id == late.id))
+        await add_answer(question_id, timedelta(seconds=0))
+        assert await refresh_trending_scores(db_session, HALF_LIFE) == 1
+
+        await add_deltas(db_session, [TRENDING_WATERMARK], late.id)
+
+        assert await refresh_trending_scores(db_session, HALF_LIFE) == 1
+        rows = await read_trending_questions(db_session, HALF_LIFE)
+        assert rows[0][0].answer_count == 2
+
+    async def test_prune_removes_cold_questions(
+        self,
+        db_session: AsyncSession,
+        add_question,
+        add_answer,
+    ):
+        question_id = await add_question()
+        await add_answer(question_id, timedelta(days=30))
+        await refresh_trending_scores(db_session, HALF_LIFE)
+
+        await prune_trending_scores(db_session, HALF_LIFE)
+
+        assert await read_trending_questions(db_session, HALF_LIFE) == []
@@ -0,0 +1,60 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.question import create_question, delete_question, read_question_by_id
+from app.crud.view_count import add_view_counts
+from app.schemas.question import QuestionCreate
+
+
+@pytest.mark.asyncio
+class TestViewCountCRUD:
+    @pytest.fixture
+    async def question_id(
+        self,
+        db_session: AsyncSession,
+        sample_question_data: dict,
+    ) -> int:
+        question_in = QuestionCreate(**sample_question_data)
+        question = await create_question(db_session, question_in)
+        return question.id
+
+    async def test_new_question_has_zero_views(
+        self,
+        db_session: AsyncSession,
+        question_id: int,
+    ):
+        question = await read_question_by_id(db_session, question_id)
+
+        assert question.view_count == 0
+
+    async def test_add_view_counts_accumulates(
+        self,
+        db_session: AsyncSession,
+        question_id: int,
+    ):
+        await add_view_counts(db_session, {question_id: 3})
+        await add_view_counts(db_session, {question_id: 4})
+        db_session.expire_all()
+
+        question = await read_question_by_id(db_session, question_id)
+
+        assert question.view_count == 7
+
+    async def test_add_view_counts_skips_deleted_question(
+        self,
+        db_session: AsyncSession,
+        question_id: int,
+        sample_question_data: dict,
+    ):
+        other = await create_question(db_session, QuestionCreate(**sample_question_data))
+        other_id = other.id
+        await delete_question(db_session, question_id)
+
+        await add_view_counts(db_session, {question_id: 5, other_id: 2})
+        db_session.expire_all()
+
+        question = await read_question_by_id(db_session, other_id)
+        assert question.view_count == 2
+
+    async def test_add_view_counts_empty(self, db_session: AsyncSession):
+        await add_view_counts(db_session, {})
@@ -0,0 +1,119 @@
+import asyncio
+import logging
+
+import psycopg
+import pytest
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import limits
+from app.db.limits import (
+    StatementBudgetError,
+    apply_statement_timeout,
+    database_error_handler,
+    query_limits,
+    start_statement_budget,
+)
+
+
+@pytest.mark.asyncio
+class TestStatementTimeout:
+    async def test_timeout_applies_to_every_transaction(self, test_engine):
+        async with AsyncSession(test_engine) as session:
+            apply_statement_timeout(session, 0.25)
+
+            assert await session.scalar(text("SHOW statement_timeout")) == "250ms"
+            await session.commit()
+            # 커밋 뒤 새로 시작한 트랜잭션에도 다시 걸림
+            assert await session.scalar(text("SHOW statement_timeout")) == "250ms"
+
+    async def test_slow_query_maps_to_504(self, test_engine):
+        async def session_with_timeout():
+            async with AsyncSession(test_engine) as session:
+                apply_statement_timeout(session, 0.1)
+                yield session
+
+        app = FastAPI()
+        app.add_exception_handler(OperationalError, database_error_handler)
+
+        @app.get("/slow")
+        async def slow(db: AsyncSession = Depends(session_with_timeout)) -> None:
+            await db.execute(text("SELECT pg_sleep(2)"))
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/slow")
+
+        assert response.status_code == 504
+
+    async def test_client_deadline_cancels_handler(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(limits, "CLIENT_DEADLINE_GRACE", 0.0)
+        cancelled = asyncio.Event()
+
+        app = FastAPI()
+
+        @app.get("/stuck")
+        @query_limits(statement_timeout=0.05)
+        async def stuck() -> None:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/stuck")
+
+        assert response.status_code == 504
+        assert cancelled.is_set()
+
+    async def test_connection_error_maps_to_503(self):
+        error = OperationalError("SELECT 1", {}, psycopg.OperationalError("connection refused"))
+
+        response = await database_error_handler(None, error)
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "5"
+
+
+@pytest.mark.asyncio
+class TestStatementBudget:
+    async def test_budget_fails_in_development(self, db_session: AsyncSession):
+        budget = start_statement_budget("test_endpoint", 2)
+        try:
+            await db_session.execute(text("SELECT 1"))
+            await db_session.execute(text("SELECT 2"))
+            with pytest.raises(StatementBudgetError, match="test_endpoint"):
+                await db_session.execute(text("SELECT 3"))
+        finally:
+            budget.active = False
+
+        assert budget.used == 3
+
+    async def test_budget_warns_once_outside_development(
+        self,
+        db_session: AsyncSession,
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture,
+    ):
+        monkeypatch.setattr(limits.settings, "environment", "production")
+        budget = start_statement_budget("test_endpoint", 1)
+        try:
+            with caplog.at_level(logging.WARNING, logger="app.db.limits"):
+                for _ in range(3):
+                    await db_session.execute(text("SELECT 1"))
+        finally:
+            budget.active = False
+
+        assert len(caplog.records) == 1
+
+    async def test_finished_budget_stops_counting(self, db_session: AsyncSession):
+        budget = start_statement_budget("test_endpoint", 1)
+        budget.active = False
+
+        await db_session.execute(text("SELECT 1"))
+        await db_session.execute(text("SELECT 2"))
+
+        assert budget.used == 0
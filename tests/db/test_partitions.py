@@ -0,0 +1,57 @@
+from datetime import UTC, date, datetime
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.answer import create_answer
+from app.crud.question import create_question
+from app.db.partitions import (
+    answer_partition_name,
+    ensure_answer_partitions,
+    is_answers_partitioned,
+    month_start,
+    read_answer_partitions,
+)
+from app.schemas.answer import AnswerCreate
+from app.schemas.question import QuestionCreate
+
+
+class TestPartitionNaming:
+    def test_month_start_wraps_year(self):
+        assert month_start(date(2026, 11, 15), 2) == date(2027, 1, 1)
+        assert month_start(date(2026, 1, 31), -1) == date(2025, 12, 1)
+
+    def test_answer_partition_name(self):
+        assert answer_partition_name(date(2026, 3, 1)) == "answers_p202603"
+
+
+@pytest.mark.asyncio
+class TestAnswerPartitions:
+    async def test_answers_table_is_partitioned(self, db_session: AsyncSession):
+        assert await is_answers_partitioned(db_session)
+        assert "answers_default" in await read_answer_partitions(db_session)
+
+    async def test_ensure_answer_partitions_is_idempotent(self, db_session: AsyncSession):
+        created = await ensure_answer_partitions(db_session, 2, today=date(2026, 11, 5))
+
+        assert created == ["answers_p202611", "answers_p202612", "answers_p202701"]
+        assert await ensure_answer_partitions(db_session, 2, today=date(2026, 11, 5)) == []
+
+    async def test_answers_are_routed_to_month_partition(
+        self,
+        db_session: AsyncSession,
+        sample_question_data: dict,
+        sample_answer_data: dict,
+    ):
+        today = datetime.now(UTC).date()
+        await ensure_answer_partitions(db_session, 0, today=today)
+        question = await create_question(db_session, QuestionCreate(**sample_question_data))
+        answer = await create_answer(db_session, question.id, AnswerCreate(**sample_answer_data))
+
+        partition = await db_session.scalar(
+            text("SELECT tableoid::regclass::text FROM answers WHERE id = :id"),
+            {"id": answer.id},
+        )
+
+        assert partition == answer_partition_name(month_start(today))
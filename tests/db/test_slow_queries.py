@@ -0,0 +1,78 @@
+import json
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.crud import question as question_crud
+from app.db.slow_queries import redact, set_query_route, slow_query_log
+from app.schemas.question import QuestionCreate
+
+
+@pytest.fixture
+def record_everything(monkeypatch: pytest.MonkeyPatch):
+    # 모든 쿼리를 느린 쿼리로 보고, 테스트가 끝나면 집계를 비움
+    monkeypatch.setattr(get_settings(), "slow_query_threshold_ms", 0.0)
+    monkeypatch.setattr(get_settings(), "slow_query_sample_rate", 0.0)
+    slow_query_log.reset()
+    yield slow_query_log
+    slow_query_log.stop()
+    slow_query_log.reset()
+    set_query_route(None)
+
+
+def test_redact_removes_literals_and_expanded_lists():
+    statement = """
+        SELECT * FROM questions
+        WHERE title = 'it''s 123m' AND id IN (%(id_1_1)s, %(id_1_2)s, %(id_1_3)s)
+        LIMIT 20
+    """
+
+    assert redact(statement) == "SELECT * FROM questions WHERE title = ? AND id IN (...) LIMIT ?"
+    assert redact("SET LOCAL statement_timeout = 5000") == "SET LOCAL statement_timeout = ?"
+
+
+@pytest.mark.asyncio
+class TestSlowQueryLog:
+    async def test_attributes_query_to_crud_function_and_route(
+        self, db_session: AsyncSession, record_everything, sample_question_data
+    ):
+        set_query_route("GET /questions/{question_id}")
+        question = await question_crud.create_question(
+            db_session, QuestionCreate(**sample_question_data)
+        )
+        await question_crud.read_question_by_id(db_session, question.id)
+
+        stats = [
+            stat
+            for stat in record_everything.top(100)
+            if stat.call_site == "app.crud.question.read_question_by_id"
+        ]
+        assert len(stats) == 1
+        assert stats[0].sql.startswith("SELECT")
+        assert stats[0].rows == 1
+        assert stats[0].routes == {"GET /questions/{question_id}": 1}
+
+    async def test_fast_queries_are_not_aggregated(
+        self, db_session: AsyncSession, record_everything, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(get_settings(), "slow_query_threshold_ms", 10_000.0)
+
+        await db_session.execute(text("SELECT 1"))
+
+        assert record_everything.stats == {}
+
+    async def test_writes_ndjson_file(
+        self, db_session: AsyncSession, record_everything, monkeypatch, tmp_path
+    ):
+        path = tmp_path / "slow.ndjson"
+        monkeypatch.setattr(get_settings(), "slow_query_log_path", str(path))
+        record_everything.start()
+
+        await db_session.execute(text("SELECT 'secret', 42"))
+        record_everything.stop()
+
+        entries = [json.loads(line) for line in path.read_text().splitlines()]
+        assert any(entry["sql"] == "SELECT ?, ?" and entry["slow"] for entry in entries)
+        assert "secret" not in path.read_text()
@@ -0,0 +1,85 @@
+"""EXPLAIN (FORMAT JSON) 결과를 골든 파일로 비교할 수 있는 모양으로 줄이고 비교"""
+
+import re
+
+
+# 월별 파티션 이름은 실행한 달에 따라 달라지므로 하나로 모음
+PARTITION_SUFFIX = re.compile(r"_p\d{6}(?=_|$)")
+# 파티션마다 같은 하위 노드가 붙는 노드
+APPEND_NODES = {"Append", "Merge Append"}
+
+INDEX_SCANS = {"Index Scan", "Index Only Scan", "Bitmap Index Scan", "Bitmap Heap Scan"}
+
+# 버퍼가 골든 값의 이 배수이면서 이 블록 수 이상 늘면 실패. 작은 쿼리의 흔들림은 무시
+BUFFER_RATIO = 1.5
+BUFFER_SLACK = 16
+
+
+def _relation(node: dict) -> str | None:
+    relation = node.get("Relation Name")
+    return None if relation is None else PARTITION_SUFFIX.sub("_p*", relation)
+
+
+def _describe(node: dict) -> str:
+    parts = [node["Node Type"]]
+    if "Join Type" in node and node["Node Type"] != "Hash":
+        parts.append(f"({node['Join Type']})")
+    if "Index Name" in node:
+        parts.append(f"using {PARTITION_SUFFIX.sub('_p*', node['Index Name'])}")
+    if (relation := _relation(node)) is not None:
+        parts.append(f"on {relation}")
+    if node.get("Parent Relationship") in ("InitPlan", "SubPlan"):
+        parts.insert(0, f"{node['Parent Relationship']}:")
+    return " ".join(parts)
+
+
+def plan_shape(plan: dict, depth: int = 0) -> list[str]:
+    """노드 종류, 인덱스, 테이블만 남긴 들여쓰기 트리. 비용, 행 수, 시간은 버림"""
+    lines = ["  " * depth + _describe(plan)]
+    seen = []
+    for child in plan.get("Plans", []):
+        child_lines = plan_shape(child, depth + 1)
+        # 가지치기되지 않은 파티션 수는 실행한 날짜에 따라 달라지므로 같은 모양은 한 번만 남김
+        if plan["Node Type"] in APPEND_NODES:
+            if child_lines in seen:
+                continue
+            seen.append(child_lines)
+        lines.extend(child_lines)
+    return lines
+
+
+def shared_buffers(plan: dict) -> int:
+    # 최상위 노드의 값이 하위 노드를 모두 포함한 누적값
+    return plan.get("Shared Hit Blocks", 0) + plan.get("Shared Read Blocks", 0)
+
+
+def _access_methods(shape: list[str]) -> dict[str, set[str]]:
+    # "Index Scan using ix_... on questions" -> {"questions": {"Index Scan"}}
+    methods: dict[str, set[str]] = {}
+    for line in shape:
+        line = line.strip().removeprefix("InitPlan: ").removeprefix("SubPlan: ")
+        if " on " not in line:
+            continue
+        node_type, relation = line.rsplit(" on ", 1)
+        methods.setdefault(relation, set()).add(node_type.split(" using ")[0])
+    return methods
+
+
+def compare_plans(golden: dict, actual: dict) -> list[str]:
+    """골든 대비 나빠진 점. 빈 목록이면 통과"""
+    problems = []
+
+    golden_methods = _access_methods(golden["shape"])
+    actual_methods = _access_methods(actual["shape"])
+    for relation, methods in golden_methods.items():
+        now = actual_methods.get(relation, set())
+        if methods & INDEX_SCANS and "Seq Scan" in now and "Seq Scan" not in methods:
+            problems.append(f"{relation}: 인덱스 스캔이 Seq Scan으로 바뀜")
+
+    if not problems and golden["shape"] != actual["shape"]:
+        problems.append("실행 계획 모양이 바뀜")
+
+    limit = max(golden["buffers"] * BUFFER_RATIO, golden["buffers"] + BUFFER_SLACK)
+    if actual["buffers"] > limit:
+        problems.append(f"버퍼 {golden['buffers']} -> {actual['buffers']} (한도 {limit:.0f})")
+    return problems
@@ -0,0 +1,346 @@
+"""app/crud/question.py, app/crud/answer.py 쿼리의 실행 계획 회귀 검사
+
+큰 데이터를 넣고 VACUUM ANALYZE한 뒤 CRUD 함수가 실제로 보내는 SQL을 보내기 직전에 잡아서
+EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)으로 실행하고 golden/의 모양, 버퍼 수와 비교한다.
+답변은 운영과 같이 월별 파티션에 나눠 넣으므로 파티션 가지치기가 깨지면 모양이 바뀐다.
+느리므로 기본으로는 건너뛴다.
+
+    uv run pytest tests/plans --run-plans
+    uv run pytest tests/plans --run-plans --update-plans   # 의도한 변경이면 골든 파일 갱신
+
+골든 파일은 로컬 PostgreSQL 16 기준이다. 병렬 실행 여부에 따라 모양이 흔들리지 않도록
+병렬 워커는 끈다.
+"""
+
+import json
+import math
+import random
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import event, insert, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.crud import answer as answer_crud
+from app.crud import question as question_crud
+from app.db.partitions import ensure_answer_partitions
+from app.models.hand import QuestionHand
+from app.schemas.answer import AnswerCreate, AnswerUpdate
+from app.schemas.question import QuestionCreate, QuestionUpdate
+from app.services.tiles import (
+    MAX_COPIES,
+    TILE_KINDS,
+    canonical_key,
+    encode_tiles,
+    format_hand,
+    parse_hand,
+    tile_counts,
+)
+from tests.plans.shapes import compare_plans, plan_shape, shared_buffers
+
+
+pytestmark = pytest.mark.plans
+
+GOLDEN_DIR = Path(__file__).parent / "golden"
+
+QUESTIONS = 20000
+ANSWERS_PER_QUESTION = 5
+ARCHIVED_QUESTIONS = 2000
+ARCHIVED_ANSWER_START = 10_000_000
+AUTHORS = 500
+ANSWERERS = 1000
+# 이 간격마다 손패가 있는 질문
+HAND_EVERY = 4
+# 질문은 10분 간격으로 지금부터 이만큼 전까지 들어감
+SEEDED_SPAN = timedelta(minutes=QUESTIONS * 10)
+SEEDED_MONTHS = math.ceil(SEEDED_SPAN / timedelta(days=28))
+
+SEED_SQL = [
+    f"""
+    INSERT INTO questions (title, content, author_nickname, created_at, updated_at)
+    SELECT '질문 ' || g, repeat('본문 ', 50) || g, '작성자' || (g % {AUTHORS}),
+           now() - ({QUESTIONS} - g) * interval '10 minutes',
+           now() - ({QUESTIONS} - g) * interval '10 minutes'
+    FROM generate_series(1, {QUESTIONS}) g
+    ORDER BY g
+    """,
+    f"""
+    INSERT INTO answers (question_id, content, author_nickname, created_at, updated_at)
+    SELECT q.id, repeat('답변 ', 30) || g, '답변자' || ((q.id * 7 + g) % {ANSWERERS}),
+           q.created_at + g * interval '1 minute', q.created_at + g * interval '1 minute'
+    FROM questions q, generate_series(1, {ANSWERS_PER_QUESTION}) g
+    ORDER BY q.id, g
+    """,
+    """
+    INSERT INTO question_view_counts (question_id, view_count, created_at, updated_at)
+    SELECT id, id % 97, created_at, created_at FROM questions WHERE id % 3 = 0
+    """,
+    f"""
+    INSERT INTO questions_archive
+        (id, title, content, author_nickname, view_count, archived_at, created_at, updated_at)
+    SELECT {QUESTIONS} + g, '보관 질문 ' || g, repeat('본문 ', 50), '작성자' || (g % {AUTHORS}),
+           g % 11, now(), now() - interval '2 years', now() - interval '2 years'
+    FROM generate_series(1, {ARCHIVED_QUESTIONS}) g
+    """,
+    f"""
+    INSERT INTO answers_archive (id, question_id, content, author_nickname, created_at, updated_at)
+    SELECT {ARCHIVED_ANSWER_START} + g, {QUESTIONS} + (g + 1) / 2, repeat('답변 ', 30),
+           '답변자' || (g % {ANSWERERS}), now() - interval '2 years', now() - interval '2 years'
+    FROM generate_series(1, {ARCHIVED_QUESTIONS} * 2) g
+    """,
+]
+
+SEEDED_TABLES = (
+    "questions",
+    "answers",
+    "question_hands",
+    "question_view_counts",
+    "questions_archive",
+    "answers_archive",
+)
+
+# EXPLAIN할 수 없거나 계획이 의미 없는 문장
+UNPLANNED_PREFIXES = ("SAVEPOINT", "RELEASE", "ROLLBACK", "BEGIN", "COMMIT", "SET")
+
+
+def random_hand(rng: random.Random) -> list[int]:
+    counts = [0] * TILE_KINDS
+    hand = []
+    while len(hand) < 13:
+        tile = rng.randrange(TILE_KINDS)
+        if counts[tile] < MAX_COPIES:
+            counts[tile] += 1
+            hand.append(tile)
+    return sorted(hand)
+
+
+def hand_rows() -> list[dict]:
+    rng = random.Random(0)
+    rows = []
+    for question_id in range(HAND_EVERY, QUESTIONS + 1, HAND_EVERY):
+        hand = random_hand(rng)
+        rows.append(
+            {
+                "question_id": question_id,
+                "notation": format_hand(hand),
+                "tiles": encode_tiles(hand),
+                "counts": tile_counts(hand),
+                "canonical_key": canonical_key(tile_counts(hand)),
+            }
+        )
+    return rows
+
+
+@pytest.fixture(scope="module")
+async def plan_engine(test_engine: AsyncEngine):
+    truncate = f"TRUNCATE {', '.join(SEEDED_TABLES)} RESTART IDENTITY CASCADE"
+    async with test_engine.begin() as conn:
+        await conn.execute(text(truncate))
+        # 넣을 답변이 모두 기본 파티션에 몰리지 않도록 가장 오래된 답변의 달부터
+        # 다음 달까지 월별 파티션을 먼저 만듦
+        async with AsyncSession(bind=conn) as session:
+            await ensure_answer_partitions(
+                session,
+                months_ahead=SEEDED_MONTHS + 1,
+                today=(datetime.now(UTC) - SEEDED_SPAN).date(),
+            )
+        for sql in SEED_SQL:
+            await conn.execute(text(sql))
+        await conn.execute(insert(QuestionHand), hand_rows())
+
+    # 통계와 가시성 맵, GIN 대기 목록을 정리해야 계획과 버퍼 수가 매번 같음
+    async with test_engine.connect() as conn:
+        autocommit = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        for table in SEEDED_TABLES:
+            await autocommit.execute(text(f"VACUUM ANALYZE {table}"))
+
+    yield test_engine
+
+    async with test_engine.begin() as conn:
+        await conn.execute(text(truncate))
+
+
+async def _create_question(db: AsyncSession) -> None:
+    await question_crud.create_question(
+        db,
+        QuestionCreate(
+            title="계획 확인용 질문",
+            content="123m456p789s1122z 에서 무엇을 버리나요?",
+            author_nickname="작성자7",
+        ),
+    )
+
+
+async def _read_questions_by_author_pages(db: AsyncSession) -> None:
+    first = await question_crud.read_questions_by_author(db, "작성자7", limit=21)
+    await question_crud.read_questions_by_author(
+        db, "작성자7", limit=21, after=(first[-1].created_at, first[-1].id)
+    )
+
+
+async def _stream_question_texts(db: AsyncSession) -> None:
+    async for _ in question_crud.stream_question_texts(db):
+        pass
+
+
+async def _read_answers_by_author_pages(db: AsyncSession) -> None:
+    first = await answer_crud.read_answers_by_author(db, "답변자7", limit=21)
+    await answer_crud.read_answers_by_author(
+        db, "답변자7", limit=21, after=(first[-1].created_at, first[-1].id)
+    )
+
+
+def seeded_answer_id(question_id: int, index: int) -> int:
+    return (question_id - 1) * ANSWERS_PER_QUESTION + index
+
+
+async def _question_created_at(db: AsyncSession, question_id: int) -> datetime:
+    # 핸들러처럼 질문을 먼저 읽고 그 작성 시각을 답변 조회의 하한으로 넘김
+    question = await question_crud.read_question_by_id(db, question_id)
+    return question.created_at
+
+
+async def _read_answer_by_id(db: AsyncSession) -> None:
+    created_after = await _question_created_at(db, 19050)
+    await answer_crud.read_answer_by_id(db, seeded_answer_id(19050, 3), created_after)
+
+
+async def _read_answers_by_question(db: AsyncSession) -> None:
+    created_after = await _question_created_at(db, 19000)
+    await answer_crud.read_answers_by_question_id(db, 19000, question_created_at=created_after)
+
+
+async def _update_answer(db: AsyncSession) -> None:
+    created_after = await _question_created_at(db, 19100)
+    await answer_crud.update_answer(
+        db,
+        seeded_answer_id(19100, 2),
+        AnswerUpdate(content="수정한 답변 내용입니다."),
+        created_after,
+    )
+
+
+async def _delete_answer(db: AsyncSession) -> None:
+    created_after = await _question_created_at(db, 19200)
+    await answer_crud.delete_answer(db, seeded_answer_id(19200, 4), created_after)
+
+
+Scenario = Callable[[AsyncSession], Awaitable[object]]
+
+SCENARIOS: dict[str, Scenario] = {
+    "question_create": _create_question,
+    "question_read_by_id": lambda db: question_crud.read_question_by_id(db, 123),
+    "question_read_archived_by_id": lambda db: question_crud.read_question_by_id(db, QUESTIONS + 5),
+    "question_read_by_ids": lambda db: question_crud.read_questions_by_ids(
+        db, [1, 500, 10000, QUESTIONS + 1]
+    ),
+    "question_list_first_page": lambda db: question_crud.read_questions(db, 0, 20),
+    "question_list_deep_page": lambda db: question_crud.read_questions(db, 15000, 20),
+    "question_list_columns": lambda db: question_crud.read_questions(
+        db, 0, 20, columns=("id", "title", "author_nickname")
+    ),
+    "question_list_by_tiles": lambda db: question_crud.read_questions(
+        db, 0, 20, tiles=parse_hand("55m")
+    ),
+    "question_list_by_author": _read_questions_by_author_pages,
+    "question_update": lambda db: question_crud.update_question(
+        db, 321, QuestionUpdate(content="수정한 본문입니다. 234s5566z 손패")
+    ),
+    "question_delete": lambda db: question_crud.delete_question(db, 42),
+    "question_stream_texts": _stream_question_texts,
+    "answer_create": lambda db: answer_crud.create_answer(
+        db, 100, AnswerCreate(content="계획 확인용 답변입니다.", author_nickname="답변자7")
+    ),
+    "answer_read_by_id": _read_answer_by_id,
+    "answer_read_archived_by_id": lambda db: answer_crud.read_answer_by_id(
+        db, ARCHIVED_ANSWER_START + 3
+    ),
+    "answer_read_by_ids": lambda db: answer_crud.read_answers_by_ids(
+        db, [1, 777, 50000, ARCHIVED_ANSWER_START + 1]
+    ),
+    "answer_list_by_question": _read_answers_by_question,
+    "answer_list_by_author": _read_answers_by_author_pages,
+    "answer_update": _update_answer,
+    "answer_delete": _delete_answer,
+}
+
+
+def explain(conn: Connection, statement: str, parameters) -> dict:
+    # EXPLAIN ANALYZE는 쓰기도 실제로 실행하므로 세이브포인트 안에서 돌리고 되돌림.
+    # SQLAlchemy 이벤트를 다시 부르지 않도록 DBAPI 커서를 직접 씀
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute("SAVEPOINT plan_explain")
+        try:
+            cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}", parameters)
+            plan = cursor.fetchone()[0][0]["Plan"]
+        finally:
+            cursor.execute("ROLLBACK TO SAVEPOINT plan_explain")
+            cursor.execute("RELEASE SAVEPOINT plan_explain")
+    finally:
+        cursor.close()
+    return {
+        "sql": " ".join(statement.split()),
+        "shape": plan_shape(plan),
+        "buffers": shared_buffers(plan),
+    }
+
+
+@contextmanager
+def explain_statements(engine: AsyncEngine) -> Iterator[list[dict]]:
+    """문장이 실행되기 직전의 상태에서 EXPLAIN
+
+    끝난 뒤에 모아서 EXPLAIN하면 DELETE는 이미 지운 행을, UPDATE는 바뀐 행을 보게 된다.
+    """
+    plans = []
+
+    def record(conn, _cursor, statement, parameters, _context, executemany) -> None:
+        if statement.lstrip().upper().startswith(UNPLANNED_PREFIXES):
+            return
+        plans.append(explain(conn, statement, parameters[0] if executemany else parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    try:
+        yield plans
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+
+async def collect_plans(engine: AsyncEngine, scenario: Scenario) -> list[dict]:
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        await conn.exec_driver_sql("SET LOCAL max_parallel_workers_per_gather = 0")
+
+        session = AsyncSession(bind=conn, join_transaction_mode="create_savepoint")
+        with explain_statements(engine) as plans:
+            await scenario(session)
+        await session.close()
+        await transaction.rollback()
+    return plans
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name", SCENARIOS)
+async def test_query_plan(name: str, plan_engine: AsyncEngine, request: pytest.FixtureRequest):
+    actual = await collect_plans(plan_engine, SCENARIOS[name])
+    golden_path = GOLDEN_DIR / f"{name}.json"
+
+    if request.config.getoption("--update-plans"):
+        golden_path.write_text(json.dumps(actual, ensure_ascii=False, indent=2) + "\n")
+        return
+    if not golden_path.exists():
+        pytest.fail(f"{golden_path.name}이 없습니다. --update-plans로 만드세요.")
+
+    golden = json.loads(golden_path.read_text())
+    assert [p["sql"] for p in actual] == [p["sql"] for p in golden], "보내는 쿼리가 바뀜"
+
+    problems = [
+        f"{index}번째 쿼리: {problem}\n  골든: {expected['shape']}\n  현재: {plan['shape']}"
+        for index, (expected, plan) in enumerate(zip(golden, actual, strict=True), 1)
+        for problem in compare_plans(expected, plan)
+    ]
+    assert not problems, "\n".join(problems)
@@ -0,0 +1,65 @@
+from tests.plans.shapes import compare_plans, plan_shape, shared_buffers
+
+
+INDEX_PLAN = {
+    "Node Type": "Limit",
+    "Shared Hit Blocks": 4,
+    "Plans": [
+        {
+            "Node Type": "Index Scan",
+            "Index Name": "ix_questions_author_nickname_created_at",
+            "Relation Name": "questions",
+        },
+        {
+            "Node Type": "Seq Scan",
+            "Relation Name": "answers_p202610",
+            "Parent Relationship": "SubPlan",
+        },
+    ],
+}
+
+
+def test_plan_shape_drops_costs_and_partition_month():
+    assert plan_shape(INDEX_PLAN) == [
+        "Limit",
+        "  Index Scan using ix_questions_author_nickname_created_at on questions",
+        "  SubPlan: Seq Scan on answers_p*",
+    ]
+    assert shared_buffers(INDEX_PLAN) == 4
+
+
+def test_plan_shape_collapses_repeated_partitions():
+    plan = {
+        "Node Type": "Append",
+        "Plans": [
+            {
+                "Node Type": "Index Scan",
+                "Index Name": f"answers_p2026{month}_id_idx",
+                "Relation Name": f"answers_p2026{month}",
+            }
+            for month in ("08", "09", "10")
+        ]
+        + [{"Node Type": "Seq Scan", "Relation Name": "answers_default"}],
+    }
+
+    assert plan_shape(plan) == [
+        "Append",
+        "  Index Scan using answers_p*_id_idx on answers_p*",
+        "  Seq Scan on answers_default",
+    ]
+
+
+def test_compare_plans_reports_index_to_seq_scan():
+    golden = {"shape": ["Limit", "  Index Scan using ix_a on questions"], "buffers": 4}
+    actual = {"shape": ["Limit", "  Sort", "    Seq Scan on questions"], "buffers": 4}
+
+    assert compare_plans(golden, actual) == ["questions: 인덱스 스캔이 Seq Scan으로 바뀜"]
+
+
+def test_compare_plans_buffer_threshold():
+    golden = {"shape": ["Seq Scan on questions"], "buffers": 100}
+
+    assert compare_plans(golden, {**golden, "buffers": 150}) == []
+    assert compare_plans(golden, {**golden, "buffers": 151}) == ["버퍼 100 -> 151 (한도 150)"]
+    # 작은 쿼리는 몇 블록 늘어도 통과
+    assert compare_plans({**golden, "buffers": 2}, {**golden, "buffers": 18}) == []
@@ -0,0 +1,176 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.dependencies.repository import get_repository
+from app.main import app
+from app.repositories.base import Repository
+from app.repositories.memory import InMemoryRepository
+from app.repositories.sql import SQLAlchemyRepository
+from app.schemas.answer import AnswerCreate
+from app.schemas.question import QuestionCreate, QuestionUpdate
+from app.services.tiles import parse_hand
+
+
+@pytest.fixture(params=["sql", "memory"])
+def repo(request: pytest.FixtureRequest) -> Repository:
+    # 두 구현이 같은 결과를 내는지 같은 테스트로 확인. memory는 DB 없이도 돌도록
+    # sql일 때만 db_session을 만듦
+    if request.param == "sql":
+        db_session: AsyncSession = request.getfixturevalue("db_session")
+        return SQLAlchemyRepository(db_session)
+    return InMemoryRepository()
+
+
+@pytest.mark.asyncio
+class TestRepository:
+    async def test_read_questions_pages(self, repo: Repository, sample_question_data: dict):
+        created = [
+            await repo.create_question(QuestionCreate(**sample_question_data)) for _ in range(5)
+        ]
+
+        first, total = await repo.read_questions(skip=0, limit=3)
+        rest, _ = await repo.read_questions(skip=3, limit=3)
+
+        assert total == 5
+        assert len(first) == 3
+        assert {q.id for q in first + rest} == {q.id for q in created}
+
+    async def test_read_questions_by_tiles(self, repo: Repository, sample_question_data: dict):
+        data = {**sample_question_data, "content": "123m456p789s11z 손패에서 무엇을 버리나요?"}
+        matched = await repo.create_question(QuestionCreate(**data))
+        await repo.create_question(QuestionCreate(**sample_question_data))
+
+        questions, total = await repo.read_questions(tiles=parse_hand("11z"))
+        missing, _ = await repo.read_questions(tiles=parse_hand("111z"))
+
+        assert total == 1
+        assert questions[0].id == matched.id
+        assert missing == []
+
+    async def test_read_questions_by_author_cursor(
+        self,
+        repo: Repository,
+        sample_question_data: dict,
+    ):
+        data = {**sample_question_data, "author_nickname": "저장소작성자"}
+        created = [await repo.create_question(QuestionCreate(**data)) for _ in range(3)]
+        expected = sorted(created, key=lambda q: (q.created_at, q.id), reverse=True)
+
+        first = await repo.read_questions_by_author("저장소작성자", limit=2)
+        after = (first[-1].created_at, first[-1].id)
+        second = await repo.read_questions_by_author("저장소작성자", limit=2, after=after)
+
+        assert [q.id for q in first + second] == [q.id for q in expected]
+
+    async def test_update_question(self, repo: Repository, sample_question_data: dict):
+        question = await repo.create_question(QuestionCreate(**sample_question_data))
+
+        updated = await repo.update_question(question.id, QuestionUpdate(title="수정된 질문 제목"))
+
+        assert updated.title == "수정된 질문 제목"
+        assert await repo.update_question(999999, QuestionUpdate(title="없는 질문 제목")) is None
+
+    async def test_read_similar_hand_questions(
+        self,
+        repo: Repository,
+        sample_question_data: dict,
+    ):
+        async def add(content: str) -> int:
+            data = {**sample_question_data, "content": content}
+            return (await repo.create_question(QuestionCreate(**data))).id
+
+        source = await add("손패 123m456p789s1122z 에서 어떻게 하나요?")
+        permuted = await add("손패 123s456m789p1122z 질문입니다.")
+        one_off = await add("손패 124m456p789s1122z 질문입니다.")
+        await add("손패 123m456p789s5566z 질문입니다.")
+        moved = await add("손패 123m456p789s1122z 질문입니다.")
+        await repo.update_question(moved, QuestionUpdate(content="손패가 없는 질문으로 바꿈"))
+
+        rows = await repo.read_similar_hand_questions(source, [parse_hand("123m456p789s1122z")])
+
+        assert [(question.id, distance) for question, _, distance in rows] == [
+            (permuted, 0),
+            (one_off, 1),
+        ]
+        assert rows[0][1] == "456m789p123s1122z"
+
+    async def test_answers_by_question_and_ids(
+        self,
+        repo: Repository,
+        sample_question_data: dict,
+        sample_answer_data: dict,
+    ):
+        question = await repo.create_question(QuestionCreate(**sample_question_data))
+        answers = [
+            (await repo.create_answer(question.id, AnswerCreate(**sample_answer_data)))[0]
+            for _ in range(3)
+        ]
+
+        listed, total = await repo.read_answers_by_question_id(question.id, limit=2)
+        found = await repo.read_answers_by_ids([answers[0].id, 999999])
+
+        assert total == 3
+        assert len(listed) == 2
+        assert list(found) == [answers[0].id]
+
+    async def test_delete_question_removes_answers(
+        self,
+        repo: Repository,
+        sample_question_data: dict,
+        sample_answer_data: dict,
+    ):
+        question = await repo.create_question(QuestionCreate(**sample_question_data))
+        question_id = question.id
+        answer, restored = await repo.create_answer(question_id, AnswerCreate(**sample_answer_data))
+        assert not restored
+        answer_id = answer.id
+
+        assert await repo.delete_question(question_id)
+        assert not await repo.delete_question(question_id)
+        assert await repo.read_question(question_id) is None
+        assert await repo.read_answer(answer_id) is None
+
+    async def test_delete_answer(
+        self,
+        repo: Repository,
+        sample_question_data: dict,
+        sample_answer_data: dict,
+    ):
+        question = await repo.create_question(QuestionCreate(**sample_question_data))
+        answer, _ = await repo.create_answer(question.id, AnswerCreate(**sample_answer_data))
+        answer_id = answer.id
+
+        assert await repo.delete_answer(answer_id)
+        assert await repo.read_answer(answer_id) is None
+        assert await repo.read_answers_by_author(sample_answer_data["author_nickname"]) == []
+
+
+@pytest.mark.asyncio
+async def test_api_with_memory_repository(sample_question_data: dict, sample_answer_data: dict):
+    # DB 세션 없이 질문/답변 API가 메모리 저장소만으로 동작하는지 확인
+    repository = InMemoryRepository()
+    app.dependency_overrides[get_repository] = lambda: repository
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            created = await client.post("/questions", json=sample_question_data)
+            question_id = created.json()["id"]
+            await client.post(f"/questions/{question_id}/answers", json=sample_answer_data)
+
+            question = await client.get(f"/questions/{question_id}")
+            listed = await client.get("/questions")
+            answers = await client.get(f"/questions/{question_id}/answers")
+            authored = await client.get(
+                f"/authors/{sample_question_data['author_nickname']}/questions"
+            )
+            deleted = await client.delete(f"/questions/{question_id}")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert created.status_code == 201
+    assert question.json()["view_count"] == 1
+    assert listed.json()["pagination"]["total"] == 1
+    assert len(answers.json()) == 1
+    assert authored.json()["items"][0]["id"] == question_id
+    assert deleted.status_code == 204
+    assert len(await repository.read_answers_by_author(sample_answer_data["author_nickname"])) == 0
@@ -0,0 +1,69 @@
+import asyncio
+import json
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.crud.answer import ANSWER_EVENTS_CHANNEL, create_answer
+from app.crud.question import create_question
+from app.schemas.answer import AnswerCreate
+from app.schemas.question import QuestionCreate
+from app.services.answer_events import AnswerEventBroker, listen_dsn
+from tests.conftest import TEST_DATABASE_URL
+
+
+def test_listen_dsn():
+    assert listen_dsn("postgresql+psycopg://u:p@h:5432/db") == "postgresql://u:p@h:5432/db"
+
+
+@pytest.mark.asyncio
+class TestAnswerEventBroker:
+    async def test_notify_reaches_subscribers_of_question(self, test_engine):
+        broker = AnswerEventBroker()
+        broker.start(TEST_DATABASE_URL)
+        try:
+            await broker.wait_until_listening(5)
+            with broker.subscribe(1) as queue, broker.subscribe(2) as other:
+                async with test_engine.connect() as conn:
+                    conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+                    payload = {"event": "deleted", "question_id": 1, "answer_id": 3}
+                    await conn.execute(
+                        select(func.pg_notify(ANSWER_EVENTS_CHANNEL, json.dumps(payload)))
+                    )
+
+                assert await asyncio.wait_for(queue.get(), 5) == ("deleted", '{"id": 3}')
+                assert other.empty()
+            assert broker.subscriber_count == 0
+        finally:
+            await broker.stop()
+
+    async def test_created_event_carries_answer(
+        self,
+        db_session: AsyncSession,
+        sample_question_data: dict,
+        sample_answer_data: dict,
+    ):
+        question = await create_question(db_session, QuestionCreate(**sample_question_data))
+        answer = await create_answer(db_session, question.id, AnswerCreate(**sample_answer_data))
+        broker = AnswerEventBroker(async_sessionmaker(await db_session.connection()))
+
+        with broker.subscribe(question.id) as queue:
+            broker._dispatch(
+                json.dumps({"event": "created", "question_id": question.id, "answer_id": answer.id})
+            )
+            event, data = await asyncio.wait_for(queue.get(), 5)
+
+        assert event == "created"
+        assert json.loads(data)["content"] == sample_answer_data["content"]
+
+    async def test_slow_subscriber_drops_oldest(self):
+        broker = AnswerEventBroker()
+        with broker.subscribe(1) as queue:
+            for answer_id in range(queue.maxsize + 1):
+                broker._dispatch(
+                    json.dumps({"event": "deleted", "question_id": 1, "answer_id": answer_id})
+                )
+
+            assert queue.qsize() == queue.maxsize
+            assert queue.get_nowait() == ("deleted", '{"id": 1}')
@@ -0,0 +1,81 @@
+import pytest
+
+from app.services import autocomplete
+from app.services.autocomplete import TitleIndex, search_key
+
+
+class TestAutocomplete:
+    def _index(self) -> TitleIndex:
+        index = TitleIndex()
+        index.add(1, "리치 후에 후리텐이면 론이 되나요")
+        index.add(2, "후리텐 판정이 궁금합니다")
+        index.add(3, "닭 울기 타이밍")
+        return index
+
+    def test_search_key(self):
+        assert search_key("리ㅊ") == "ㄹㅣㅊ"
+        assert search_key("후리텐 론!") == search_key("후리텐론")
+
+    def test_prefix_while_typing(self):
+        index = self._index()
+
+        assert index.search("리ㅊ") == [(1, "리치 후에 후리텐이면 론이 되나요")]
+        assert index.search("달ㄱ") == [(3, "닭 울기 타이밍")]
+
+    def test_title_start_ranked_before_word_match(self):
+        assert [question_id for question_id, _ in self._index().search("후리텐")] == [2, 1]
+
+    def test_update_and_remove(self):
+        index = self._index()
+        index.add(2, "도라 질문")
+        index.remove(3)
+
+        assert [question_id for question_id, _ in index.search("후리텐")] == [1]
+        assert index.search("닭") == []
+        assert len(index) == 2
+
+    def test_load_matches_incremental(self):
+        index = self._index()
+        loaded = TitleIndex()
+        loaded.load(
+            [
+                (1, "리치 후에 후리텐이면 론이 되나요"),
+                (2, "후리텐 판정이 궁금합니다"),
+                (3, "닭 울기 타이밍"),
+            ]
+        )
+
+        assert loaded.search("후") == index.search("후")
+
+    def test_ranks_all_matching_keys(self):
+        # 키 순서로 앞쪽 일부만 보면 가장 최신인 299번을 놓침
+        index = TitleIndex()
+        for question_id in range(300):
+            index.add(question_id, f"후리텐 {question_id:03d}")
+
+        assert [question_id for question_id, _ in index.search("후리", 3)] == [299, 298, 297]
+
+    def test_ranked_prefix_follows_writes(self):
+        index = self._index()
+        assert [question_id for question_id, _ in index.search("후")] == [2, 1]
+
+        index.add(4, "후리텐 리치")
+        assert [question_id for question_id, _ in index.search("후")] == [4, 2, 1]
+
+        index.remove(2)
+        assert [question_id for question_id, _ in index.search("후")] == [4, 1]
+
+    def test_small_blocks_match_bulk_load(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(autocomplete, "BLOCK_SIZE", 2)
+        titles = [(question_id, f"질문 {question_id}번 후리텐") for question_id in range(20)]
+        index = TitleIndex()
+        for question_id, title in reversed(titles):
+            index.add(question_id, title)
+        for question_id in range(0, 20, 3):
+            index.remove(question_id)
+
+        loaded = TitleIndex()
+        loaded.load([item for item in titles if item[0] % 3])
+
+        assert index.search("후리텐", 20) == loaded.search("후리텐", 20)
+        assert index.search("ㅈ", 20) == loaded.search("ㅈ", 20)
@@ -0,0 +1,77 @@
+import time
+
+import pytest
+
+from app.services.discard import (
+    SimulationDeadlineError,
+    evaluate_discards,
+    remaining_wall,
+    simulate_discard,
+)
+from app.services.tiles import parse_hand, parse_tiles, tile_counts, tile_name
+
+
+def counts_of(notation: str) -> list[int]:
+    return tile_counts(parse_tiles(notation))
+
+
+class TestSimulateDiscard:
+    def test_tenpai_after_discard(self):
+        counts = counts_of("123m456p789s1123z")
+        counts[parse_hand("4z")[0]] += 1
+        wall = remaining_wall(counts, [0] * 34)
+
+        estimate = simulate_discard(tuple(counts), parse_hand("4z")[0], wall, 8, 500, seed=1)
+
+        assert estimate.shanten == 1
+        assert estimate.tenpai_probability > estimate.win_probability > 0
+
+    def test_same_seed_same_result(self):
+        counts = tuple(counts_of("123m456p78s1135z29s"))
+        wall = remaining_wall(list(counts), [0] * 34)
+        discard = parse_hand("5z")[0]
+
+        first = simulate_discard(counts, discard, wall, 6, 300, seed=7)
+        second = simulate_discard(counts, discard, wall, 6, 300, seed=7)
+
+        assert first == second
+
+    def test_visible_tiles_reduce_ukeire(self):
+        counts = counts_of("123m456p789s11z23m5z")
+        discard = parse_hand("5z")[0]
+        hidden = remaining_wall(counts, [0] * 34)
+        seen = remaining_wall(counts, counts_of("1144m"))
+
+        open_wall = simulate_discard(tuple(counts), discard, hidden, 1, 10, seed=0)
+        dead_wall = simulate_discard(tuple(counts), discard, seen, 1, 10, seed=0)
+
+        assert open_wall.ukeire == 7
+        assert dead_wall.ukeire == 3
+
+    def test_stops_after_deadline(self):
+        counts = counts_of("123m456p789s1123z4z")
+        wall = remaining_wall(counts, [0] * 34)
+
+        with pytest.raises(SimulationDeadlineError):
+            simulate_discard(tuple(counts), 0, wall, 6, 100, seed=0, deadline=time.time() - 1)
+
+    def test_remaining_wall_rejects_fifth_copy(self):
+        with pytest.raises(ValueError):
+            remaining_wall(counts_of("1111m"), counts_of("1m"))
+
+
+@pytest.mark.asyncio
+class TestEvaluateDiscards:
+    async def test_ranks_candidates_on_pool(self):
+        counts = counts_of("123m456p789s1123z4z")
+
+        estimates, complete = await evaluate_discards(counts, [0] * 34, 6, 200, seed=3)
+
+        assert complete
+        assert len(estimates) == 13
+        assert tile_name(estimates[0].tile) in {"2z", "3z", "4z"}
+        assert estimates[0].shanten == 1
+
+    async def test_rejects_wrong_tile_count(self):
+        with pytest.raises(ValueError):
+            await evaluate_discards(counts_of("123m"), [0] * 34, 6, 10)
@@ -0,0 +1,56 @@
+from app.services.duplicates import MinHashIndex
+from app.services.text import char_shingles, normalize_text
+
+
+FURITEN = (
+    "리치 후에 후리텐이면 론 할 수 있나요? 리치를 걸고 나서 내가 버린 패로 "
+    "대기가 후리텐이 되었습니다. 이 경우 쯔모만 가능한가요?"
+)
+FURITEN_REWORDED = (
+    "리치 후 후리텐 이면 론 가능한가요? 리치를 걸고 나서 내가 버린 패로 "
+    "대기가 후리텐이 됐어요. 이 경우 쯔모만 가능한가요?"
+)
+DORA = "도라 표시패가 북이면 도라는 무엇인가요? 처음 배우는 중이라 헷갈립니다."
+
+
+class TestText:
+    def test_normalize_text(self):
+        assert normalize_text("  리치，  후리텐!! ABC ") == "리치 후리텐 abc"
+
+    def test_shingles_ignore_spacing(self):
+        assert char_shingles("후리텐 이면") == char_shingles("후리텐이면")
+
+    def test_short_text(self):
+        assert char_shingles("론") == {"론"}
+        assert char_shingles("?!") == set()
+
+
+class TestMinHashIndex:
+    def test_query_finds_reworded_question(self):
+        index = MinHashIndex()
+        index.add(1, FURITEN)
+        index.add(2, DORA)
+
+        matches = index.query(FURITEN_REWORDED, threshold=0.5)
+
+        assert [question_id for question_id, _ in matches] == [1]
+        assert 0.5 <= matches[0][1] < 1
+
+    def test_query_excludes_self(self):
+        index = MinHashIndex()
+        index.add(1, FURITEN)
+        index.add(2, FURITEN)
+
+        assert index.query(FURITEN, threshold=0.5, exclude=1) == [(2, 1.0)]
+
+    def test_add_replaces_and_remove(self):
+        index = MinHashIndex()
+        index.add(1, FURITEN)
+        index.add(1, DORA)
+
+        assert index.query(FURITEN, threshold=0.5) == []
+
+        index.remove(1)
+
+        assert len(index) == 0
+        assert index.query(DORA, threshold=0.5) == []
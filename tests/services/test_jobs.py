@@ -0,0 +1,111 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.crud.job import enqueue_job
+from app.services import jobs
+from app.services.jobs import JOB_HANDLERS, JobMetrics, JobWorker, job_handler, retry_delay
+
+
+@pytest.fixture
+def worker(db_session: AsyncSession) -> JobWorker:
+    # 워커의 커밋이 테스트 트랜잭션 안의 savepoint가 되도록 같은 연결에 묶음
+    factory = async_sessionmaker(
+        bind=db_session.bind,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+    return JobWorker(factory, concurrency=1, batch_size=10, poll_interval=0)
+
+
+@pytest.fixture
+def handlers():
+    calls = []
+
+    @job_handler("test.ok")
+    async def ok(db: AsyncSession, payload: dict) -> None:
+        calls.append(payload)
+
+    @job_handler("test.broken")
+    async def broken(db: AsyncSession, payload: dict) -> None:
+        raise RuntimeError("broken")
+
+    yield calls
+    JOB_HANDLERS.pop("test.ok")
+    JOB_HANDLERS.pop("test.broken")
+
+
+@pytest.mark.asyncio
+class TestJobWorker:
+    async def test_runs_handler_and_completes(
+        self, db_session: AsyncSession, worker: JobWorker, handlers: list
+    ):
+        job = await enqueue_job(db_session, "test.ok", {"question_id": 1})
+        await db_session.commit()
+
+        assert await worker.run_once() == 1
+        await worker.drain()
+
+        await db_session.refresh(job)
+        assert job.status == "done"
+        assert handlers == [{"question_id": 1}]
+        assert worker.metrics.completed["test.ok"] == 1
+        assert worker.metrics.completed_last_minute() == 1
+
+    @pytest.mark.usefixtures("handlers")
+    async def test_failure_retries_then_fails(self, db_session: AsyncSession, worker: JobWorker):
+        job = await enqueue_job(db_session, "test.broken", max_attempts=1)
+        retried = await enqueue_job(db_session, "test.broken", max_attempts=3)
+        unknown = await enqueue_job(db_session, "test.unknown")
+        await db_session.commit()
+
+        for _ in range(3):
+            await worker.run_once()
+            await worker.drain()
+
+        for item in (job, retried, unknown):
+            await db_session.refresh(item)
+        assert (job.status, job.attempts) == ("failed", 1)
+        assert (retried.status, retried.attempts) == ("pending", 1)
+        assert "broken" in retried.last_error
+        assert unknown.status == "failed"
+        assert worker.metrics.retried["test.broken"] == 1
+
+    @pytest.mark.usefixtures("handlers")
+    async def test_failure_to_record_failure_is_logged(
+        self,
+        db_session: AsyncSession,
+        worker: JobWorker,
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture,
+    ):
+        async def fail_job(*_args) -> bool:
+            raise ConnectionError("db down")
+
+        monkeypatch.setattr(jobs, "fail_job", fail_job)
+        job = await enqueue_job(db_session, "test.broken", max_attempts=3)
+        await db_session.commit()
+
+        await worker.run_once()
+        await worker.drain()
+
+        # 실패를 기록하지 못한 작업은 running으로 남아 maintain이 다시 넣음
+        await db_session.refresh(job)
+        assert job.status == "running"
+        assert worker.metrics.retried["test.broken"] == 1
+        assert "작업 실패 기록 실패" in caplog.text
+
+
+def test_retry_delay_backs_off_to_max():
+    assert retry_delay(2) == 2 * retry_delay(1)
+    assert retry_delay(100) == retry_delay(101)
+
+
+def test_metrics_window():
+    metrics = JobMetrics()
+    metrics.record("test", "completed", 1.0, 0.5, now=0)
+    metrics.record("test", "failed", 3.0, 1.5, now=0)
+
+    assert metrics.completed_last_minute(now=30) == 1
+    assert metrics.completed_last_minute(now=61) == 0
+    assert metrics.average_duration == 2.0
+    assert metrics.average_start_lag == 1.0
@@ -0,0 +1,66 @@
+import pytest
+
+from app.core.config import get_settings
+from app.services import list_cache
+from app.services.list_cache import QuestionListCache
+
+
+@pytest.fixture
+def cache(monkeypatch: pytest.MonkeyPatch) -> QuestionListCache:
+    settings = get_settings()
+    monkeypatch.setattr(settings, "question_list_cache_entries", 2)
+    monkeypatch.setattr(settings, "question_list_cache_max_bytes", 10)
+    monkeypatch.setattr(settings, "question_list_cache_max_page", 3)
+    return QuestionListCache()
+
+
+def test_only_first_pages_are_cached(cache: QuestionListCache):
+    assert cache.accepts(3)
+    assert not cache.accepts(4)
+
+
+def test_write_during_read_discards_response(cache: QuestionListCache):
+    generation = cache.generation
+    cache.invalidate()
+    cache.put(1, 10, generation, b"old")
+
+    assert cache.get(1, 10) is None
+
+
+def test_invalidate_drops_entries(cache: QuestionListCache):
+    cache.put(1, 10, cache.generation, b"page1")
+    assert cache.get(1, 10) == b"page1"
+
+    cache.invalidate()
+
+    assert cache.get(1, 10) is None
+    assert cache.size_bytes == 0
+
+
+def test_memory_is_bounded_by_entries_and_bytes(cache: QuestionListCache):
+    generation = cache.generation
+    cache.put(1, 10, generation, b"aaaa")
+    cache.put(2, 10, generation, b"bbbb")
+    cache.get(1, 10)
+    # 항목 수 초과. 가장 오래 안 쓴 2페이지가 빠짐
+    cache.put(3, 10, generation, b"cccc")
+    assert (cache.get(1, 10), cache.get(2, 10)) == (b"aaaa", None)
+
+    # 크기 초과
+    cache.put(1, 20, generation, b"dddddddd")
+    assert len(cache) == 1
+    assert cache.size_bytes == 8
+
+    cache.put(2, 20, generation, b"x" * 11)
+    assert cache.get(2, 20) is None
+
+
+def test_entries_expire(cache: QuestionListCache, monkeypatch: pytest.MonkeyPatch):
+    now = 1000.0
+    monkeypatch.setattr(list_cache.time, "monotonic", lambda: now)
+    cache.put(1, 10, cache.generation, b"page1")
+
+    now += get_settings().question_list_cache_ttl
+
+    assert cache.get(1, 10) is None
+    assert len(cache) == 0
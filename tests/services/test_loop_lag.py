@@ -0,0 +1,70 @@
+import asyncio
+import time
+
+import pytest
+
+from app.core.config import get_settings
+from app.services.loop_lag import LAG_BUCKETS_MS, LagHistogram, LoopLagMonitor
+
+
+def _hold_loop(seconds: float) -> None:
+    # 핸들러 안의 동기 호출을 흉내 냄
+    time.sleep(seconds)
+
+
+def test_histogram_buckets_use_upper_bounds():
+    histogram = LagHistogram()
+    for lag_ms in (0.2, 1.0, 3.0, 40.0, 10_000.0):
+        histogram.observe(lag_ms)
+
+    assert histogram.counts[0] == 2
+    assert histogram.counts[LAG_BUCKETS_MS.index(5.0)] == 1
+    assert histogram.counts[LAG_BUCKETS_MS.index(50.0)] == 1
+    assert histogram.counts[-1] == 1
+    assert histogram.max_ms == 10_000.0
+    assert histogram.quantile(0.5) == 3.0
+
+
+@pytest.mark.asyncio
+class TestLoopLagMonitor:
+    @pytest.fixture
+    def settings(self, monkeypatch: pytest.MonkeyPatch):
+        settings = get_settings()
+        monkeypatch.setattr(settings, "loop_lag_interval", 0.01)
+        monkeypatch.setattr(settings, "loop_block_threshold", 0.02)
+        return settings
+
+    @pytest.mark.usefixtures("settings")
+    async def test_blocking_call_shows_up_as_lag(self):
+        monitor = LoopLagMonitor()
+        monitor.start()
+        try:
+            await asyncio.sleep(0.03)
+            _hold_loop(0.1)
+            await asyncio.sleep(0.03)
+        finally:
+            await monitor.stop()
+
+        assert monitor.histogram.count >= 2
+        assert monitor.histogram.max_ms >= 80
+        assert not monitor.stalls
+
+    async def test_watchdog_records_blocking_stack(
+        self, settings, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ):
+        monkeypatch.setattr(settings, "loop_watchdog", True)
+        monitor = LoopLagMonitor()
+        monitor.start()
+        try:
+            await asyncio.sleep(0.05)
+            _hold_loop(0.2)
+            await asyncio.sleep(0.05)
+        finally:
+            await monitor.stop()
+
+        assert not monitor.watchdog_running
+        assert len(monitor.stalls) == 1
+        stall = monitor.stalls[0]
+        assert stall.duration_ms >= 150
+        assert "_hold_loop" in stall.stack[-1]
+        assert "_hold_loop" in caplog.text
@@ -0,0 +1,97 @@
+import pytest
+
+from app.services.related import TfidfIndex
+from app.services.text import terms
+
+
+class TestTerms:
+    def test_hangul_words_split_into_bigrams(self):
+        assert terms("후리텐이면 론") == ["후리", "리텐", "텐이", "이면", "론"]
+
+    def test_other_words_kept(self):
+        assert terms("123m456p 리치!") == ["123m456p", "리치"]
+
+
+class TestTfidfIndex:
+    def _index(self) -> TfidfIndex:
+        index = TfidfIndex()
+        index.add(1, "후리텐 상태에서 론을 할 수 있나요")
+        index.add(2, "리치 후 후리텐이면 론이 안 되나요")
+        index.add(3, "도라 표시패가 북이면 도라는 무엇인가요")
+        index.add(4, "점수 계산에서 부수는 어떻게 세나요")
+        return index
+
+    def test_related_ranks_by_similarity(self):
+        related = self._index().related(1)
+
+        assert related[0][0] == 2
+        assert all(question_id != 1 for question_id, _ in related)
+        assert all(0 < score <= 1 for _, score in related)
+
+    def test_unknown_question(self):
+        assert self._index().related(99) == []
+
+    def test_neighbors_cached_until_expiry(self):
+        index = self._index()
+        index.related(3, now=0)
+        index.add(5, "도라 표시패가 북이면 도라는 남인가요")
+
+        assert 5 not in [question_id for question_id, _ in index.related(3, now=1)]
+        assert index.related(3, now=10**6)[0][0] == 5
+
+    def test_write_invalidates_own_neighbors(self):
+        index = self._index()
+        index.related(1, now=0)
+        index.add(1, "도라 표시패가 북이면 도라는 무엇인가요")
+
+        assert index.related(1, now=1)[0][0] == 3
+
+    def test_remove(self):
+        index = self._index()
+        index.remove(2)
+
+        assert len(index) == 3
+        assert 2 not in [question_id for question_id, _ in index.related(1)]
+
+
+@pytest.mark.asyncio
+class TestTfidfIndexRebuild:
+    async def _rebuilt_index(self) -> TfidfIndex:
+        index = TestTfidfIndex()._index()
+        await index.rebuild()
+        return index
+
+    async def test_rebuild_matches_incremental_scores(self):
+        incremental = TestTfidfIndex()._index()
+        rebuilt = await self._rebuilt_index()
+
+        assert rebuilt.pending == 0
+        for question_id in (1, 2, 3, 4):
+            expected = incremental.related(question_id)
+            actual = rebuilt.related(question_id)
+            assert [i for i, _ in actual] == [i for i, _ in expected]
+            assert [s for _, s in actual] == pytest.approx([s for _, s in expected], rel=1e-5)
+
+    async def test_writes_are_scored_without_rebuilding(self):
+        index = await self._rebuilt_index()
+        snapshot = index._snapshot
+
+        index.add(5, "후리텐 상태에서 론을 할 수 있나요")
+        index.add(2, "점수 계산에서 부수는 어떻게 세나요")
+
+        # 스냅샷은 그대로 두고 바뀐 질문만 따로 계산
+        assert index._snapshot is snapshot
+        assert index.pending == 2
+        assert index.related(5, now=0)[0][0] == 1
+        assert index.related(4, now=0)[0][0] == 2
+        assert index.related(1, now=0)[0][0] == 5
+
+        await index.rebuild()
+        assert index.pending == 0
+        assert index.related(5, now=10**6)[0][0] == 1
+
+    async def test_removed_question_dropped_before_rebuild(self):
+        index = await self._rebuilt_index()
+        index.remove(2)
+
+        assert 2 not in [question_id for question_id, _ in index.related(1)]
@@ -0,0 +1,96 @@
+import pytest
+
+from app.services.scoring import WinContext, decompose, parse_meld, score_hand
+from app.services.tiles import parse_hand, tile_counts
+
+
+def score(hand: str, win: str, melds=(), **kwargs):
+    context = WinContext(
+        win_tile=parse_hand(win)[0],
+        round_wind=kwargs.pop("round_wind", 27),
+        seat_wind=kwargs.pop("seat_wind", 28),
+        **kwargs,
+    )
+    parsed = [parse_meld(kind, parse_hand(tiles)) for kind, tiles in melds]
+    return score_hand(parse_hand(hand), parsed, context)
+
+
+class TestScoring:
+    def test_riichi_pinfu_tanyao_ron(self):
+        result = score("234m567m234p567s88s", "7s", riichi=True)
+
+        assert [name for name, _ in result.yaku] == ["리치", "핑후", "탕야오"]
+        assert (result.han, result.fu) == (3, 30)
+        assert result.ron == 3900
+
+    def test_pinfu_tsumo_is_20_fu(self):
+        result = score("234m567m234p567s88s", "7s", tsumo=True)
+
+        assert (result.han, result.fu) == (3, 20)
+        assert (result.tsumo_dealer, result.tsumo_non_dealer) == (1300, 700)
+        assert result.total == 2700
+
+    def test_dealer_ron_with_dora(self):
+        result = score("234m567m234p345s88s", "8s", seat_wind=27, dora=2)
+
+        assert (result.han, result.fu) == (3, 40)
+        assert result.ron == 7700
+
+    def test_open_hand_minimum_30_fu(self):
+        melds = [("pon", "555z"), ("chi", "234p"), ("pon", "888s"), ("chi", "678m")]
+
+        result = score("22m", "2m", melds=melds)
+
+        assert result.yaku == [("역패 백", 1)]
+        assert result.fu == 30
+        assert result.ron == 1000
+
+    def test_prefers_ryanpeikou_over_chiitoitsu(self):
+        result = score("234m234m567p567p11s", "1s", riichi=True)
+
+        assert ("량페코", 3) in result.yaku
+        assert result.limit == "만관"
+        assert result.ron == 8000
+
+    def test_chiitoitsu_tsumo(self):
+        result = score("113355m77p99s1122z", "2z", tsumo=True)
+
+        assert (result.han, result.fu) == (3, 25)
+        assert result.total == 3200
+
+    @pytest.mark.parametrize(
+        ("hand", "win", "name"),
+        [
+            ("19m19p19s12345677z", "7z", "국사무쌍"),
+            ("111m999p111s55599m", "9m", "스안커"),
+            ("11123456789995m", "5m", "구련보등"),
+        ],
+    )
+    def test_yakuman(self, hand: str, win: str, name: str):
+        result = score(hand, win, tsumo=True)
+
+        assert result.yaku == [(name, 13)]
+        assert result.total == 32000
+
+    def test_no_yaku(self):
+        with pytest.raises(ValueError, match="역이 없습니다"):
+            score("123m456p789s11z", "1z", melds=[("chi", "123m")])
+
+    def test_not_a_winning_hand(self):
+        with pytest.raises(ValueError, match="화료 형태가 아닙니다"):
+            score("123m456p789s12344z", "1z")
+
+    def test_decompose_is_memoized(self):
+        counts = tuple(tile_counts(parse_hand("111222333m456p77z")))
+        decompose.cache_clear()
+
+        first = decompose(counts)
+        second = decompose(counts)
+
+        assert first is second
+        assert len(first) == 2
+        assert decompose.cache_info().hits == 1
+
+    def test_invalid_meld(self):
+        with pytest.raises(ValueError):
+            parse_meld("chi", parse_hand("135m"))
@@ -0,0 +1,69 @@
+import pytest
+
+from app.services.shanten import analyze_hand, calculate_shanten, ukeire
+from app.services.tiles import parse_hand, tile_counts, tile_name
+
+
+def shanten(notation: str):
+    return calculate_shanten(tile_counts(parse_hand(notation)))
+
+
+class TestShanten:
+    @pytest.mark.parametrize(
+        ("notation", "expected"),
+        [
+            ("123m456p789s11222z", -1),
+            ("123m456p789s1122z", 0),
+            ("123m456p789s1123z", 1),
+            ("13579m13579p135s", 4),
+            ("1112345678999m", 0),
+            # 가진 네 장째 패는 기다릴 수 없음
+            ("1111m", 1),
+            ("111m2z", 0),
+        ],
+    )
+    def test_regular(self, notation: str, expected: int):
+        assert shanten(notation).regular == expected
+
+    def test_chiitoitsu(self):
+        result = shanten("1122m3344p5566s7z")
+
+        assert result.chiitoitsu == 0
+        assert result.regular == 3
+        assert result.shanten == 0
+
+    def test_chiitoitsu_needs_distinct_pairs(self):
+        assert shanten("11112222333344m").chiitoitsu == 5
+
+    def test_kokushi(self):
+        result = shanten("19m19p19s1234567z")
+
+        assert result.kokushi == 0
+        assert result.shanten == 0
+
+    def test_called_hand_skips_special_forms(self):
+        result = shanten("111m2z")
+
+        assert result.chiitoitsu is None
+        assert result.kokushi is None
+
+    @pytest.mark.parametrize("notation", ["123m", "123456789m123p11z1s"])
+    def test_invalid_tile_count(self, notation: str):
+        with pytest.raises(ValueError):
+            shanten(notation)
+
+    def test_ukeire_nine_gates(self):
+        counts = tile_counts(parse_hand("1112345678999m"))
+
+        accepted = {tile_name(tile): count for tile, count in ukeire(counts).items()}
+
+        assert list(accepted) == [f"{n}m" for n in range(1, 10)]
+        assert accepted["1m"] == 1
+        assert accepted["5m"] == 3
+
+    def test_discard_options_sorted_best_first(self):
+        _, options = analyze_hand(parse_hand("123m456p789s11225z"))
+
+        assert tile_name(options[0].tile) == "5z"
+        assert options[0].shanten == 0
+        assert options[-1].shanten > 0
@@ -0,0 +1,71 @@
+import pytest
+
+from app.services.tiles import (
+    canonical_key,
+    encode_tiles,
+    extract_hands,
+    format_hand,
+    neighbor_keys,
+    parse_hand,
+    tile_counts,
+)
+
+
+class TestTiles:
+    def test_parse_hand(self):
+        hand = parse_hand("123m456p789s11z")
+
+        assert len(hand) == 11
+        assert hand[:3] == (0, 1, 2)
+        assert hand[-2:] == (27, 27)
+
+    def test_parse_red_five_as_five(self):
+        assert parse_hand("0m") == parse_hand("5m")
+        assert parse_hand("0p0s") == parse_hand("5p5s")
+
+    @pytest.mark.parametrize(
+        "notation", ["8z", "0z", "11111m", "123", "m123", "1234567890123456789m"]
+    )
+    def test_parse_hand_invalid(self, notation: str):
+        with pytest.raises(ValueError):
+            parse_hand(notation)
+
+    def test_format_hand_normalizes_order(self):
+        assert format_hand(parse_hand("11z789s456p123m")) == "123m456p789s11z"
+
+    def test_tile_counts(self):
+        counts = tile_counts(parse_hand("555m1z"))
+
+        assert len(counts) == 34
+        assert counts[4] == 3
+        assert counts[27] == 1
+        assert sum(counts) == 4
+
+    def test_encode_tiles_numbers_copies(self):
+        assert encode_tiles(parse_hand("55m1z")) == [16, 17, 108]
+
+    def test_extract_hands_from_text(self):
+        text = "손패가 123m456p789s11z 일 때 2m을 버려도 될까요? 2026년 8z 12345m"
+
+        hands = extract_hands(text)
+
+        assert [format_hand(hand) for hand in hands] == ["123m456p789s11z", "2m", "12345m"]
+
+    def test_canonical_key_ignores_suit_permutation(self):
+        def key(notation: str) -> str:
+            return canonical_key(tile_counts(parse_hand(notation)))
+
+        assert key("123m456p789s11z") == key("789m123p456s11z")
+        assert key("123m456p789s11z") != key("124m456p789s11z")
+        # 동(1z)과 중(7z)은 다른 패
+        assert key("123m456p789s11z") != key("123m456p789s77z")
+
+    def test_neighbor_keys(self):
+        hand = parse_hand("123m456p789s1122z")
+        keys = neighbor_keys(hand)
+
+        assert canonical_key(tile_counts(hand)) in keys
+        assert canonical_key(tile_counts(parse_hand("123m456p789s112z"))) in keys
+        assert canonical_key(tile_counts(parse_hand("123m456p789s11223z"))) in keys
+        assert canonical_key(tile_counts(parse_hand("124m456p789s1122z"))) in keys
+        assert canonical_key(tile_counts(parse_hand("159m456p789s1122z"))) not in keys
@@ -0,0 +1,113 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.question import create_question, read_question_by_id
+from app.db import limits, slow_queries
+from app.schemas.question import QuestionCreate
+from app.services.view_counter import ViewCounter
+
+
+@pytest.mark.asyncio
+class TestViewCounter:
+    @pytest.fixture
+    def counter(self, db_session: AsyncSession) -> ViewCounter:
+        @asynccontextmanager
+        async def session_factory():
+            yield db_session
+
+        return ViewCounter(max_pending=1000, session_factory=session_factory)
+
+    async def test_record_keeps_counts_in_memory(self, counter: ViewCounter):
+        counter.record(1)
+        counter.record(1)
+        counter.record(2)
+
+        assert counter.pending(1) == 2
+        assert counter.pending(2) == 1
+        assert counter.pending(3) == 0
+        assert counter.pending_total == 3
+
+    async def test_flush_writes_batch(
+        self,
+        counter: ViewCounter,
+        db_session: AsyncSession,
+        sample_question_data: dict,
+    ):
+        question = await create_question(db_session, QuestionCreate(**sample_question_data))
+        question_id = question.id
+        for _ in range(5):
+            counter.record(question_id)
+
+        flushed = await counter.flush()
+        db_session.expire_all()
+
+        assert flushed == 5
+        assert counter.pending_total == 0
+        assert (await read_question_by_id(db_session, question_id)).view_count == 5
+
+    async def test_flush_failure_restores_pending(self):
+        @asynccontextmanager
+        async def broken_session_factory():
+            raise RuntimeError("db down")
+            yield
+
+        counter = ViewCounter(max_pending=1000, session_factory=broken_session_factory)
+        counter.record(1)
+
+        assert await counter.flush() == 0
+        assert counter.pending(1) == 1
+        assert counter.pending_total == 1
+
+    async def test_cancelled_flush_restores_pending(self):
+        started = asyncio.Event()
+
+        @asynccontextmanager
+        async def hanging_session_factory():
+            started.set()
+            await asyncio.sleep(10)
+            yield
+
+        counter = ViewCounter(max_pending=1000, session_factory=hanging_session_factory)
+        counter.record(1)
+        counter.record(1)
+        flush = asyncio.create_task(counter.flush())
+        await started.wait()
+
+        # 종료할 때 주기 작업이 진행 중인 flush를 취소하는 경우
+        flush.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await flush
+
+        assert counter.pending(1) == 2
+        assert counter.pending_total == 2
+
+    async def test_close_waits_for_running_flush(self, counter: ViewCounter):
+        counter.max_pending = 1
+        counter.record(1)
+        running = counter._flush_task
+
+        await counter.close()
+
+        assert running.done()
+        assert counter.pending_total == 0
+
+    async def test_flush_task_does_not_inherit_request_context(self):
+        seen = []
+
+        @asynccontextmanager
+        async def session_factory():
+            seen.append((limits._current_budget.get(), slow_queries._current_route.get()))
+            raise RuntimeError("db down")
+            yield
+
+        counter = ViewCounter(max_pending=1, session_factory=session_factory)
+        limits.start_statement_budget("GET /questions/{question_id}", 5)
+        slow_queries.set_query_route("GET /questions/{question_id}")
+
+        counter.record(1)
+        await counter._flush_task
+
+        assert seen == [(None, None)]